@@ -1,19 +1,75 @@
-import { createSafeDsServices } from '@safe-ds/lang';
+import { createSafeDsServices, SafeDsLanguageMetaData, type SafeDsServices } from '@safe-ds/lang';
 import { NodeFileSystem } from 'langium/node';
-import { extractDocuments } from '../helpers/documents.js';
+import { LangiumDocument, URI } from 'langium';
+import { buildDocuments, extractUris } from '../helpers/documents.js';
 import { diagnosticToString, getDiagnostics } from '../helpers/diagnostics.js';
+import { watchPaths } from '../helpers/watch.js';
+import { runInWorkers, WorkerResult } from '../helpers/workers.js';
 import { Diagnostic, DiagnosticSeverity } from 'vscode-languageserver';
 import chalk from 'chalk';
 import { ExitCode } from './exitCode.js';
 
 export const check = async (fsPaths: string[], options: CheckOptions): Promise<void> => {
+    if (options.watch) {
+        return checkAndWatch(fsPaths, options);
+    }
+
+    let results: CheckResult[];
+    if (options.jobs > 1) {
+        const uris = extractUris({ LanguageMetaData: SafeDsLanguageMetaData }, fsPaths);
+        results = await runInWorkers<CheckResult>({ command: 'check', options }, uris, options.jobs);
+    } else {
+        const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+        const uris = extractUris(services, fsPaths);
+        results = await checkDocuments(services, uris, uris);
+    }
+
+    if (printDiagnostics(results, options) > 0) {
+        process.exit(ExitCode.FileHasErrors);
+    }
+};
+
+/**
+ * Checks the documents at the given paths and then keeps checking the documents that are affected by changes. The
+ * language services are kept alive in between, so builtin files are only indexed once.
+ */
+const checkAndWatch = async (fsPaths: string[], options: CheckOptions): Promise<void> => {
     const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+    const uris = extractUris(services, fsPaths);
+    printDiagnostics(await checkDocuments(services, uris, uris), options);
+
+    watchPaths(services, fsPaths, (documents) => {
+        printDiagnostics(documents.map(toCheckResult), options);
+    });
+    console.log(chalk.gray('Watching for file changes...'));
+};
+
+/**
+ * Loads all documents with the given URIs and validates the ones in `shard`.
+ *
+ * @returns The diagnostics of the validated documents in the order of `uris`.
+ */
+export const checkDocuments = async (services: SafeDsServices, uris: URI[], shard: URI[]): Promise<CheckResult[]> => {
+    const documents = await buildDocuments(services, uris, shard);
+    return documents.map(toCheckResult);
+};
+
+const toCheckResult = (document: LangiumDocument): CheckResult => ({
+    uri: document.uri.toString(),
+    diagnostics: getDiagnostics(document),
+});
 
+/**
+ * Prints the diagnostics of the given documents followed by the number of errors.
+ *
+ * @returns The number of errors.
+ */
+const printDiagnostics = (results: CheckResult[], options: CheckOptions): number => {
     let errorCount = 0;
 
-    for (const document of await extractDocuments(services, fsPaths)) {
-        for (const diagnostic of getDiagnostics(document)) {
-            console.log(diagnosticToString(document.uri, diagnostic, options));
+    for (const { uri, diagnostics } of results) {
+        for (const diagnostic of diagnostics) {
+            console.log(diagnosticToString(URI.parse(uri), diagnostic, options));
 
             if (isError(diagnostic, options)) {
                 errorCount++;
@@ -23,10 +79,11 @@ export const check = async (fsPaths: string[], options: CheckOptions): Promise<v
 
     if (errorCount > 0) {
         console.error(chalk.red(`Found ${errorCount} ${errorCount === 1 ? 'error' : 'errors'}.`));
-        process.exit(ExitCode.FileHasErrors);
     } else {
         console.log(chalk.green(`No errors found.`));
     }
+
+    return errorCount;
 };
 
 /**
@@ -37,6 +94,23 @@ export interface CheckOptions {
      * Whether the program should fail on warnings.
      */
     strict: boolean;
+
+    /**
+     * The number of worker threads that validate documents in parallel.
+     */
+    jobs: number;
+
+    /**
+     * Whether the program should keep running and check changed files again.
+     */
+    watch: boolean;
+}
+
+/**
+ * The diagnostics of a single document.
+ */
+export interface CheckResult extends WorkerResult {
+    diagnostics: Diagnostic[];
 }
 
 const isError = (diagnostic: Diagnostic, options: CheckOptions) => {
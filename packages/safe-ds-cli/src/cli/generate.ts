@@ -1,24 +1,125 @@
-import { createSafeDsServices } from '@safe-ds/lang';
+import { createSafeDsServices, SafeDsLanguageMetaData, type SafeDsServices } from '@safe-ds/lang';
 import chalk from 'chalk';
-import { URI } from 'langium';
+import { LangiumDocument, URI } from 'langium';
 import { NodeFileSystem } from 'langium/node';
 import fs from 'node:fs';
 import path from 'node:path';
-import { extractDocuments } from '../helpers/documents.js';
-import { makeParentDirectoriesSync } from '../helpers/files.js';
-import { exitIfDocumentHasErrors } from '../helpers/diagnostics.js';
+import { Diagnostic, DiagnosticSeverity } from 'vscode-languageserver';
+import { buildDocuments, extractUris } from '../helpers/documents.js';
+import { deleteFiles, FileToWrite, writeFilesInBatches } from '../helpers/files.js';
+import { exitIfDiagnosticsContainErrors, getDiagnostics, reportErrors } from '../helpers/diagnostics.js';
+import {
+    BuildManifest,
+    computeSourceHash,
+    createConfigurationKey,
+    ManifestEntry,
+    readManifest,
+    writeManifest,
+} from '../helpers/manifest.js';
+import { watchPaths } from '../helpers/watch.js';
+import { runInWorkers, WorkerResult } from '../helpers/workers.js';
 
 export const generate = async (fsPaths: string[], options: GenerateOptions): Promise<void> => {
-    const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
-    const documents = await extractDocuments(services, fsPaths);
+    if (options.watch) {
+        return generateAndWatch(fsPaths, options);
+    }
 
-    // Exit if any document has errors before generating code
-    for (const document of documents) {
-        exitIfDocumentHasErrors(document);
+    const outputDirectory = path.resolve(options.out);
+    const manifest = readManifest(outputDirectory, createConfigurationKey({ sourcemaps: options.sourcemaps }));
+
+    let results: GenerateResult[];
+    if (options.jobs > 1) {
+        const uris = extractUris({ LanguageMetaData: SafeDsLanguageMetaData }, fsPaths);
+        results = await runInWorkers<GenerateResult>({ command: 'generate', options, manifest }, uris, options.jobs);
+    } else {
+        const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+        const uris = extractUris(services, fsPaths);
+        results = await generateDocuments(services, uris, uris, options, manifest);
     }
 
-    // Generate code
-    for (const document of documents) {
+    // Exit if any document has errors before writing code
+    for (const { uri, diagnostics } of results) {
+        exitIfDiagnosticsContainErrors(URI.parse(uri), diagnostics);
+    }
+
+    await writeResults(outputDirectory, manifest, results);
+    console.log(chalk.green(`Python code generated successfully.`));
+};
+
+/**
+ * Generates Python code for the documents at the given paths and then keeps regenerating code for the documents that
+ * are affected by changes. Documents with errors are reported but do not stop the process.
+ */
+const generateAndWatch = async (fsPaths: string[], options: GenerateOptions): Promise<void> => {
+    const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+    const outputDirectory = path.resolve(options.out);
+    let manifest = readManifest(outputDirectory, createConfigurationKey({ sourcemaps: options.sourcemaps }));
+
+    const uris = extractUris(services, fsPaths);
+    const sourceUris = new Set(uris.map((it) => it.toString()));
+
+    const generateAndWrite = async (documents: LangiumDocument[]) => {
+        const results = generateBuiltDocuments(services, documents, sourceUris, options, manifest);
+        const documentsWithErrors = results.filter(({ uri, diagnostics }) => reportErrors(URI.parse(uri), diagnostics));
+
+        manifest = await writeResults(outputDirectory, manifest, results);
+        if (documentsWithErrors.length === 0) {
+            console.log(chalk.green(`Python code generated successfully.`));
+        }
+    };
+
+    await generateAndWrite(await buildDocuments(services, uris));
+
+    watchPaths(services, fsPaths, async (documents, deleted) => {
+        documents.forEach((it) => sourceUris.add(it.uri.toString()));
+        deleted.forEach((it) => sourceUris.delete(it.toString()));
+        await generateAndWrite(documents);
+    });
+    console.log(chalk.gray('Watching for file changes...'));
+};
+
+/**
+ * Loads all documents with the given URIs, validates the ones in `shard`, and generates Python code for those without
+ * errors. Documents whose entry in the manifest is still up to date are skipped. The generated files are not written
+ * yet.
+ *
+ * @returns The diagnostics and generated files of the validated documents in the order of `uris`.
+ */
+export const generateDocuments = async (
+    services: SafeDsServices,
+    uris: URI[],
+    shard: URI[],
+    options: GenerateOptions,
+    manifest: BuildManifest,
+): Promise<GenerateResult[]> => {
+    const documents = await buildDocuments(services, uris, shard);
+    const sourceUris = new Set(uris.map((it) => it.toString()));
+    return generateBuiltDocuments(services, documents, sourceUris, options, manifest);
+};
+
+const generateBuiltDocuments = (
+    services: SafeDsServices,
+    documents: LangiumDocument[],
+    sourceUris: Set<string>,
+    options: GenerateOptions,
+    manifest: BuildManifest,
+): GenerateResult[] => {
+    const langiumDocuments = services.shared.workspace.LangiumDocuments;
+
+    return documents.map((document) => {
+        const uri = document.uri.toString();
+        const diagnostics = getDiagnostics(document);
+        if (diagnostics.some((it) => it.severity === DiagnosticSeverity.Error)) {
+            return { uri, diagnostics, entry: undefined, files: [] };
+        }
+
+        // Skip documents that did not change since the last run
+        const hash = computeSourceHash(langiumDocuments, document, sourceUris);
+        const previousEntry = manifest.documents[uri];
+        if (previousEntry?.hash === hash && previousEntry.outputs.every((it) => fs.existsSync(URI.parse(it).fsPath))) {
+            return { uri, diagnostics, entry: previousEntry, files: [] };
+        }
+
         const generatedFiles = services.generation.PythonGenerator.generate(document, {
             destination: URI.file(path.resolve(options.out)),
             createSourceMaps: options.sourcemaps,
@@ -26,14 +127,59 @@ export const generate = async (fsPaths: string[], options: GenerateOptions): Pro
             disableRunnerIntegration: false,
         });
 
-        for (const file of generatedFiles) {
-            const fsPath = URI.parse(file.uri).fsPath;
-            makeParentDirectoriesSync(fsPath);
-            fs.writeFileSync(fsPath, file.getText());
+        return {
+            uri,
+            diagnostics,
+            entry: { hash, outputs: generatedFiles.map((file) => file.uri) },
+            files: generatedFiles.map((file) => ({ uri: file.uri, text: file.getText() })),
+        };
+    });
+};
+
+/**
+ * Writes the generated files, deletes outputs that are no longer generated, and updates the manifest.
+ *
+ * @returns The new manifest.
+ */
+const writeResults = async (
+    outputDirectory: string,
+    manifest: BuildManifest,
+    results: GenerateResult[],
+): Promise<BuildManifest> => {
+    const newManifest = updateManifest(manifest, results);
+    await deleteFiles(getStaleOutputs(manifest, newManifest));
+    await writeFilesInBatches(results.flatMap((it) => it.files));
+    await writeManifest(outputDirectory, newManifest);
+    return newManifest;
+};
+
+/**
+ * Creates a new manifest with the entries of the processed documents. Entries of other documents are kept as long as
+ * their source still exists, since they might have been generated by an earlier run with different paths.
+ */
+const updateManifest = (manifest: BuildManifest, results: GenerateResult[]): BuildManifest => {
+    const documents: Record<string, ManifestEntry> = {};
+
+    for (const [uri, entry] of Object.entries(manifest.documents)) {
+        if (fs.existsSync(URI.parse(uri).fsPath)) {
+            documents[uri] = entry;
         }
     }
 
-    console.log(chalk.green(`Python code generated successfully.`));
+    for (const { uri, entry } of results) {
+        if (entry) {
+            documents[uri] = entry;
+        }
+    }
+
+    return { ...manifest, documents };
+};
+
+const getStaleOutputs = (oldManifest: BuildManifest, newManifest: BuildManifest): string[] => {
+    const newOutputs = new Set(Object.values(newManifest.documents).flatMap((it) => it.outputs));
+    return Object.values(oldManifest.documents)
+        .flatMap((it) => it.outputs)
+        .filter((it) => !newOutputs.has(it));
 };
 
 /**
@@ -42,4 +188,23 @@ export const generate = async (fsPaths: string[], options: GenerateOptions): Pro
 export interface GenerateOptions {
     out: string;
     sourcemaps: boolean;
+    jobs: number;
+    watch: boolean;
+}
+
+/**
+ * The diagnostics of a single document and the Python files generated for it.
+ */
+export interface GenerateResult extends WorkerResult {
+    diagnostics: Diagnostic[];
+
+    /**
+     * The new manifest entry of the document. This is undefined if the document has errors.
+     */
+    entry: ManifestEntry | undefined;
+
+    /**
+     * The files that must be written. This is empty if the document was skipped.
+     */
+    files: FileToWrite[];
 }
@@ -1,4 +1,4 @@
-import { Command } from 'commander';
+import { Command, InvalidArgumentError } from 'commander';
 import { createRequire } from 'node:module';
 import { fileURLToPath } from 'node:url';
 import { generate } from './generate.js';
@@ -6,6 +6,14 @@ import { check } from './check.js';
 import { format } from './format.js';
 import { doDocument } from './document.js';
 
+const parseJobs = (value: string): number => {
+    const result = Number(value);
+    if (!Number.isInteger(result) || result < 1) {
+        throw new InvalidArgumentError('Must be a positive integer.');
+    }
+    return result;
+};
+
 const program = new Command();
 
 // Version command
@@ -18,6 +26,8 @@ program
     .command('check')
     .argument('<paths...>', `list of files or directories to check`)
     .option('-s, --strict', 'whether the program should fail on warnings', false)
+    .option('-j, --jobs <count>', 'number of worker threads that check files in parallel', parseJobs, 1)
+    .option('-w, --watch', 'whether changed files should be checked again', false)
     .description('check Safe-DS code')
     .action(check);
 
@@ -42,6 +52,8 @@ program
     .argument('<paths...>', `list of files or directories to generate Python code for`)
     .option('-o, --out <dir>', 'destination directory for generation', 'generated')
     .option('-s, --sourcemaps', 'whether source maps should be generated', false)
+    .option('-j, --jobs <count>', 'number of worker threads that generate code in parallel', parseJobs, 1)
+    .option('-w, --watch', 'whether code should be generated again for changed files', false)
     .description('generate Python code')
     .action(generate);
 
@@ -0,0 +1,19 @@
+import { createSafeDsServices } from '@safe-ds/lang';
+import { URI } from 'langium';
+import { NodeFileSystem } from 'langium/node';
+import { parentPort, workerData } from 'node:worker_threads';
+import type { WorkerInput } from '../helpers/workers.js';
+import { checkDocuments } from './check.js';
+import { generateDocuments } from './generate.js';
+
+// Entry point of the worker threads that are started by `runInWorkers`
+const input: WorkerInput = workerData;
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const uris = input.uris.map((it) => URI.parse(it));
+const shard = input.shard.map((it) => URI.parse(it));
+
+if (input.command === 'check') {
+    parentPort!.postMessage(await checkDocuments(services, uris, shard));
+} else {
+    parentPort!.postMessage(await generateDocuments(services, uris, shard, input.options, input.manifest));
+}
@@ -89,14 +89,33 @@ const colorizeBySeverity = (diagnostic: Diagnostic, message: string, options: Di
  * Exits the process if the given document has errors.
  */
 export const exitIfDocumentHasErrors = function (document: LangiumDocument): void {
-    const errors = getErrors(document);
+    exitIfDiagnosticsContainErrors(document.uri, getDiagnostics(document));
+};
+
+/**
+ * Exits the process if the given diagnostics of the document with the given URI contain errors.
+ */
+export const exitIfDiagnosticsContainErrors = function (uri: URI, diagnostics: Diagnostic[]): void {
+    if (reportErrors(uri, diagnostics)) {
+        process.exit(ExitCode.FileHasErrors);
+    }
+};
+
+/**
+ * Prints the errors among the given diagnostics of the document with the given URI.
+ *
+ * @returns Whether there were any errors.
+ */
+export const reportErrors = function (uri: URI, diagnostics: Diagnostic[]): boolean {
+    const errors = diagnostics.filter(isError);
     if (errors.length > 0) {
-        console.error(chalk.red(`The file '${uriToRelativePath(document.uri)}' has errors:`));
+        console.error(chalk.red(`The file '${uriToRelativePath(uri)}' has errors:`));
         for (const error of errors) {
-            console.error(diagnosticToString(document.uri, error));
+            console.error(diagnosticToString(uri, error));
         }
-        process.exit(ExitCode.FileHasErrors);
     }
+
+    return errors.length > 0;
 };
 
 /**
@@ -114,7 +133,11 @@ export const exitIfDocumentHasSyntaxErrors = function (document: LangiumDocument
 };
 
 const getErrors = (document: LangiumDocument): Diagnostic[] => {
-    return getDiagnostics(document).filter((it) => it.severity === DiagnosticSeverity.Error);
+    return getDiagnostics(document).filter(isError);
+};
+
+const isError = (diagnostic: Diagnostic): boolean => {
+    return diagnostic.severity === DiagnosticSeverity.Error;
 };
 
 const getSyntaxErrors = (document: LangiumDocument): Diagnostic[] => {
@@ -14,20 +14,51 @@ export const extractDocuments = async function (
     services: LangiumServices,
     fsPaths: string[],
 ): Promise<LangiumDocument[]> {
-    // Access services
-    const langiumDocuments = services.shared.workspace.LangiumDocuments;
-    const documentBuilder = services.shared.workspace.DocumentBuilder;
+    const uris = extractUris(services, fsPaths);
+    return buildDocuments(services, uris);
+};
 
-    // Build documents
+/**
+ * Processes the given paths and returns the corresponding URIs. Exits the process if the paths are invalid.
+ */
+export const extractUris = (services: Pick<LangiumServices, 'LanguageMetaData'>, fsPaths: string[]): URI[] => {
     const uris = processPaths(services, fsPaths);
     if (uris.isErr) {
         console.error(chalk.red(uris.error.message));
         process.exit(uris.error.code);
     }
 
-    const documents = await Promise.all(uris.value.map((uri) => langiumDocuments.getOrCreateDocument(uri)));
-    await documentBuilder.build(documents, { validation: true });
-    return documents;
+    return uris.value;
+};
+
+/**
+ * Builds the documents with the given URIs. All of them are loaded and linked, since they may reference each other,
+ * but only the documents in `urisToValidate` are validated.
+ *
+ * @returns The validated documents in the order of `uris`.
+ */
+export const buildDocuments = async function (
+    services: LangiumServices,
+    uris: URI[],
+    urisToValidate: URI[] = uris,
+): Promise<LangiumDocument[]> {
+    // Access services
+    const langiumDocuments = services.shared.workspace.LangiumDocuments;
+    const documentBuilder = services.shared.workspace.DocumentBuilder;
+
+    // Build documents
+    const documents = await Promise.all(uris.map((uri) => langiumDocuments.getOrCreateDocument(uri)));
+    const validatedUris = new Set(urisToValidate.map((it) => it.toString()));
+    const documentsToValidate = documents.filter((it) => validatedUris.has(it.uri.toString()));
+
+    if (documentsToValidate.length === documents.length) {
+        await documentBuilder.build(documents, { validation: true });
+    } else {
+        await documentBuilder.build(documents, { validation: false });
+        await documentBuilder.build(documentsToValidate, { validation: true });
+    }
+
+    return documentsToValidate;
 };
 
 /**
@@ -36,7 +67,10 @@ export const extractDocuments = async function (
  *
  * @returns The URIs of the matched files.
  */
-export const processPaths = (services: LangiumServices, fsPaths: string[]): Result<URI[], ProcessPathsError> => {
+export const processPaths = (
+    services: Pick<LangiumServices, 'LanguageMetaData'>,
+    fsPaths: string[],
+): Result<URI[], ProcessPathsError> => {
     // Safe-DS file extensions
     const extensions = services.LanguageMetaData.fileExtensions;
     const pattern = `**/*{${extensions.join(',')}}`;
@@ -12,6 +12,57 @@ export const makeParentDirectoriesSync = (fsPath: string) => {
     }
 };
 
+/**
+ * Writes the given files asynchronously. At most `batchSize` files are written at the same time. Files whose content
+ * would not change are not written again, so their modification time stays stable.
+ */
+export const writeFilesInBatches = async (files: FileToWrite[], batchSize: number = 64): Promise<void> => {
+    for (let i = 0; i < files.length; i += batchSize) {
+        const batch = files.slice(i, i + batchSize);
+        await Promise.all(
+            batch.map(async (file) => {
+                const fsPath = URI.parse(file.uri).fsPath;
+                if (await hasContent(fsPath, file.text)) {
+                    return;
+                }
+
+                await fs.promises.mkdir(path.dirname(fsPath), { recursive: true });
+                await fs.promises.writeFile(fsPath, file.text);
+            }),
+        );
+    }
+};
+
+const hasContent = async (fsPath: string, text: string): Promise<boolean> => {
+    try {
+        return (await fs.promises.readFile(fsPath, 'utf-8')) === text;
+    } catch {
+        return false;
+    }
+};
+
+/**
+ * Deletes the files with the given URIs asynchronously. Files that do not exist are ignored.
+ */
+export const deleteFiles = async (uris: string[]): Promise<void> => {
+    await Promise.all(uris.map((uri) => fs.promises.rm(URI.parse(uri).fsPath, { force: true })));
+};
+
+/**
+ * A file that should be written to disk.
+ */
+export interface FileToWrite {
+    /**
+     * The URI of the file.
+     */
+    uri: string;
+
+    /**
+     * The content of the file.
+     */
+    text: string;
+}
+
 /**
  * Converts the given URI to a path relative to the current working directory.
  */
@@ -0,0 +1,127 @@
+import crypto from 'node:crypto';
+import fs from 'node:fs';
+import { createRequire } from 'node:module';
+import path from 'node:path';
+import { fileURLToPath } from 'node:url';
+import { LangiumDocument, LangiumDocuments } from 'langium';
+
+/**
+ * The name of the build manifest in the output directory of the `generate` command.
+ */
+export const MANIFEST_FILE_NAME = '.safe-ds-manifest.json';
+
+/**
+ * Must be increased whenever the format of the build manifest changes.
+ */
+const MANIFEST_FORMAT_VERSION = 1;
+
+/**
+ * Reads the build manifest from the given output directory. If it does not exist, is invalid, or was created with a
+ * different configuration, an empty manifest is returned, so all documents get generated again.
+ */
+export const readManifest = (outputDirectory: string, configuration: string): BuildManifest => {
+    const emptyManifest: BuildManifest = { formatVersion: MANIFEST_FORMAT_VERSION, configuration, documents: {} };
+
+    const manifestPath = path.join(outputDirectory, MANIFEST_FILE_NAME);
+    if (!fs.existsSync(manifestPath)) {
+        return emptyManifest;
+    }
+
+    try {
+        const manifest = JSON.parse(fs.readFileSync(manifestPath, 'utf-8'));
+        if (manifest.formatVersion !== MANIFEST_FORMAT_VERSION || manifest.configuration !== configuration) {
+            return emptyManifest;
+        }
+        return manifest;
+    } /* c8 ignore start */ catch {
+        return emptyManifest;
+    } /* c8 ignore stop */
+};
+
+/**
+ * Writes the build manifest to the given output directory.
+ */
+export const writeManifest = async (outputDirectory: string, manifest: BuildManifest): Promise<void> => {
+    await fs.promises.mkdir(outputDirectory, { recursive: true });
+    await fs.promises.writeFile(path.join(outputDirectory, MANIFEST_FILE_NAME), JSON.stringify(manifest, null, 4));
+};
+
+/**
+ * Returns a key for everything besides the source documents that affects the generated code. This includes the version
+ * of the CLI, which is released together with the language package and, thus, also covers the builtin files.
+ */
+export const createConfigurationKey = (options: object): string => {
+    const packagePath = fileURLToPath(new URL('../../package.json', import.meta.url));
+    const require = createRequire(import.meta.url);
+    return JSON.stringify({ version: require(packagePath).version, options });
+};
+
+/**
+ * Computes a hash of the given document and of all source documents it references transitively. Documents that are
+ * not in `sourceUris`, like the builtin files, are covered by the configuration key instead.
+ */
+export const computeSourceHash = (
+    langiumDocuments: LangiumDocuments,
+    document: LangiumDocument,
+    sourceUris: Set<string>,
+): string => {
+    const visited = new Map<string, LangiumDocument>([[document.uri.toString(), document]]);
+    const queue = [document];
+
+    while (queue.length > 0) {
+        const current = queue.pop()!;
+
+        for (const reference of current.references) {
+            const targetUri = reference.$nodeDescription?.documentUri;
+            if (!targetUri || visited.has(targetUri.toString()) || !sourceUris.has(targetUri.toString())) {
+                continue;
+            }
+
+            const target = langiumDocuments.getDocument(targetUri);
+            if (target) {
+                visited.set(targetUri.toString(), target);
+                queue.push(target);
+            }
+        }
+    }
+
+    const hash = crypto.createHash('sha256');
+    for (const uri of Array.from(visited.keys()).sort()) {
+        hash.update(`${uri}\0`);
+        hash.update(visited.get(uri)!.textDocument.getText());
+        hash.update('\0');
+    }
+    return hash.digest('hex');
+};
+
+/**
+ * Records which files were generated for which source documents, so unchanged documents can be skipped.
+ */
+export interface BuildManifest {
+    readonly formatVersion: number;
+
+    /**
+     * The key that was returned by `createConfigurationKey` when the manifest was created.
+     */
+    readonly configuration: string;
+
+    /**
+     * Maps URIs of source documents to their entries.
+     */
+    readonly documents: Record<string, ManifestEntry>;
+}
+
+/**
+ * The entry of a single source document in the build manifest.
+ */
+export interface ManifestEntry {
+    /**
+     * The hash that was returned by `computeSourceHash` when the files were generated.
+     */
+    readonly hash: string;
+
+    /**
+     * The URIs of the files that were generated for the document.
+     */
+    readonly outputs: string[];
+}
@@ -0,0 +1,139 @@
+import chalk from 'chalk';
+import { DocumentState, LangiumDocument, URI } from 'langium';
+import { type LangiumServices } from 'langium/lsp';
+import fs from 'node:fs';
+import path from 'node:path';
+
+/**
+ * How long to wait for further changes before rebuilding, in milliseconds. Editors often emit several events when
+ * saving a single file.
+ */
+const WATCH_DEBOUNCE_MS = 100;
+
+/**
+ * Watches the given paths for changes of Safe-DS files. Changed and deleted files are passed to
+ * `DocumentBuilder.update`, which rebuilds them and all documents that depend on them. Afterward, `onUpdate` is called
+ * with the watched documents that were validated again and with the URIs of the deleted documents.
+ *
+ * The documents at the given paths must already be built.
+ */
+export const watchPaths = (
+    services: LangiumServices,
+    fsPaths: string[],
+    onUpdate: (documents: LangiumDocument[], deleted: URI[]) => Promise<void> | void,
+): void => {
+    // Access services
+    const documentBuilder = services.shared.workspace.DocumentBuilder;
+    const langiumDocuments = services.shared.workspace.LangiumDocuments;
+    const extensions = services.LanguageMetaData.fileExtensions;
+
+    // Rebuilds should report the same diagnostics as the initial build
+    documentBuilder.updateBuildOptions.validation = true;
+
+    const watchedPaths = fsPaths.map((it) => path.resolve(it));
+    const isWatched = (uri: URI) => {
+        return watchedPaths.some((it) => {
+            const relativePath = path.relative(it, uri.fsPath);
+            return !relativePath.startsWith('..') && !path.isAbsolute(relativePath);
+        });
+    };
+
+    const validatedDocuments: LangiumDocument[] = [];
+    documentBuilder.onDocumentPhase(DocumentState.Validated, (document) => {
+        if (isWatched(document.uri)) {
+            validatedDocuments.push(document);
+        }
+    });
+
+    // Updates are processed one after another
+    const pendingPaths = new Set<string>();
+    let timeout: NodeJS.Timeout | undefined = undefined;
+    let currentUpdate = Promise.resolve();
+
+    const update = async () => {
+        const changedPaths = Array.from(pendingPaths);
+        pendingPaths.clear();
+
+        const changed = changedPaths.filter((it) => fs.existsSync(it)).map((it) => URI.file(it));
+        const deleted = changedPaths
+            .filter((it) => !fs.existsSync(it))
+            .map((it) => URI.file(it))
+            .filter((it) => langiumDocuments.hasDocument(it));
+
+        await documentBuilder.update(changed, deleted);
+        await onUpdate(validatedDocuments.splice(0), deleted);
+    };
+
+    const onFileChange = (fsPath: string) => {
+        if (!extensions.includes(path.extname(fsPath))) {
+            return;
+        }
+
+        pendingPaths.add(path.resolve(fsPath));
+        clearTimeout(timeout);
+        timeout = setTimeout(() => {
+            currentUpdate = currentUpdate.then(update).catch((error) => console.error(chalk.red(String(error))));
+        }, WATCH_DEBOUNCE_MS);
+    };
+
+    for (const watchedPath of watchedPaths) {
+        if (fs.statSync(watchedPath).isDirectory()) {
+            watchDirectory(watchedPath, onFileChange);
+        } else {
+            fs.watch(watchedPath, () => onFileChange(watchedPath));
+        }
+    }
+};
+
+/**
+ * Watches a directory and all its subdirectories. Recursive watchers are not available on Linux before Node 20, so we
+ * fall back to one watcher per directory there. Directories that are created later get watched as well.
+ */
+const watchDirectory = (directoryPath: string, onFileChange: (fsPath: string) => void): void => {
+    try {
+        fs.watch(directoryPath, { recursive: true }, (_event, fileName) => {
+            if (fileName) {
+                onFileChange(path.join(directoryPath, fileName));
+            }
+        });
+    } catch (error) {
+        if ((error as NodeJS.ErrnoException).code !== 'ERR_FEATURE_UNAVAILABLE_ON_PLATFORM') {
+            throw error;
+        }
+
+        watchDirectoryTree(directoryPath, onFileChange, new Set());
+    }
+};
+
+const watchDirectoryTree = (
+    directoryPath: string,
+    onFileChange: (fsPath: string) => void,
+    watchedDirectories: Set<string>,
+): void => {
+    if (watchedDirectories.has(directoryPath)) {
+        return;
+    }
+    watchedDirectories.add(directoryPath);
+
+    const watcher = fs.watch(directoryPath, (_event, fileName) => {
+        if (!fileName) {
+            return;
+        }
+
+        const fsPath = path.join(directoryPath, fileName);
+        if (fs.existsSync(fsPath) && fs.statSync(fsPath).isDirectory()) {
+            watchDirectoryTree(fsPath, onFileChange, watchedDirectories);
+        } else {
+            onFileChange(fsPath);
+        }
+    });
+    // Watchers of deleted directories fail, but the directory is no longer relevant then
+    watcher.on('error', () => watcher.close());
+    watcher.on('close', () => watchedDirectories.delete(directoryPath));
+
+    for (const entry of fs.readdirSync(directoryPath, { withFileTypes: true })) {
+        if (entry.isDirectory()) {
+            watchDirectoryTree(path.join(directoryPath, entry.name), onFileChange, watchedDirectories);
+        }
+    }
+};
@@ -0,0 +1,89 @@
+import { URI } from 'langium';
+import { Worker } from 'node:worker_threads';
+import type { CheckOptions } from '../cli/check.js';
+import type { GenerateOptions } from '../cli/generate.js';
+import type { BuildManifest } from './manifest.js';
+
+/**
+ * Processes the documents with the given URIs in `jobs` worker threads. Every worker loads and links all documents,
+ * since they may reference each other, but only validates and generates code for its own shard of them.
+ *
+ * @returns The results of all workers in the order of `uris`.
+ */
+export const runInWorkers = async <R extends WorkerResult>(
+    task: WorkerTask,
+    uris: URI[],
+    jobs: number,
+): Promise<R[]> => {
+    const allUris = uris.map((it) => it.toString());
+    const shards = createShards(allUris, jobs);
+
+    const results = await Promise.all(shards.map((shard) => runWorker<R>({ ...task, uris: allUris, shard })));
+    const resultsByUri = new Map(results.flat().map((it) => [it.uri, it]));
+    return allUris.map((uri) => resultsByUri.get(uri)!);
+};
+
+/**
+ * Distributes the items round-robin to at most `count` non-empty shards. Since the items are sorted by path, this
+ * spreads the files of large directories across all shards.
+ */
+export const createShards = <T>(items: T[], count: number): T[][] => {
+    const shards: T[][] = Array.from({ length: Math.min(count, items.length) }, () => []);
+    items.forEach((item, index) => shards[index % shards.length]!.push(item));
+    return shards;
+};
+
+const runWorker = <R extends WorkerResult>(input: WorkerInput): Promise<R[]> => {
+    return new Promise((resolve, reject) => {
+        const worker = new Worker(new URL('../cli/worker.js', import.meta.url), { workerData: input });
+        worker.once('message', resolve);
+        worker.once('error', reject);
+        worker.once('exit', (code) => {
+            // Settling an already settled promise has no effect, so this only matters if no result was posted
+            if (code !== 0) {
+                reject(new Error(`Worker stopped with exit code ${code}.`));
+            } else {
+                reject(new Error('Worker stopped without posting a result.'));
+            }
+        });
+    });
+};
+
+/**
+ * The command that a worker should execute.
+ */
+export type WorkerTask =
+    | {
+          command: 'check';
+          options: CheckOptions;
+      }
+    | {
+          command: 'generate';
+          options: GenerateOptions;
+          manifest: BuildManifest;
+      };
+
+/**
+ * The data that is passed to a worker.
+ */
+export type WorkerInput = WorkerTask & {
+    /**
+     * The URIs of all documents that should be loaded.
+     */
+    uris: string[];
+
+    /**
+     * The URIs of the documents that the worker should process.
+     */
+    shard: string[];
+};
+
+/**
+ * The result of a worker for a single document.
+ */
+export interface WorkerResult {
+    /**
+     * The URI of the document.
+     */
+    uri: string;
+}
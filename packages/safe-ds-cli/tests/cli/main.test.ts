@@ -1,5 +1,7 @@
-import { execSync, spawnSync } from 'node:child_process';
+import { ChildProcess, execSync, spawn, spawnSync } from 'node:child_process';
 import fs from 'node:fs';
+import os from 'node:os';
+import path from 'node:path';
 import { fileURLToPath } from 'url';
 import { afterAll, beforeAll, describe, expect, it } from 'vitest';
 import { ExitCode } from '../../src/cli/exitCode.js';
@@ -74,6 +76,35 @@ describe('safe-ds', () => {
             expect(process.status).toBe(ExitCode.Success);
         });
 
+        it('should show the same diagnostics in the same order if the --jobs option is passed', () => {
+            const sequentialProcess = spawnCheckProcess([], ['.']);
+            const parallelProcess = spawnCheckProcess(['-j', '3'], ['.']);
+            expect(parallelProcess.stdout.toString()).toStrictEqual(sequentialProcess.stdout.toString());
+            expect(parallelProcess.status).toBe(ExitCode.FileHasErrors);
+        });
+
+        it('should show an error if the --jobs option is not a positive integer', () => {
+            const process = spawnCheckProcess(['-j', '0'], ['correct.sdsdev']);
+            expect(process.stderr.toString()).toContain('Must be a positive integer.');
+            expect(process.status).not.toBe(ExitCode.Success);
+        });
+
+        it('should check changed files again if the --watch option is passed', async () => {
+            const sourceDirectory = fs.mkdtempSync(path.join(os.tmpdir(), 'safe-ds-'));
+            const sourceFile = path.join(sourceDirectory, 'watched.sds');
+            fs.writeFileSync(sourceFile, 'package watched\n\npipeline myPipeline {}\n');
+
+            const process = spawn('node', ['./bin/cli', 'check', '--watch', sourceDirectory], { cwd: projectRoot });
+            try {
+                await waitForOutput(process, 'Watching for file changes...');
+                fs.writeFileSync(sourceFile, 'package watched\n\npipeline myPipeline { Unresolved(); }\n');
+                await waitForOutput(process, "Could not find a declaration named 'Unresolved' in this context.");
+            } finally {
+                process.kill();
+                fs.rmSync(sourceDirectory, { recursive: true, force: true });
+            }
+        }, 30_000);
+
         it('should treat warnings as errors in strict mode', () => {
             const process = spawnCheckProcess(['-s'], ['contains warnings.sdsdev']);
             expect(process.stderr.toString()).toMatch(/Found \d+ errors?\./u);
@@ -244,6 +275,37 @@ describe('safe-ds', () => {
             expect(process.status).toBe(ExitCode.Success);
         });
 
+        it('should not rewrite generated files if nothing changed', () => {
+            const generatedFile = new URL('test/gen_correct.py', `${out}/`);
+
+            spawnGenerateProcess([], ['correct.sdsdev']);
+            const modificationTime = fs.statSync(generatedFile).mtimeMs;
+
+            const process = spawnGenerateProcess([], ['correct.sdsdev']);
+            expect(process.status).toBe(ExitCode.Success);
+            expect(fs.statSync(generatedFile).mtimeMs).toBe(modificationTime);
+        });
+
+        it('should delete generated files of deleted documents', () => {
+            const sourceDirectory = fs.mkdtempSync(path.join(os.tmpdir(), 'safe-ds-'));
+            const sourceFile = path.join(sourceDirectory, 'deleted.sds');
+            const outputDirectory = path.join(sourceDirectory, 'generated');
+            const generatedFile = path.join(outputDirectory, 'deleted', 'gen_deleted.py');
+
+            try {
+                fs.writeFileSync(sourceFile, 'package deleted\n\npipeline myPipeline {}\n');
+                spawnSync('node', ['./bin/cli', 'generate', '-o', outputDirectory, sourceFile], { cwd: projectRoot });
+                expect(fs.existsSync(generatedFile)).toBeTruthy();
+
+                fs.rmSync(sourceFile);
+                const process = spawnGenerateProcess(['-o', outputDirectory], ['correct.sdsdev']);
+                expect(process.status).toBe(ExitCode.Success);
+                expect(fs.existsSync(generatedFile)).toBeFalsy();
+            } finally {
+                fs.rmSync(sourceDirectory, { recursive: true, force: true });
+            }
+        });
+
         it('should show an error if the file does not exist', () => {
             const process = spawnGenerateProcess([], ['missing.sdsdev']);
             expect(process.stderr.toString()).toMatch(/Path .* does not exist./u);
@@ -256,6 +318,12 @@ describe('safe-ds', () => {
             expect(process.status).toBe(ExitCode.FileWithoutSafeDsExtension);
         });
 
+        it('should generate Python code in parallel if the --jobs option is passed', () => {
+            const process = spawnGenerateProcess(['-j', '2'], ['correct.sdsdev', 'references builtins.sdsdev']);
+            expect(process.stdout.toString()).toContain('Python code generated successfully.');
+            expect(process.status).toBe(ExitCode.Success);
+        });
+
         it('should show an error if a Safe-DS file has errors', () => {
             const process = spawnGenerateProcess([], ['.']);
             expect(process.stderr.toString()).toContain(
@@ -265,3 +333,19 @@ describe('safe-ds', () => {
         });
     });
 });
+
+const waitForOutput = (process: ChildProcess, text: string): Promise<void> => {
+    return new Promise((resolve) => {
+        let output = '';
+        const onData = (data: Buffer) => {
+            output += data.toString();
+            if (output.includes(text)) {
+                process.stdout?.off('data', onData);
+                process.stderr?.off('data', onData);
+                resolve();
+            }
+        };
+        process.stdout?.on('data', onData);
+        process.stderr?.on('data', onData);
+    });
+};
@@ -1 +1,7 @@
 export const imageWidthToHeightRatio = 1 + 1 / 3;
+
+// Number of table rows that are requested from the runner at once
+export const tablePageSize = 200;
+
+// Columns with at most this many distinct values can be filtered by a specific value
+export const maxSpecificValueFilterCount = 5;
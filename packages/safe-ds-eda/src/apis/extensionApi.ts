@@ -1,5 +1,5 @@
 import { get } from 'svelte/store';
-import type { HistoryEntry } from '../../types/state';
+import type { HistoryEntry, TableRowSource } from '../../types/state';
 import { profilingLoading, table, history } from '../webviewState';
 import type { ExecuteRunnerAllEntry } from '../../types/messaging';
 import { filterHistoryOnlyInternal } from '../filterHistory';
@@ -103,6 +103,13 @@ export const executeRunner = function (state: HistoryEntry[], entry: HistoryEntr
     }
 };
 
+export const requestTableRows = function (rowSource: TableRowSource, begin: number, size: number) {
+    window.injVscode.postMessage({
+        command: 'getTableRows',
+        value: { rowSource, begin, size },
+    });
+};
+
 export const refreshProfiling = function (historyId: number) {
     profilingLoading.set(true);
 
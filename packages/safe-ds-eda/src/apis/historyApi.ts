@@ -733,11 +733,8 @@ const deployResult = function (
                 ...state,
                 columns: updatedColumns,
                 totalRows: initialTable?.totalRows ?? 0,
-                visibleRows:
-                    updatedColumns.reduce((acc, column) => {
-                        if (column.values.length > acc) return column.values.length;
-                        return acc;
-                    }, 0) ?? 0,
+                visibleRows: resultContent.content.visibleRows ?? 0,
+                rowSource: resultContent.content.rowSource,
             };
         });
 
@@ -0,0 +1,127 @@
+import { writable } from 'svelte/store';
+import type { Table, TableRows, TableRowSource } from '../types/state';
+import { tablePageSize } from '../consts.config';
+import { requestTableRows } from './apis/extensionApi';
+
+// Number of pages that are kept, so memory stays bounded for tables of any size
+const maxCachedPages = 20;
+
+// Number of pages before and after the visible rows that are loaded in advance
+const prefetchedPages = 1;
+
+let currentSourceKey: string | undefined;
+let currentSource: TableRowSource | undefined;
+let currentRowCount = 0;
+
+// Rows by page index, the least recently used page comes first
+const pages = new Map<number, { [columnName: string]: any[] }>();
+const requestedPages = new Set<number>();
+
+const loadedRowsKey = writable<number>(0); // Changes whenever rows were loaded
+
+const sourceKey = function (rowSource: TableRowSource): string {
+    return `${rowSource.pipelineExecutionId}/${rowSource.placeholderName}`;
+};
+
+/**
+ * Switches the cache to the rows of the given table, unless it already holds them. The rows that were sent along with
+ * the table become the first page.
+ */
+const useTableRows = function (table: Table): void {
+    if (!table.rowSource) {
+        currentSourceKey = undefined;
+        currentSource = undefined;
+        pages.clear();
+        requestedPages.clear();
+        return;
+    }
+
+    const key = sourceKey(table.rowSource);
+    if (key === currentSourceKey) {
+        return;
+    }
+
+    currentSourceKey = key;
+    currentSource = table.rowSource;
+    currentRowCount = table.visibleRows ?? table.totalRows;
+    pages.clear();
+    requestedPages.clear();
+
+    const firstPage: { [columnName: string]: any[] } = {};
+    for (const column of table.columns) {
+        firstPage[column.name] = column.values;
+    }
+    pages.set(0, firstPage);
+};
+
+/**
+ * Returns the value of a cell or `undefined` if its row is not loaded.
+ */
+const getCellValue = function (columnName: string, rowIndex: number): any {
+    const page = pages.get(Math.floor(rowIndex / tablePageSize));
+    return page?.[columnName]?.[rowIndex % tablePageSize];
+};
+
+/**
+ * Returns whether the row is loaded.
+ */
+const isRowLoaded = function (rowIndex: number): boolean {
+    return pages.has(Math.floor(rowIndex / tablePageSize));
+};
+
+/**
+ * Requests all pages that overlap the visible rows, as well as the adjacent pages, if they are not loaded yet. Visible
+ * pages are marked as recently used, so they are evicted last.
+ */
+const loadRows = function (visibleStart: number, visibleEnd: number): void {
+    if (!currentSource || currentRowCount === 0) return;
+
+    const lastPage = Math.floor((currentRowCount - 1) / tablePageSize);
+    const firstVisiblePage = Math.floor(visibleStart / tablePageSize);
+    const lastVisiblePage = Math.min(Math.floor(Math.max(visibleEnd - 1, 0) / tablePageSize), lastPage);
+
+    for (let pageIndex = firstVisiblePage; pageIndex <= lastVisiblePage; pageIndex++) {
+        touchPage(pageIndex);
+    }
+
+    const from = Math.max(0, firstVisiblePage - prefetchedPages);
+    const to = Math.min(lastPage, lastVisiblePage + prefetchedPages);
+    for (let pageIndex = from; pageIndex <= to; pageIndex++) {
+        if (!pages.has(pageIndex) && !requestedPages.has(pageIndex)) {
+            requestedPages.add(pageIndex);
+            requestTableRows(currentSource, pageIndex * tablePageSize, tablePageSize);
+        }
+    }
+};
+
+/**
+ * Stores rows that were sent by the extension. Rows of tables that are no longer shown are ignored. Pages that could
+ * not be loaded are requested again once they become visible.
+ */
+const addTableRows = function (rows: TableRows): void {
+    if (sourceKey(rows.rowSource) !== currentSourceKey) return;
+
+    const pageIndex = Math.floor(rows.begin / tablePageSize);
+    requestedPages.delete(pageIndex);
+    if (!rows.columns) return;
+
+    pages.set(pageIndex, rows.columns);
+
+    // Evict the least recently used pages, but always keep the first one, since the table holds it anyway
+    for (const evictedPageIndex of pages.keys()) {
+        if (pages.size <= maxCachedPages) break;
+        if (evictedPageIndex !== 0) pages.delete(evictedPageIndex);
+    }
+
+    loadedRowsKey.update((key) => key + 1);
+};
+
+const touchPage = function (pageIndex: number): void {
+    const page = pages.get(pageIndex);
+    if (page) {
+        pages.delete(pageIndex);
+        pages.set(pageIndex, page);
+    }
+};
+
+export { useTableRows, getCellValue, isRowLoaded, loadRows, addTableRows, loadedRowsKey };
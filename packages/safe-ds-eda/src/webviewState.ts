@@ -2,6 +2,8 @@ import type { FromExtensionMessage } from '../types/messaging';
 import type { HistoryEntry, PossibleColumnFilter, Profiling, Tab, Table } from '../types/state';
 import { get, writable } from 'svelte/store';
 import { filterHistoryOnlyProfilingInvalidating } from './filterHistory';
+import { addTableRows } from './tableRows';
+import { maxSpecificValueFilterCount } from '../consts.config';
 // import { filterHistoryOnlyProfilingInvalidating } from './filterHistory';
 
 const tabs = writable<Tab[]>([]);
@@ -48,6 +50,9 @@ window.addEventListener('message', (event) => {
                 throw new Error('setInitialTable called more than once');
             }
             break;
+        case 'setTableRows':
+            addTableRows(message.value);
+            break;
         case 'setProfiling':
             if (message.historyId !== undefined) {
                 setProfiling(message.value);
@@ -160,18 +165,16 @@ const getPosiibleColumnFilters = function (columnIndex: number): PossibleColumnF
 
     const possibleColumnFiltersHere: PossibleColumnFilter[] = [];
 
-    const distinctValues: string[] = [];
-    for (const value of column.values) {
-        if (!distinctValues.includes(value)) {
-            distinctValues.push(value);
-        }
-        if (distinctValues.length > 5) {
-            break;
-        }
-    }
+    // Only the first rows are loaded, so the extension sends the statistics of the whole column. Filters that depend on
+    // them are not offered while they are missing.
+    const distinctValueCount = column.distinctValueCount;
+    const distinctValues =
+        distinctValueCount !== undefined && distinctValueCount <= maxSpecificValueFilterCount
+            ? column.distinctValues
+            : undefined;
 
     if (column.type === 'categorical') {
-        if (distinctValues.length <= 5) {
+        if (distinctValues) {
             possibleColumnFiltersHere.push({
                 type: 'specificValue',
                 values: ['-'].concat(distinctValues),
@@ -182,27 +185,23 @@ const getPosiibleColumnFilters = function (columnIndex: number): PossibleColumnF
             });
         }
     } else {
-        if (distinctValues.length <= 5) {
+        if (distinctValues) {
             possibleColumnFiltersHere.push({
                 type: 'specificValue',
                 values: ['-'].concat(distinctValues),
             });
         }
 
-        if (distinctValues.length >= 4) {
-            const colMax = column.values.reduce(
-                (acc: number, val: number) => Math.max(acc, val),
-                Number.NEGATIVE_INFINITY,
-            );
-            const colMin = column.values.reduce(
-                (acc: number, val: number) => Math.min(acc, val),
-                Number.POSITIVE_INFINITY,
-            );
-
+        if (
+            distinctValueCount !== undefined &&
+            distinctValueCount >= 4 &&
+            column.min !== undefined &&
+            column.max !== undefined
+        ) {
             possibleColumnFiltersHere.push({
                 type: 'valueRange',
-                min: colMin,
-                max: colMax,
+                min: column.min,
+                max: column.max,
             });
         }
     }
@@ -9,7 +9,8 @@ type ToExtensionCommand =
     | 'executeRunner'
     | 'executeRunnerAll'
     | 'executeRunnerAllFuture'
-    | 'refreshProfiling';
+    | 'refreshProfiling'
+    | 'getTableRows';
 
 interface ToExtensionCommandMessage {
     command: ToExtensionCommand;
@@ -70,6 +71,15 @@ export interface ToExtensionRefreshProfilingMessage extends ToExtensionCommandMe
     };
 }
 
+export interface ToExtensionGetTableRowsMessage extends ToExtensionCommandMessage {
+    command: 'getTableRows';
+    value: {
+        rowSource: defaultTypes.TableRowSource;
+        begin: number;
+        size: number;
+    };
+}
+
 interface ToExtensionExecuteAllRunnerMessage extends ToExtensionCommandMessage {
     command: 'executeRunnerAll';
     value: { entries: ExecuteRunnerAllEntry[]; jumpedToHistoryId: number };
@@ -82,7 +92,8 @@ export type ToExtensionMessage =
     | ToExtensionExecuteRunnerExcludingHiddenColumnsMessage
     | ToExtensionExecuteAllRunnerMessage
     | ToExtensionExecuteAllFutureRunnerMessage
-    | ToExtensionRefreshProfilingMessage;
+    | ToExtensionRefreshProfilingMessage
+    | ToExtensionGetTableRowsMessage;
 
 // From extension
 type FromExtensionCommand =
@@ -90,7 +101,8 @@ type FromExtensionCommand =
     | 'setProfiling'
     | 'runnerExecutionResult'
     | 'multipleRunnerExecutionResult'
-    | 'cancelRunnerExecution';
+    | 'cancelRunnerExecution'
+    | 'setTableRows';
 
 interface FromExtensionCommandMessage {
     command: FromExtensionCommand;
@@ -146,9 +158,15 @@ export interface CancelRunnerExecutionMessage extends FromExtensionCommandMessag
     value: defaultTypes.HistoryEntry;
 }
 
+export interface FromExtensionSetTableRowsMessage extends FromExtensionCommandMessage {
+    command: 'setTableRows';
+    value: defaultTypes.TableRows;
+}
+
 export type FromExtensionMessage =
     | FromExtensionSetInitialTableMessage
     | FromExtensionSetProfilingMessage
     | RunnerExecutionResultMessage
     | CancelRunnerExecutionMessage
-    | MultipleRunnerExecutionResultMessage;
+    | MultipleRunnerExecutionResultMessage
+    | FromExtensionSetTableRowsMessage;
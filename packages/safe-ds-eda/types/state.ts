@@ -234,6 +234,25 @@ export interface Table {
     visibleRows?: number;
     totalRows: number;
     appliedFilters: TableFilter;
+    rowSource?: TableRowSource;
+}
+
+/**
+ * Identifies the placeholder in a pipeline execution that further rows of a table can be requested from.
+ */
+export interface TableRowSource {
+    pipelineExecutionId: string;
+    placeholderName: string;
+}
+
+/**
+ * A window of rows of a table. Rows are stored by column, starting at index `begin` of the table. The columns are
+ * `undefined` if the rows could not be loaded.
+ */
+export interface TableRows {
+    rowSource: TableRowSource;
+    begin: number;
+    columns: { [columnName: string]: any[] } | undefined;
 }
 
 // ------------ Types for the Profiling -----------
@@ -276,17 +295,21 @@ export type PossibleSorts = 'asc' | 'desc';
 interface ColumnBase {
     type: 'numerical' | 'categorical';
     name: string;
-    values: any;
+    values: any; // Only the first rows of the table, further rows are loaded when they become visible
     hidden: boolean;
     highlighted: boolean;
     appliedSort: PossibleSorts | null;
     profiling?: Profiling;
+    distinctValueCount?: number; // Of the whole table, computed by the runner
+    distinctValues?: any[]; // Of the whole table, only sent for at most `maxSpecificValueFilterCount` values
 }
 
 export interface NumericalColumn extends ColumnBase {
     type: 'numerical';
     appliedFilters: NumericalFilter[];
     coloredHighLow: boolean;
+    min?: number;
+    max?: number;
 }
 
 export interface CategoricalColumn extends ColumnBase {
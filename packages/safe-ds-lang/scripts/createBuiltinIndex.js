@@ -0,0 +1,16 @@
+// Creates the serialized index of the builtin files in `lib/resources`. Must run after the package was compiled.
+
+import { NodeFileSystem } from 'langium/node';
+// eslint-disable-next-line import/no-unresolved
+import { createSafeDsServices } from '../lib/language/safe-ds-module.js';
+import {
+    deleteBuiltinIndexSnapshot,
+    writeBuiltinIndexSnapshot,
+    // eslint-disable-next-line import/no-unresolved
+} from '../lib/language/workspace/safe-ds-builtin-index.js';
+
+// An outdated index must not be used to create the new one
+deleteBuiltinIndexSnapshot();
+
+const { SafeDs } = await createSafeDsServices(NodeFileSystem);
+await writeBuiltinIndexSnapshot(SafeDs);
@@ -0,0 +1,72 @@
+/**
+ * A map with a maximum number of entries. If a new entry would exceed the maximum, the least recently used entry is
+ * removed. Both reading and writing an entry count as using it.
+ */
+export class LruCache<K, V> {
+    // Maps keep their insertion order, so the first key is always the least recently used one
+    private readonly entries = new Map<K, V>();
+
+    constructor(readonly maxSize: number) {
+        if (maxSize < 1) {
+            throw new RangeError('The maximum size of an LRU cache must be at least 1.');
+        }
+    }
+
+    /**
+     * The number of entries in the cache.
+     */
+    get size(): number {
+        return this.entries.size;
+    }
+
+    /**
+     * Returns the value for the given key or `undefined` if there is none. The entry is marked as recently used.
+     */
+    get(key: K): V | undefined {
+        if (!this.entries.has(key)) {
+            return undefined;
+        }
+
+        const value = this.entries.get(key)!;
+        this.entries.delete(key);
+        this.entries.set(key, value);
+        return value;
+    }
+
+    /**
+     * Returns whether the cache has an entry for the given key. The entry is not marked as recently used.
+     */
+    has(key: K): boolean {
+        return this.entries.has(key);
+    }
+
+    /**
+     * Sets the value for the given key and marks the entry as recently used. If the cache is full afterward, the least
+     * recently used entry is removed.
+     */
+    set(key: K, value: V): this {
+        this.entries.delete(key);
+        this.entries.set(key, value);
+
+        if (this.entries.size > this.maxSize) {
+            const leastRecentlyUsedKey = this.entries.keys().next().value as K;
+            this.entries.delete(leastRecentlyUsedKey);
+        }
+
+        return this;
+    }
+
+    /**
+     * Removes the entry for the given key. Returns whether there was such an entry.
+     */
+    delete(key: K): boolean {
+        return this.entries.delete(key);
+    }
+
+    /**
+     * Removes all entries.
+     */
+    clear(): void {
+        this.entries.clear();
+    }
+}
@@ -1,22 +1,21 @@
 import { SafeDsServices } from '../safe-ds-module.js';
 import { isSdsModule, SdsModuleMember } from '../generated/ast.js';
-import { LangiumDocuments, URI, WorkspaceCache } from 'langium';
+import { LangiumDocuments, URI } from 'langium';
 import { getModuleMembers } from '../helpers/nodeProperties.js';
+import { DocumentDependentCache } from '../workspace/safe-ds-document-dependency-tracker.js';
 
 export abstract class SafeDsModuleMembers<T extends SdsModuleMember> {
     private readonly langiumDocuments: LangiumDocuments;
-    private readonly cache: WorkspaceCache<string, T>;
+    private readonly cache: DocumentDependentCache<string, T>;
 
     constructor(services: SafeDsServices) {
         this.langiumDocuments = services.shared.workspace.LangiumDocuments;
-        this.cache = new WorkspaceCache(services.shared);
+        this.cache = new DocumentDependentCache(services.workspace.DocumentDependencyTracker);
     }
 
     protected getModuleMember(uri: URI, name: string, predicate: (node: unknown) => node is T): T | undefined {
-        const key = `${uri.toString()}#${name}`;
-
-        if (this.cache.has(key)) {
-            return this.cache.get(key);
+        if (this.cache.has(uri, name)) {
+            return this.cache.get(uri, name);
         }
 
         const document = this.langiumDocuments.getDocument(uri);
@@ -37,7 +36,7 @@ export abstract class SafeDsModuleMembers<T extends SdsModuleMember> {
             return undefined;
         }
 
-        this.cache.set(key, firstMatchingModuleMember);
+        this.cache.set(uri, name, firstMatchingModuleMember);
         return firstMatchingModuleMember;
     }
 }
@@ -25,6 +25,11 @@ export interface RunnerStartedParams {
      * The port the runner is listening on.
      */
     port: number;
+
+    /**
+     * The version of the runner.
+     */
+    version?: string;
 }
 
 export namespace UpdateRunnerNotification {
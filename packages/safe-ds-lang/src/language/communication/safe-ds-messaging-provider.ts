@@ -250,7 +250,7 @@ export class SafeDsMessagingProvider {
         title: string,
         message?: string,
         cancellable: boolean = false,
-    ): Promise<WorkDoneProgressReporter> {
+    ): Promise<SafeDsProgressReporter> {
         if (this.userInteractionProvider?.showProgress) {
             return this.userInteractionProvider.showProgress(title, 0, message, cancellable);
         } /* c8 ignore start */ else if (this.connection) {
@@ -489,7 +489,14 @@ export interface SafeDsUserInteractionProvider {
         percentage?: number,
         message?: string,
         cancellable?: boolean,
-    ) => Thenable<WorkDoneProgressReporter>;
+    ) => Thenable<SafeDsProgressReporter>;
+}
+
+/**
+ * Reports the progress of a task. The token is cancelled once the user cancels a cancellable progress indicator.
+ */
+export interface SafeDsProgressReporter extends WorkDoneProgressReporter {
+    readonly token?: CancellationToken;
 }
 
 /**
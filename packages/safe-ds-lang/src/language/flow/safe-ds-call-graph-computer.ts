@@ -1,4 +1,4 @@
-import { AstNode, type AstNodeLocator, AstUtils, stream, WorkspaceCache } from 'langium';
+import { AstNode, type AstNodeLocator, AstUtils, stream } from 'langium';
 import {
     isSdsBlockLambda,
     isSdsCall,
@@ -37,6 +37,7 @@ import { SafeDsTypeComputer } from '../typing/safe-ds-type-computer.js';
 import { CallableType } from '../typing/model.js';
 import { isEmpty } from '../../helpers/collections.js';
 import { SafeDsPartialEvaluator } from '../partialEvaluation/safe-ds-partial-evaluator.js';
+import { DocumentDependentCache } from '../workspace/safe-ds-document-dependency-tracker.js';
 
 export class SafeDsCallGraphComputer {
     private readonly astNodeLocator: AstNodeLocator;
@@ -47,12 +48,12 @@ export class SafeDsCallGraphComputer {
     /**
      * Stores the calls inside the node with the given ID.
      */
-    private readonly callCache: WorkspaceCache<string, SdsCall[]>;
+    private readonly callCache: DocumentDependentCache<string, SdsCall[]>;
 
     /**
      * Stores the call graph for the callable with the given ID if it is called without substitutions.
      */
-    private readonly callGraphCache: WorkspaceCache<string, CallGraph>;
+    private readonly callGraphCache: DocumentDependentCache<string, CallGraph>;
 
     constructor(services: SafeDsServices) {
         this.astNodeLocator = services.workspace.AstNodeLocator;
@@ -60,8 +61,8 @@ export class SafeDsCallGraphComputer {
         this.partialEvaluator = services.evaluation.PartialEvaluator;
         this.typeComputer = services.typing.TypeComputer;
 
-        this.callCache = new WorkspaceCache(services.shared);
-        this.callGraphCache = new WorkspaceCache(services.shared);
+        this.callCache = new DocumentDependentCache(services.workspace.DocumentDependencyTracker);
+        this.callGraphCache = new DocumentDependentCache(services.workspace.DocumentDependencyTracker);
     }
 
     /**
@@ -94,8 +95,9 @@ export class SafeDsCallGraphComputer {
     getCallGraph(node: SdsCall | SdsCallable, substitutions: ParameterSubstitutions = NO_SUBSTITUTIONS): CallGraph {
         // Cache the result if no substitutions are given
         if (isEmpty(substitutions)) {
-            const key = this.getNodeId(node);
-            return this.callGraphCache.get(key, () => {
+            const documentUri = AstUtils.getDocument(node).uri;
+            const nodePath = this.astNodeLocator.getAstNodePath(node);
+            return this.callGraphCache.get(documentUri, nodePath, () => {
                 return this.doGetCallGraph(node, substitutions);
             });
         } else {
@@ -325,14 +327,9 @@ export class SafeDsCallGraphComputer {
             return [];
         }
 
-        const key = this.getNodeId(node);
-        return this.callCache.get(key, () => AstUtils.streamAst(node).filter(isSdsCall).toArray());
-    }
-
-    private getNodeId(node: AstNode) {
-        const documentUri = AstUtils.getDocument(node).uri.toString();
+        const documentUri = AstUtils.getDocument(node).uri;
         const nodePath = this.astNodeLocator.getAstNodePath(node);
-        return `${documentUri}~${nodePath}`;
+        return this.callCache.get(documentUri, nodePath, () => AstUtils.streamAst(node).filter(isSdsCall).toArray());
     }
 }
 
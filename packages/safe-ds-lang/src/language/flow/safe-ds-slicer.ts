@@ -1,100 +1,227 @@
 import { SafeDsServices } from '../safe-ds-module.js';
 import { isSdsAssignment, isSdsPlaceholder, isSdsReference, SdsPlaceholder, SdsStatement } from '../generated/ast.js';
-import { AstUtils, Stream } from 'langium';
-import { ImpurityReason } from '../purity/model.js';
+import { AstNodeLocator, AstUtils } from 'langium';
+import { ALL_RESOURCES } from '../purity/model.js';
 import { getAssignees } from '../helpers/nodeProperties.js';
 import { SafeDsPurityComputer } from '../purity/safe-ds-purity-computer.js';
+import { DocumentDependentCache } from '../workspace/safe-ds-document-dependency-tracker.js';
 
 export class SafeDsSlicer {
+    private readonly astNodeLocator: AstNodeLocator;
     private readonly purityComputer: SafeDsPurityComputer;
 
+    private readonly graphCache: DocumentDependentCache<string, StatementDependencyGraph>;
+
     constructor(services: SafeDsServices) {
+        this.astNodeLocator = services.workspace.AstNodeLocator;
         this.purityComputer = services.purity.PurityComputer;
+
+        this.graphCache = new DocumentDependentCache(services.workspace.DocumentDependencyTracker);
     }
 
     /**
      * Computes the subset of the given statements that are needed to calculate the target placeholders.
      */
     computeBackwardSliceToTargets(statements: SdsStatement[], targets: SdsStatement[]): SdsStatement[] {
-        const aggregator = new BackwardSliceAggregator(this.purityComputer);
-
-        for (const statement of statements.reverse()) {
-            // Keep if it is a target
-            if (targets.includes(statement)) {
-                aggregator.addStatement(statement);
-            }
-
-            // Keep if it declares a referenced placeholder
-            else if (
-                isSdsAssignment(statement) &&
-                getAssignees(statement).some((it) => isSdsPlaceholder(it) && aggregator.referencedPlaceholders.has(it))
-            ) {
-                aggregator.addStatement(statement);
-            }
-
-            // Keep if it has an impurity reason that affects a future impurity reason
-            else if (
-                this.purityComputer
-                    .getImpurityReasonsForStatement(statement)
-                    .some((pastReason) =>
-                        aggregator.impurityReasons.some((futureReason) =>
-                            pastReason.canAffectFutureImpurityReason(futureReason),
-                        ),
-                    )
-            ) {
-                aggregator.addStatement(statement);
-            }
+        if (statements.length === 0) {
+            return [];
         }
 
-        return aggregator.statements;
+        const graph = this.getDependencyGraph(statements);
+        const targetIndices = targets.map((it) => graph.indexOf(it)).filter((it) => it !== undefined);
+        return graph.computeBackwardSlice(targetIndices).map((it) => statements[it]!);
+    }
+
+    /**
+     * Returns the dependency graph of the given statements. It is cached, since the same block is usually sliced many
+     * times for different targets.
+     */
+    private getDependencyGraph(statements: SdsStatement[]): StatementDependencyGraph {
+        const firstStatement = statements[0]!;
+        const documentUri = AstUtils.getDocument(firstStatement).uri;
+        const blockPath = this.astNodeLocator.getAstNodePath(firstStatement.$container!);
+        const key = `${blockPath}:${statements.map((it) => it.$containerIndex).join(',')}`;
+
+        return this.graphCache.get(
+            documentUri,
+            key,
+            () => new StatementDependencyGraph(statements, this.purityComputer),
+        );
     }
 }
 
-class BackwardSliceAggregator {
-    private readonly purityComputer: SafeDsPurityComputer;
+/**
+ * Records which of the given statements a statement depends on. A statement depends on an earlier statement if
+ *
+ * - it references a placeholder that is declared by the earlier statement, or
+ * - one of its impurity reasons can be affected by an impurity reason of the earlier statement.
+ *
+ * Placeholder dependencies are stored as edges. Impurity dependencies are indexed by resource instead, since there
+ * can be quadratically many of them.
+ */
+class StatementDependencyGraph {
+    private readonly indices: Map<SdsStatement, number>;
 
     /**
-     * The statements that are needed to calculate the target statements.
+     * The indices of the statements that declare the placeholders that are referenced by each statement.
      */
-    readonly statements: SdsStatement[] = [];
+    private readonly placeholderDependencies: number[][];
 
     /**
-     * The placeholders that are needed to calculate the target statements.
+     * The resources of the impurity reasons of each statement.
      */
-    readonly referencedPlaceholders: Set<SdsPlaceholder>;
+    private readonly resources: string[][];
 
     /**
-     * The impurity reasons of the collected statements.
+     * Maps resources to the sorted indices of statements that can affect them.
      */
-    readonly impurityReasons: ImpurityReason[] = [];
+    private readonly writersByResource: Map<string, number[]>;
 
-    constructor(purityComputer: SafeDsPurityComputer) {
-        this.purityComputer = purityComputer;
+    /**
+     * The sorted indices of statements that can affect all resources.
+     */
+    private readonly writersOfAllResources: number[];
+
+    constructor(statements: SdsStatement[], purityComputer: SafeDsPurityComputer) {
+        this.indices = new Map(statements.map((it, index) => [it, index]));
+        this.placeholderDependencies = [];
+        this.resources = [];
+        this.writersByResource = new Map();
+        this.writersOfAllResources = [];
+
+        const declaringStatements = new Map<SdsPlaceholder, number>();
+
+        statements.forEach((statement, index) => {
+            // Placeholders can only be referenced after they are declared
+            const dependencies = new Set<number>();
+            for (const placeholder of getReferencedPlaceholders(statement)) {
+                const declaringStatement = declaringStatements.get(placeholder);
+                if (declaringStatement !== undefined) {
+                    dependencies.add(declaringStatement);
+                }
+            }
+            this.placeholderDependencies.push(Array.from(dependencies));
+
+            if (isSdsAssignment(statement)) {
+                for (const assignee of getAssignees(statement)) {
+                    if (isSdsPlaceholder(assignee)) {
+                        declaringStatements.set(assignee, index);
+                    }
+                }
+            }
 
-        this.referencedPlaceholders = new Set();
+            // Index impurity reasons by resource
+            const resources = new Set<string>();
+            let affectsAllResources = false;
+            const affectedResources = new Set<string>();
+
+            for (const reason of purityComputer.getImpurityReasonsForStatement(statement)) {
+                if (reason.resource !== undefined) {
+                    resources.add(reason.resource);
+                }
+
+                if (reason.affectedResources === ALL_RESOURCES) {
+                    affectsAllResources = true;
+                } else {
+                    reason.affectedResources.forEach((it) => affectedResources.add(it));
+                }
+            }
+            this.resources.push(Array.from(resources));
+
+            if (affectsAllResources) {
+                this.writersOfAllResources.push(index);
+            } else {
+                for (const resource of affectedResources) {
+                    if (!this.writersByResource.has(resource)) {
+                        this.writersByResource.set(resource, []);
+                    }
+                    this.writersByResource.get(resource)!.push(index);
+                }
+            }
+        });
     }
 
-    addStatement(statement: SdsStatement): void {
-        this.statements.unshift(statement);
+    /**
+     * Returns the index of the given statement or undefined if it is not part of the graph.
+     */
+    indexOf(statement: SdsStatement): number | undefined {
+        return this.indices.get(statement);
+    }
 
-        // Remember all referenced placeholders
-        this.getReferencedPlaceholders(statement).forEach((it) => {
-            this.referencedPlaceholders.add(it);
-        });
+    /**
+     * Computes the sorted indices of all statements that the target statements depend on transitively, including the
+     * targets themselves. The runtime is linear in the size of the slice, up to a logarithmic factor.
+     */
+    computeBackwardSlice(targetIndices: number[]): number[] {
+        const isInSlice = new Set<number>();
+        const worklist: number[] = [];
+        const add = (index: number) => {
+            if (!isInSlice.has(index)) {
+                isInSlice.add(index);
+                worklist.push(index);
+            }
+        };
+
+        // The writers of a resource that come before some statement form a prefix of the sorted list of writers. We
+        // remember how long the prefix is that has already been added for each list, so every writer is visited once.
+        const addedPrefixLengths = new Map<number[], number>();
+        const addWritersBefore = (writers: number[], index: number) => {
+            const start = addedPrefixLengths.get(writers) ?? 0;
+            const end = countLessThan(writers, index);
+            for (let i = start; i < end; i++) {
+                add(writers[i]!);
+            }
+            addedPrefixLengths.set(writers, Math.max(start, end));
+        };
 
-        // Remember all impurity reasons
-        this.purityComputer.getImpurityReasonsForStatement(statement).forEach((it) => {
-            this.impurityReasons.push(it);
-        });
+        targetIndices.forEach(add);
+
+        while (worklist.length > 0) {
+            const index = worklist.pop()!;
+
+            this.placeholderDependencies[index]!.forEach(add);
+
+            for (const resource of this.resources[index]!) {
+                addWritersBefore(this.writersOfAllResources, index);
+
+                const writers = this.writersByResource.get(resource);
+                if (writers) {
+                    addWritersBefore(writers, index);
+                }
+            }
+        }
+
+        return Array.from(isInSlice).sort((a, b) => a - b);
     }
+}
 
-    private getReferencedPlaceholders(node: SdsStatement): Stream<SdsPlaceholder> {
-        return AstUtils.streamAllContents(node).flatMap((it) => {
+const getReferencedPlaceholders = (node: SdsStatement): SdsPlaceholder[] => {
+    return AstUtils.streamAllContents(node)
+        .flatMap((it) => {
             if (isSdsReference(it) && isSdsPlaceholder(it.target.ref)) {
                 return [it.target.ref];
             } else {
                 return [];
             }
-        });
+        })
+        .toArray();
+};
+
+/**
+ * Returns the number of elements of the sorted array that are less than the given value.
+ */
+const countLessThan = (sortedArray: number[], value: number): number => {
+    let low = 0;
+    let high = sortedArray.length;
+
+    while (low < high) {
+        const middle = (low + high) >>> 1;
+        if (sortedArray[middle]! < value) {
+            low = middle + 1;
+        } else {
+            high = middle;
+        }
     }
-}
+
+    return low;
+};
@@ -33,6 +33,7 @@ import {
     isSdsFunction,
     isSdsIndexedAccess,
     isSdsInfixOperation,
+    isSdsLambda,
     isSdsList,
     isSdsMap,
     isSdsMemberAccess,
@@ -45,6 +46,7 @@ import {
     isSdsPrefixOperation,
     isSdsReference,
     isSdsSegment,
+    isSdsStatement,
     isSdsTemplateString,
     isSdsTemplateStringEnd,
     isSdsTemplateStringInner,
@@ -72,6 +74,7 @@ import {
     SdsParameter,
     SdsParameterList,
     SdsPipeline,
+    SdsPlaceholder,
     SdsReference,
     SdsSegment,
     SdsStatement,
@@ -92,6 +95,8 @@ import {
 import { SafeDsNodeMapper } from '../../helpers/safe-ds-node-mapper.js';
 import {
     BooleanConstant,
+    EvaluatedNamedTuple,
+    EvaluatedNode,
     FloatConstant,
     IntConstant,
     NullConstant,
@@ -111,6 +116,7 @@ import {
     nullSafeCall,
     nullSafeIndexedAccess,
     nullSafeMemberAccess,
+    runInParallel,
     UtilityFunction,
 } from './utilityFunctions.js';
 import { CODEGEN_PREFIX } from './constants.js';
@@ -124,6 +130,7 @@ const BLOCK_LAMBDA_RESULT_PREFIX = `${CODEGEN_PREFIX}block_lambda_result_`;
 const OUTPUT_PREFIX = `${CODEGEN_PREFIX}output_`;
 const PLACEHOLDER_PREFIX = `${CODEGEN_PREFIX}placeholder_`;
 const RECEIVER_PREFIX = `${CODEGEN_PREFIX}receiver_`;
+const TASK_PREFIX = `${CODEGEN_PREFIX}task_`;
 const YIELD_PREFIX = `${CODEGEN_PREFIX}yield_`;
 
 const RUNNER_PACKAGE = 'safeds_runner';
@@ -157,6 +164,16 @@ export class SafeDsPythonGenerator {
     }
 
     generate(document: LangiumDocument, options: GenerateOptions): TextDocument[] {
+        return this.generateLazily(document, options).map((file) =>
+            TextDocument.create(file.uri, 'py', 0, file.getText()),
+        );
+    }
+
+    /**
+     * Generates the same files as `generate`, but the text of source maps is only computed once it is requested. This
+     * is useful if source maps are rarely needed, e.g. only to map runtime errors back to the Safe-DS code.
+     */
+    generateLazily(document: LangiumDocument, options: GenerateOptions): GeneratedFile[] {
         const node = document.parseResult.value;
 
         // Do not generate stub files
@@ -169,17 +186,18 @@ export class SafeDsPythonGenerator {
         const packagePath = pythonModuleName === undefined ? node.name.split('.') : [pythonModuleName];
         const parentDirectoryPath = path.join(options.destination!.fsPath, ...packagePath);
 
-        const generatedFiles = new Map<string, string>();
+        const generatedFiles = new Map<string, () => string>();
         const generatedModule = this.generateModule(node, options);
         const { text, trace } = toStringAndTrace(generatedModule);
         const pythonOutputPath = `${path.join(parentDirectoryPath, this.formatGeneratedFileName(name))}.py`;
         if (options.createSourceMaps) {
-            generatedFiles.set(
-                `${pythonOutputPath}.map`,
-                this.generateSourceMap(document, text, trace, this.formatGeneratedFileName(name)),
-            );
+            let sourceMap: string | undefined = undefined;
+            generatedFiles.set(`${pythonOutputPath}.map`, () => {
+                sourceMap ??= this.generateSourceMap(document, text, trace, this.formatGeneratedFileName(name));
+                return sourceMap;
+            });
         }
-        generatedFiles.set(pythonOutputPath, text);
+        generatedFiles.set(pythonOutputPath, () => text);
         for (const pipeline of getModuleMembers(node).filter(isSdsPipeline)) {
             const entryPointFilename = `${path.join(
                 parentDirectoryPath,
@@ -193,12 +211,13 @@ export class SafeDsPythonGenerator {
                 pipeline,
             )}()`.appendNewLine();
             const generatedPipelineEntry = toStringAndTrace(entryPointContent);
-            generatedFiles.set(entryPointFilename, generatedPipelineEntry.text);
+            generatedFiles.set(entryPointFilename, () => generatedPipelineEntry.text);
         }
 
-        return Array.from(generatedFiles.entries()).map(([fsPath, content]) =>
-            TextDocument.create(URI.file(fsPath).toString(), 'py', 0, content),
-        );
+        return Array.from(generatedFiles.entries()).map(([fsPath, getText]) => ({
+            uri: URI.file(fsPath).toString(),
+            getText,
+        }));
     }
 
     private generateSourceMap(
@@ -359,14 +378,23 @@ export class SafeDsPythonGenerator {
         typeVariableSet: Set<string>,
         generateOptions: GenerateOptions,
     ): Generated {
-        const infoFrame = new GenerationInfoFrame(
-            importSet,
+        const functionImportSet = generateOptions.lazyImports ? new Map<String, ImportData>() : importSet;
+        const infoFrame = new GenerationInfoFrame({
+            importSet: functionImportSet,
+            moduleImportSet: importSet,
             utilitySet,
             typeVariableSet,
-            false,
-            undefined,
-            generateOptions.disableRunnerIntegration,
-        );
+            disableRunnerIntegration: generateOptions.disableRunnerIntegration,
+        });
+        // Default values are evaluated when the module is loaded, so their imports must stay at the top level
+        const parameterFrame = generateOptions.lazyImports
+            ? new GenerationInfoFrame({
+                  importSet,
+                  utilitySet,
+                  typeVariableSet,
+                  disableRunnerIntegration: generateOptions.disableRunnerIntegration,
+              })
+            : infoFrame;
         const segmentResult = segment.resultList?.results || [];
         const segmentBlock = this.generateBlock(segment.body, infoFrame);
         if (segmentResult.length !== 0) {
@@ -382,9 +410,29 @@ export class SafeDsPythonGenerator {
         return expandTracedToNode(segment)`def ${traceToNode(
             segment,
             'name',
-        )(this.getPythonNameOrDefault(segment))}(${this.generateParameters(segment.parameterList, infoFrame)}):`
+        )(this.getPythonNameOrDefault(segment))}(${this.generateParameters(segment.parameterList, parameterFrame)}):`
             .appendNewLine()
-            .indent({ indentedChildren: [segmentBlock], indentation: PYTHON_INDENT });
+            .indent({
+                indentedChildren: [this.generateFunctionBody(segmentBlock, functionImportSet, importSet)],
+                indentation: PYTHON_INDENT,
+            });
+    }
+
+    /**
+     * Prepends the imports that are local to a function to its body. If the function uses the imports of the module,
+     * the body is returned unchanged.
+     */
+    private generateFunctionBody(
+        body: Generated,
+        functionImportSet: Map<String, ImportData>,
+        moduleImportSet: Map<String, ImportData>,
+    ): Generated {
+        if (functionImportSet === moduleImportSet || functionImportSet.size === 0) {
+            return body;
+        }
+
+        const imports = this.generateImports(Array.from(functionImportSet.values()));
+        return joinToNode([...imports, body], { separator: NL });
     }
 
     private generateParameters(
@@ -426,20 +474,29 @@ export class SafeDsPythonGenerator {
                 ? [generateOptions.targetStatements]
                 : generateOptions.targetStatements;
 
-        const infoFrame = new GenerationInfoFrame(
-            importSet,
+        const functionImportSet = generateOptions.lazyImports ? new Map<String, ImportData>() : importSet;
+        const infoFrame = new GenerationInfoFrame({
+            importSet: functionImportSet,
+            moduleImportSet: importSet,
             utilitySet,
             typeVariableSet,
-            true,
+            isInsidePipeline: true,
             targetStatements,
-            generateOptions.disableRunnerIntegration,
-        );
+            disableRunnerIntegration: generateOptions.disableRunnerIntegration,
+            releasePlaceholders: generateOptions.releasePlaceholders,
+            parallelism: generateOptions.parallelism,
+            optimize: generateOptions.optimize,
+        });
+        const pipelineBlock = this.generateBlock(pipeline.body, infoFrame);
         return expandTracedToNode(pipeline)`def ${traceToNode(
             pipeline,
             'name',
         )(this.getPythonNameOrDefault(pipeline))}():`
             .appendNewLine()
-            .indent({ indentedChildren: [this.generateBlock(pipeline.body, infoFrame)], indentation: PYTHON_INDENT });
+            .indent({
+                indentedChildren: [this.generateFunctionBody(pipelineBlock, functionImportSet, importSet)],
+                indentation: PYTHON_INDENT,
+            });
     }
 
     private generateImports(importSet: ImportData[]): string[] {
@@ -483,7 +540,6 @@ export class SafeDsPythonGenerator {
         frame: GenerationInfoFrame,
         generateLambda: boolean = false,
     ): CompositeGeneratorNode {
-        // TODO: if there are no target statements, only generate code that causes side-effects
         let statements = getStatements(block).filter((stmt) => this.statementDoesSomething(stmt));
         if (frame.targetStatements) {
             const targetStatements = frame.targetStatements.flatMap((it) => {
@@ -492,19 +548,195 @@ export class SafeDsPythonGenerator {
             if (!isEmpty(targetStatements)) {
                 statements = this.slicer.computeBackwardSliceToTargets(statements, targetStatements);
             }
+        } else if (frame.isInsidePipeline && !generateLambda && frame.optimize) {
+            // Without target statements, only the statements that lead to side effects or outputs are needed
+            const targetStatements = statements.filter((stmt) => this.statementHasEffect(stmt));
+            statements = this.slicer.computeBackwardSliceToTargets(statements, targetStatements);
         }
         if (statements.length === 0) {
             return traceToNode(block)('pass');
         }
+
+        const groups =
+            frame.isInsidePipeline && !generateLambda && frame.parallelism > 1
+                ? this.groupIndependentStatements(statements)
+                : statements.map((it) => [it]);
+
+        // Grouping can reorder statements, so liveness must be computed for the order of execution
+        const releasedPlaceholders =
+            frame.isInsidePipeline && !generateLambda && frame.releasePlaceholders
+                ? this.computeReleasedPlaceholders(groups.flat())
+                : new Map<SdsStatement, SdsPlaceholder[]>();
+
         return joinTracedToNode(block, 'statements')(
-            statements,
-            (stmt) => this.generateStatement(stmt, frame, generateLambda),
+            groups,
+            (group) => {
+                const statement =
+                    group.length === 1
+                        ? this.generateStatement(group[0]!, frame, generateLambda)
+                        : this.generateParallelStatements(group, frame);
+
+                // Placeholders are only released once all statements of the group are done, since they run concurrently
+                const placeholders = group.flatMap((it) => releasedPlaceholders.get(it) ?? []);
+                if (isEmpty(placeholders)) {
+                    return statement;
+                }
+
+                return joinToNode(
+                    [
+                        statement,
+                        expandToNode`del ${joinToNode(placeholders, (it) => `${PLACEHOLDER_PREFIX}${it.name}`, {
+                            separator: ', ',
+                        })}`,
+                    ],
+                    { separator: NL },
+                );
+            },
             {
                 separator: NL,
             },
         )!;
     }
 
+    /**
+     * Computes which placeholders can be deleted after each of the given statements. A placeholder is deleted after its
+     * last use, or right after its declaration if it is never used, so its value can be freed before the pipeline ends.
+     *
+     * Placeholders that are referenced by a lambda are kept, since the lambda might be called later.
+     */
+    private computeReleasedPlaceholders(statements: SdsStatement[]): Map<SdsStatement, SdsPlaceholder[]> {
+        const indices = new Map(statements.map((it, index) => [it, index]));
+        const lastUses = new Map<SdsPlaceholder, number>();
+
+        statements.forEach((statement, index) => {
+            if (!isSdsAssignment(statement)) {
+                return;
+            }
+
+            for (const placeholder of getAssignees(statement).filter(isSdsPlaceholder)) {
+                let lastUse: number | undefined = index;
+
+                for (const reference of this.nodeMapper.placeholderToReferences(placeholder)) {
+                    if (AstUtils.hasContainerOfType(reference, isSdsLambda)) {
+                        lastUse = undefined;
+                        break;
+                    }
+
+                    const referencingStatement = getOutermostContainerOfType(reference, isSdsStatement);
+                    const referencingIndex = indices.get(referencingStatement!);
+                    if (referencingIndex !== undefined && referencingIndex > lastUse) {
+                        lastUse = referencingIndex;
+                    }
+                }
+
+                if (lastUse !== undefined) {
+                    lastUses.set(placeholder, lastUse);
+                }
+            }
+        });
+
+        const result = new Map<SdsStatement, SdsPlaceholder[]>();
+        for (const [placeholder, lastUse] of lastUses) {
+            const statement = statements[lastUse]!;
+            if (!result.has(statement)) {
+                result.set(statement, []);
+            }
+            result.get(statement)!.push(placeholder);
+        }
+        return result;
+    }
+
+    /**
+     * Groups the given statements, so the statements of a group can be executed concurrently. Statements are only put
+     * into a group with others if they are pure assignments. Between two statements with side effects, pure assignments
+     * are grouped by their depth in the dependency graph of placeholders, so independent statements end up in the same
+     * group. Statements with side effects keep their order relative to all other statements.
+     */
+    private groupIndependentStatements(statements: SdsStatement[]): SdsStatement[][] {
+        const result: SdsStatement[][] = [];
+        let levels: SdsStatement[][] = [];
+        const levelOfPlaceholder = new Map<SdsPlaceholder, number>();
+
+        const flushLevels = () => {
+            result.push(...levels);
+            levels = [];
+            levelOfPlaceholder.clear();
+        };
+
+        for (const statement of statements) {
+            if (!this.canRunConcurrently(statement)) {
+                flushLevels();
+                result.push([statement]);
+                continue;
+            }
+
+            let level = 0;
+            for (const reference of AstUtils.streamAllContents(statement).filter(isSdsReference)) {
+                const target = reference.target.ref;
+                if (isSdsPlaceholder(target) && levelOfPlaceholder.has(target)) {
+                    level = Math.max(level, levelOfPlaceholder.get(target)! + 1);
+                }
+            }
+
+            if (!levels[level]) {
+                levels[level] = [];
+            }
+            levels[level]!.push(statement);
+            for (const placeholder of getAssignees(statement as SdsAssignment).filter(isSdsPlaceholder)) {
+                levelOfPlaceholder.set(placeholder, level);
+            }
+        }
+
+        flushLevels();
+        return result;
+    }
+
+    private canRunConcurrently(statement: SdsStatement): statement is SdsAssignment {
+        return (
+            isSdsAssignment(statement) &&
+            getAssignees(statement).some(isSdsPlaceholder) &&
+            this.purityComputer.isPureExpression(statement.expression)
+        );
+    }
+
+    /**
+     * Generates code that executes the given independent statements concurrently. Each statement is wrapped in a
+     * function that returns the values of its placeholders, which are then assigned in the pipeline.
+     */
+    private generateParallelStatements(statements: SdsStatement[], frame: GenerationInfoFrame): Generated {
+        frame.addUtility(runInParallel);
+
+        const tasks = statements.map((statement) => {
+            const placeholders = getAssignees(statement as SdsAssignment).filter(isSdsPlaceholder);
+            const name = `${TASK_PREFIX}${statement.$containerIndex}`;
+            const definition = expandToNode`def ${name}():`.appendNewLine().indent({
+                indentedChildren: [
+                    this.generateStatement(statement, frame, false),
+                    NL,
+                    expandToNode`return ${joinToNode(placeholders, (it) => `${PLACEHOLDER_PREFIX}${it.name}`, {
+                        separator: ', ',
+                    })}`,
+                ],
+                indentation: PYTHON_INDENT,
+            });
+            const target =
+                placeholders.length === 1
+                    ? `${PLACEHOLDER_PREFIX}${placeholders[0]!.name}`
+                    : `(${placeholders.map((it) => `${PLACEHOLDER_PREFIX}${it.name}`).join(', ')})`;
+            return { name, definition, target };
+        });
+
+        return joinToNode(
+            [
+                ...tasks.map((it) => it.definition),
+                expandToNode`${joinToNode(tasks, (it) => it.target, { separator: ', ' })} = ${
+                    runInParallel.name
+                }(${frame.parallelism}, ${joinToNode(tasks, (it) => it.name, { separator: ', ' })})`,
+            ],
+            { separator: NL },
+        );
+    }
+
     /**
      * Returns whether the given statement does something. It must either
      *     - create a placeholder,
@@ -527,6 +759,18 @@ export class SafeDsPythonGenerator {
         }
     }
 
+    /**
+     * Returns whether the given statement has an effect that is observable after the pipeline is done, i.e. whether it
+     * has side effects or is an output statement.
+     */
+    private statementHasEffect(node: SdsStatement): boolean {
+        if (isSdsAssignment(node) || isSdsExpressionStatement(node)) {
+            return this.purityComputer.expressionHasSideEffects(node.expression);
+        } else {
+            return isSdsOutputStatement(node);
+        }
+    }
+
     private generateStatement(statement: SdsStatement, frame: GenerationInfoFrame, generateLambda: boolean): Generated {
         const result: Generated[] = [];
 
@@ -582,7 +826,12 @@ export class SafeDsPythonGenerator {
                     )} = ${this.generateExpression(assignment.expression!, frame)}`,
                 );
             }
-            if (frame.isInsidePipeline && !generateLambda && !frame.disableRunnerIntegration) {
+            if (
+                frame.isInsidePipeline &&
+                !generateLambda &&
+                !frame.disableRunnerIntegration &&
+                frame.shouldSavePlaceholdersOf(assignment)
+            ) {
                 for (const savableAssignment of assignees.filter(isSdsPlaceholder)) {
                     // should always be SdsPlaceholder
                     frame.addImport({ importPath: RUNNER_PACKAGE });
@@ -713,17 +962,17 @@ export class SafeDsPythonGenerator {
 
         if (!this.purityComputer.expressionHasSideEffects(expression)) {
             const partiallyEvaluatedNode = this.partialEvaluator.evaluate(expression);
-            if (partiallyEvaluatedNode instanceof BooleanConstant) {
-                return traceToNode(expression)(partiallyEvaluatedNode.value ? 'True' : 'False');
-            } else if (partiallyEvaluatedNode instanceof IntConstant) {
-                return traceToNode(expression)(String(partiallyEvaluatedNode.value));
-            } else if (partiallyEvaluatedNode instanceof FloatConstant) {
-                const floatValue = partiallyEvaluatedNode.value;
-                return traceToNode(expression)(Number.isInteger(floatValue) ? `${floatValue}.0` : String(floatValue));
-            } else if (partiallyEvaluatedNode === NullConstant) {
-                return traceToNode(expression)('None');
-            } else if (partiallyEvaluatedNode instanceof StringConstant) {
-                return expandTracedToNode(expression)`'${this.formatStringSingleLine(partiallyEvaluatedNode.value)}'`;
+            const constant = this.formatConstant(partiallyEvaluatedNode);
+            if (constant !== undefined) {
+                return traceToNode(expression)(constant);
+            } else if (frame.optimize && partiallyEvaluatedNode instanceof EvaluatedNamedTuple) {
+                // Calls of segments or block lambdas with several constant results are replaced by a tuple
+                const results = Array.from({ length: partiallyEvaluatedNode.size }, (_, index) =>
+                    this.formatConstant(partiallyEvaluatedNode.getResultValueByIndex(index)),
+                );
+                if (results.every((it) => it !== undefined)) {
+                    return traceToNode(expression)(`(${results.join(', ')})`);
+                }
             }
         }
 
@@ -1288,11 +1537,38 @@ export class SafeDsPythonGenerator {
         return path.basename(filePath, path.extname(filePath));
     }
 
+    /**
+     * Returns the Python literal for the given node if it is a constant of a primitive type.
+     */
+    private formatConstant(node: EvaluatedNode): string | undefined {
+        if (node instanceof BooleanConstant) {
+            return node.value ? 'True' : 'False';
+        } else if (node instanceof IntConstant) {
+            return String(node.value);
+        } else if (node instanceof FloatConstant) {
+            return Number.isInteger(node.value) ? `${node.value}.0` : String(node.value);
+        } else if (node === NullConstant) {
+            return 'None';
+        } else if (node instanceof StringConstant) {
+            return `'${this.formatStringSingleLine(node.value)}'`;
+        } else {
+            return undefined;
+        }
+    }
+
     private formatStringSingleLine(value: string): string {
         return value.replaceAll('\r\n', '\\n').replaceAll('\n', '\\n').replaceAll("'", "\\'");
     }
 }
 
+/**
+ * A file that was generated by `generateLazily`. Its text is computed once `getText` is called for the first time.
+ */
+export interface GeneratedFile {
+    readonly uri: string;
+    readonly getText: () => string;
+}
+
 interface ImportData {
     readonly importPath: string;
     readonly declarationName?: string;
@@ -1302,36 +1578,53 @@ interface ImportData {
 class GenerationInfoFrame {
     private readonly idManager: IdManager<SdsExpression>;
     private readonly importSet: Map<String, ImportData>;
+    private readonly moduleImportSet: Map<String, ImportData>;
     private readonly utilitySet: Set<UtilityFunction>;
     private readonly typeVariableSet: Set<string>;
     public readonly isInsidePipeline: boolean;
     public readonly targetStatements: number[] | undefined;
     public readonly disableRunnerIntegration: boolean;
+    public readonly releasePlaceholders: boolean;
+    public readonly parallelism: number;
+    public readonly optimize: boolean;
     private extraStatements = new Map<SdsExpression, Generated>();
 
-    constructor(
-        importSet: Map<String, ImportData> = new Map<String, ImportData>(),
-        utilitySet: Set<UtilityFunction> = new Set<UtilityFunction>(),
-        typeVariableSet: Set<string> = new Set<string>(),
-        insidePipeline: boolean = false,
-        targetStatements: number[] | undefined = undefined,
-        disableRunnerIntegration: boolean = false,
-        idManager: IdManager<SdsExpression> = new IdManager(),
-    ) {
-        this.idManager = idManager;
-        this.importSet = importSet;
-        this.utilitySet = utilitySet;
-        this.typeVariableSet = typeVariableSet;
-        this.isInsidePipeline = insidePipeline;
-        this.targetStatements = targetStatements;
-        this.disableRunnerIntegration = disableRunnerIntegration;
+    constructor(options: GenerationInfoFrameOptions = {}) {
+        this.idManager = options.idManager ?? new IdManager();
+        this.importSet = options.importSet ?? new Map<String, ImportData>();
+        this.moduleImportSet = options.moduleImportSet ?? this.importSet;
+        this.utilitySet = options.utilitySet ?? new Set<UtilityFunction>();
+        this.typeVariableSet = options.typeVariableSet ?? new Set<string>();
+        this.isInsidePipeline = options.isInsidePipeline ?? false;
+        this.targetStatements = options.targetStatements;
+        this.disableRunnerIntegration = options.disableRunnerIntegration ?? false;
+        this.releasePlaceholders = options.releasePlaceholders ?? false;
+        this.parallelism = options.parallelism ?? 1;
+        this.optimize = options.optimize ?? false;
+    }
+
+    /**
+     * Returns whether the placeholders of the given statement should be saved for the runner. If placeholders are
+     * released during a partial execution, only those of target statements are saved, since the runner keeps saved
+     * values alive. Full executions save all placeholders, so the runner can report their types and progress.
+     */
+    shouldSavePlaceholdersOf(statement: SdsStatement): boolean {
+        return (
+            !this.releasePlaceholders ||
+            !this.targetStatements ||
+            this.targetStatements.includes(statement.$containerIndex ?? -1)
+        );
     }
 
     addImport(importData: ImportData | undefined) {
+        this.addImportTo(this.importSet, importData);
+    }
+
+    private addImportTo(importSet: Map<String, ImportData>, importData: ImportData | undefined) {
         if (importData) {
             const hashKey = JSON.stringify(importData);
-            if (!this.importSet.has(hashKey)) {
-                this.importSet.set(hashKey, importData);
+            if (!importSet.has(hashKey)) {
+                importSet.set(hashKey, importData);
             }
         }
     }
@@ -1340,13 +1633,14 @@ class GenerationInfoFrame {
         const imports = utilityFunction.imports || [];
         const typeVariables = utilityFunction.typeVariables || [];
 
+        // Utility functions and type variables are defined at the top level of the module, so they need its imports
         this.utilitySet.add(utilityFunction);
         for (const importData of imports) {
-            this.addImport(importData);
+            this.addImportTo(this.moduleImportSet, importData);
         }
 
         if (!isEmpty(typeVariables)) {
-            this.addImport({ importPath: 'typing', declarationName: 'TypeVar' });
+            this.addImportTo(this.moduleImportSet, { importPath: 'typing', declarationName: 'TypeVar' });
         }
 
         for (const typeVariable of typeVariables) {
@@ -1377,18 +1671,40 @@ class GenerationInfoFrame {
     }
 
     newScope(): GenerationInfoFrame {
-        return new GenerationInfoFrame(
-            this.importSet,
-            this.utilitySet,
-            this.typeVariableSet,
-            this.isInsidePipeline,
-            this.targetStatements,
-            this.disableRunnerIntegration,
-            this.idManager,
-        );
+        return new GenerationInfoFrame({
+            importSet: this.importSet,
+            moduleImportSet: this.moduleImportSet,
+            utilitySet: this.utilitySet,
+            typeVariableSet: this.typeVariableSet,
+            isInsidePipeline: this.isInsidePipeline,
+            targetStatements: this.targetStatements,
+            disableRunnerIntegration: this.disableRunnerIntegration,
+            releasePlaceholders: this.releasePlaceholders,
+            parallelism: this.parallelism,
+            optimize: this.optimize,
+            idManager: this.idManager,
+        });
     }
 }
 
+/**
+ * The options of a `GenerationInfoFrame`. Imports of utility functions are added to the `moduleImportSet`, which
+ * defaults to the `importSet`.
+ */
+interface GenerationInfoFrameOptions {
+    readonly importSet?: Map<String, ImportData>;
+    readonly moduleImportSet?: Map<String, ImportData>;
+    readonly utilitySet?: Set<UtilityFunction>;
+    readonly typeVariableSet?: Set<string>;
+    readonly isInsidePipeline?: boolean;
+    readonly targetStatements?: number[];
+    readonly disableRunnerIntegration?: boolean;
+    readonly releasePlaceholders?: boolean;
+    readonly parallelism?: number;
+    readonly optimize?: boolean;
+    readonly idManager?: IdManager<SdsExpression>;
+}
+
 export interface GenerateOptions {
     /**
      * Where the generated code should be written to.
@@ -1412,4 +1728,31 @@ export interface GenerateOptions {
      * Whether to disable the integration with the `safe-ds-runner` package and instead generate plain Python code.
      */
     disableRunnerIntegration: boolean;
+
+    /**
+     * Whether to delete the placeholders of pipelines after their last use, so large intermediate values can be freed
+     * before the pipeline ends. With runner integration and target statements, only the placeholders of target
+     * statements are saved then.
+     */
+    releasePlaceholders?: boolean;
+
+    /**
+     * The maximum number of independent pure statements of a pipeline that are executed concurrently on a thread pool.
+     * Values less than or equal to 1 disable concurrent execution.
+     */
+    parallelism?: number;
+
+    /**
+     * Whether to optimize the generated code of pipelines. If there are no target statements, only code for statements
+     * with side effects, output statements, and the statements they depend on is generated. Calls of segments with
+     * several constant results are replaced by their results.
+     */
+    optimize?: boolean;
+
+    /**
+     * Whether to import modules in the segments and pipelines that use them instead of at the top level of the
+     * generated module. Loading the module is then cheap, and a pipeline only imports what its generated statements
+     * need, which is particularly useful for partial executions.
+     */
+    lazyImports?: boolean;
 }
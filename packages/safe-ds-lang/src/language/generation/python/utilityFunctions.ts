@@ -60,6 +60,21 @@ export const nullSafeMemberAccess: UtilityFunction = {
     typeVariables: [`${CODEGEN_PREFIX}T`],
 };
 
+export const runInParallel: UtilityFunction = {
+    name: `${CODEGEN_PREFIX}run_in_parallel`,
+    code: expandToNode`
+        def ${CODEGEN_PREFIX}run_in_parallel(max_workers: int, *tasks: Callable[[], Any]) -> list[Any]:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(task) for task in tasks]
+                return [future.result() for future in futures]
+    `,
+    imports: [
+        { importPath: 'concurrent.futures', declarationName: 'ThreadPoolExecutor' },
+        { importPath: 'typing', declarationName: 'Any' },
+        { importPath: 'typing', declarationName: 'Callable' },
+    ],
+};
+
 export interface UtilityFunction {
     readonly name: string;
     readonly code: Generated;
@@ -1,4 +1,13 @@
-import { AstUtils, EMPTY_STREAM, Stream } from 'langium';
+import {
+    AstNode,
+    AstNodeLocator,
+    AstUtils,
+    DocumentState,
+    EMPTY_STREAM,
+    Reference,
+    stream,
+    Stream,
+} from 'langium';
 import {
     isSdsAbstractCall,
     isSdsAnnotationCall,
@@ -32,6 +41,7 @@ import {
 import { SafeDsServices } from '../safe-ds-module.js';
 import { CallableType, StaticType } from '../typing/model.js';
 import { SafeDsTypeComputer } from '../typing/safe-ds-type-computer.js';
+import { DocumentDependentCache } from '../workspace/safe-ds-document-dependency-tracker.js';
 import {
     Argument,
     getAbstractResults,
@@ -43,10 +53,19 @@ import {
 } from './nodeProperties.js';
 
 export class SafeDsNodeMapper {
+    private readonly astNodeLocator: AstNodeLocator;
     private readonly typeComputer: () => SafeDsTypeComputer;
 
+    /**
+     * Stores the references inside a node by their target, keyed by the ID of the node.
+     */
+    private readonly localReferencesCache: DocumentDependentCache<string, Map<AstNode, Reference[]>>;
+
     constructor(services: SafeDsServices) {
+        this.astNodeLocator = services.workspace.AstNodeLocator;
         this.typeComputer = () => services.typing.TypeComputer;
+
+        this.localReferencesCache = new DocumentDependentCache(services.workspace.DocumentDependencyTracker);
     }
 
     /**
@@ -256,7 +275,7 @@ export class SafeDsNodeMapper {
         }
         /* c8 ignore stop */
 
-        return AstUtils.findLocalReferences(node, containingCallable)
+        return this.findLocalReferences(node, containingCallable)
             .map((it) => it.$refNode?.astNode)
             .filter(isSdsReference);
     }
@@ -276,7 +295,7 @@ export class SafeDsNodeMapper {
         }
         /* c8 ignore stop */
 
-        return AstUtils.findLocalReferences(node, containingBlock)
+        return this.findLocalReferences(node, containingBlock)
             .map((it) => it.$refNode?.astNode)
             .filter(isSdsReference);
     }
@@ -294,7 +313,7 @@ export class SafeDsNodeMapper {
             return EMPTY_STREAM;
         }
 
-        return AstUtils.findLocalReferences(node, containingSegment)
+        return this.findLocalReferences(node, containingSegment)
             .map((it) => it.$refNode?.astNode)
             .filter(isSdsYield);
     }
@@ -334,4 +353,41 @@ export class SafeDsNodeMapper {
         const typeParameters = getTypeParameters(namedTypeDeclaration);
         return typeParameters[typeArgumentPosition];
     }
+
+    /**
+     * Returns all references inside the root node that target the given node. Once the document is linked, the
+     * references inside the root node are grouped by their target in a single pass, so further queries for other
+     * targets are answered without walking the root node again.
+     */
+    private findLocalReferences(target: AstNode, root: AstNode): Stream<Reference> {
+        const document = AstUtils.getDocument(root);
+
+        // Resolving all references of a document that is still being linked could lead to cyclic resolutions
+        if (document.state < DocumentState.Linked) {
+            return AstUtils.findLocalReferences(target, root);
+        }
+
+        const nodePath = this.astNodeLocator.getAstNodePath(root);
+        const referencesByTarget = this.localReferencesCache.get(document.uri, nodePath, () => {
+            const result = new Map<AstNode, Reference[]>();
+
+            AstUtils.streamAst(root).forEach((node) => {
+                AstUtils.streamReferences(node).forEach(({ reference }) => {
+                    const referencedNode = reference.ref;
+                    if (!referencedNode) {
+                        return;
+                    }
+
+                    if (!result.has(referencedNode)) {
+                        result.set(referencedNode, []);
+                    }
+                    result.get(referencedNode)!.push(reference);
+                });
+            });
+
+            return result;
+        });
+
+        return stream(referencesByTarget.get(target) ?? []);
+    }
 }
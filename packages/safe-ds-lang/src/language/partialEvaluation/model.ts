@@ -411,6 +411,13 @@ export class EvaluatedNamedTuple extends EvaluatedNode {
 
     override readonly isFullyEvaluated: boolean = stream(this.entries.values()).every(isFullyEvaluated);
 
+    /**
+     * The number of results in the record.
+     */
+    get size(): number {
+        return this.entries.size;
+    }
+
     /**
      * Returns the value of the result with the given name. If the result does not occur in the record,
      * `UnknownEvaluatedNode` is returned.
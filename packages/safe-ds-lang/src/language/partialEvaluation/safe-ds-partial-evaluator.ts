@@ -1,4 +1,4 @@
-import { AstNode, AstNodeLocator, AstUtils, WorkspaceCache } from 'langium';
+import { AstNode, AstNodeLocator, AstUtils } from 'langium';
 import { isEmpty } from '../../helpers/collections.js';
 import {
     isSdsArgument,
@@ -77,6 +77,7 @@ import {
 } from './model.js';
 import type { SafeDsTypeComputer } from '../typing/safe-ds-type-computer.js';
 import { SafeDsCoreTypes } from '../typing/safe-ds-core-types.js';
+import { DocumentDependentCache } from '../workspace/safe-ds-document-dependency-tracker.js';
 
 export class SafeDsPartialEvaluator {
     private readonly astNodeLocator: AstNodeLocator;
@@ -84,7 +85,7 @@ export class SafeDsPartialEvaluator {
     private readonly nodeMapper: SafeDsNodeMapper;
     private readonly typeComputer: () => SafeDsTypeComputer;
 
-    private readonly cache: WorkspaceCache<string, EvaluatedNode>;
+    private readonly cache: DocumentDependentCache<string, EvaluatedNode>;
 
     constructor(services: SafeDsServices) {
         this.astNodeLocator = services.workspace.AstNodeLocator;
@@ -92,7 +93,7 @@ export class SafeDsPartialEvaluator {
         this.nodeMapper = services.helpers.NodeMapper;
         this.typeComputer = () => services.typing.TypeComputer;
 
-        this.cache = new WorkspaceCache(services.shared);
+        this.cache = new DocumentDependentCache(services.workspace.DocumentDependencyTracker);
     }
 
     // -----------------------------------------------------------------------------------------------------------------
@@ -116,7 +117,9 @@ export class SafeDsPartialEvaluator {
         const newVisited: VisitedState[] = [...visited, [node, substitutions]];
 
         // Try to evaluate the node without parameter substitutions and cache the result
-        const resultWithoutSubstitutions = this.cache.get(this.getNodeId(node), () =>
+        const documentUri = AstUtils.getDocument(node).uri;
+        const nodePath = this.astNodeLocator.getAstNodePath(node);
+        const resultWithoutSubstitutions = this.cache.get(documentUri, nodePath, () =>
             this.doEvaluateWithRecursionCheck(node, NO_SUBSTITUTIONS, newVisited),
         );
         if (resultWithoutSubstitutions.isFullyEvaluated || isEmpty(substitutions)) {
@@ -127,12 +130,6 @@ export class SafeDsPartialEvaluator {
         }
     }
 
-    private getNodeId(node: AstNode) {
-        const documentUri = AstUtils.getDocument(node).uri.toString();
-        const nodePath = this.astNodeLocator.getAstNodePath(node);
-        return `${documentUri}~${nodePath}`;
-    }
-
     private doEvaluateWithRecursionCheck(
         node: AstNode | undefined,
         substitutions: ParameterSubstitutions,
@@ -26,8 +26,45 @@ export abstract class ImpurityReason {
      * @param future Future Impurity reason to test, if this reason may have an effect on it.
      */
     abstract canAffectFutureImpurityReason(future: ImpurityReason): boolean;
+
+    /**
+     * The resource that is accessed due to this impurity reason. If this is undefined, no past impurity reason can
+     * affect this one.
+     *
+     * This is consistent with `canAffectFutureImpurityReason`, but allows to index impurity reasons by resource.
+     */
+    abstract readonly resource: string | undefined;
+
+    /**
+     * The resources of future impurity reasons that this impurity reason can affect. `ALL_RESOURCES` means that it
+     * can affect every future impurity reason with a defined resource.
+     */
+    abstract readonly affectedResources: readonly string[] | typeof ALL_RESOURCES;
 }
 
+/**
+ * Marks an impurity reason that can affect the resources of all future impurity reasons.
+ */
+export const ALL_RESOURCES = 'all';
+
+/**
+ * The resource of impurity reasons that access a file whose path is not known statically.
+ */
+const UNKNOWN_FILE_RESOURCE = 'unknown file';
+
+/**
+ * The resource of all impurity reasons that don't access files.
+ */
+const OTHER_RESOURCE = 'other';
+
+const getFileResource = (path: SdsParameter | string | undefined): string => {
+    if (typeof path === 'string') {
+        return `file:${path}`;
+    } else {
+        return UNKNOWN_FILE_RESOURCE;
+    }
+};
+
 /**
  * The function reads from a file.
  *
@@ -58,6 +95,14 @@ export class FileRead extends ImpurityReason {
         // Reads can't affect other reasons
         return false;
     }
+
+    override get resource(): string {
+        return getFileResource(this.path);
+    }
+
+    override get affectedResources(): readonly string[] {
+        return [];
+    }
 }
 
 /**
@@ -95,6 +140,18 @@ export class FileWrite extends ImpurityReason {
         }
         return future !== EndlessRecursion;
     }
+
+    override get resource(): string {
+        return getFileResource(this.path);
+    }
+
+    override get affectedResources(): readonly string[] | typeof ALL_RESOURCES {
+        if (typeof this.path === 'string') {
+            return [getFileResource(this.path), UNKNOWN_FILE_RESOURCE, OTHER_RESOURCE];
+        } else {
+            return ALL_RESOURCES;
+        }
+    }
 }
 
 /**
@@ -124,6 +181,9 @@ export class PotentiallyImpureParameterCall extends ImpurityReason {
     override canAffectFutureImpurityReason(future: ImpurityReason): boolean {
         return future !== EndlessRecursion;
     }
+
+    override readonly resource = OTHER_RESOURCE;
+    override readonly affectedResources = ALL_RESOURCES;
 }
 
 /**
@@ -144,6 +204,9 @@ class UnknownCallableCallClass extends ImpurityReason {
         /* c8 ignore next 2 */
         return future !== EndlessRecursion;
     }
+
+    override readonly resource = OTHER_RESOURCE;
+    override readonly affectedResources = ALL_RESOURCES;
 }
 
 export const UnknownCallableCall = new UnknownCallableCallClass();
@@ -167,6 +230,9 @@ class EndlessRecursionClass extends ImpurityReason {
         // Endless recursions don't have any effect on others
         return false;
     }
+
+    override readonly resource = undefined;
+    override readonly affectedResources = [];
 }
 
 export const EndlessRecursion = new EndlessRecursionClass();
@@ -188,6 +254,9 @@ class OtherImpurityReasonClass extends ImpurityReason {
     canAffectFutureImpurityReason(future: ImpurityReason): boolean {
         return future !== EndlessRecursion;
     }
+
+    override readonly resource = OTHER_RESOURCE;
+    override readonly affectedResources = ALL_RESOURCES;
 }
 
 /**
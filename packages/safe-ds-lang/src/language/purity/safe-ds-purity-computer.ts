@@ -1,4 +1,4 @@
-import { type AstNode, type AstNodeLocator, AstUtils, EMPTY_STREAM, Stream, WorkspaceCache } from 'langium';
+import { type AstNodeLocator, AstUtils, EMPTY_STREAM, Stream } from 'langium';
 import { isEmpty } from '../../helpers/collections.js';
 import type { SafeDsCallGraphComputer } from '../flow/safe-ds-call-graph-computer.js';
 import type { SafeDsServices } from '../safe-ds-module.js';
@@ -34,6 +34,7 @@ import { SafeDsAnnotations } from '../builtins/safe-ds-annotations.js';
 import { SafeDsImpurityReasons } from '../builtins/safe-ds-enums.js';
 import { getParameters } from '../helpers/nodeProperties.js';
 import { isContainedInOrEqual } from '../helpers/astUtils.js';
+import { DocumentDependentCache } from '../workspace/safe-ds-document-dependency-tracker.js';
 
 export class SafeDsPurityComputer {
     private readonly astNodeLocator: AstNodeLocator;
@@ -41,7 +42,7 @@ export class SafeDsPurityComputer {
     private readonly builtinImpurityReasons: SafeDsImpurityReasons;
     private readonly callGraphComputer: SafeDsCallGraphComputer;
 
-    private readonly reasonsCache: WorkspaceCache<string, ImpurityReason[]>;
+    private readonly reasonsCache: DocumentDependentCache<string, ImpurityReason[]>;
 
     constructor(services: SafeDsServices) {
         this.astNodeLocator = services.workspace.AstNodeLocator;
@@ -49,7 +50,7 @@ export class SafeDsPurityComputer {
         this.builtinImpurityReasons = services.builtins.ImpurityReasons;
         this.callGraphComputer = services.flow.CallGraphComputer;
 
-        this.reasonsCache = new WorkspaceCache(services.shared);
+        this.reasonsCache = new DocumentDependentCache(services.workspace.DocumentDependencyTracker);
     }
 
     // We need separate methods for callables and expressions because lambdas are both. The caller must decide whether
@@ -200,8 +201,9 @@ export class SafeDsPurityComputer {
 
         // Cache the result if no substitutions are given
         if (isEmpty(substitutions)) {
-            const key = this.getNodeId(node);
-            return this.reasonsCache.get(key, () => this.doGetImpurityReasons(node, substitutions));
+            const documentUri = AstUtils.getDocument(node).uri;
+            const nodePath = this.astNodeLocator.getAstNodePath(node);
+            return this.reasonsCache.get(documentUri, nodePath, () => this.doGetImpurityReasons(node, substitutions));
         } else {
             /* c8 ignore next 2 */
             return this.doGetImpurityReasons(node, substitutions);
@@ -284,12 +286,6 @@ export class SafeDsPurityComputer {
 
         return getParameters(node).find((it) => it.name === parameterName.value);
     }
-
-    private getNodeId(node: AstNode) {
-        const documentUri = AstUtils.getDocument(node).uri.toString();
-        const nodePath = this.astNodeLocator.getAstNodePath(node);
-        return `${documentUri}~${nodePath}`;
-    }
 }
 
 const NO_SUBSTITUTIONS: ParameterSubstitutions = new Map();
@@ -9,10 +9,12 @@
 export type PythonServerMessage =
     | ProgramMessage
     | PlaceholderQueryMessage
+    | PlaceholderBatchQueryMessage
     | PlaceholderTypeMessage
     | PlaceholderValueMessage
     | RuntimeErrorMessage
     | RuntimeProgressMessage
+    | CancelMessage
     | ShutdownMessage;
 
 export type RuntimeProgress = 'done';
@@ -110,6 +112,17 @@ export interface PlaceholderQueryWindow {
     size?: number;
 }
 
+// Extension to Runner
+/**
+ * Message that contains a request to send back the values of several placeholders. The runner answers with a separate
+ * placeholder value message for each placeholder, as soon as its value is ready.
+ */
+export interface PlaceholderBatchQueryMessage {
+    type: 'placeholder_batch_query';
+    id: string;
+    data: PlaceholderQuery[];
+}
+
 // Runner to Extension
 /**
  * Message that contains information about a calculated placeholder.
@@ -265,6 +278,31 @@ export const createPlaceholderQueryMessage = function (
     };
 };
 
+export const createPlaceholderBatchQueryMessage = function (
+    id: string,
+    queries: PlaceholderQuery[],
+): PythonServerMessage {
+    return { type: 'placeholder_batch_query', id, data: queries };
+};
+
+// Extension to Runner
+/**
+ * Message that instructs the runner to stop the pipeline execution with the given id as soon as possible. Stored
+ * placeholder values of the execution may be discarded.
+ *
+ * There will be no response to this message, data field is therefore empty. Cancelling a finished execution has no
+ * effect.
+ */
+export interface CancelMessage {
+    type: 'cancel';
+    id: string;
+    data: '';
+}
+
+export const createCancelMessage = function (id: string): PythonServerMessage {
+    return { type: 'cancel', id, data: '' };
+};
+
 // Extension to Runner
 /**
  * Message that instructs the runner to shut itself down as soon as possible.
@@ -280,3 +318,183 @@ export interface ShutdownMessage {
 export const createShutdownMessage = function (): PythonServerMessage {
     return { type: 'shutdown', id: '', data: '' };
 };
+
+// Binary messages -----------------------------------------------------------------------------------------------------
+
+/*
+ * Large placeholder values can be sent by the runner in binary WebSocket frames instead of text frames. Each frame
+ * starts with the length of a header as an unsigned 32-bit big-endian integer, followed by the header as UTF-8 encoded
+ * JSON and the payload. A value can be split into several chunks, each of which is sent in its own frame.
+ */
+
+/**
+ * The header of a binary frame that contains a chunk of a placeholder value.
+ */
+export interface PlaceholderValueChunkHeader {
+    type: 'placeholder_value';
+    id: string;
+    data: PlaceholderValueChunkDescription;
+}
+
+/**
+ * Describes a placeholder value and which part of it is contained in the payload of a binary frame.
+ */
+export interface PlaceholderValueChunkDescription {
+    /**
+     * Name of the calculated placeholder.
+     */
+    name: string;
+
+    /**
+     * Type of the calculated placeholder.
+     */
+    type: string;
+
+    /**
+     * How the concatenated payloads of all chunks are encoded.
+     */
+    encoding: PlaceholderValueEncoding;
+
+    /**
+     * The zero-based index of this chunk.
+     */
+    chunkIndex: number;
+
+    /**
+     * The total number of chunks of the value.
+     */
+    chunkCount: number;
+
+    /**
+     * Optional windowing information when only a subset of the data was requested.
+     */
+    window?: PlaceholderValueWindow;
+}
+
+/**
+ * The encoding of the payload of a binary placeholder value:
+ *
+ * - `json`: UTF-8 encoded JSON, just like the value of a text message.
+ * - `png`: The raw bytes of a PNG image.
+ */
+export type PlaceholderValueEncoding = 'json' | 'png';
+
+const HEADER_LENGTH_BYTES = 4;
+
+/**
+ * Creates a binary frame with the given header and payload.
+ */
+export const encodeBinaryMessage = function (header: PlaceholderValueChunkHeader, payload: Uint8Array): Buffer {
+    const headerBytes = Buffer.from(JSON.stringify(header), 'utf-8');
+    const headerLength = Buffer.alloc(HEADER_LENGTH_BYTES);
+    headerLength.writeUInt32BE(headerBytes.length);
+    return Buffer.concat([headerLength, headerBytes, payload]);
+};
+
+/**
+ * Splits a binary frame into its header and payload. The payload shares its memory with the frame.
+ *
+ * @throws Error If the frame is malformed.
+ */
+export const decodeBinaryMessage = function (frame: Buffer): {
+    header: PlaceholderValueChunkHeader;
+    payload: Buffer;
+} {
+    if (frame.length < HEADER_LENGTH_BYTES) {
+        throw new Error('Binary message is too short to contain a header.');
+    }
+
+    const headerEnd = HEADER_LENGTH_BYTES + frame.readUInt32BE(0);
+    if (frame.length < headerEnd) {
+        throw new Error('Binary message is shorter than its header.');
+    }
+
+    const header = JSON.parse(frame.toString('utf-8', HEADER_LENGTH_BYTES, headerEnd));
+    if (header?.type !== 'placeholder_value') {
+        throw new Error(`Binary messages of type '${header?.type}' are not supported.`);
+    }
+
+    return { header, payload: frame.subarray(headerEnd) };
+};
+
+/**
+ * Collects the chunks of placeholder values that are sent in binary frames. Once all chunks of a value were received,
+ * they are joined and decoded into a regular placeholder value message.
+ */
+export class PlaceholderValueAssembler {
+    private readonly pendingValues = new Map<string, PendingPlaceholderValue>();
+
+    /**
+     * Adds a binary frame. Returns the complete placeholder value message if this was its last missing chunk, and
+     * `undefined` otherwise.
+     *
+     * @throws Error If the frame is malformed.
+     */
+    add(frame: Buffer): PlaceholderValueMessage | undefined {
+        const { header, payload } = decodeBinaryMessage(frame);
+        const { chunkIndex, chunkCount } = header.data;
+        if (!Number.isInteger(chunkCount) || chunkCount < 1 || chunkIndex < 0 || chunkIndex >= chunkCount) {
+            throw new Error(`Invalid chunk ${chunkIndex} of ${chunkCount}.`);
+        }
+
+        const key = `${header.id}\0${header.data.name}`;
+        let pendingValue = this.pendingValues.get(key);
+
+        // A different number of chunks means the runner started to send another version of the value
+        if (!pendingValue || pendingValue.chunks.length !== chunkCount) {
+            pendingValue = { header, chunks: new Array(chunkCount), receivedChunks: 0 };
+            this.pendingValues.set(key, pendingValue);
+        }
+
+        if (!pendingValue.chunks[chunkIndex]) {
+            pendingValue.receivedChunks++;
+        }
+        pendingValue.chunks[chunkIndex] = payload;
+
+        if (pendingValue.receivedChunks < chunkCount) {
+            return undefined;
+        }
+
+        this.pendingValues.delete(key);
+        const { name, type, encoding, window } = pendingValue.header.data;
+        return {
+            type: 'placeholder_value',
+            id: header.id,
+            data: {
+                name,
+                type,
+                value: decodePayload(encoding, Buffer.concat(pendingValue.chunks)),
+                window,
+            },
+        };
+    }
+
+    /**
+     * Discards the partially received values of the given execution. If names are given, only the values of these
+     * placeholders are discarded.
+     */
+    discard(id: string, names?: ReadonlySet<string>): void {
+        for (const [key, pendingValue] of this.pendingValues) {
+            if (pendingValue.header.id === id && (!names || names.has(pendingValue.header.data.name))) {
+                this.pendingValues.delete(key);
+            }
+        }
+    }
+}
+
+interface PendingPlaceholderValue {
+    readonly header: PlaceholderValueChunkHeader;
+    readonly chunks: Buffer[];
+    receivedChunks: number;
+}
+
+const decodePayload = (encoding: PlaceholderValueEncoding, payload: Buffer): any => {
+    switch (encoding) {
+        case 'json':
+            return JSON.parse(payload.toString('utf-8'));
+        case 'png':
+            return { format: 'png', bytes: payload.toString('base64') };
+        default:
+            throw new Error(`Unsupported encoding '${encoding}'.`);
+    }
+};
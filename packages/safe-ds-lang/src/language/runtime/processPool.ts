@@ -0,0 +1,101 @@
+/**
+ * The priority of a pipeline execution. Interactive executions, like showing the value of a placeholder, are waited for
+ * by the user. Background executions, like running a whole pipeline, may take long.
+ */
+export type ExecutionPriority = 'interactive' | 'background';
+
+/**
+ * A process that can be part of a pool.
+ */
+export interface PooledProcess {
+    /**
+     * The IDs of the executions that run on this process.
+     */
+    readonly runningExecutions: ReadonlySet<string>;
+
+    /**
+     * Stops the process.
+     */
+    stop(): Promise<void>;
+}
+
+/**
+ * A pool of processes that run pipeline executions. The first process is the primary one. It is always part of the
+ * pool, while further processes are added and removed as needed.
+ */
+export class ProcessPool<P extends PooledProcess> {
+    private readonly processes: P[];
+
+    /**
+     * The process that last ran each pipeline in the background.
+     */
+    private readonly pipelineProcesses = new Map<string, P>();
+
+    constructor(private readonly createProcess: (index: number) => P) {
+        this.processes = [createProcess(0)];
+    }
+
+    /**
+     * The primary process.
+     */
+    get primary(): P {
+        return this.processes[0]!;
+    }
+
+    /**
+     * All processes of the pool, starting with the primary one.
+     */
+    get all(): readonly P[] {
+        return this.processes;
+    }
+
+    /**
+     * Adds or removes processes, so the pool has the given size. It always keeps the primary process. Removed
+     * processes are stopped.
+     */
+    resize(size: number): void {
+        const processCount = Math.max(1, size);
+
+        while (this.processes.length < processCount) {
+            this.processes.push(this.createProcess(this.processes.length));
+        }
+        while (this.processes.length > processCount) {
+            this.processes.pop()!.stop();
+        }
+    }
+
+    /**
+     * Chooses the process that runs an execution of a pipeline:
+     *
+     * - Interactive executions always run on the primary process. Their values are often read by the language client,
+     *   which is only connected to this process.
+     * - Background executions of a pipeline stick to the process that ran it before, so the memoization cache of
+     *   this process stays warm. New pipelines go to the secondary process with the fewest running executions.
+     *
+     * This way, a long-running pipeline does not block interactive executions. If the pool has a single process,
+     * everything runs on the primary process.
+     *
+     * @param pipelineKey Identifies the pipeline.
+     * @param priority The priority of the execution.
+     */
+    choose(pipelineKey: string, priority: ExecutionPriority): P {
+        const secondaryProcesses = this.processes.slice(1);
+        if (priority === 'interactive' || secondaryProcesses.length === 0) {
+            return this.primary;
+        }
+
+        let result = this.pipelineProcesses.get(pipelineKey);
+        if (!result || !secondaryProcesses.includes(result)) {
+            result = secondaryProcesses.reduce((a, b) => (b.runningExecutions.size < a.runningExecutions.size ? b : a));
+            this.pipelineProcesses.set(pipelineKey, result);
+        }
+        return result;
+    }
+
+    /**
+     * Forgets which process ran each pipeline.
+     */
+    clearAssignments(): void {
+        this.pipelineProcesses.clear();
+    }
+}
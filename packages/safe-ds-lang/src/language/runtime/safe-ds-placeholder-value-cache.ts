@@ -0,0 +1,175 @@
+import { AstUtils, LangiumDocument, LangiumDocuments } from 'langium';
+import crypto from 'crypto';
+import fs from 'fs';
+import path from 'path';
+import { LruCache } from '../../helpers/lruCache.js';
+import { SafeDsSlicer } from '../flow/safe-ds-slicer.js';
+import { isSdsBlock, SdsStatement } from '../generated/ast.js';
+import { isStubFile } from '../helpers/fileExtensions.js';
+import { getStatements } from '../helpers/nodeProperties.js';
+import { FileRead } from '../purity/model.js';
+import { SafeDsPurityComputer } from '../purity/safe-ds-purity-computer.js';
+import { SafeDsServices } from '../safe-ds-module.js';
+import { ProgramCodeMap } from './messages.js';
+
+/**
+ * The maximum number of placeholder values that are kept.
+ */
+const MAX_CACHED_VALUES = 64;
+
+/**
+ * Keeps the values of placeholders that were fetched from the runner, so they can be shown again without executing the
+ * pipeline. Values are keyed by a fingerprint of everything the computation of the placeholder depends on.
+ *
+ * Only the value of the exact placeholder that was requested before is reused. Requesting another placeholder of the
+ * same pipeline still executes its whole backward slice. Intermediate results of those statements are reused by the
+ * memoization of the runner, not by this cache.
+ */
+export class SafeDsPlaceholderValueCache {
+    private readonly langiumDocuments: LangiumDocuments;
+    private readonly purityComputer: SafeDsPurityComputer;
+    private readonly slicer: SafeDsSlicer;
+
+    private readonly values = new LruCache<string, any>(MAX_CACHED_VALUES);
+
+    constructor(services: SafeDsServices) {
+        this.langiumDocuments = services.shared.workspace.LangiumDocuments;
+        this.purityComputer = services.purity.PurityComputer;
+        this.slicer = services.flow.Slicer;
+    }
+
+    /**
+     * Computes a fingerprint for the value of a placeholder. It covers
+     *
+     * - the Python code that is generated to compute the placeholder,
+     * - the texts of all Safe-DS pipeline files that the document references transitively, and
+     * - the modification times of all files that are read to compute the placeholder.
+     *
+     * Returns `undefined` if the value cannot be cached, since its computation has an impurity reason other than
+     * reading a file with a constant path.
+     *
+     * @param statement The statement that declares the placeholder.
+     * @param placeholderName The name of the placeholder in the generated code.
+     * @param codeMap The code that is sent to the runner to compute the placeholder.
+     */
+    computeFingerprint(statement: SdsStatement, placeholderName: string, codeMap: ProgramCodeMap): string | undefined {
+        const block = statement.$container;
+        if (!isSdsBlock(block)) {
+            /* c8 ignore next 2 */
+            return undefined;
+        }
+
+        const document = AstUtils.getDocument(statement);
+        const slice = this.slicer.computeBackwardSliceToTargets(getStatements(block), [statement]);
+        const modificationTimes = this.getModificationTimesOfReadFiles(document, slice);
+        if (!modificationTimes) {
+            return undefined;
+        }
+
+        const hash = crypto.createHash('sha256');
+        hash.update(`${placeholderName}\0`);
+        hash.update(JSON.stringify(codeMap));
+        hash.update('\0');
+
+        for (const [fsPath, modificationTime] of modificationTimes) {
+            hash.update(`${fsPath}\0${modificationTime}\0`);
+        }
+
+        for (const referencedDocument of this.getReferencedPipelineDocuments(document)) {
+            hash.update(`${referencedDocument.uri.toString()}\0`);
+            hash.update(referencedDocument.textDocument.getText());
+            hash.update('\0');
+        }
+
+        return hash.digest('hex');
+    }
+
+    /**
+     * Returns the cached value for the fingerprint or `undefined` if there is none.
+     */
+    get(fingerprint: string | undefined): any | undefined {
+        if (fingerprint === undefined) {
+            return undefined;
+        }
+
+        return this.values.get(fingerprint);
+    }
+
+    /**
+     * Caches the value for the fingerprint. Nothing is cached if the fingerprint or the value is `undefined`.
+     */
+    set(fingerprint: string | undefined, value: any | undefined): void {
+        if (fingerprint === undefined || value === undefined) {
+            return;
+        }
+
+        this.values.set(fingerprint, value);
+    }
+
+    /**
+     * Removes all cached values.
+     */
+    clear(): void {
+        this.values.clear();
+    }
+
+    /**
+     * Returns the modification times of the files that are read by the given statements, sorted by path. Returns
+     * `undefined` if a statement has another impurity reason or a read file does not exist.
+     */
+    private getModificationTimesOfReadFiles(
+        document: LangiumDocument,
+        statements: SdsStatement[],
+    ): [string, number][] | undefined {
+        const cwd = path.dirname(document.uri.fsPath);
+        const result = new Map<string, number>();
+
+        for (const statement of statements) {
+            for (const reason of this.purityComputer.getImpurityReasonsForStatement(statement)) {
+                if (!(reason instanceof FileRead) || typeof reason.path !== 'string') {
+                    return undefined;
+                }
+
+                const fsPath = path.resolve(cwd, reason.path);
+                if (!result.has(fsPath)) {
+                    try {
+                        result.set(fsPath, fs.statSync(fsPath).mtimeMs);
+                    } catch {
+                        return undefined;
+                    }
+                }
+            }
+        }
+
+        return Array.from(result).sort(([a], [b]) => a.localeCompare(b));
+    }
+
+    /**
+     * Returns all pipeline files that the document references transitively, sorted by URI. Stub files are not
+     * included, since changes to them are reflected in the generated code.
+     */
+    private getReferencedPipelineDocuments(document: LangiumDocument): LangiumDocument[] {
+        const visited = new Map<string, LangiumDocument>([[document.uri.toString(), document]]);
+        const queue = [document];
+
+        while (queue.length > 0) {
+            const current = queue.pop()!;
+
+            for (const reference of current.references) {
+                const targetUri = reference.$nodeDescription?.documentUri;
+                if (!targetUri || visited.has(targetUri.toString())) {
+                    continue;
+                }
+
+                const target = this.langiumDocuments.getDocument(targetUri);
+                if (target && !isStubFile(target)) {
+                    visited.set(targetUri.toString(), target);
+                    queue.push(target);
+                }
+            }
+        }
+
+        visited.delete(document.uri.toString());
+        return Array.from(visited.values()).sort((a, b) => a.uri.toString().localeCompare(b.uri.toString()));
+    }
+}
@@ -3,8 +3,20 @@ import treeKill from 'tree-kill';
 import { SafeDsLogger, SafeDsMessagingProvider } from '../communication/safe-ds-messaging-provider.js';
 import child_process from 'child_process';
 import WebSocket from 'ws';
-import { createShutdownMessage, PythonServerMessage } from './messages.js';
+import {
+    createCancelMessage,
+    createPlaceholderBatchQueryMessage,
+    createPlaceholderQueryMessage,
+    createShutdownMessage,
+    PlaceholderQuery,
+    PlaceholderValue,
+    PlaceholderValueAssembler,
+    PlaceholderValueMessage,
+    ProgramMessage,
+    PythonServerMessage,
+} from './messages.js';
 import { Disposable } from 'langium';
+import { LruCache } from '../../helpers/lruCache.js';
 import { SafeDsSettingsProvider } from '../workspace/safe-ds-settings-provider.js';
 import semver from 'semver';
 import net, { AddressInfo } from 'node:net';
@@ -15,26 +27,64 @@ import {
     StartRunnerNotification,
     UpdateRunnerNotification,
 } from '../communication/rpc.js';
+import { ExecutionPriority, ProcessPool } from './processPool.js';
 
 const LOWEST_SUPPORTED_RUNNER_VERSION = '0.19.0';
 const LOWEST_UNSUPPORTED_RUNNER_VERSION = '0.20.0';
 const npmVersionRange = `>=${LOWEST_SUPPORTED_RUNNER_VERSION} <${LOWEST_UNSUPPORTED_RUNNER_VERSION}`;
 export const pipVersionRange = `>=${LOWEST_SUPPORTED_RUNNER_VERSION},<${LOWEST_UNSUPPORTED_RUNNER_VERSION}`;
 
+/**
+ * The lowest runner versions that understand optional messages. Older runners ignore these messages, so they are only
+ * sent if the runner is known to support them.
+ */
+const RUNNER_FEATURE_VERSIONS = {
+    batchQueries: '0.20.0',
+    cancellation: '0.20.0',
+} as const;
+
+/**
+ * An optional part of the protocol between the language server and the runner.
+ */
+export type RunnerFeature = keyof typeof RUNNER_FEATURE_VERSIONS;
+
+/**
+ * The number of executions whose runner process is remembered, so later messages about them reach the right process.
+ */
+const MAX_TRACKED_EXECUTIONS = 1024;
+
 /* c8 ignore start */
 export class SafeDsPythonServer {
     private readonly logger: SafeDsLogger;
     private readonly messaging: SafeDsMessagingProvider;
     private readonly settingsProvider: SafeDsSettingsProvider;
 
-    private state: State = stopped;
     private restartTracker = new RestartTracker();
     private messageCallbacks: Map<PythonServerMessage['type'], ((message: PythonServerMessage) => void)[]> = new Map();
+    private cancellationListeners: Map<string, (() => void)[]> = new Map();
+
+    /**
+     * The runner processes. The language client connects to the primary one.
+     */
+    private readonly pool: ProcessPool<RunnerProcess>;
+
+    /**
+     * The validated runner command. It is used to start further processes on demand.
+     */
+    private command: string | undefined = undefined;
+
+    /**
+     * The version of the runner, if it is known.
+     */
+    private runnerVersion: string | undefined = undefined;
+
+    private readonly executionProcesses = new LruCache<string, RunnerProcess>(MAX_TRACKED_EXECUTIONS);
 
     constructor(services: SafeDsServices) {
         this.logger = services.communication.MessagingProvider.createTaggedLogger('Python Server');
         this.messaging = services.communication.MessagingProvider;
         this.settingsProvider = services.workspace.SettingsProvider;
+        this.pool = new ProcessPool((index) => this.createProcess(index));
 
         // Restart if the runner command changes
         services.workspace.SettingsProvider.onRunnerCommandUpdate(async () => {
@@ -59,38 +109,44 @@ export class SafeDsPythonServer {
      * Whether the Python server is started and ready to accept requests.
      */
     get isStarted(): boolean {
-        return isStarted(this.state);
+        return this.primaryProcess.isStarted;
+    }
+
+    /**
+     * The process that the language client connects to.
+     */
+    private get primaryProcess(): RunnerProcess {
+        return this.pool.primary;
     }
 
     /**
-     * Start the Python server and connect to it.
+     * Start the Python server and connect to it. Further processes of the pool are started once they are needed.
      */
     private async start(): Promise<void> {
-        if (!isStopped(this.state)) {
+        if (!this.primaryProcess.reserve()) {
             return;
         }
-        this.state = starting();
         this.logger.info('Starting...');
 
         // Get the runner command
         const command = await this.getValidRunnerCommand();
         if (!command) {
-            this.state = stopped;
+            this.primaryProcess.release();
             return;
         }
+        this.command = command;
 
-        // Start the server at a free port
-        const port = await this.getFreePort();
-        this.startServerProcess(command, port);
-
-        // Connect to the server
-        await this.connectToServer(port);
+        // Start the server at a free port and connect to it
+        const port = await this.primaryProcess.launch(command);
 
         // Notify the services in the language client that the process has started.
         // TODO: Removed once all the execution logic is in the language server.
-        if (isStarted(this.state)) {
+        if (port !== undefined && this.isStarted) {
             this.logger.info('Started successfully.');
-            await this.messaging.sendNotification(RunnerStartedNotification.type, { port });
+            await this.messaging.sendNotification(RunnerStartedNotification.type, {
+                port,
+                version: this.runnerVersion,
+            });
         }
     }
 
@@ -99,30 +155,9 @@ export class SafeDsPythonServer {
      */
     // TODO make private once the execution logic is fully handled in the language server
     async stop(): Promise<void> {
-        if (!isStarting(this.state) && !isStarted(this.state)) {
-            return;
-        }
-        this.state = stopping(this.state?.serverProcess, this.state?.serverConnection);
-        this.logger.info('Stopping...');
-
-        // Attempt a graceful shutdown first
-        await this.stopServerProcessGracefully(2500);
-        if (isStopped(this.state)) {
-            this.logger.info('Stopped successfully.');
-            return;
-        }
-
-        // If the graceful shutdown failed, kill the server process
-        this.logger.debug('Graceful shutdown failed. Killing the server process...');
-        await this.killServerProcess();
-        if (isStopped(this.state)) {
-            this.logger.info('Stopped successfully.');
-            return;
-        }
-
-        // The server could not be stopped
-        this.logger.error('Could not stop the server.');
-        this.state = failed;
+        this.pool.clearAssignments();
+        this.executionProcesses.clear();
+        await Promise.all(this.pool.all.map((it) => it.stop()));
     }
 
     /**
@@ -140,6 +175,87 @@ export class SafeDsPythonServer {
         await this.start();
     }
 
+    // Process pool ----------------------------------------------------------------------------------------------------
+
+    private createProcess(index: number): RunnerProcess {
+        const tag = index === 0 ? 'Python Server' : `Python Server ${index + 1}`;
+
+        const runnerProcess: RunnerProcess = new RunnerProcess(this.messaging.createTaggedLogger(tag), {
+            onMessage: (message) => this.dispatchMessage(message),
+            onUnexpectedClose: () => {
+                if (runnerProcess === this.primaryProcess) {
+                    this.restart(true);
+                }
+                // Other processes are started again once they are needed
+            },
+            onStartFailed: (pendingMessages) => this.handleFailedStart(runnerProcess, pendingMessages),
+        });
+        return runnerProcess;
+    }
+
+    /**
+     * Chooses the process that executes a program and starts it if needed. Programs only run on other processes than
+     * the primary one if we started the primary process ourselves, so we can start further processes in the same way.
+     */
+    private scheduleProgram(message: ProgramMessage, priority: ExecutionPriority): RunnerProcess {
+        if (this.command === undefined) {
+            return this.primaryProcess;
+        }
+
+        this.pool.resize(this.settingsProvider.getRunnerProcessCount());
+        const { modulepath, module, pipeline } = message.data.main;
+        const runnerProcess = this.pool.choose(`${modulepath}.${module}.${pipeline}`, priority);
+
+        // Messages are queued until the process is started
+        if (runnerProcess.reserve()) {
+            runnerProcess.launch(this.command);
+        }
+
+        return runnerProcess;
+    }
+
+    /**
+     * Handles the messages that were queued for a process that could not be started. If it is not the primary process,
+     * the executions move to the primary process. Otherwise, they fail, so nobody waits for them forever.
+     */
+    private handleFailedStart(runnerProcess: RunnerProcess, pendingMessages: PythonServerMessage[]): void {
+        const canFallBack = runnerProcess !== this.primaryProcess && this.primaryProcess.isStarted;
+        if (canFallBack) {
+            this.logger.warn('Could not start a further process. Falling back to the primary process.');
+        }
+
+        for (const message of pendingMessages) {
+            if (canFallBack) {
+                if (message.type === 'program') {
+                    this.executionProcesses.set(message.id, this.primaryProcess);
+                    this.primaryProcess.runningExecutions.add(message.id);
+                }
+                this.primaryProcess.send(message);
+            } else if (message.type === 'program') {
+                this.dispatchMessage({
+                    type: 'runtime_error',
+                    id: message.id,
+                    data: { message: 'The runner could not be started.', backtrace: [] },
+                });
+            }
+        }
+    }
+
+    private dispatchMessage(pythonServerMessage: PythonServerMessage): void {
+        // Executions end with a progress message or an error
+        if (pythonServerMessage.type === 'runtime_progress' || pythonServerMessage.type === 'runtime_error') {
+            this.executionProcesses.get(pythonServerMessage.id)?.runningExecutions.delete(pythonServerMessage.id);
+        }
+
+        if (!this.messageCallbacks.has(pythonServerMessage.type)) {
+            this.logger.trace(`Message type '${pythonServerMessage.type}' is not handled`, undefined);
+            return;
+        }
+        for (const callback of this.messageCallbacks.get(pythonServerMessage.type)!) {
+            callback(pythonServerMessage);
+        }
+    }
+
     // Command handling ------------------------------------------------------------------------------------------------
 
     /**
@@ -167,6 +283,8 @@ export class SafeDsPythonServer {
             return undefined;
         }
 
+        this.runnerVersion = installedVersion;
+
         // Check whether a new version of the runner is available
         const latestVersion = await this.getLatestMatchingRunnerVersion();
         if (latestVersion && semver.gt(latestVersion, installedVersion)) {
@@ -235,6 +353,443 @@ export class SafeDsPythonServer {
         return semver.satisfies(version, npmVersionRange);
     }
 
+    /**
+     * Check whether the runner understands an optional part of the protocol. If the version of the runner is unknown,
+     * it is assumed to only support the required messages.
+     */
+    public supportsFeature(feature: RunnerFeature): boolean {
+        return this.runnerVersion !== undefined && semver.gte(this.runnerVersion, RUNNER_FEATURE_VERSIONS[feature]);
+    }
+
+    // User interaction ------------------------------------------------------------------------------------------------
+
+    /**
+     * Report to the user that the runner cannot be started with the configured command.
+     */
+    private async reportBadRunnerCommand(command: string, error: unknown): Promise<void> {
+        const message = error instanceof Error ? error.message : String(error);
+        this.logger.error(`Could not start runner with command "${command}": ${message}`);
+
+        // Show an error message to the user and offer to install the runner
+        const action = await this.messaging.showErrorMessage(`The runner could not be started.`, {
+            title: 'Install runner',
+        });
+        if (action?.title === 'Install runner') {
+            await this.messaging.sendNotification(InstallRunnerNotification.type);
+        }
+    }
+
+    /**
+     * Report to the user that the runner version does not match the required version range.
+     */
+    private async reportInvalidRunnerVersion(version: string): Promise<void> {
+        this.logger.error(`Installed runner version ${version} is not in range "${pipVersionRange}".`);
+
+        // Show an error message to the user and offer to update the runner
+        const action = await this.messaging.showErrorMessage(
+            `The runner must be updated to a version in the range "${pipVersionRange}".`,
+            { title: 'Update runner' },
+        );
+        if (action?.title === 'Update runner') {
+            await this.messaging.sendNotification(UpdateRunnerNotification.type);
+        }
+    }
+
+    /**
+     * Report to the user that the installed runner is outdated.
+     *
+     * @returns Whether the user decided to update the runner. Returning `true` aborts the start process.
+     */
+    private async reportOutdatedRunner(installedVersion: string, availableVersion: string): Promise<boolean> {
+        this.logger.info(
+            `Installed runner version ${installedVersion} is outdated. Latest version is ${availableVersion}.`,
+        );
+
+        // Show an error message to the user and offer to update the runner
+        const action = await this.messaging.showInformationMessage(`A new version of the runner is available.`, {
+            title: 'Update runner',
+        });
+        if (action?.title === 'Update runner') {
+            await this.messaging.sendNotification(UpdateRunnerNotification.type);
+            return true;
+        } else {
+            return false;
+        }
+    }
+
+    // TODO ------------------------------------------------------------------------------------------------------------
+
+    /**
+     * Send a message to the python server using the websocket connection. Programs are scheduled on a process of the
+     * pool, all other messages are sent to the process that runs the execution they refer to.
+     *
+     * @param message Message to be sent to the python server. This message should be serializable to JSON.
+     * @param priority The priority of the execution if the message is a program.
+     */
+    public sendMessageToPythonServer(message: PythonServerMessage, priority: ExecutionPriority = 'interactive'): void {
+        let runnerProcess: RunnerProcess;
+        if (message.type === 'program') {
+            runnerProcess = this.scheduleProgram(message, priority);
+            this.executionProcesses.set(message.id, runnerProcess);
+            runnerProcess.runningExecutions.add(message.id);
+        } else {
+            runnerProcess = this.executionProcesses.get(message.id) ?? this.primaryProcess;
+        }
+
+        runnerProcess.send(message);
+    }
+
+    /**
+     * Request the values of several placeholders of a pipeline execution. If the runner supports it, all placeholders
+     * are requested with a single message, otherwise with one message each. The runner sends each value as soon as it
+     * is ready, and `onValue` is called for it right away.
+     *
+     * @param id The id of the pipeline execution.
+     * @param queries The requested placeholders. Each placeholder may only be requested once.
+     * @param onValue Called for each value once it arrives.
+     * @param timeoutMs How long to wait for all values.
+     * @returns The received values by placeholder name. Values that did not arrive before the timeout are missing, and
+     * chunks of them that were already received are discarded.
+     */
+    public async queryPlaceholders(
+        id: string,
+        queries: PlaceholderQuery[],
+        onValue?: (value: PlaceholderValue) => void,
+        timeoutMs: number = 30000,
+    ): Promise<Map<string, PlaceholderValue>> {
+        const result = new Map<string, PlaceholderValue>();
+        const pendingNames = new Set(queries.map((it) => it.name));
+        if (pendingNames.size === 0) {
+            return result;
+        }
+
+        return new Promise((resolve) => {
+            const finish = () => {
+                disposable.dispose();
+                cancellationDisposable.dispose();
+                clearTimeout(timeout);
+                resolve(result);
+            };
+
+            const disposable = this.addMessageCallback('placeholder_value', (message: PlaceholderValueMessage) => {
+                if (message.id !== id || !pendingNames.delete(message.data.name)) {
+                    return;
+                }
+
+                result.set(message.data.name, message.data);
+                onValue?.(message.data);
+                if (pendingNames.size === 0) {
+                    finish();
+                }
+            });
+            const cancellationDisposable = this.onExecutionCancelled(id, finish);
+            const timeout = setTimeout(() => {
+                // Chunks of the missing values that were already received are useless now
+                (this.executionProcesses.get(id) ?? this.primaryProcess).discardPartialValues(id, pendingNames);
+                finish();
+            }, timeoutMs);
+
+            if (this.supportsFeature('batchQueries')) {
+                this.sendMessageToPythonServer(createPlaceholderBatchQueryMessage(id, queries));
+            } else {
+                for (const { name, window } of queries) {
+                    this.sendMessageToPythonServer(createPlaceholderQueryMessage(id, name, window.begin, window.size));
+                }
+            }
+        });
+    }
+
+    /**
+     * Cancel a pipeline execution. The listeners that were registered with `onExecutionCancelled` are called, so they
+     * can remove their callbacks and timers. Pending placeholder queries of the execution resolve right away.
+     *
+     * If the program was not sent yet, it is dropped. Otherwise, the runner stops computing it if it supports
+     * cancellation. Older runners finish the execution, but its results are ignored.
+     *
+     * @param id The id of the pipeline execution.
+     */
+    public cancelExecution(id: string): void {
+        const runnerProcess = this.executionProcesses.get(id);
+        if (runnerProcess?.runningExecutions.has(id)) {
+            runnerProcess.cancel(id, this.supportsFeature('cancellation'));
+        }
+
+        const listeners = this.cancellationListeners.get(id) ?? [];
+        this.cancellationListeners.delete(id);
+        for (const listener of listeners) {
+            listener();
+        }
+    }
+
+    /**
+     * Register a listener that is called once the pipeline execution is cancelled. Dispose the listener once the
+     * execution is finished.
+     *
+     * @param id The id of the pipeline execution.
+     * @param listener The listener to call.
+     */
+    public onExecutionCancelled(id: string, listener: () => void): Disposable {
+        if (!this.cancellationListeners.has(id)) {
+            this.cancellationListeners.set(id, []);
+        }
+        this.cancellationListeners.get(id)!.push(listener);
+        return Disposable.create(() => {
+            const remainingListeners = (this.cancellationListeners.get(id) ?? []).filter((it) => it !== listener);
+            if (remainingListeners.length === 0) {
+                this.cancellationListeners.delete(id);
+            } else {
+                this.cancellationListeners.set(id, remainingListeners);
+            }
+        });
+    }
+
+    /**
+     * Register a callback to execute when a message from the python server arrives.
+     *
+     * @param messageType Message type to register the callback for.
+     * @param callback Callback to execute
+     */
+    public addMessageCallback<M extends PythonServerMessage['type']>(
+        messageType: M,
+        callback: (message: Extract<PythonServerMessage, { type: M }>) => void,
+    ): Disposable {
+        if (!this.messageCallbacks.has(messageType)) {
+            this.messageCallbacks.set(messageType, []);
+        }
+        this.messageCallbacks.get(messageType)!.push(<(message: PythonServerMessage) => void>callback);
+        return Disposable.create(() => {
+            if (!this.messageCallbacks.has(messageType)) {
+                return;
+            }
+            this.messageCallbacks.set(
+                messageType,
+                this.messageCallbacks.get(messageType)!.filter((storedCallback) => storedCallback !== callback),
+            );
+        });
+    }
+
+    /**
+     * Remove a previously registered callback from being called when a message from the python server arrives.
+     *
+     * @param messageType Message type the callback was registered for.
+     * @param callback Callback to remove
+     */
+    public removeMessageCallback<M extends PythonServerMessage['type']>(
+        messageType: M,
+        callback: (message: Extract<PythonServerMessage, { type: M }>) => void,
+    ): void {
+        if (!this.messageCallbacks.has(messageType)) {
+            return;
+        }
+        this.messageCallbacks.set(
+            messageType,
+            this.messageCallbacks.get(messageType)!.filter((storedCallback) => storedCallback !== callback),
+        );
+    }
+
+    /**
+     * Connect to a Python server that was started by another process. No further processes are started.
+     *
+     * @param port The port the server is listening on.
+     * @param version The version of the runner. Optional messages are only sent if it is known.
+     */
+    async connectToPort(port: number, version?: string): Promise<void> {
+        if (!this.primaryProcess.reserve()) {
+            return;
+        }
+        this.runnerVersion = version;
+
+        await this.primaryProcess.connect(port);
+    }
+}
+
+// Runner processes ----------------------------------------------------------------------------------------------------
+
+interface RunnerProcessCallbacks {
+    /**
+     * Called for each complete message that the process sends.
+     */
+    onMessage(message: PythonServerMessage): void;
+
+    /**
+     * Called if the connection to a process that was started by us closes although it was not stopped.
+     */
+    onUnexpectedClose(): void;
+
+    /**
+     * Called if the process could not be started. The messages that were queued for it are passed on.
+     */
+    onStartFailed(pendingMessages: PythonServerMessage[]): void;
+}
+
+/**
+ * A single runner process and the connection to it.
+ */
+class RunnerProcess {
+    private state: State = stopped;
+    private placeholderValueAssembler = new PlaceholderValueAssembler();
+
+    /**
+     * Messages that are sent once the process is started.
+     */
+    private pendingMessages: PythonServerMessage[] = [];
+
+    /**
+     * The IDs of the executions that run on this process.
+     */
+    readonly runningExecutions = new Set<string>();
+
+    constructor(
+        private readonly logger: SafeDsLogger,
+        private readonly callbacks: RunnerProcessCallbacks,
+    ) {}
+
+    get isStarted(): boolean {
+        return isStarted(this.state);
+    }
+
+    /**
+     * Marks the process as starting if it is stopped.
+     *
+     * @returns Whether the process was stopped, so the caller must start it.
+     */
+    reserve(): boolean {
+        if (!isStopped(this.state)) {
+            return false;
+        }
+
+        this.state = starting();
+        return true;
+    }
+
+    /**
+     * Reverts `reserve` if the process cannot be started after all.
+     */
+    release(): void {
+        if (isStarting(this.state) && !this.state.serverProcess) {
+            this.state = stopped;
+            this.pendingMessages = [];
+        }
+    }
+
+    /**
+     * Starts the server at a free port and connects to it. The process must be reserved first.
+     *
+     * @returns The port of the server.
+     */
+    async launch(command: string): Promise<number | undefined> {
+        const port = await this.getFreePort();
+        this.startServerProcess(command, port);
+        await this.connect(port);
+        return this.isStarted ? port : undefined;
+    }
+
+    /**
+     * Connects to the server at the given port. The process must be reserved first.
+     */
+    async connect(port: number): Promise<void> {
+        try {
+            await this.doConnectToServer(port);
+        } catch {
+            // The executions are handed over with the pending messages
+            const pendingMessages = this.pendingMessages;
+            this.runningExecutions.clear();
+            await this.stop();
+            this.callbacks.onStartFailed(pendingMessages);
+        }
+    }
+
+    /**
+     * Stops the process. Executions that still run on it end with an error.
+     */
+    async stop(): Promise<void> {
+        this.pendingMessages = [];
+        this.failRunningExecutions('The runner was stopped.');
+
+        if (!isStarting(this.state) && !isStarted(this.state)) {
+            return;
+        }
+        this.state = stopping(this.state?.serverProcess, this.state?.serverConnection);
+        this.logger.info('Stopping...');
+
+        // Attempt a graceful shutdown first
+        await this.stopServerProcessGracefully(2500);
+        if (isStopped(this.state)) {
+            this.logger.info('Stopped successfully.');
+            return;
+        }
+
+        // If the graceful shutdown failed, kill the server process
+        this.logger.debug('Graceful shutdown failed. Killing the server process...');
+        await this.killServerProcess();
+        if (isStopped(this.state)) {
+            this.logger.info('Stopped successfully.');
+            return;
+        }
+
+        // The server could not be stopped
+        this.logger.error('Could not stop the server.');
+        this.state = failed;
+    }
+
+    /**
+     * Stops an execution. Programs that were not sent yet are dropped. Chunks of values of the execution that were
+     * already received are discarded.
+     *
+     * @param id The id of the execution.
+     * @param sendCancelMessage Whether to ask the runner to stop a program that was sent already.
+     */
+    cancel(id: string, sendCancelMessage: boolean): void {
+        this.runningExecutions.delete(id);
+        this.placeholderValueAssembler.discard(id);
+
+        const pendingCount = this.pendingMessages.length;
+        this.pendingMessages = this.pendingMessages.filter((it) => it.id !== id);
+        if (this.pendingMessages.length === pendingCount && sendCancelMessage) {
+            this.send(createCancelMessage(id));
+        }
+    }
+
+    /**
+     * Discards the chunks of the values of the given placeholders that were already received.
+     *
+     * @param id The id of the execution.
+     * @param names The names of the placeholders.
+     */
+    discardPartialValues(id: string, names: ReadonlySet<string>): void {
+        this.placeholderValueAssembler.discard(id, names);
+    }
+
+    /**
+     * Sends a message to the process. Messages are queued while the process is starting.
+     */
+    send(message: PythonServerMessage): void {
+        if (isStarting(this.state)) {
+            this.pendingMessages.push(message);
+            return;
+        } else if (!this.state.serverConnection) {
+            return;
+        }
+
+        const messageString = JSON.stringify(message);
+        this.logger.trace(`Sending message to python server: ${messageString}`);
+        this.state.serverConnection.send(messageString);
+    }
+
+    /**
+     * Ends all executions that run on this process with an error. No message of the runner would end them anymore, so
+     * nobody waits for them forever.
+     */
+    private failRunningExecutions(message: string): void {
+        const ids = Array.from(this.runningExecutions);
+        this.runningExecutions.clear();
+
+        for (const id of ids) {
+            this.placeholderValueAssembler.discard(id);
+            this.callbacks.onMessage({ type: 'runtime_error', id, data: { message, backtrace: [] } });
+        }
+    }
+
     // Port handling ---------------------------------------------------------------------------------------------------
 
     /**
@@ -303,7 +858,7 @@ export class SafeDsPythonServer {
             });
 
             // Send a shutdown message to the server. Do this last, so we don't miss the close event.
-            this.sendMessageToPythonServer(createShutdownMessage());
+            this.send(createShutdownMessage());
         });
     }
 
@@ -336,17 +891,6 @@ export class SafeDsPythonServer {
 
     // Socket handling -------------------------------------------------------------------------------------------------
 
-    /**
-     * Connect to the server using the given port.
-     */
-    private async connectToServer(port: number): Promise<void> {
-        try {
-            await this.doConnectToServer(port);
-        } catch {
-            await this.stop();
-        }
-    }
-
     private async doConnectToServer(port: number): Promise<void> {
         if (!isStarting(this.state)) {
             return;
@@ -362,12 +906,19 @@ export class SafeDsPythonServer {
                 const serverConnection = new WebSocket(`ws://127.0.0.1:${port}/WSMain`, {
                     handshakeTimeout: 10 * 1000,
                 });
+                serverConnection.binaryType = 'nodebuffer';
 
                 // Connected successfully
                 serverConnection.onopen = () => {
                     this.logger.debug(`Connected successfully.`);
                     this.state = started(this.state.serverProcess, serverConnection);
+                    this.placeholderValueAssembler = new PlaceholderValueAssembler();
                     resolve();
+
+                    // Send the messages that were queued while starting
+                    const pendingMessages = this.pendingMessages;
+                    this.pendingMessages = [];
+                    pendingMessages.forEach((it) => this.send(it));
                 };
 
                 // Handle connection errors
@@ -380,6 +931,7 @@ export class SafeDsPythonServer {
 
                         if (currentTry > maxConnectionTries) {
                             this.logger.error('Max retries reached. No further attempt at connecting is made.');
+                            reject();
                         } else {
                             this.logger.debug(`Not yet up. Retrying...`);
                             setTimeout(tryConnect, baseTimeoutMs * 2 ** (currentTry - 1)); // use exponential backoff
@@ -396,7 +948,10 @@ export class SafeDsPythonServer {
 
                 // Handle incoming messages
                 serverConnection.onmessage = (event) => {
-                    if (typeof event.data !== 'string') {
+                    if (Buffer.isBuffer(event.data)) {
+                        this.handleBinaryMessage(event.data);
+                        return;
+                    } else if (typeof event.data !== 'string') {
                         this.logger.trace(`Message received: (${event.type}, ${typeof event.data}) ${event.data}`);
                         return;
                     }
@@ -406,25 +961,20 @@ export class SafeDsPythonServer {
                         }'`,
                     );
 
-                    const pythonServerMessage: PythonServerMessage = JSON.parse(<string>event.data);
-                    if (!this.messageCallbacks.has(pythonServerMessage.type)) {
-                        this.logger.trace(`Message type '${pythonServerMessage.type}' is not handled`, undefined);
-                        return;
-                    }
-                    for (const callback of this.messageCallbacks.get(pythonServerMessage.type)!) {
-                        callback(pythonServerMessage);
-                    }
+                    this.dispatchMessage(JSON.parse(<string>event.data));
                 };
 
                 // Handle the server closing the connection
                 serverConnection.onclose = () => {
-                    if (
-                        isStarted(this.state) &&
-                        this.state.serverProcess &&
-                        this.state.serverConnection === serverConnection
-                    ) {
+                    if (!isStarted(this.state) || this.state.serverConnection !== serverConnection) {
+                        return;
+                    }
+
+                    // The runner cannot end the executions anymore, even if we did not start it ourselves
+                    this.failRunningExecutions('The connection to the runner was closed unexpectedly.');
+                    if (this.state.serverProcess) {
                         this.logger.error('Connection was unexpectedly closed');
-                        this.restart(true);
+                        this.callbacks.onUnexpectedClose();
                     }
                 };
             };
@@ -432,134 +982,31 @@ export class SafeDsPythonServer {
         });
     }
 
-    // User interaction ------------------------------------------------------------------------------------------------
-
-    /**
-     * Report to the user that the runner cannot be started with the configured command.
-     */
-    private async reportBadRunnerCommand(command: string, error: unknown): Promise<void> {
-        const message = error instanceof Error ? error.message : String(error);
-        this.logger.error(`Could not start runner with command "${command}": ${message}`);
-
-        // Show an error message to the user and offer to install the runner
-        const action = await this.messaging.showErrorMessage(`The runner could not be started.`, {
-            title: 'Install runner',
-        });
-        if (action?.title === 'Install runner') {
-            await this.messaging.sendNotification(InstallRunnerNotification.type);
-        }
-    }
-
     /**
-     * Report to the user that the runner version does not match the required version range.
+     * Handle a binary frame that contains a chunk of a placeholder value. Large values are sent this way, so they don't
+     * have to be embedded in a JSON string. Messages are dispatched once all chunks of a value were received.
      */
-    private async reportInvalidRunnerVersion(version: string): Promise<void> {
-        this.logger.error(`Installed runner version ${version} is not in range "${pipVersionRange}".`);
-
-        // Show an error message to the user and offer to update the runner
-        const action = await this.messaging.showErrorMessage(
-            `The runner must be updated to a version in the range "${pipVersionRange}".`,
-            { title: 'Update runner' },
-        );
-        if (action?.title === 'Update runner') {
-            await this.messaging.sendNotification(UpdateRunnerNotification.type);
-        }
-    }
-
-    /**
-     * Report to the user that the installed runner is outdated.
-     *
-     * @returns Whether the user decided to update the runner. Returning `true` aborts the start process.
-     */
-    private async reportOutdatedRunner(installedVersion: string, availableVersion: string): Promise<boolean> {
-        this.logger.info(
-            `Installed runner version ${installedVersion} is outdated. Latest version is ${availableVersion}.`,
-        );
-
-        // Show an error message to the user and offer to update the runner
-        const action = await this.messaging.showInformationMessage(`A new version of the runner is available.`, {
-            title: 'Update runner',
-        });
-        if (action?.title === 'Update runner') {
-            await this.messaging.sendNotification(UpdateRunnerNotification.type);
-            return true;
-        } else {
-            return false;
-        }
-    }
-
-    // TODO ------------------------------------------------------------------------------------------------------------
+    private handleBinaryMessage(frame: Buffer): void {
+        this.logger.trace(`Binary message received: ${frame.length} bytes`);
 
-    /**
-     * Send a message to the python server using the websocket connection.
-     *
-     * @param message Message to be sent to the python server. This message should be serializable to JSON.
-     */
-    public sendMessageToPythonServer(message: PythonServerMessage): void {
-        if (!this.state.serverConnection) {
-            return;
-        }
-
-        const messageString = JSON.stringify(message);
-        this.logger.trace(`Sending message to python server: ${messageString}`);
-        this.state.serverConnection.send(messageString);
-    }
-
-    /**
-     * Register a callback to execute when a message from the python server arrives.
-     *
-     * @param messageType Message type to register the callback for.
-     * @param callback Callback to execute
-     */
-    public addMessageCallback<M extends PythonServerMessage['type']>(
-        messageType: M,
-        callback: (message: Extract<PythonServerMessage, { type: M }>) => void,
-    ): Disposable {
-        if (!this.messageCallbacks.has(messageType)) {
-            this.messageCallbacks.set(messageType, []);
-        }
-        this.messageCallbacks.get(messageType)!.push(<(message: PythonServerMessage) => void>callback);
-        return Disposable.create(() => {
-            if (!this.messageCallbacks.has(messageType)) {
-                return;
+        try {
+            const pythonServerMessage = this.placeholderValueAssembler.add(frame);
+            if (pythonServerMessage) {
+                this.dispatchMessage(pythonServerMessage);
             }
-            this.messageCallbacks.set(
-                messageType,
-                this.messageCallbacks.get(messageType)!.filter((storedCallback) => storedCallback !== callback),
-            );
-        });
-    }
-
-    /**
-     * Remove a previously registered callback from being called when a message from the python server arrives.
-     *
-     * @param messageType Message type the callback was registered for.
-     * @param callback Callback to remove
-     */
-    public removeMessageCallback<M extends PythonServerMessage['type']>(
-        messageType: M,
-        callback: (message: Extract<PythonServerMessage, { type: M }>) => void,
-    ): void {
-        if (!this.messageCallbacks.has(messageType)) {
-            return;
+        } catch (error) {
+            this.logger.error(`Could not read binary message: ${error instanceof Error ? error.message : error}`);
         }
-        this.messageCallbacks.set(
-            messageType,
-            this.messageCallbacks.get(messageType)!.filter((storedCallback) => storedCallback !== callback),
-        );
     }
 
-    async connectToPort(port: number): Promise<void> {
-        if (!isStopped(this.state)) {
-            return;
+    private dispatchMessage(pythonServerMessage: PythonServerMessage): void {
+        // The remaining chunks of values of a failed execution never arrive. Values of finished executions can still be
+        // in flight, so they are only discarded once their query times out.
+        if (pythonServerMessage.type === 'runtime_error') {
+            this.placeholderValueAssembler.discard(pythonServerMessage.id);
         }
-        this.state = starting();
 
-        try {
-            await this.doConnectToServer(port);
-        } catch {
-            await this.stop();
-        }
+        this.callbacks.onMessage(pythonServerMessage);
     }
 }
 
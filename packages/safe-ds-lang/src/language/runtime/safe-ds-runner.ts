@@ -1,14 +1,15 @@
 import { SafeDsServices } from '../safe-ds-module.js';
-import { AstNodeLocator, AstUtils, Disposable, LangiumDocument, LangiumDocuments, URI } from 'langium';
-import path from 'path';
 import {
-    createPlaceholderQueryMessage,
-    createProgramMessage,
-    PlaceholderValueMessage,
-    ProgramCodeMap,
-    RuntimeErrorBacktraceFrame,
-    RuntimeErrorMessage,
-} from './messages.js';
+    AstNodeLocator,
+    AstUtils,
+    CancellationToken,
+    Disposable,
+    LangiumDocument,
+    LangiumDocuments,
+    URI,
+} from 'langium';
+import path from 'path';
+import { createProgramMessage, ProgramCodeMap, RuntimeErrorBacktraceFrame, RuntimeErrorMessage } from './messages.js';
 import { SourceMapConsumer } from 'source-map-js';
 import { SafeDsAnnotations } from '../builtins/safe-ds-annotations.js';
 import { SafeDsPythonGenerator } from '../generation/python/safe-ds-python-generator.js';
@@ -23,11 +24,15 @@ import {
 import { SafeDsLogger, SafeDsMessagingProvider } from '../communication/safe-ds-messaging-provider.js';
 import crypto from 'crypto';
 import { SafeDsPythonServer } from './safe-ds-python-server.js';
+import { ExecutionPriority } from './processPool.js';
+import { SafeDsPlaceholderValueCache } from './safe-ds-placeholder-value-cache.js';
 import { ExploreTableNotification, IsRunnerReadyRequest, ShowImageNotification } from '../communication/rpc.js';
 import { expandToStringLF, joinToNode } from 'langium/generate';
 import { UUID } from 'node:crypto';
 import { CODEGEN_PREFIX } from '../generation/python/constants.js';
 import { addLinePrefix } from '../../helpers/strings.js';
+import { SafeDsSettingsProvider } from '../workspace/safe-ds-settings-provider.js';
+import { DocumentDependentCache } from '../workspace/safe-ds-document-dependency-tracker.js';
 
 // Most of the functionality cannot be tested automatically as a functioning runner setup would always be required
 
@@ -41,7 +46,15 @@ export class SafeDsRunner {
     private readonly langiumDocuments: LangiumDocuments;
     private readonly logger: SafeDsLogger;
     private readonly messaging: SafeDsMessagingProvider;
+    private readonly placeholderValueCache: SafeDsPlaceholderValueCache;
     private readonly pythonServer: SafeDsPythonServer;
+    private readonly settingsProvider: SafeDsSettingsProvider;
+
+    /**
+     * Generated programs by the URI of the pipeline document and the options they were generated with. Entries are
+     * evicted once the document or any document it depends on changes.
+     */
+    private readonly generatedCodeCache: DocumentDependentCache<string, GeneratedCode>;
 
     constructor(services: SafeDsServices) {
         this.annotations = services.builtins.Annotations;
@@ -50,7 +63,11 @@ export class SafeDsRunner {
         this.langiumDocuments = services.shared.workspace.LangiumDocuments;
         this.logger = services.communication.MessagingProvider.createTaggedLogger(RUNNER_TAG);
         this.messaging = services.communication.MessagingProvider;
+        this.placeholderValueCache = services.runtime.PlaceholderValueCache;
         this.pythonServer = services.runtime.PythonServer;
+        this.settingsProvider = services.workspace.SettingsProvider;
+
+        this.generatedCodeCache = new DocumentDependentCache(services.workspace.DocumentDependencyTracker);
 
         this.registerMessageLoggingCallbacks();
 
@@ -66,7 +83,7 @@ export class SafeDsRunner {
         return this.pythonServer.isStarted;
     }
 
-    async runPipeline(documentUri: string, nodePath: string) {
+    async runPipeline(documentUri: string, nodePath: string, cancelToken?: CancellationToken) {
         const document = this.getDocument(documentUri);
         if (!document) {
             return;
@@ -79,12 +96,18 @@ export class SafeDsRunner {
             return;
         }
 
-        await this.runWithCallbacks(`running pipeline ${node.name} in ${documentUri}`, async (pipelineExecutionId) => {
-            await this.executePipeline(pipelineExecutionId, document, node.name);
-        });
+        await this.runWithCallbacks(
+            `running pipeline ${node.name} in ${documentUri}`,
+            `runPipeline ${documentUri} ${node.name}`,
+            async (pipelineExecutionId) => {
+                await this.executePipeline(pipelineExecutionId, document, node.name, undefined, 'background');
+            },
+            undefined,
+            cancelToken,
+        );
     }
 
-    async exploreTable(name: string, documentUri: string, nodePath: string) {
+    async exploreTable(name: string, documentUri: string, nodePath: string, cancelToken?: CancellationToken) {
         const document = this.getDocument(documentUri);
         if (!document) {
             return;
@@ -112,6 +135,7 @@ export class SafeDsRunner {
 
         await this.runWithCallbacks(
             `exploring table ${pipeline.name}/${name} in ${documentUri}`,
+            `exploreTable ${documentUri} ${pipeline.name}`,
             async (pipelineExecutionId) => {
                 await this.executePipeline(pipelineExecutionId, document, pipeline.name, statement.$containerIndex);
             },
@@ -126,10 +150,11 @@ export class SafeDsRunner {
                     });
                 }
             },
+            cancelToken,
         );
     }
 
-    async printValue(name: string, documentUri: string, nodePath: string) {
+    async printValue(name: string, documentUri: string, nodePath: string, cancelToken?: CancellationToken) {
         const document = this.getDocument(documentUri);
         if (!document) {
             return;
@@ -154,29 +179,46 @@ export class SafeDsRunner {
             return;
         }
 
+        // Values that were already fetched for the same code and inputs are shown without running the pipeline
+        const generatedCode = this.generateCodeForRunner(document, statement.$containerIndex);
+        const fingerprint = this.placeholderValueCache.computeFingerprint(statement, placeholderName, generatedCode[0]);
+        const cachedValue = this.placeholderValueCache.get(fingerprint);
+        if (cachedValue !== undefined) {
+            this.logger.info(`Reusing cached value of ${pipeline.name}/${name}.`);
+            this.printPlaceholderValue(name, cachedValue);
+            return;
+        }
+
         await this.runWithCallbacks(
             `printing value ${pipeline.name}/${name} in ${documentUri}`,
+            `printValue ${documentUri} ${pipeline.name}`,
             async (pipelineExecutionId) => {
-                await this.executePipeline(pipelineExecutionId, document, pipeline.name, statement.$containerIndex);
+                await this.executeGeneratedPipeline(pipelineExecutionId, document, pipeline.name, generatedCode);
             },
             async (pipelineExecutionId, currentPlaceholderName) => {
                 if (currentPlaceholderName === placeholderName) {
                     const data = await this.getPlaceholderValue(placeholderName, pipelineExecutionId);
-                    if (this.isMultilineString(data)) {
-                        this.logger.result(`val ${name} = \`\n${addLinePrefix(data, '    ')}\n\`;`);
-                    } else {
-                        this.logger.result(`val ${name} = ${JSON.stringify(data, null, 2)};`);
-                    }
+                    this.placeholderValueCache.set(fingerprint, data);
+                    this.printPlaceholderValue(name, data);
                 }
             },
+            cancelToken,
         );
     }
 
+    private printPlaceholderValue(name: string, data: any) {
+        if (this.isMultilineString(data)) {
+            this.logger.result(`val ${name} = \`\n${addLinePrefix(data, '    ')}\n\`;`);
+        } else {
+            this.logger.result(`val ${name} = ${JSON.stringify(data, null, 2)};`);
+        }
+    }
+
     private isMultilineString(data: any): data is string {
         return typeof data === 'string' && data.includes('\n');
     }
 
-    async showImage(name: string, documentUri: string, nodePath: string) {
+    async showImage(name: string, documentUri: string, nodePath: string, cancelToken?: CancellationToken) {
         const document = this.getDocument(documentUri);
         if (!document) {
             return;
@@ -201,17 +243,29 @@ export class SafeDsRunner {
             return;
         }
 
+        const generatedCode = this.generateCodeForRunner(document, statement.$containerIndex);
+        const fingerprint = this.placeholderValueCache.computeFingerprint(statement, placeholderName, generatedCode[0]);
+        const cachedValue = this.placeholderValueCache.get(fingerprint);
+        if (cachedValue !== undefined) {
+            this.logger.info(`Reusing cached value of ${pipeline.name}/${name}.`);
+            await this.messaging.sendNotification(ShowImageNotification.type, { image: cachedValue });
+            return;
+        }
+
         await this.runWithCallbacks(
             `showing image ${pipeline.name}/${name} in ${documentUri}`,
+            `showImage ${documentUri} ${pipeline.name}`,
             async (pipelineExecutionId) => {
-                await this.executePipeline(pipelineExecutionId, document, pipeline.name, statement.$containerIndex);
+                await this.executeGeneratedPipeline(pipelineExecutionId, document, pipeline.name, generatedCode);
             },
             async (pipelineExecutionId, currentPlaceholderName) => {
                 if (currentPlaceholderName === placeholderName) {
                     const data = await this.getPlaceholderValue(placeholderName, pipelineExecutionId);
+                    this.placeholderValueCache.set(fingerprint, data);
                     await this.messaging.sendNotification(ShowImageNotification.type, { image: data });
                 }
             },
+            cancelToken,
         );
     }
 
@@ -225,18 +279,51 @@ export class SafeDsRunner {
         return document;
     }
 
+    /**
+     * Run a task on the runner and show its progress. The task can be cancelled by the user with the progress
+     * indicator or with the token. Starting a task with the same supersede key cancels the previous one if it is still
+     * running, since its results would be stale.
+     *
+     * @returns A promise that resolves once the task is finished, failed, or was cancelled.
+     */
     async runWithCallbacks(
         taskName: string,
+        supersedeKey: string,
         func: (pipelineExecutionId: UUID) => Promise<void>,
         onPlaceholderReady?: (pipelineExecutionId: UUID, placeholderName: string) => Promise<void>,
-    ) {
+        cancelToken?: CancellationToken,
+    ): Promise<void> {
         const pipelineExecutionId = crypto.randomUUID();
         const start = Date.now();
 
-        const progress = await this.messaging.showProgress('Safe-DS Runner', 'Starting...');
+        const supersededExecutionId = this.runningTasks.get(supersedeKey);
+        if (supersededExecutionId) {
+            this.logger.info(`[${supersededExecutionId}] Superseded by ${pipelineExecutionId}.`);
+            this.pythonServer.cancelExecution(supersededExecutionId);
+        }
+        this.runningTasks.set(supersedeKey, pipelineExecutionId);
+
+        const progress = await this.messaging.showProgress('Safe-DS Runner', 'Starting...', true);
         this.logger.info(`[${pipelineExecutionId}] Starting ${taskName}.`);
 
+        let resolveFinished: () => void;
+        const finished = new Promise<void>((resolve) => {
+            resolveFinished = resolve;
+        });
+
         let disposables: Disposable[] = [];
+        const finish = () => {
+            disposables.forEach((it) => {
+                it.dispose();
+            });
+            if (this.runningTasks.get(supersedeKey) === pipelineExecutionId) {
+                this.runningTasks.delete(supersedeKey);
+            }
+
+            progress.done();
+            resolveFinished();
+        };
+
         disposables.push(
             this.pythonServer.addMessageCallback('placeholder_type', async (message) => {
                 if (message.id === pipelineExecutionId) {
@@ -247,11 +334,7 @@ export class SafeDsRunner {
 
             this.pythonServer.addMessageCallback('runtime_progress', (message) => {
                 if (message.id === pipelineExecutionId) {
-                    disposables.forEach((it) => {
-                        it.dispose();
-                    });
-
-                    progress.done();
+                    finish();
                     const timeElapsed = Date.now() - start;
                     this.logger.info(`[${pipelineExecutionId}] Finished ${taskName} in ${timeElapsed}ms.`);
                 }
@@ -259,17 +342,27 @@ export class SafeDsRunner {
 
             this.pythonServer.addMessageCallback('runtime_error', (message) => {
                 if (message.id === pipelineExecutionId) {
-                    disposables.forEach((it) => {
-                        it.dispose();
-                    });
-
-                    progress.done();
+                    finish();
                     this.messaging.showErrorMessage('An error occurred during pipeline execution.');
                 }
             }),
+
+            this.pythonServer.onExecutionCancelled(pipelineExecutionId, () => {
+                finish();
+                this.logger.info(`[${pipelineExecutionId}] Cancelled ${taskName}.`);
+            }),
         );
 
+        for (const token of [progress.token, cancelToken]) {
+            if (token) {
+                disposables.push(
+                    token.onCancellationRequested(() => this.pythonServer.cancelExecution(pipelineExecutionId)),
+                );
+            }
+        }
+
         await func(pipelineExecutionId);
+        return finished;
     }
 
     private getPlaceholderName(statement: SdsStatement, name: string): string | undefined {
@@ -283,31 +376,22 @@ export class SafeDsRunner {
     }
 
     private async getPlaceholderValue(placeholder: string, pipelineExecutionId: string): Promise<any | undefined> {
-        return new Promise((resolve) => {
-            if (placeholder === '') {
-                resolve(undefined);
-            }
-
-            const placeholderValueCallback = (message: PlaceholderValueMessage) => {
-                if (message.id !== pipelineExecutionId || message.data.name !== placeholder) {
-                    return;
-                }
-                this.pythonServer.removeMessageCallback('placeholder_value', placeholderValueCallback);
-                resolve(message.data.value);
-            };
-
-            this.pythonServer.addMessageCallback('placeholder_value', placeholderValueCallback);
-            this.logger.info('Getting placeholder from Runner ...');
-            this.pythonServer.sendMessageToPythonServer(
-                createPlaceholderQueryMessage(pipelineExecutionId, placeholder),
-            );
+        if (placeholder === '') {
+            return undefined;
+        }
 
-            setTimeout(() => {
-                resolve(undefined);
-            }, 30000);
-        });
+        this.logger.info('Getting placeholder from Runner ...');
+        const values = await this.pythonServer.queryPlaceholders(pipelineExecutionId, [
+            { name: placeholder, window: {} },
+        ]);
+        return values.get(placeholder)?.value;
     }
 
+    /**
+     * The IDs of the running tasks by their supersede key.
+     */
+    private readonly runningTasks = new Map<string, string>();
+
     /**
      * Map that contains information about an execution keyed by the execution id.
      */
@@ -350,12 +434,33 @@ export class SafeDsRunner {
      * @param pipelineDocument Document containing the main Safe-DS pipeline to execute.
      * @param pipelineName Name of the pipeline that should be run
      * @param targetStatements The indices of the target statements, used to do partial execution. If undefined is provided, the entire pipeline is run.
+     * @param priority Background executions do not block interactive ones if several runner processes are available.
      */
     public async executePipeline(
         id: string,
         pipelineDocument: LangiumDocument,
         pipelineName: string,
         targetStatements: number[] | number | undefined = undefined,
+        priority: ExecutionPriority = 'interactive',
+    ) {
+        if (!isSdsModule(pipelineDocument.parseResult.value)) {
+            return;
+        }
+        // Code generation
+        const generatedCode = this.generateCodeForRunner(pipelineDocument, targetStatements);
+        await this.executeGeneratedPipeline(id, pipelineDocument, pipelineName, generatedCode, priority);
+    }
+
+    /**
+     * Execute a Safe-DS pipeline on the python runner, using code that was already generated by
+     * `generateCodeForRunner`.
+     */
+    private async executeGeneratedPipeline(
+        id: string,
+        pipelineDocument: LangiumDocument,
+        pipelineName: string,
+        [codeMap, lastGeneratedSources]: GeneratedCode,
+        priority: ExecutionPriority = 'interactive',
     ) {
         const node = pipelineDocument.parseResult.value;
         if (!isSdsModule(node)) {
@@ -365,8 +470,6 @@ export class SafeDsRunner {
         const mainPythonModuleName = this.annotations.getPythonModule(node);
         const mainPackage = mainPythonModuleName === undefined ? node.name.split('.') : [mainPythonModuleName];
         const mainModuleName = this.getMainModuleName(pipelineDocument);
-        // Code generation
-        const [codeMap, lastGeneratedSources] = this.generateCodeForRunner(pipelineDocument, targetStatements);
         // Store information about the run
         this.executionInformation.set(id, {
             generatedSource: lastGeneratedSources,
@@ -386,6 +489,7 @@ export class SafeDsRunner {
                 },
                 cwd: path.parse(pipelineDocument.uri.fsPath).dir,
             }),
+            priority,
         );
     }
 
@@ -478,7 +582,8 @@ export class SafeDsRunner {
         }
         let sourceMapKey = sourceMapKeys[0]!;
         if (!execInfo.sourceMappings.has(sourceMapKey)) {
-            const sourceMapObject = JSON.parse(execInfo.generatedSource.get(sourceMapKey)!);
+            // Source maps are only created once they are needed for the first time
+            const sourceMapObject = JSON.parse(execInfo.generatedSource.get(sourceMapKey)!());
             sourceMapObject.sourcesContent = [execInfo.source];
             const consumer = new SourceMapConsumer(sourceMapObject);
             execInfo.sourceMappings.set(sourceMapKey, consumer);
@@ -491,18 +596,40 @@ export class SafeDsRunner {
         return { file: outputPosition.source || '<unknown>', line: outputPosition.line || 0 };
     }
 
+    /**
+     * Generate the program that is sent to the runner. Programs are cached, so running the same pipeline again does not
+     * generate code again unless the document or any document it depends on changed.
+     */
     public generateCodeForRunner(
         pipelineDocument: LangiumDocument,
         targetStatements: number[] | number | undefined,
-    ): [ProgramCodeMap, Map<string, string>] {
+    ): GeneratedCode {
+        const parallelism = this.settingsProvider.getRunnerParallelism();
+        const sortedTargetStatements =
+            targetStatements === undefined ? 'all' : [targetStatements].flat().sort((a, b) => a - b).join(',');
+        const key = `${pipelineDocument.textDocument.version}/${sortedTargetStatements}/${parallelism}`;
+
+        return this.generatedCodeCache.get(pipelineDocument.uri, key, () =>
+            this.doGenerateCodeForRunner(pipelineDocument, targetStatements, parallelism),
+        );
+    }
+
+    private doGenerateCodeForRunner(
+        pipelineDocument: LangiumDocument,
+        targetStatements: number[] | number | undefined,
+        parallelism: number,
+    ): GeneratedCode {
         const rootGenerationDir = path.parse(pipelineDocument.uri.fsPath).dir;
-        const generatedDocuments = this.generator.generate(pipelineDocument, {
+        const generatedDocuments = this.generator.generateLazily(pipelineDocument, {
             destination: URI.file(rootGenerationDir), // actual directory of main module file
             createSourceMaps: true,
             targetStatements,
             disableRunnerIntegration: false,
+            releasePlaceholders: true,
+            parallelism,
+            lazyImports: true,
         });
-        const lastGeneratedSources = new Map<string, string>();
+        const lastGeneratedSources = new Map<string, () => string>();
         let codeMap: ProgramCodeMap = {};
         for (const generatedDocument of generatedDocuments) {
             const fsPath = URI.parse(generatedDocument.uri).fsPath;
@@ -516,7 +643,7 @@ export class SafeDsRunner {
             // Put code in map for further use in the extension (e.g. to remap errors)
             lastGeneratedSources.set(
                 path.join(workspaceRelativeFilePath, sdsFileName).replaceAll('\\', '/'),
-                generatedDocument.getText(),
+                generatedDocument.getText,
             );
             // Check for sourcemaps after they are already added to the pipeline context
             // This needs to happen after lastGeneratedSources.set, as errors would not get mapped otherwise
@@ -545,12 +672,18 @@ export class SafeDsRunner {
     }
 }
 
+/**
+ * The code that is sent to the runner and the generated files by their path relative to the pipeline document. The
+ * files also include source maps, which are created lazily.
+ */
+export type GeneratedCode = [ProgramCodeMap, Map<string, () => string>];
+
 /**
  * Context containing information about the execution of a pipeline.
  */
 export interface PipelineExecutionInformation {
     source: string;
-    generatedSource: Map<string, string>;
+    generatedSource: Map<string, () => string>;
     sourceMappings: Map<string, SourceMapConsumer>;
     path: string;
     /**
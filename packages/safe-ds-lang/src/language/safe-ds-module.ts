@@ -36,6 +36,11 @@ import { SafeDsTypeComputer } from './typing/safe-ds-type-computer.js';
 import { registerValidationChecks } from './validation/safe-ds-validator.js';
 import { SafeDsPackageManager } from './workspace/safe-ds-package-manager.js';
 import { SafeDsWorkspaceManager } from './workspace/safe-ds-workspace-manager.js';
+import { SafeDsDocumentDependencyTracker } from './workspace/safe-ds-document-dependency-tracker.js';
+import { SafeDsOverlayDocuments } from './workspace/safe-ds-overlay-documents.js';
+import { SafeDsBuiltinIndex } from './workspace/safe-ds-builtin-index.js';
+import { SafeDsIndexManager } from './workspace/safe-ds-index-manager.js';
+import { SafeDsLangiumDocuments } from './workspace/safe-ds-langium-documents.js';
 import { SafeDsPurityComputer } from './purity/safe-ds-purity-computer.js';
 import { SafeDsSettings, SafeDsSettingsProvider } from './workspace/safe-ds-settings-provider.js';
 import { SafeDsRenameProvider } from './lsp/safe-ds-rename-provider.js';
@@ -54,6 +59,7 @@ import { SafeDsCodeLensProvider } from './lsp/safe-ds-code-lens-provider.js';
 import { SafeDsExecuteCommandHandler } from './lsp/safe-ds-execute-command-handler.js';
 import { SafeDsServiceRegistry } from './safe-ds-service-registry.js';
 import { SafeDsPythonServer } from './runtime/safe-ds-python-server.js';
+import { SafeDsPlaceholderValueCache } from './runtime/safe-ds-placeholder-value-cache.js';
 import { SafeDsSlicer } from './flow/safe-ds-slicer.js';
 import { SafeDsSyntheticProperties } from './helpers/safe-ds-synthetic-properties.js';
 import { SafeDsLinker } from './scoping/safe-ds-linker.js';
@@ -102,6 +108,7 @@ export type SafeDsAddedServices = {
         PurityComputer: SafeDsPurityComputer;
     };
     runtime: {
+        PlaceholderValueCache: SafeDsPlaceholderValueCache;
         PythonServer: SafeDsPythonServer;
         Runner: SafeDsRunner;
     };
@@ -113,6 +120,8 @@ export type SafeDsAddedServices = {
         TypeFactory: SafeDsTypeFactory;
     };
     workspace: {
+        DocumentDependencyTracker: SafeDsDocumentDependencyTracker;
+        OverlayDocuments: SafeDsOverlayDocuments;
         PackageManager: SafeDsPackageManager;
         SettingsProvider: SafeDsSettingsProvider;
     };
@@ -120,6 +129,10 @@ export type SafeDsAddedServices = {
 
 export type SafeDsAddedSharedServices = {
     ServiceRegistry: SafeDsServiceRegistry;
+    workspace: {
+        BuiltinIndex: SafeDsBuiltinIndex;
+        IndexManager: SafeDsIndexManager;
+    };
 };
 
 /**
@@ -197,6 +210,7 @@ export const SafeDsModule: Module<SafeDsServices, PartialLangiumServices & SafeD
         ScopeProvider: (services) => new SafeDsScopeProvider(services),
     },
     runtime: {
+        PlaceholderValueCache: (services) => new SafeDsPlaceholderValueCache(services),
         PythonServer: (services) => new SafeDsPythonServer(services),
         Runner: (services) => new SafeDsRunner(services),
     },
@@ -208,6 +222,8 @@ export const SafeDsModule: Module<SafeDsServices, PartialLangiumServices & SafeD
         TypeFactory: (services) => new SafeDsTypeFactory(services),
     },
     workspace: {
+        DocumentDependencyTracker: (services) => new SafeDsDocumentDependencyTracker(services),
+        OverlayDocuments: (services) => new SafeDsOverlayDocuments(services),
         PackageManager: (services) => new SafeDsPackageManager(services),
         SettingsProvider: (services) => new SafeDsSettingsProvider(services),
     },
@@ -221,6 +237,9 @@ export const SafeDsSharedModule: Module<SafeDsSharedServices, DeepPartial<SafeDs
         NodeKindProvider: () => new SafeDsNodeKindProvider(),
     },
     workspace: {
+        BuiltinIndex: (sharedServices) => new SafeDsBuiltinIndex(sharedServices),
+        IndexManager: (sharedServices) => new SafeDsIndexManager(sharedServices),
+        LangiumDocuments: (sharedServices) => new SafeDsLangiumDocuments(sharedServices),
         WorkspaceManager: (sharedServices) => new SafeDsWorkspaceManager(sharedServices),
     },
 };
@@ -4,6 +4,7 @@ import {
     AstUtils,
     DefaultScopeComputation,
     LangiumDocument,
+    MultiMap,
     PrecomputedScopes,
 } from 'langium';
 import {
@@ -44,6 +45,18 @@ export class SafeDsScopeComputation extends DefaultScopeComputation {
         super.exportNode(node, exports, document);
     }
 
+    /**
+     * Computes the local scopes of the document synchronously. This is needed to load builtin documents on demand,
+     * which happens while other references are being resolved.
+     */
+    computeLocalScopesSync(document: LangiumDocument): PrecomputedScopes {
+        const scopes = new MultiMap<AstNode, AstNodeDescription>();
+        for (const node of AstUtils.streamAllContents(document.parseResult.value)) {
+            this.processNode(node, document, scopes);
+        }
+        return scopes;
+    }
+
     protected override processNode(node: AstNode, document: LangiumDocument, scopes: PrecomputedScopes): void {
         if (isSdsClass(node)) {
             this.processSdsClass(node, document, scopes);
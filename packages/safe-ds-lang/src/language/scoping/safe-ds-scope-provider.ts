@@ -4,10 +4,12 @@ import {
     AstReflection,
     AstUtils,
     DefaultScopeProvider,
+    DocumentState,
     EMPTY_SCOPE,
     ReferenceInfo,
     Scope,
-    WorkspaceCache,
+    stream,
+    Stream,
 } from 'langium';
 import {
     isSdsAbstractCall,
@@ -75,7 +77,8 @@ import { SafeDsServices } from '../safe-ds-module.js';
 import { ClassType, EnumVariantType, LiteralType, TypeVariable } from '../typing/model.js';
 import type { SafeDsClassHierarchy } from '../typing/safe-ds-class-hierarchy.js';
 import { SafeDsTypeComputer } from '../typing/safe-ds-type-computer.js';
-import { SafeDsPackageManager } from '../workspace/safe-ds-package-manager.js';
+import { GetDeclarationsOptions, SafeDsPackageManager } from '../workspace/safe-ds-package-manager.js';
+import { isEqualSet } from '../../helpers/collections.js';
 
 export class SafeDsScopeProvider extends DefaultScopeProvider {
     private readonly astReflection: AstReflection;
@@ -84,7 +87,12 @@ export class SafeDsScopeProvider extends DefaultScopeProvider {
     private readonly packageManager: SafeDsPackageManager;
     private readonly typeComputer: SafeDsTypeComputer;
 
-    private readonly coreDeclarationCache: WorkspaceCache<string, AstNodeDescription[]>;
+    /**
+     * Stores the declarations in the core package by node type. This is only cleared if the contents of the core
+     * package change, so edits of user code keep it.
+     */
+    private readonly coreDeclarationCache: Map<string, AstNodeDescription[]>;
+    private coreDeclarationNodes: Set<AstNode | undefined> = new Set();
 
     constructor(services: SafeDsServices) {
         super(services);
@@ -95,7 +103,12 @@ export class SafeDsScopeProvider extends DefaultScopeProvider {
         this.packageManager = services.workspace.PackageManager;
         this.typeComputer = services.typing.TypeComputer;
 
-        this.coreDeclarationCache = new WorkspaceCache(services.shared);
+        this.coreDeclarationCache = new Map();
+
+        // The package manager updates its data in the same phase and was created first, so it is up-to-date here
+        services.shared.workspace.DocumentBuilder.onBuildPhase(DocumentState.IndexedContent, () =>
+            this.invalidateCoreDeclarationCacheIfNeeded(),
+        );
     }
 
     override getScope(context: ReferenceInfo): Scope {
@@ -157,11 +170,10 @@ export class SafeDsScopeProvider extends DefaultScopeProvider {
             return EMPTY_SCOPE;
         }
 
-        const declarationsInPackage = this.packageManager.getDeclarationsInPackage(containingQualifiedImport.package, {
+        return new PackageScope(this.packageManager, containingQualifiedImport.package, {
             nodeType: SdsDeclaration,
             hideInternal: containingQualifiedImport.package !== ownPackageName,
         });
-        return this.createScope(declarationsInPackage);
     }
 
     private getScopeForMemberTypeMember(node: SdsMemberType): Scope {
@@ -501,12 +513,45 @@ export class SafeDsScopeProvider extends DefaultScopeProvider {
     }
 
     private coreDeclarations(referenceType: string, outerScope: Scope): Scope {
-        const descriptions = this.coreDeclarationCache.get(referenceType, () =>
-            this.packageManager.getDeclarationsInPackage('safeds.lang', {
+        let descriptions = this.coreDeclarationCache.get(referenceType);
+        if (!descriptions) {
+            descriptions = this.packageManager.getDeclarationsInPackage(CORE_PACKAGE, {
                 nodeType: referenceType,
                 hideInternal: true,
-            }),
-        );
+            });
+            this.coreDeclarationCache.set(referenceType, descriptions);
+        }
+
         return this.createScope(descriptions, outerScope);
     }
+
+    private invalidateCoreDeclarationCacheIfNeeded(): void {
+        const nodes = new Set(this.packageManager.getDeclarationsInPackage(CORE_PACKAGE).map((it) => it.node));
+        if (!isEqualSet(nodes, this.coreDeclarationNodes)) {
+            this.coreDeclarationCache.clear();
+            this.coreDeclarationNodes = nodes;
+        }
+    }
+}
+
+const CORE_PACKAGE = 'safeds.lang';
+
+/**
+ * Contains the declarations of a package. Elements are looked up by name in the index of the package manager, so the
+ * declarations of the package are not scanned for each lookup.
+ */
+class PackageScope implements Scope {
+    constructor(
+        private readonly packageManager: SafeDsPackageManager,
+        private readonly packageName: string,
+        private readonly options: GetDeclarationsOptions,
+    ) {}
+
+    getElement(name: string): AstNodeDescription | undefined {
+        return this.packageManager.getDeclarationsInPackageByName(this.packageName, name, this.options)[0];
+    }
+
+    getAllElements(): Stream<AstNodeDescription> {
+        return stream(this.packageManager.getDeclarationsInPackage(this.packageName, this.options));
+    }
 }
@@ -1,18 +1,55 @@
-import { AstUtils, CstUtils, EMPTY_STREAM, LangiumDocuments, References, stream, Stream } from 'langium';
+import {
+    AstNodeLocator,
+    AstUtils,
+    EMPTY_STREAM,
+    IndexManager,
+    LangiumDocument,
+    LangiumDocuments,
+    stream,
+    Stream,
+    URI,
+} from 'langium';
 import { SafeDsClasses } from '../builtins/safe-ds-classes.js';
-import { isSdsClass, isSdsNamedType, isSdsParentTypeList, SdsClass, type SdsClassMember } from '../generated/ast.js';
+import { isSdsClass, isSdsNamedType, SdsClass, type SdsClassMember } from '../generated/ast.js';
 import { getClassMembers, getParentTypes, isStatic } from '../helpers/nodeProperties.js';
 import { SafeDsServices } from '../safe-ds-module.js';
+import { DocumentDependentCache } from '../workspace/safe-ds-document-dependency-tracker.js';
 
 export class SafeDsClassHierarchy {
+    private readonly astNodeLocator: AstNodeLocator;
     private readonly builtinClasses: SafeDsClasses;
+    private readonly indexManager: IndexManager;
     private readonly langiumDocuments: LangiumDocuments;
-    private readonly references: References;
+
+    /**
+     * Stores the superclasses and inherited members of a class by the ID of the class.
+     */
+    private readonly hierarchyCache: DocumentDependentCache<string, ClassHierarchyEntry>;
+
+    /**
+     * Stores the pairs of classes and their parent classes that are declared in a document, by the URI of the document.
+     */
+    private readonly parentClassRelations = new Map<string, ParentClassRelations>();
+
+    /**
+     * The direct subclasses of each class in the workspace. It is rebuilt once the parent class relations change.
+     */
+    private directSubclasses: Map<SdsClass, SdsClass[]> | undefined = undefined;
 
     constructor(services: SafeDsServices) {
+        this.astNodeLocator = services.workspace.AstNodeLocator;
         this.builtinClasses = services.builtins.Classes;
+        this.indexManager = services.shared.workspace.IndexManager;
         this.langiumDocuments = services.shared.workspace.LangiumDocuments;
-        this.references = services.references.References;
+        this.hierarchyCache = new DocumentDependentCache(services.workspace.DocumentDependencyTracker);
+
+        services.workspace.DocumentDependencyTracker.onInvalidation((uris) => {
+            for (const uri of uris) {
+                if (this.parentClassRelations.delete(uri)) {
+                    this.directSubclasses = undefined;
+                }
+            }
+        });
     }
 
     /**
@@ -29,7 +66,7 @@ export class SafeDsClassHierarchy {
             return true;
         }
 
-        return node === other || this.streamProperSuperclasses(node).includes(other);
+        return node === other || this.getHierarchyEntry(node).superclassSet.has(other);
     }
 
     /**
@@ -42,7 +79,7 @@ export class SafeDsClassHierarchy {
             return EMPTY_STREAM;
         }
 
-        return stream(this.properSuperclassesGenerator(node));
+        return stream(this.getHierarchyEntry(node).superclasses);
     }
 
     private *properSuperclassesGenerator(node: SdsClass): Generator<SdsClass, void> {
@@ -81,9 +118,7 @@ export class SafeDsClassHierarchy {
             return EMPTY_STREAM;
         }
 
-        return this.streamProperSuperclasses(node)
-            .flatMap(getClassMembers)
-            .filter((it) => !isStatic(it));
+        return stream(this.getHierarchyEntry(node).inheritedMembers);
     }
 
     /**
@@ -124,9 +159,7 @@ export class SafeDsClassHierarchy {
             return undefined;
         }
 
-        return this.streamSuperclassMembers(containingClass)
-            .filter((it) => !isStatic(it) && it.name === node.name)
-            .head();
+        return this.getHierarchyEntry(containingClass).inheritedMembersByName.get(node.name);
     }
 
     /**
@@ -140,42 +173,122 @@ export class SafeDsClassHierarchy {
             return EMPTY_STREAM;
         }
 
-        return this.references
-            .findReferences(node, {
-                includeDeclaration: false,
-            })
-            .flatMap((it) => {
-                const document = this.langiumDocuments.getDocument(it.sourceUri);
-                if (!document) {
-                    /* c8 ignore next 2 */
-                    return [];
-                }
+        this.loadReferencingDocuments(node);
+        return stream(this.getDirectSubclasses().get(node) ?? []);
+    }
 
-                const rootNode = document.parseResult.value;
-                if (!rootNode.$cstNode) {
-                    /* c8 ignore next 2 */
-                    return [];
-                }
+    /**
+     * Loads the documents that reference the given class. Builtin documents that were registered from the builtin index
+     * are only loaded on demand, so subclasses of builtin classes would be missing otherwise.
+     */
+    private loadReferencingDocuments(node: SdsClass): void {
+        const nodePath = this.astNodeLocator.getAstNodePath(node);
+        for (const reference of this.indexManager.findAllReferences(node, nodePath)) {
+            this.langiumDocuments.getDocument(reference.sourceUri);
+        }
+    }
+
+    /**
+     * Returns the superclasses and inherited members of the given class. They are computed once per class and kept until
+     * the document of the class or any document it depends on changes.
+     */
+    private getHierarchyEntry(node: SdsClass): ClassHierarchyEntry {
+        const documentUri = AstUtils.getDocument(node).uri;
+        const nodePath = this.astNodeLocator.getAstNodePath(node);
+
+        return this.hierarchyCache.get(documentUri, nodePath, () => {
+            const superclasses = Array.from(this.properSuperclassesGenerator(node));
+            const inheritedMembers = superclasses.flatMap(getClassMembers).filter((it) => !isStatic(it));
 
-                const targetCstNode = CstUtils.findLeafNodeAtOffset(rootNode.$cstNode, it.segment.offset);
-                if (!targetCstNode) {
-                    /* c8 ignore next 2 */
-                    return [];
+            // Members of closer ancestors hide members of more distant ones
+            const inheritedMembersByName = new Map<string, SdsClassMember>();
+            for (const member of inheritedMembers) {
+                if (!inheritedMembersByName.has(member.name)) {
+                    inheritedMembersByName.set(member.name, member);
                 }
+            }
 
-                // Only consider the first parent type
-                const targetNode = targetCstNode.astNode;
-                if (!isSdsParentTypeList(targetNode.$container) || targetNode.$containerIndex !== 0) {
-                    return [];
+            return {
+                superclasses,
+                superclassSet: new Set(superclasses),
+                inheritedMembers,
+                inheritedMembersByName,
+            };
+        });
+    }
+
+    /**
+     * Returns the direct subclasses of all classes in the workspace. Only the parent class relations of documents that
+     * are new or changed are computed again.
+     */
+    private getDirectSubclasses(): Map<SdsClass, SdsClass[]> {
+        for (const document of this.langiumDocuments.all) {
+            const uri = document.uri.toString();
+            if (this.parentClassRelations.get(uri)?.document !== document) {
+                this.parentClassRelations.set(uri, this.computeParentClassRelations(document));
+                this.directSubclasses = undefined;
+            }
+        }
+
+        if (!this.directSubclasses) {
+            this.directSubclasses = new Map();
+
+            for (const [uri, { pairs }] of this.parentClassRelations) {
+                // Documents might be deleted without an update of the workspace
+                if (!this.langiumDocuments.hasDocument(URI.parse(uri))) {
+                    this.parentClassRelations.delete(uri);
+                    continue;
                 }
 
-                const containingClass = AstUtils.getContainerOfType(targetNode, isSdsClass);
-                if (!containingClass) {
-                    /* c8 ignore next 2 */
-                    return [];
+                for (const [subclass, parentClass] of pairs) {
+                    if (!this.directSubclasses.has(parentClass)) {
+                        this.directSubclasses.set(parentClass, []);
+                    }
+                    this.directSubclasses.get(parentClass)!.push(subclass);
                 }
+            }
+        }
+
+        return this.directSubclasses;
+    }
+
+    private computeParentClassRelations(document: LangiumDocument): ParentClassRelations {
+        const pairs: [SdsClass, SdsClass][] = [];
 
-                return [containingClass];
-            });
+        for (const node of AstUtils.streamAst(document.parseResult.value).filter(isSdsClass)) {
+            const parentClass = this.parentClass(node);
+            if (parentClass) {
+                pairs.push([node, parentClass]);
+            }
+        }
+
+        return { document, pairs };
     }
 }
+
+interface ClassHierarchyEntry {
+    /**
+     * The proper superclasses in the order of `streamProperSuperclasses`.
+     */
+    readonly superclasses: SdsClass[];
+
+    /**
+     * The proper superclasses for constant-time ancestor checks.
+     */
+    readonly superclassSet: ReadonlySet<SdsClass>;
+
+    /**
+     * The inherited instance members in the order of `streamInheritedMembers`.
+     */
+    readonly inheritedMembers: SdsClassMember[];
+
+    /**
+     * The first inherited instance member with each name.
+     */
+    readonly inheritedMembersByName: ReadonlyMap<string, SdsClassMember>;
+}
+
+interface ParentClassRelations {
+    readonly document: LangiumDocument;
+    readonly pairs: [SdsClass, SdsClass][];
+}
@@ -1,17 +1,18 @@
-import { WorkspaceCache } from 'langium';
+import { AstUtils } from 'langium';
 import { SafeDsClasses } from '../builtins/safe-ds-classes.js';
 import { SdsClass } from '../generated/ast.js';
 import { SafeDsServices } from '../safe-ds-module.js';
 import { ClassType, Type, TypeParameterSubstitutions, UnknownType } from './model.js';
 import { getTypeParameters } from '../helpers/nodeProperties.js';
+import { DocumentDependentCache } from '../workspace/safe-ds-document-dependency-tracker.js';
 
 export class SafeDsCoreTypes {
     private readonly builtinClasses: SafeDsClasses;
-    private readonly cache: WorkspaceCache<string, Type>;
+    private readonly cache: DocumentDependentCache<string, Type>;
 
     constructor(services: SafeDsServices) {
         this.builtinClasses = services.builtins.Classes;
-        this.cache = new WorkspaceCache(services.shared);
+        this.cache = new DocumentDependentCache(services.workspace.DocumentDependencyTracker);
     }
 
     get Any(): Type {
@@ -124,8 +125,9 @@ export class SafeDsCoreTypes {
             return UnknownType;
         }
 
+        const documentUri = AstUtils.getDocument(coreClass).uri;
         const key = `${coreClass.name}~${isNullable}`;
-        return this.cache.get(key, () => new ClassType(coreClass, NO_SUBSTITUTIONS, isNullable));
+        return this.cache.get(documentUri, key, () => new ClassType(coreClass, NO_SUBSTITUTIONS, isNullable));
     }
 }
 
@@ -1,4 +1,4 @@
-import { AstNode, AstNodeLocator, AstUtils, EMPTY_STREAM, Stream, stream, WorkspaceCache } from 'langium';
+import { AstNode, AstNodeLocator, AstUtils, EMPTY_STREAM, Stream, stream } from 'langium';
 import { isEmpty } from '../../helpers/collections.js';
 import {
     isSdsAnnotation,
@@ -115,6 +115,7 @@ import { SafeDsCoreTypes } from './safe-ds-core-types.js';
 import type { SafeDsTypeChecker } from './safe-ds-type-checker.js';
 import { SafeDsClasses } from '../builtins/safe-ds-classes.js';
 import { SafeDsTypeFactory } from './safe-ds-type-factory.js';
+import { DocumentDependentCache } from '../workspace/safe-ds-document-dependency-tracker.js';
 
 export class SafeDsTypeComputer {
     private readonly astNodeLocator: AstNodeLocator;
@@ -131,7 +132,7 @@ export class SafeDsTypeComputer {
      * of a lambda in turn depends on the substitutions of the call it is passed to.
      */
     private readonly incompleteCalls = new Set<SdsAbstractCall>();
-    private readonly nodeTypeCache: WorkspaceCache<string, Type>;
+    private readonly nodeTypeCache: DocumentDependentCache<string, Type>;
 
     constructor(services: SafeDsServices) {
         this.astNodeLocator = services.workspace.AstNodeLocator;
@@ -142,7 +143,7 @@ export class SafeDsTypeComputer {
         this.partialEvaluator = services.evaluation.PartialEvaluator;
         this.typeChecker = services.typing.TypeChecker;
 
-        this.nodeTypeCache = new WorkspaceCache(services.shared);
+        this.nodeTypeCache = new DocumentDependentCache(services.workspace.DocumentDependencyTracker);
     }
 
     // -----------------------------------------------------------------------------------------------------------------
@@ -158,15 +159,16 @@ export class SafeDsTypeComputer {
             return UnknownType;
         }
 
-        const id = this.getNodeId(node);
+        const documentUri = AstUtils.getDocument(node).uri;
+        const nodePath = this.astNodeLocator.getAstNodePath(node);
 
         // Only cache fully substituted types
-        let unsubstitutedType: Type | undefined = this.nodeTypeCache.get(id);
+        let unsubstitutedType: Type | undefined = this.nodeTypeCache.get(documentUri, nodePath);
         if (!unsubstitutedType) {
             unsubstitutedType = this.doComputeType(node).simplify();
 
             if (unsubstitutedType.isFullySubstituted) {
-                this.nodeTypeCache.set(id, unsubstitutedType);
+                this.nodeTypeCache.set(documentUri, nodePath, unsubstitutedType);
             }
         }
 
@@ -181,12 +183,6 @@ export class SafeDsTypeComputer {
         return unsubstitutedType.substituteTypeParameters(simplifiedSubstitutions);
     }
 
-    private getNodeId(node: AstNode) {
-        const documentUri = AstUtils.getDocument(node).uri.toString();
-        const nodePath = this.astNodeLocator.getAstNodePath(node);
-        return `${documentUri}~${nodePath}`;
-    }
-
     private doComputeType(node: AstNode | undefined): Type {
         if (isSdsAssignee(node)) {
             return this.computeTypeOfAssignee(node);
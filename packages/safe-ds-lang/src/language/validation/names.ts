@@ -88,8 +88,8 @@ export const nameMustNotOccurOnCoreDeclaration = (services: SafeDsServices) => {
             return;
         }
 
-        const coreDeclarations = packageManager.getDeclarationsInPackage(SAFEDS_LANG_PACKAGE);
-        if (coreDeclarations.some((it) => it.name === node.name)) {
+        const coreDeclarations = packageManager.getDeclarationsInPackageByName(SAFEDS_LANG_PACKAGE, node.name);
+        if (coreDeclarations.length > 0) {
             accept('error', 'Names of core declarations must not be used for own declarations.', {
                 node,
                 property: 'name',
@@ -310,19 +310,19 @@ export const moduleMemberMustHaveNameThatIsUniqueInPackage = (services: SafeDsSe
             let kind: string;
             if (packageName.startsWith(SAFEDS_ROOT_PACKAGE)) {
                 // For a builtin package, the simple names of declarations must be unique
-                declarationsInPackage = packageManager.getDeclarationsInPackageOrSubpackage(SAFEDS_ROOT_PACKAGE);
+                declarationsInPackage = packageManager.getDeclarationsInPackageOrSubpackageByName(
+                    SAFEDS_ROOT_PACKAGE,
+                    member.name,
+                );
                 kind = 'builtin declarations';
             } else {
-                declarationsInPackage = packageManager.getDeclarationsInPackage(packageName);
+                declarationsInPackage = packageManager.getDeclarationsInPackageByName(packageName, member.name);
                 kind = 'declarations in this package';
             }
 
             if (
                 declarationsInPackage.some(
-                    (it) =>
-                        it.name === member.name &&
-                        it.documentUri.toString() !== moduleUri &&
-                        !builtinUris.has(it.documentUri.toString()),
+                    (it) => it.documentUri.toString() !== moduleUri && !builtinUris.has(it.documentUri.toString()),
                 )
             ) {
                 accept('error', `Multiple ${kind} have the name '${member.name}'.`, {
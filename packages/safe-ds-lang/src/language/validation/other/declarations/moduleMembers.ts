@@ -6,7 +6,8 @@ import { DiagnosticTag } from 'vscode-languageserver';
 export const CODE_MODULE_MEMBER_UNUSED = 'module-member/unused';
 
 export const moduleMemberShouldBeUsed = (services: SafeDsServices) => {
-    const referenceProvider = services.references.References;
+    const astNodeLocator = services.workspace.AstNodeLocator;
+    const indexManager = services.shared.workspace.IndexManager;
 
     return (node: SdsModuleMember, accept: ValidationAcceptor) => {
         // Don't show this warning for pipelines or public declarations
@@ -14,8 +15,7 @@ export const moduleMemberShouldBeUsed = (services: SafeDsServices) => {
             return;
         }
 
-        const references = referenceProvider.findReferences(node, {});
-        if (references.isEmpty()) {
+        if (!indexManager.isReferenced(node, astNodeLocator.getAstNodePath(node))) {
             accept('warning', 'This declaration is unused and can be removed.', {
                 node,
                 property: 'name',
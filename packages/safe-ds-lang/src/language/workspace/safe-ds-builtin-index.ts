@@ -0,0 +1,259 @@
+import crypto from 'crypto';
+import fs from 'fs';
+import { AstNodeDescription, DocumentSegment, ReferenceDescription, URI } from 'langium';
+import { resourceNameToUri, uriToShortenedResourceName } from '../../helpers/resources.js';
+import { listBuiltinFiles } from '../builtins/fileFinder.js';
+import { getPackageName } from '../helpers/nodeProperties.js';
+import type { SafeDsServices, SafeDsSharedServices } from '../safe-ds-module.js';
+import type { SafeDsIndexManager } from './safe-ds-index-manager.js';
+
+/**
+ * The resource name of the serialized builtin index. It is created when the package is built.
+ */
+export const BUILTIN_INDEX_RESOURCE_NAME = 'builtins.index.json';
+
+/**
+ * Must be increased whenever the format of the serialized builtin index changes.
+ */
+const BUILTIN_INDEX_FORMAT_VERSION = 1;
+
+/**
+ * Serves the exports, references, and package names of the builtin files from a snapshot, so the files themselves only
+ * get parsed once a reference resolves into them.
+ */
+export class SafeDsBuiltinIndex {
+    private readonly indexManager: () => SafeDsIndexManager;
+
+    /**
+     * Maps URIs of builtin documents that are registered from a snapshot to their package names.
+     */
+    private readonly packageNames = new Map<string, string>();
+
+    /**
+     * URIs of builtin documents that are registered from a snapshot but have not been loaded yet.
+     */
+    private readonly unloadedUris = new Set<string>();
+
+    constructor(sharedServices: SafeDsSharedServices) {
+        this.indexManager = () => sharedServices.workspace.IndexManager;
+    }
+
+    /**
+     * Registers the serialized builtin index if it exists and matches the current builtin files.
+     *
+     * @return Whether the snapshot was registered. If not, the builtin files must be loaded as usual.
+     */
+    tryRegisterSnapshot(): boolean {
+        const snapshot = readBuiltinIndexSnapshot();
+        if (!snapshot || snapshot.fingerprint !== computeBuiltinFingerprint()) {
+            return false;
+        }
+
+        this.registerSnapshot(snapshot);
+        return true;
+    }
+
+    /**
+     * Adds the contents of the snapshot to the index without loading any of the builtin files.
+     */
+    registerSnapshot(snapshot: BuiltinIndexSnapshot): void {
+        for (const entry of snapshot.documents) {
+            const uri = builtinResourceNameToUri(entry.resourceName);
+            const exports = entry.exports.map((it) => deserializeExport(uri, it));
+            const references = entry.references.map((it) => deserializeReference(uri, it));
+
+            this.indexManager().addPrecomputedContent(uri, exports, references);
+            this.packageNames.set(uri.toString(), entry.packageName);
+            this.unloadedUris.add(uri.toString());
+        }
+    }
+
+    /**
+     * Returns the package name of the builtin document with the given URI if it was registered from a snapshot.
+     */
+    getPackageName(uri: URI): string | undefined {
+        return this.packageNames.get(uri.toString());
+    }
+
+    /**
+     * Returns whether the builtin document with the given URI was registered from a snapshot but not loaded yet.
+     */
+    isUnloaded(uri: URI): boolean {
+        return this.unloadedUris.has(uri.toString());
+    }
+
+    /**
+     * Marks the builtin document with the given URI as loaded.
+     */
+    markLoaded(uri: URI): void {
+        this.unloadedUris.delete(uri.toString());
+    }
+}
+
+/**
+ * Creates a snapshot of the index for all builtin files. The builtin files must be loaded and indexed.
+ */
+export const createBuiltinIndexSnapshot = async (services: SafeDsServices): Promise<BuiltinIndexSnapshot> => {
+    const langiumDocuments = services.shared.workspace.LangiumDocuments;
+    const referenceDescriptionProvider = services.workspace.ReferenceDescriptionProvider;
+    const scopeComputation = services.references.ScopeComputation;
+
+    const documents: SerializedDocument[] = [];
+    for (const uri of sortedBuiltinFiles()) {
+        const document = await langiumDocuments.getOrCreateDocument(uri);
+        const exports = await scopeComputation.computeExports(document);
+        const references = await referenceDescriptionProvider.createDescriptions(document);
+
+        documents.push({
+            resourceName: uriToBuiltinResourceName(uri),
+            packageName: getPackageName(document.parseResult.value) ?? '',
+            exports: exports.map(serializeExport),
+            references: references.map(serializeReference),
+        });
+    }
+
+    return {
+        formatVersion: BUILTIN_INDEX_FORMAT_VERSION,
+        fingerprint: computeBuiltinFingerprint(),
+        documents,
+    };
+};
+
+/**
+ * Creates a snapshot of the index for all builtin files and writes it to the resources directory.
+ */
+export const writeBuiltinIndexSnapshot = async (services: SafeDsServices): Promise<void> => {
+    const snapshot = await createBuiltinIndexSnapshot(services);
+    fs.writeFileSync(resourceNameToUri(BUILTIN_INDEX_RESOURCE_NAME).fsPath, JSON.stringify(snapshot));
+};
+
+/**
+ * Deletes the serialized builtin index from the resources directory if it exists.
+ */
+export const deleteBuiltinIndexSnapshot = (): void => {
+    fs.rmSync(resourceNameToUri(BUILTIN_INDEX_RESOURCE_NAME).fsPath, { force: true });
+};
+
+const readBuiltinIndexSnapshot = (): BuiltinIndexSnapshot | undefined => {
+    const snapshotPath = resourceNameToUri(BUILTIN_INDEX_RESOURCE_NAME).fsPath;
+    if (!fs.existsSync(snapshotPath)) {
+        return undefined;
+    }
+
+    try {
+        const snapshot = JSON.parse(fs.readFileSync(snapshotPath, 'utf-8'));
+        return snapshot.formatVersion === BUILTIN_INDEX_FORMAT_VERSION ? snapshot : undefined;
+    } /* c8 ignore start */ catch {
+        return undefined;
+    } /* c8 ignore stop */
+};
+
+/**
+ * Computes a hash of the names and contents of all builtin files. A snapshot is only used if its fingerprint matches.
+ */
+export const computeBuiltinFingerprint = (): string => {
+    const hash = crypto.createHash('sha256');
+    hash.update(`${BUILTIN_INDEX_FORMAT_VERSION}\0`);
+
+    for (const uri of sortedBuiltinFiles()) {
+        hash.update(`${uriToBuiltinResourceName(uri)}\0`);
+        hash.update(fs.readFileSync(uri.fsPath));
+        hash.update('\0');
+    }
+
+    return hash.digest('hex');
+};
+
+const sortedBuiltinFiles = (): URI[] => {
+    return listBuiltinFiles().sort((a, b) => uriToBuiltinResourceName(a).localeCompare(uriToBuiltinResourceName(b)));
+};
+
+// Resource names are stored with forward slashes, so snapshots can be shared across platforms
+const uriToBuiltinResourceName = (uri: URI): string => {
+    return uriToShortenedResourceName(uri, 'builtins').replaceAll('\\', '/');
+};
+
+const builtinResourceNameToUri = (resourceName: string): URI => {
+    return resourceNameToUri(`builtins/${resourceName}`);
+};
+
+// -----------------------------------------------------------------------------------------------------------------
+// Serialization
+// -----------------------------------------------------------------------------------------------------------------
+
+const serializeExport = (description: AstNodeDescription): SerializedExport => {
+    return {
+        name: description.name,
+        type: description.type,
+        path: description.path,
+        nameSegment: description.nameSegment,
+        selectionSegment: description.selectionSegment,
+    };
+};
+
+const deserializeExport = (documentUri: URI, serialized: SerializedExport): AstNodeDescription => {
+    return {
+        name: serialized.name,
+        type: serialized.type,
+        documentUri,
+        path: serialized.path,
+        nameSegment: serialized.nameSegment,
+        selectionSegment: serialized.selectionSegment,
+    };
+};
+
+const serializeReference = (description: ReferenceDescription): SerializedReference => {
+    return {
+        sourcePath: description.sourcePath,
+        targetResourceName: uriToBuiltinResourceName(description.targetUri),
+        targetPath: description.targetPath,
+        segment: description.segment,
+        local: description.local,
+    };
+};
+
+const deserializeReference = (sourceUri: URI, serialized: SerializedReference): ReferenceDescription => {
+    return {
+        sourceUri,
+        sourcePath: serialized.sourcePath,
+        targetUri: builtinResourceNameToUri(serialized.targetResourceName),
+        targetPath: serialized.targetPath,
+        segment: serialized.segment,
+        local: serialized.local,
+    };
+};
+
+/**
+ * A serializable snapshot of the index for all builtin files.
+ */
+export interface BuiltinIndexSnapshot {
+    readonly formatVersion: number;
+    readonly fingerprint: string;
+    readonly documents: SerializedDocument[];
+}
+
+interface SerializedDocument {
+    /**
+     * The path of the document relative to the builtins directory.
+     */
+    readonly resourceName: string;
+    readonly packageName: string;
+    readonly exports: SerializedExport[];
+    readonly references: SerializedReference[];
+}
+
+interface SerializedExport {
+    readonly name: string;
+    readonly type: string;
+    readonly path: string;
+    readonly nameSegment?: DocumentSegment;
+    readonly selectionSegment?: DocumentSegment;
+}
+
+interface SerializedReference {
+    readonly sourcePath: string;
+    readonly targetResourceName: string;
+    readonly targetPath: string;
+    readonly segment: DocumentSegment;
+    readonly local: boolean;
+}
@@ -0,0 +1,106 @@
+import { ContextCache, Disposable, DocumentState, IndexManager, LangiumDocuments, URI } from 'langium';
+import { SafeDsServices } from '../safe-ds-module.js';
+
+/**
+ * Determines which documents are affected by an update of the workspace. Caches can subscribe to this information to
+ * evict only the entries of affected documents instead of clearing everything on every change.
+ */
+export class SafeDsDocumentDependencyTracker {
+    private readonly indexManager: IndexManager;
+    private readonly langiumDocuments: LangiumDocuments;
+
+    private readonly listeners = new Set<InvalidationListener>();
+
+    constructor(services: SafeDsServices) {
+        this.indexManager = services.shared.workspace.IndexManager;
+        this.langiumDocuments = services.shared.workspace.LangiumDocuments;
+
+        services.shared.workspace.DocumentBuilder.onUpdate((changed, deleted) => {
+            const affectedUris = this.computeAffectedUris(changed, deleted);
+            for (const listener of this.listeners) {
+                listener(affectedUris);
+            }
+        });
+    }
+
+    /**
+     * Registers a listener that is called with the URIs of all affected documents whenever the workspace gets updated.
+     */
+    onInvalidation(listener: InvalidationListener): Disposable {
+        this.listeners.add(listener);
+
+        return Disposable.create(() => {
+            /* c8 ignore next */
+            this.listeners.delete(listener);
+        });
+    }
+
+    /**
+     * Notifies all listeners that the given documents are outdated. This is needed for documents that are not part of
+     * the workspace, since the document builder does not report changes to them.
+     */
+    invalidate(uris: URI[]): void {
+        const affectedUris = new Set(uris.map((it) => it.toString()));
+        for (const listener of this.listeners) {
+            listener(affectedUris);
+        }
+    }
+
+    /**
+     * Returns the URIs of all documents whose derived data is outdated after the given documents were changed or
+     * deleted. Besides those documents, this includes all documents that are going to be relinked and all documents
+     * that (transitively) reference any affected document.
+     *
+     * This must be called after the document builder has invalidated the documents, so it's best called in an
+     * `onUpdate` listener.
+     */
+    computeAffectedUris(changed: URI[], deleted: URI[]): Set<string> {
+        const result = new Set([...changed, ...deleted].map((it) => it.toString()));
+
+        // The document builder unlinks all documents that might resolve references differently after the update
+        for (const document of this.langiumDocuments.all) {
+            if (document.state < DocumentState.Linked) {
+                result.add(document.uri.toString());
+            }
+        }
+
+        // Add documents that reference newly affected documents until we reach a fixpoint
+        let frontier = new Set(result);
+        while (frontier.size > 0) {
+            const newlyAffected = new Set<string>();
+
+            for (const document of this.langiumDocuments.all) {
+                const uri = document.uri.toString();
+                if (!result.has(uri) && this.indexManager.isAffected(document, frontier)) {
+                    newlyAffected.add(uri);
+                }
+            }
+
+            newlyAffected.forEach((it) => result.add(it));
+            frontier = newlyAffected;
+        }
+
+        return result;
+    }
+}
+
+/**
+ * A cache that groups its entries by the document they were computed for. Once a document or any document it
+ * (transitively) depends on changes, the entries of this document are evicted. All other entries are kept, so, for
+ * instance, data computed for builtin files survives edits of user code.
+ */
+export class DocumentDependentCache<K, V> extends ContextCache<URI | string, K, V, string> {
+    constructor(tracker: SafeDsDocumentDependencyTracker) {
+        super((uri) => uri.toString());
+
+        this.toDispose.push(
+            tracker.onInvalidation((uris) => {
+                for (const uri of uris) {
+                    this.clear(uri);
+                }
+            }),
+        );
+    }
+}
+
+type InvalidationListener = (affectedUris: ReadonlySet<string>) => void;
@@ -0,0 +1,122 @@
+import {
+    AstNode,
+    AstNodeDescription,
+    AstUtils,
+    DefaultIndexManager,
+    LangiumDocument,
+    ReferenceDescription,
+    stream,
+    Stream,
+    URI,
+} from 'langium';
+import { CancellationToken } from 'vscode-languageserver';
+
+export class SafeDsIndexManager extends DefaultIndexManager {
+    /**
+     * Stores the references to each declaration by the URI of the document that contains them. Declarations are keyed
+     * by the URI of their document and their path. This is the inverse of `referenceIndex`, so references to a
+     * declaration can be found without scanning the references of all documents.
+     */
+    protected readonly reverseReferenceIndex = new Map<string, Map<string, ReferenceDescription[]>>();
+
+    /**
+     * Adds precomputed exports and references of a document to the index. The document itself does not have to be
+     * loaded for this.
+     */
+    addPrecomputedContent(uri: URI, exports: AstNodeDescription[], references: ReferenceDescription[]): void {
+        const key = uri.toString();
+        const oldReferences = this.referenceIndex.get(key) ?? [];
+        this.symbolIndex.set(key, exports);
+        this.referenceIndex.set(key, references);
+        this.updateReverseReferenceIndex(key, oldReferences, references);
+    }
+
+    override async updateReferences(
+        document: LangiumDocument,
+        cancelToken: CancellationToken = CancellationToken.None,
+    ): Promise<void> {
+        const key = document.uri.toString();
+        const oldReferences = this.referenceIndex.get(key) ?? [];
+        await super.updateReferences(document, cancelToken);
+        this.updateReverseReferenceIndex(key, oldReferences, this.referenceIndex.get(key) ?? []);
+    }
+
+    override remove(uri: URI): void {
+        const key = uri.toString();
+        const oldReferences = this.referenceIndex.get(key) ?? [];
+        super.remove(uri);
+        this.updateReverseReferenceIndex(key, oldReferences, []);
+    }
+
+    override removeReferences(uri: URI): void {
+        const key = uri.toString();
+        const oldReferences = this.referenceIndex.get(key) ?? [];
+        super.removeReferences(uri);
+        this.updateReverseReferenceIndex(key, oldReferences, []);
+    }
+
+    override findAllReferences(targetNode: AstNode, astNodePath: string): Stream<ReferenceDescription> {
+        const referencesBySource = this.reverseReferenceIndex.get(this.getTargetKey(targetNode, astNodePath));
+        return stream(referencesBySource?.values() ?? []).flat();
+    }
+
+    /**
+     * Returns the exported symbols of each indexed document by the URI of the document. The list of a document is
+     * replaced once its exports are indexed again.
+     */
+    getExportsByDocument(): ReadonlyMap<string, AstNodeDescription[]> {
+        return this.symbolIndex;
+    }
+
+    /**
+     * Returns whether any indexed document references the given node.
+     */
+    isReferenced(targetNode: AstNode, astNodePath: string): boolean {
+        return this.reverseReferenceIndex.has(this.getTargetKey(targetNode, astNodePath));
+    }
+
+    /**
+     * Replaces the references of a document in the reverse reference index.
+     */
+    private updateReverseReferenceIndex(
+        sourceUri: string,
+        oldReferences: ReferenceDescription[],
+        newReferences: ReferenceDescription[],
+    ): void {
+        // Group the new references by their target
+        const newReferencesByTarget = new Map<string, ReferenceDescription[]>();
+        for (const reference of newReferences) {
+            const targetKey = `${reference.targetUri.toString()}#${reference.targetPath}`;
+            if (!newReferencesByTarget.has(targetKey)) {
+                newReferencesByTarget.set(targetKey, []);
+            }
+            newReferencesByTarget.get(targetKey)!.push(reference);
+        }
+
+        // Remove references to declarations that are no longer referenced by the document
+        for (const reference of oldReferences) {
+            const targetKey = `${reference.targetUri.toString()}#${reference.targetPath}`;
+            if (newReferencesByTarget.has(targetKey)) {
+                continue;
+            }
+
+            const referencesBySource = this.reverseReferenceIndex.get(targetKey);
+            referencesBySource?.delete(sourceUri);
+            if (referencesBySource?.size === 0) {
+                this.reverseReferenceIndex.delete(targetKey);
+            }
+        }
+
+        // Add the new references
+        for (const [targetKey, targetReferences] of newReferencesByTarget) {
+            if (!this.reverseReferenceIndex.has(targetKey)) {
+                this.reverseReferenceIndex.set(targetKey, new Map());
+            }
+            this.reverseReferenceIndex.get(targetKey)!.set(sourceUri, targetReferences);
+        }
+    }
+
+    private getTargetKey(targetNode: AstNode, astNodePath: string): string {
+        return `${AstUtils.getDocument(targetNode).uri.toString()}#${astNodePath}`;
+    }
+}
@@ -0,0 +1,50 @@
+import { DefaultLangiumDocuments, DocumentState, LangiumDocument, LangiumDocumentFactory, URI } from 'langium';
+import fs from 'fs';
+import type { SafeDsSharedServices } from '../safe-ds-module.js';
+import type { SafeDsScopeComputation } from '../scoping/safe-ds-scope-computation.js';
+import type { SafeDsBuiltinIndex } from './safe-ds-builtin-index.js';
+
+export class SafeDsLangiumDocuments extends DefaultLangiumDocuments {
+    private readonly builtinIndex: () => SafeDsBuiltinIndex;
+    private readonly documentFactory: () => LangiumDocumentFactory;
+    private readonly sharedServices: SafeDsSharedServices;
+
+    constructor(sharedServices: SafeDsSharedServices) {
+        super(sharedServices);
+
+        this.builtinIndex = () => sharedServices.workspace.BuiltinIndex;
+        this.documentFactory = () => sharedServices.workspace.LangiumDocumentFactory;
+        this.sharedServices = sharedServices;
+    }
+
+    override getDocument(uri: URI): LangiumDocument | undefined {
+        return super.getDocument(uri) ?? this.loadIndexedBuiltinDocument(uri);
+    }
+
+    /**
+     * Loads a builtin document whose exports and references were taken from the builtin index. This happens on demand,
+     * usually while a reference into the document gets resolved, so it must be synchronous.
+     */
+    private loadIndexedBuiltinDocument(uri: URI): LangiumDocument | undefined {
+        const builtinIndex = this.builtinIndex();
+        if (!builtinIndex.isUnloaded(uri)) {
+            return undefined;
+        }
+        builtinIndex.markLoaded(uri);
+
+        const text = fs.readFileSync(uri.fsPath, 'utf-8');
+        const document = this.documentFactory().fromString(text, uri);
+
+        const scopeComputation = <SafeDsScopeComputation>(
+            this.sharedServices.ServiceRegistry.getServices(uri).references.ScopeComputation
+        );
+        document.precomputedScopes = scopeComputation.computeLocalScopesSync(document);
+
+        // The index already contains exports and references, and builtin files are never validated. References are
+        // resolved lazily once they are accessed.
+        document.state = DocumentState.Validated;
+
+        this.addDocument(document);
+        return document;
+    }
+}
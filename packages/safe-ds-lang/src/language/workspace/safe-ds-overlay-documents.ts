@@ -0,0 +1,68 @@
+import { DocumentState, LangiumDocument, LangiumDocumentFactory, Linker } from 'langium';
+import { SafeDsServices } from '../safe-ds-module.js';
+import { SafeDsScopeComputation } from '../scoping/safe-ds-scope-computation.js';
+import { SafeDsDocumentDependencyTracker } from './safe-ds-document-dependency-tracker.js';
+
+/**
+ * Creates documents that are copies of a workspace document with some text edits applied, e.g. to append synthetic
+ * statements to a pipeline before it is executed.
+ *
+ * Overlays get their own URI and are never added to the workspace, so the documents that the editor shows are never
+ * replaced and no other document can reference an overlay. Overlays are parsed once and linked, but not indexed or
+ * validated.
+ */
+export class SafeDsOverlayDocuments {
+    private readonly dependencyTracker: SafeDsDocumentDependencyTracker;
+    private readonly documentFactory: LangiumDocumentFactory;
+    private readonly linker: Linker;
+    private readonly scopeComputation: SafeDsScopeComputation;
+
+    private overlayCounter = 0;
+
+    constructor(services: SafeDsServices) {
+        this.dependencyTracker = services.workspace.DocumentDependencyTracker;
+        this.documentFactory = services.shared.workspace.LangiumDocumentFactory;
+        this.linker = services.references.Linker;
+        this.scopeComputation = services.references.ScopeComputation as SafeDsScopeComputation;
+    }
+
+    /**
+     * Creates an overlay of the base document. The URI of the overlay only differs from the one of the base document in
+     * its query, so the overlay has the same file system path. Edits must not overlap. Their offsets refer to the text
+     * of the base document.
+     *
+     * Call `delete` once the overlay is no longer needed.
+     */
+    async create(baseDocument: LangiumDocument, edits: OverlayEdit[]): Promise<LangiumDocument> {
+        let text = baseDocument.textDocument.getText();
+        for (const edit of [...edits].sort((a, b) => b.start - a.start || b.end - a.end)) {
+            text = text.substring(0, edit.start) + edit.text + text.substring(edit.end);
+        }
+
+        const uri = baseDocument.uri.with({ query: `overlay=${this.overlayCounter++}` });
+        const document = this.documentFactory.fromString(text, uri);
+
+        document.precomputedScopes = await this.scopeComputation.computeLocalScopes(document);
+        document.state = DocumentState.ComputedScopes;
+        await this.linker.link(document);
+        document.state = DocumentState.Linked;
+
+        return document;
+    }
+
+    /**
+     * Evicts all data that was computed for the overlay from the caches.
+     */
+    delete(overlay: LangiumDocument): void {
+        this.dependencyTracker.invalidate([overlay.uri]);
+    }
+}
+
+/**
+ * Replaces the text between the offsets `start` (inclusive) and `end` (exclusive) with `text`.
+ */
+export interface OverlayEdit {
+    readonly start: number;
+    readonly end: number;
+    readonly text: string;
+}
@@ -5,36 +5,43 @@ import {
     AstNodeLocator,
     AstReflection,
     DocumentState,
-    IndexManager,
     LangiumDocuments,
 } from 'langium';
 import { isSdsDeclaration } from '../generated/ast.js';
 import { getPackageName, isInternal } from '../helpers/nodeProperties.js';
+import type { SafeDsBuiltinIndex } from './safe-ds-builtin-index.js';
+import type { SafeDsIndexManager } from './safe-ds-index-manager.js';
 
 export class SafeDsPackageManager {
     private readonly astNodeLocator: AstNodeLocator;
     private readonly astReflection: AstReflection;
-    private readonly indexManager: IndexManager;
+    private readonly builtinIndex: SafeDsBuiltinIndex;
+    private readonly indexManager: SafeDsIndexManager;
     private readonly langiumDocuments: LangiumDocuments;
 
     private readonly packageNames: PackageNames;
     private readonly packageContents: PackageContents;
 
+    /**
+     * The exports of each document that are currently part of the package tree, along with the package name of the
+     * document. Exports are only added to the tree again if the index manager replaced them.
+     */
+    private readonly documentExports: Map<string, DocumentExports>;
+
     constructor(services: SafeDsServices) {
         this.astNodeLocator = services.workspace.AstNodeLocator;
         this.astReflection = services.shared.AstReflection;
+        this.builtinIndex = services.shared.workspace.BuiltinIndex;
         this.indexManager = services.shared.workspace.IndexManager;
         this.langiumDocuments = services.shared.workspace.LangiumDocuments;
 
-        this.packageNames = new Set();
-        this.packageContents = {
-            subpackages: new Map(),
-            ownDeclarations: [],
-        };
+        this.packageNames = new Map();
+        this.packageContents = createPackageContents();
+        this.documentExports = new Map();
 
         // Update data once documents are indexed
         services.shared.workspace.DocumentBuilder.onBuildPhase(DocumentState.IndexedContent, () =>
-            this.buildPackageStructures(),
+            this.updatePackageStructures(),
         );
     }
 
@@ -42,7 +49,7 @@ export class SafeDsPackageManager {
      * Returns all package names that are defined in the workspace sorted alphabetically.
      */
     getPackageNames(): string[] {
-        return Array.from(this.packageNames).sort();
+        return Array.from(this.packageNames.keys()).sort();
     }
 
     /**
@@ -57,8 +64,29 @@ export class SafeDsPackageManager {
      * results.
      */
     getDeclarationsInPackage(packageName: string, options: GetDeclarationsOptions = {}): AstNodeDescription[] {
-        const result = this.getPackageContents(packageName)?.ownDeclarations ?? [];
-        return this.filterDescriptions(result, options);
+        const packageContents = this.getPackageContents(packageName);
+        if (!packageContents) {
+            return [];
+        }
+
+        return this.getFilteredDeclarations(this.getOwnDeclarations(packageContents), options);
+    }
+
+    /**
+     * Returns all declarations with the given name that are defined directly in the given package. The options can be
+     * used to filter the results.
+     */
+    getDeclarationsInPackageByName(
+        packageName: string,
+        name: string,
+        options: GetDeclarationsOptions = {},
+    ): AstNodeDescription[] {
+        const packageContents = this.getPackageContents(packageName);
+        if (!packageContents) {
+            return [];
+        }
+
+        return this.getFilteredDeclarationsByName(this.getOwnDeclarations(packageContents), name, options);
     }
 
     /**
@@ -74,15 +102,24 @@ export class SafeDsPackageManager {
             return [];
         }
 
-        const result: AstNodeDescription[] = [];
-        const queue: PackageContents[] = [packageContents];
-        while (queue.length > 0) {
-            const current = queue.shift()!;
-            result.push(...current.ownDeclarations);
-            queue.push(...current.subpackages.values());
+        return this.getFilteredDeclarations(this.getSubtreeDeclarations(packageContents), options);
+    }
+
+    /**
+     * Returns all declarations with the given name that are defined in the given package or any of its (transitive)
+     * subpackages. The options can be used to filter the results.
+     */
+    getDeclarationsInPackageOrSubpackageByName(
+        packageName: string,
+        name: string,
+        options: GetDeclarationsOptions = {},
+    ): AstNodeDescription[] {
+        const packageContents = this.getPackageContents(packageName);
+        if (!packageContents) {
+            return [];
         }
 
-        return this.filterDescriptions(result, options);
+        return this.getFilteredDeclarationsByName(this.getSubtreeDeclarations(packageContents), name, options);
     }
 
     private getPackageContents(packageName: string): PackageContents | undefined {
@@ -100,58 +137,228 @@ export class SafeDsPackageManager {
         return current;
     }
 
-    private filterDescriptions(
-        descriptions: AstNodeDescription[],
+    /**
+     * Returns the declarations of the package and all its (transitive) subpackages. Declarations of a package come
+     * before the ones of its subpackages.
+     */
+    private getSubtreeDeclarations(packageContents: PackageContents): Declarations {
+        if (!packageContents.subtreeDeclarations) {
+            const descriptions: AstNodeDescription[] = [];
+            const queue: PackageContents[] = [packageContents];
+            for (let i = 0; i < queue.length; i++) {
+                const current = queue[i]!;
+                descriptions.push(...this.getOwnDeclarations(current).all);
+                queue.push(...current.subpackages.values());
+            }
+
+            packageContents.subtreeDeclarations = createDeclarations(descriptions);
+        }
+
+        return packageContents.subtreeDeclarations;
+    }
+
+    /**
+     * Returns the declarations of the package itself in the order in which their documents were indexed.
+     */
+    private getOwnDeclarations(packageContents: PackageContents): Declarations {
+        if (!packageContents.ownDeclarations) {
+            packageContents.ownDeclarations = createDeclarations(
+                Array.from(packageContents.declarationsByDocument.values()).flat(),
+            );
+        }
+
+        return packageContents.ownDeclarations;
+    }
+
+    /**
+     * Returns the declarations that match the options. Results are kept until the declarations change.
+     */
+    private getFilteredDeclarations(
+        declarations: Declarations,
         options: GetDeclarationsOptions,
     ): AstNodeDescription[] {
         const { nodeType, hideInternal } = options;
-        let result = descriptions;
-
-        if (nodeType) {
-            result = descriptions.filter((it) => this.astReflection.isSubtype(it.type, nodeType));
+        if (!nodeType && !hideInternal) {
+            return declarations.all;
         }
 
-        if (hideInternal) {
-            result = result.filter((it) => !isSdsDeclaration(it.node) || !isInternal(it.node));
+        const key = `${nodeType ?? ''}/${hideInternal ?? false}`;
+        let result = declarations.filtered.get(key);
+        if (!result) {
+            result = this.filterDescriptions(this.getDescriptionsOfNodeType(declarations, nodeType), hideInternal);
+            declarations.filtered.set(key, result);
         }
 
         return result;
     }
 
-    private buildPackageStructures(): void {
-        this.packageNames.clear();
-        this.packageContents.subpackages.clear();
+    private getFilteredDeclarationsByName(
+        declarations: Declarations,
+        name: string,
+        options: GetDeclarationsOptions,
+    ): AstNodeDescription[] {
+        if (!declarations.byName) {
+            declarations.byName = new Map();
+            for (const description of declarations.all) {
+                if (!declarations.byName.has(description.name)) {
+                    declarations.byName.set(description.name, []);
+                }
+                declarations.byName.get(description.name)!.push(description);
+            }
+        }
+
+        const { nodeType, hideInternal } = options;
+        const result = declarations.byName.get(name) ?? [];
+        return this.filterDescriptions(
+            nodeType ? result.filter((it) => this.astReflection.isSubtype(it.type, nodeType)) : result,
+            hideInternal,
+        );
+    }
+
+    /**
+     * Returns the declarations of the given node type. They are computed from buckets per exact node type, so the
+     * subtype check is done once per node type instead of once per declaration.
+     */
+    private getDescriptionsOfNodeType(declarations: Declarations, nodeType: string | undefined): AstNodeDescription[] {
+        if (!nodeType) {
+            return declarations.all;
+        }
+
+        if (!declarations.byType) {
+            declarations.byType = new Map();
+            for (const description of declarations.all) {
+                if (!declarations.byType.has(description.type)) {
+                    declarations.byType.set(description.type, []);
+                }
+                declarations.byType.get(description.type)!.push(description);
+            }
+        }
+
+        const matchingTypes = new Set(
+            Array.from(declarations.byType.keys()).filter((it) => this.astReflection.isSubtype(it, nodeType)),
+        );
+        if (matchingTypes.size === declarations.byType.size) {
+            return declarations.all;
+        }
+
+        // Keep the original order of the declarations
+        return declarations.all.filter((it) => matchingTypes.has(it.type));
+    }
+
+    private filterDescriptions(
+        descriptions: AstNodeDescription[],
+        hideInternal: boolean | undefined,
+    ): AstNodeDescription[] {
+        if (!hideInternal) {
+            return descriptions;
+        }
+
+        return descriptions.filter((it) => !isSdsDeclaration(it.node) || !isInternal(it.node));
+    }
 
-        for (const description of this.indexManager.allElements()) {
-            const node = this.loadAstNode(description);
-            if (!node) {
-                /* c8 ignore next 2 */
-                continue;
+    /**
+     * Updates the package tree for all documents whose exports were added, replaced, or removed since the last update.
+     */
+    private updatePackageStructures(): void {
+        const exportsByDocument = this.indexManager.getExportsByDocument();
+
+        // Remove documents that are no longer indexed or whose exports were replaced
+        for (const [uri, { exports }] of this.documentExports) {
+            if (exportsByDocument.get(uri) !== exports) {
+                this.removeDocument(uri);
             }
+        }
 
-            const packageName = getPackageName(node);
-            if (!packageName || !this.isValidPackageName(packageName)) {
-                /* c8 ignore next 2 */
-                continue;
+        // Add new exports
+        for (const [uri, exports] of exportsByDocument) {
+            if (!this.documentExports.has(uri)) {
+                this.addDocument(uri, exports);
             }
+        }
+    }
+
+    private addDocument(uri: string, exports: AstNodeDescription[]): void {
+        const firstExport = exports[0];
+        const packageName = firstExport ? this.getPackageNameOfDescription(firstExport) : undefined;
+        this.documentExports.set(uri, { exports, packageName });
+
+        if (!packageName || !this.isValidPackageName(packageName)) {
+            return;
+        }
+
+        this.packageNames.set(packageName, (this.packageNames.get(packageName) ?? 0) + 1);
+        this.addToTree(packageName, uri, exports);
+    }
+
+    private removeDocument(uri: string): void {
+        const packageName = this.documentExports.get(uri)?.packageName;
+        this.documentExports.delete(uri);
+
+        if (!packageName || !this.isValidPackageName(packageName)) {
+            return;
+        }
+
+        const documentCount = (this.packageNames.get(packageName) ?? 1) - 1;
+        if (documentCount === 0) {
+            this.packageNames.delete(packageName);
+        } else {
+            this.packageNames.set(packageName, documentCount);
+        }
 
-            this.packageNames.add(packageName);
-            this.addToTree(packageName, description, node);
+        for (const packageContents of this.getPathToPackage(packageName)) {
+            packageContents.subtreeDeclarations = undefined;
         }
+
+        const packageContents = this.getPackageContents(packageName);
+        if (packageContents) {
+            packageContents.declarationsByDocument.delete(uri);
+            packageContents.ownDeclarations = undefined;
+        }
+    }
+
+    private getPackageNameOfDescription(description: AstNodeDescription): string | undefined {
+        // Builtin files that were registered from the serialized index should not be loaded just to get their package
+        const indexedPackageName = this.builtinIndex.getPackageName(description.documentUri);
+        if (indexedPackageName !== undefined) {
+            return indexedPackageName;
+        }
+
+        return getPackageName(this.loadAstNode(description));
     }
 
     private loadAstNode(nodeDescription: AstNodeDescription): AstNode | undefined {
         if (nodeDescription.node) {
             return nodeDescription.node;
         }
-        /* c8 ignore start */
+
         const document = this.langiumDocuments.getDocument(nodeDescription.documentUri);
         if (!document) {
+            /* c8 ignore next 2 */
             return undefined;
         }
 
         return this.astNodeLocator.getAstNode(document.parseResult.value, nodeDescription.path);
-        /* c8 ignore stop */
+    }
+
+    /**
+     * Returns a description whose node is only loaded once it is accessed. Descriptions that already contain their node
+     * are returned as is.
+     */
+    private withLazyNode(description: AstNodeDescription): AstNodeDescription {
+        if (description.node) {
+            return description;
+        }
+
+        const loadAstNode = () => this.loadAstNode(description);
+        let node: AstNode | undefined = undefined;
+
+        return {
+            ...description,
+            get node() {
+                node ??= loadAstNode();
+                return node;
+            },
+        };
     }
 
     /**
@@ -161,24 +368,40 @@ export class SafeDsPackageManager {
         return packageName.split('.').every((it) => it !== '');
     }
 
-    private addToTree(packageName: string, description: AstNodeDescription, node: AstNode): void {
-        const descriptionWithResolvedNode = { ...description, node };
+    private addToTree(packageName: string, uri: string, exports: AstNodeDescription[]): void {
+        const descriptionsWithResolvedNodes = exports.map((it) => this.withLazyNode(it));
 
-        const parts = packageName.split('.');
+        // Create missing nodes and invalidate the declarations of the package and all its ancestors
+        const path = this.getPathToPackage(packageName, true);
+        for (const packageContents of path) {
+            packageContents.subtreeDeclarations = undefined;
+        }
+
+        const current = path[path.length - 1]!;
+        current.declarationsByDocument.set(uri, descriptionsWithResolvedNodes);
+        current.ownDeclarations = undefined;
+    }
+
+    /**
+     * Returns the contents of the root package, the given package, and all packages in between. If `createMissing` is
+     * `true`, missing packages are created. Otherwise, the path ends at the last existing package.
+     */
+    private getPathToPackage(packageName: string, createMissing: boolean = false): PackageContents[] {
+        const result = [this.packageContents];
         let current = this.packageContents;
 
-        // Traverse the package tree and create missing nodes
-        for (const part of parts) {
+        for (const part of packageName.split('.')) {
             if (!current.subpackages.has(part)) {
-                current.subpackages.set(part, {
-                    subpackages: new Map(),
-                    ownDeclarations: [],
-                });
+                if (!createMissing) {
+                    break;
+                }
+                current.subpackages.set(part, createPackageContents());
             }
             current = current.subpackages.get(part)!;
+            result.push(current);
         }
 
-        current.ownDeclarations.push(descriptionWithResolvedNode);
+        return result;
     }
 }
 
@@ -194,10 +417,44 @@ export interface GetDeclarationsOptions {
     readonly hideInternal?: boolean;
 }
 
-type PackageNames = Set<string>;
+/**
+ * The number of documents per package name.
+ */
+type PackageNames = Map<string, number>;
+
 type PackageContents = {
     subpackages: PackageTree;
-    ownDeclarations: OwnDeclarations;
+    declarationsByDocument: Map<string, AstNodeDescription[]>;
+    ownDeclarations: Declarations | undefined;
+    subtreeDeclarations: Declarations | undefined;
 };
 type PackageTree = Map<string, PackageContents>;
-type OwnDeclarations = AstNodeDescription[];
+
+/**
+ * A list of declarations along with lookup tables that are computed once they are needed.
+ */
+type Declarations = {
+    all: AstNodeDescription[];
+    byName: Map<string, AstNodeDescription[]> | undefined;
+    byType: Map<string, AstNodeDescription[]> | undefined;
+    filtered: Map<string, AstNodeDescription[]>;
+};
+
+type DocumentExports = {
+    exports: AstNodeDescription[];
+    packageName: string | undefined;
+};
+
+const createPackageContents = (): PackageContents => ({
+    subpackages: new Map(),
+    declarationsByDocument: new Map(),
+    ownDeclarations: undefined,
+    subtreeDeclarations: undefined,
+});
+
+const createDeclarations = (all: AstNodeDescription[]): Declarations => ({
+    all,
+    byName: undefined,
+    byType: undefined,
+    filtered: new Map(),
+});
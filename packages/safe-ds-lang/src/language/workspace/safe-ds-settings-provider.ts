@@ -45,6 +45,16 @@ export class SafeDsSettingsProvider {
         return this.cachedSettings.runner?.command ?? 'safe-ds-runner';
     }
 
+    getRunnerProcessCount(): number {
+        /* c8 ignore next 2 */
+        return this.cachedSettings.runner?.processCount ?? 1;
+    }
+
+    getRunnerParallelism(): number {
+        /* c8 ignore next 2 */
+        return this.cachedSettings.runner?.parallelism ?? 1;
+    }
+
     onRunnerCommandUpdate(callback: (newValue: string | undefined) => void): Disposable {
         const watcher: SettingsWatcher<string | undefined> = {
             accessor: (settings) => settings.runner?.command,
@@ -112,6 +122,8 @@ export interface SafeDsInlayHintsSettings {
 
 export interface SafeDsRunnerSettings {
     command: string;
+    processCount: number;
+    parallelism: number;
 }
 
 export interface SafeDsValidationSettings {
@@ -1,13 +1,16 @@
 import { DefaultWorkspaceManager, LangiumDocument, LangiumDocumentFactory } from 'langium';
 import { WorkspaceFolder } from 'vscode-languageserver';
 import { listBuiltinFiles } from '../builtins/fileFinder.js';
-import { type LangiumSharedServices } from 'langium/lsp';
+import type { SafeDsSharedServices } from '../safe-ds-module.js';
+import type { SafeDsBuiltinIndex } from './safe-ds-builtin-index.js';
 
 export class SafeDsWorkspaceManager extends DefaultWorkspaceManager {
+    private readonly builtinIndex: SafeDsBuiltinIndex;
     private documentFactory: LangiumDocumentFactory;
 
-    constructor(services: LangiumSharedServices) {
+    constructor(services: SafeDsSharedServices) {
         super(services);
+        this.builtinIndex = services.workspace.BuiltinIndex;
         this.documentFactory = services.workspace.LangiumDocumentFactory;
     }
 
@@ -17,6 +20,11 @@ export class SafeDsWorkspaceManager extends DefaultWorkspaceManager {
     ): Promise<void> {
         await super.loadAdditionalDocuments(folders, collector);
 
+        // Builtin files that are covered by the serialized index are only loaded once they are needed
+        if (this.builtinIndex.tryRegisterSnapshot()) {
+            return;
+        }
+
         // Load builtin files
         for (const uri of listBuiltinFiles()) {
             collector(await this.documentFactory.fromUri(uri));
@@ -0,0 +1,160 @@
+import { DocumentState, LangiumDocument } from 'langium';
+import fs from 'node:fs';
+import path from 'node:path';
+import { fileURLToPath } from 'node:url';
+import { SafeDsServices } from '../../src/language/index.js';
+import { SyntheticWorkspace } from './workspaces.js';
+
+const RESULTS_PATH = fileURLToPath(new URL('./results', import.meta.url));
+
+// Documents are already parsed when they are created, so the builder never notifies listeners of the `Parsed` phase
+const BUILD_PHASES = [
+    DocumentState.IndexedContent,
+    DocumentState.ComputedScopes,
+    DocumentState.Linked,
+    DocumentState.IndexedReferences,
+];
+
+/**
+ * Collects the durations of the phases of the language pipeline across repeated runs. The document builder phases are
+ * measured with build phase listeners, all other phases with `measure`.
+ */
+export class PhaseTimings {
+    /**
+     * Maps workload names to phase names to all measured durations in milliseconds.
+     */
+    private readonly durations = new Map<string, Map<string, number[]>>();
+
+    /**
+     * Loads the files of the workspace and builds them without validation. The duration of each build phase is
+     * recorded. Validation is measured separately, so it can run after other phases that fill the caches it needs.
+     *
+     * @returns The loaded documents.
+     */
+    async link(services: SafeDsServices, workspace: SyntheticWorkspace): Promise<LangiumDocument[]> {
+        const documentBuilder = services.shared.workspace.DocumentBuilder;
+        const documentFactory = services.shared.workspace.LangiumDocumentFactory;
+        const langiumDocuments = services.shared.workspace.LangiumDocuments;
+
+        // Documents are parsed when they are created, so parsing is measured separately
+        let phaseStart = performance.now();
+        const documents = workspace.files.map((file) => {
+            const document = documentFactory.fromString(file.code, file.uri);
+            langiumDocuments.addDocument(document);
+            return document;
+        });
+        const parseEnd = performance.now();
+        this.record(workspace.name, `build: ${DocumentState[DocumentState.Parsed]}`, parseEnd - phaseStart);
+        phaseStart = parseEnd;
+
+        const listeners = BUILD_PHASES.map((phase) =>
+            documentBuilder.onBuildPhase(phase, () => {
+                const now = performance.now();
+                this.record(workspace.name, `build: ${DocumentState[phase]}`, now - phaseStart);
+                phaseStart = now;
+            }),
+        );
+
+        try {
+            await documentBuilder.build(documents, { validation: false });
+        } finally {
+            listeners.forEach((it) => it.dispose());
+        }
+
+        return documents;
+    }
+
+    /**
+     * Runs the given function and records its duration for the given phase.
+     */
+    async measure<T>(workspace: SyntheticWorkspace, phase: string, fn: () => T | Promise<T>): Promise<T> {
+        const start = performance.now();
+        const result = await fn();
+        this.record(workspace.name, phase, performance.now() - start);
+        return result;
+    }
+
+    private record(workload: string, phase: string, duration: number): void {
+        if (!this.durations.has(workload)) {
+            this.durations.set(workload, new Map());
+        }
+
+        const phases = this.durations.get(workload)!;
+        if (!phases.has(phase)) {
+            phases.set(phase, []);
+        }
+
+        phases.get(phase)!.push(duration);
+    }
+
+    /**
+     * Returns the mean and median duration of every phase, grouped by workload.
+     */
+    summarize(): PhaseTimingsReport {
+        const workloads: PhaseTimingsReport['workloads'] = {};
+
+        for (const [workload, phases] of this.durations) {
+            workloads[workload] = {};
+            for (const [phase, durations] of phases) {
+                const sorted = [...durations].sort((a, b) => a - b);
+                workloads[workload]![phase] = {
+                    samples: sorted.length,
+                    mean: sorted.reduce((a, b) => a + b, 0) / sorted.length,
+                    median: sorted[Math.floor(sorted.length / 2)]!,
+                };
+            }
+        }
+
+        return { createdAt: new Date().toISOString(), workloads };
+    }
+
+    /**
+     * Writes the summary to `tests/benchmarks/results/phases-<timestamp>.json` and prints how the median of every
+     * phase changed compared to the previous report.
+     */
+    writeReport(): void {
+        const report = this.summarize();
+        const previousReport = readLatestReport();
+
+        fs.mkdirSync(RESULTS_PATH, { recursive: true });
+        const fileName = `phases-${report.createdAt.replaceAll(':', '-')}.json`;
+        fs.writeFileSync(path.join(RESULTS_PATH, fileName), JSON.stringify(report, null, 4));
+
+        const rows = Object.entries(report.workloads).flatMap(([workload, phases]) =>
+            Object.entries(phases).map(([phase, timing]) => {
+                const previousMedian = previousReport?.workloads[workload]?.[phase]?.median;
+                const change = previousMedian ? `${((timing.median / previousMedian - 1) * 100).toFixed(1)}%` : '-';
+                return { workload, phase, 'median [ms]': timing.median.toFixed(2), 'vs. previous': change };
+            }),
+        );
+
+        // eslint-disable-next-line no-console
+        console.table(rows);
+    }
+}
+
+const readLatestReport = (): PhaseTimingsReport | undefined => {
+    if (!fs.existsSync(RESULTS_PATH)) {
+        return undefined;
+    }
+
+    const latest = fs
+        .readdirSync(RESULTS_PATH)
+        .filter((it) => it.startsWith('phases-') && it.endsWith('.json'))
+        .sort()
+        .at(-1);
+
+    if (!latest) {
+        return undefined;
+    }
+
+    return JSON.parse(fs.readFileSync(path.join(RESULTS_PATH, latest), 'utf-8'));
+};
+
+/**
+ * The durations of all phases of all workloads. Durations are given in milliseconds.
+ */
+export interface PhaseTimingsReport {
+    readonly createdAt: string;
+    readonly workloads: Record<string, Record<string, { samples: number; mean: number; median: number }>>;
+}
@@ -0,0 +1,84 @@
+import { AstUtils, LangiumDocument, URI } from 'langium';
+import { NodeFileSystem } from 'langium/node';
+import { afterAll, bench, describe } from 'vitest';
+import { isSdsCallable, isSdsExpression } from '../../src/language/generated/ast.js';
+import { createSafeDsServices } from '../../src/language/index.js';
+import { PhaseTimings } from './phaseTimings.js';
+import {
+    createClassHierarchy,
+    createCrossPackageImports,
+    createDeepCallChain,
+    createWidePipeline,
+    SyntheticWorkspace,
+} from './workspaces.js';
+
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const documentBuilder = services.shared.workspace.DocumentBuilder;
+const formatter = services.lsp.Formatter!;
+const pythonGenerator = services.generation.PythonGenerator;
+const purityComputer = services.purity.PurityComputer;
+const typeComputer = services.typing.TypeComputer;
+
+const timings = new PhaseTimings();
+
+const workspaces: SyntheticWorkspace[] = [
+    createDeepCallChain(200),
+    createWidePipeline(2000),
+    createClassHierarchy(100),
+    createCrossPackageImports(50, 20),
+];
+
+/**
+ * Runs the whole language pipeline on the workspace. Types and purity are computed before validation, so they are
+ * measured with empty caches.
+ */
+const runPipeline = async (workspace: SyntheticWorkspace) => {
+    // Remove the documents of the previous iteration
+    await documentBuilder.update(
+        [],
+        workspace.files.map((it) => it.uri),
+    );
+
+    const documents = await timings.link(services, workspace);
+    const nodes = documents.flatMap((it) => AstUtils.streamAllContents(it.parseResult.value).toArray());
+
+    await timings.measure(workspace, 'TypeComputer.computeType', () => {
+        nodes.filter(isSdsExpression).forEach((it) => typeComputer.computeType(it));
+    });
+    await timings.measure(workspace, 'PurityComputer.getImpurityReasonsForCallable', () => {
+        nodes.filter(isSdsCallable).forEach((it) => purityComputer.getImpurityReasonsForCallable(it));
+    });
+    await timings.measure(workspace, 'build: Validated', () => documentBuilder.build(documents, { validation: true }));
+    await timings.measure(workspace, 'PythonGenerator.generate', () => {
+        documents.forEach((it) => generate(it));
+    });
+    await timings.measure(workspace, 'Formatter.formatDocument', () =>
+        Promise.all(documents.map((it) => format(it))),
+    );
+};
+
+const generate = (document: LangiumDocument) => {
+    return pythonGenerator.generate(document, {
+        destination: URI.file('/bench'),
+        createSourceMaps: true,
+        targetStatements: undefined,
+        disableRunnerIntegration: false,
+    });
+};
+
+const format = (document: LangiumDocument) => {
+    return formatter.formatDocument(document, {
+        textDocument: { uri: document.uri.toString() },
+        options: { tabSize: 4, insertSpaces: true },
+    });
+};
+
+describe('language pipeline', () => {
+    afterAll(() => {
+        timings.writeReport();
+    });
+
+    for (const workspace of workspaces) {
+        bench(workspace.name, () => runPipeline(workspace), { iterations: 10, warmupIterations: 2 });
+    }
+});
@@ -0,0 +1,166 @@
+import { URI } from 'langium';
+
+/**
+ * A synthetic workspace that is created in memory for benchmarks.
+ */
+export interface SyntheticWorkspace {
+    /**
+     * A short description of the workload that is used as the name of the benchmark group.
+     */
+    readonly name: string;
+
+    /**
+     * The files of the workspace.
+     */
+    readonly files: SyntheticFile[];
+}
+
+/**
+ * A single file of a synthetic workspace.
+ */
+export interface SyntheticFile {
+    readonly uri: URI;
+    readonly code: string;
+}
+
+/**
+ * Creates a chain of segments, where each segment calls the next one. This stresses the type computer, the purity
+ * computer, and the call graph computer, since the result of the first segment depends on all others.
+ *
+ * @param depth The number of segments.
+ */
+export const createDeepCallChain = (depth: number): SyntheticWorkspace => {
+    const segments = Array.from({ length: depth }, (_, i) => {
+        const body = i === depth - 1 ? 'yield r = p + 1;' : `yield r = s${i + 1}(p) + 1;`;
+        return `segment s${i}(p: Int) -> r: Int {\n    ${body}\n}`;
+    });
+
+    const code = `package bench.chain
+
+pipeline myPipeline {
+    val result = s0(1);
+}
+
+${segments.join('\n\n')}
+`;
+
+    return {
+        name: `deep call chain (${depth} segments)`,
+        files: [{ uri: syntheticUri('chain/main.sds'), code }],
+    };
+};
+
+/**
+ * Creates a single pipeline with many statements, where each placeholder depends on the two previous ones. This
+ * stresses linking, validation, and Python generation.
+ *
+ * @param statementCount The number of statements in the pipeline.
+ */
+export const createWidePipeline = (statementCount: number): SyntheticWorkspace => {
+    const statements = Array.from({ length: statementCount }, (_, i) => {
+        if (i < 2) {
+            return `    val p${i} = ${i};`;
+        } else {
+            return `    val p${i} = p${i - 1} + p${i - 2} * ${i};`;
+        }
+    });
+
+    const code = `package bench.wide
+
+pipeline myPipeline {
+${statements.join('\n')}
+}
+`;
+
+    return {
+        name: `wide pipeline (${statementCount} statements)`,
+        files: [{ uri: syntheticUri('wide/main.sds'), code }],
+    };
+};
+
+/**
+ * Creates a deep class hierarchy in a stub file and a pipeline that accesses inherited members on the most derived
+ * class. This stresses the class hierarchy and member lookup.
+ *
+ * @param depth The number of classes in the hierarchy.
+ */
+export const createClassHierarchy = (depth: number): SyntheticWorkspace => {
+    const classes = Array.from({ length: depth }, (_, i) => {
+        const parent = i === 0 ? '' : ` sub C${i - 1}`;
+        return `class C${i}()${parent} {
+    attr a${i}: Int
+
+    @Pure
+    fun m${i}() -> r: Int
+}`;
+    });
+
+    const accesses = Array.from({ length: depth }, (_, i) => `    val v${i} = instance.m${i}() + instance.a${i};`);
+
+    const stubCode = `package bench.hierarchy
+
+${classes.join('\n\n')}
+`;
+    const pipelineCode = `package bench.hierarchy
+
+pipeline myPipeline {
+    val instance = C${depth - 1}();
+${accesses.join('\n')}
+}
+`;
+
+    return {
+        name: `class hierarchy (${depth} classes)`,
+        files: [
+            { uri: syntheticUri('hierarchy/classes.sdsstub'), code: stubCode },
+            { uri: syntheticUri('hierarchy/main.sds'), code: pipelineCode },
+        ],
+    };
+};
+
+/**
+ * Creates many packages with segments that import and call segments from the previous package. This stresses scoping
+ * and indexing across documents.
+ *
+ * @param packageCount The number of packages.
+ * @param segmentsPerPackage The number of segments in each package.
+ */
+export const createCrossPackageImports = (packageCount: number, segmentsPerPackage: number): SyntheticWorkspace => {
+    const files = Array.from({ length: packageCount }, (_, i) => {
+        const imports = i === 0 ? '' : `from bench.packages.p${i - 1} import *\n\n`;
+        const segments = Array.from({ length: segmentsPerPackage }, (__, j) => {
+            const call = i === 0 ? 'p' : `p${i - 1}s${j}(p)`;
+            return `segment p${i}s${j}(p: Int) -> r: Int {\n    yield r = ${call} * 2;\n}`;
+        });
+
+        return {
+            uri: syntheticUri(`packages/p${i}.sds`),
+            code: `package bench.packages.p${i}\n\n${imports}${segments.join('\n\n')}\n`,
+        };
+    });
+
+    const calls = Array.from(
+        { length: segmentsPerPackage },
+        (_, j) => `    val r${j} = p${packageCount - 1}s${j}(${j});`,
+    );
+    files.push({
+        uri: syntheticUri('packages/main.sds'),
+        code: `package bench.packages.main
+
+from bench.packages.p${packageCount - 1} import *
+
+pipeline myPipeline {
+${calls.join('\n')}
+}
+`,
+    });
+
+    return {
+        name: `cross-package imports (${packageCount} packages, ${segmentsPerPackage} segments each)`,
+        files,
+    };
+};
+
+const syntheticUri = (path: string): URI => {
+    return URI.parse(`memory:///bench/${path}`);
+};
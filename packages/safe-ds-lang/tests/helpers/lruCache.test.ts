@@ -0,0 +1,66 @@
+import { describe, expect, it } from 'vitest';
+import { LruCache } from '../../src/helpers/lruCache.js';
+
+describe('LruCache', () => {
+    it('should throw if the maximum size is less than 1', () => {
+        expect(() => new LruCache(0)).toThrowError(RangeError);
+    });
+
+    it('should return the value that was set for a key', () => {
+        const cache = new LruCache<string, number>(2);
+        cache.set('a', 1);
+        expect(cache.get('a')).toBe(1);
+    });
+
+    it('should return undefined for a missing key', () => {
+        const cache = new LruCache<string, number>(2);
+        expect(cache.get('a')).toBeUndefined();
+    });
+
+    it('should replace the value of an existing key', () => {
+        const cache = new LruCache<string, number>(2);
+        cache.set('a', 1).set('a', 2);
+        expect(cache.get('a')).toBe(2);
+        expect(cache.size).toBe(1);
+    });
+
+    it('should remove the least recently set entry if the cache is full', () => {
+        const cache = new LruCache<string, number>(2);
+        cache.set('a', 1).set('b', 2).set('c', 3);
+        expect(cache.has('a')).toBeFalsy();
+        expect(cache.has('b')).toBeTruthy();
+        expect(cache.has('c')).toBeTruthy();
+    });
+
+    it('should keep entries that were read recently', () => {
+        const cache = new LruCache<string, number>(2);
+        cache.set('a', 1).set('b', 2);
+        cache.get('a');
+        cache.set('c', 3);
+        expect(cache.has('a')).toBeTruthy();
+        expect(cache.has('b')).toBeFalsy();
+    });
+
+    it('should not count checking for a key as using it', () => {
+        const cache = new LruCache<string, number>(2);
+        cache.set('a', 1).set('b', 2);
+        cache.has('a');
+        cache.set('c', 3);
+        expect(cache.has('a')).toBeFalsy();
+    });
+
+    it('should delete entries', () => {
+        const cache = new LruCache<string, number>(2);
+        cache.set('a', 1);
+        expect(cache.delete('a')).toBeTruthy();
+        expect(cache.delete('a')).toBeFalsy();
+        expect(cache.size).toBe(0);
+    });
+
+    it('should clear all entries', () => {
+        const cache = new LruCache<string, number>(2);
+        cache.set('a', 1).set('b', 2);
+        cache.clear();
+        expect(cache.size).toBe(0);
+    });
+});
@@ -134,6 +134,46 @@ describe('computeBackwardSliceToTargets', async () => {
             targetIndices: [1],
             expectedIndices: [0, 1],
         },
+        {
+            testName: 'not required due to impurity reason for another file',
+            code: `
+                package test
+
+                @Impure([ImpurityReason.FileReadFromConstantPath("a.txt")])
+                fun fileRead() -> content: String
+
+                @Impure([ImpurityReason.FileWriteToConstantPath("b.txt")])
+                fun fileWrite()
+
+                pipeline myPipeline {
+                    fileWrite();
+                    val a = fileRead();
+                }
+            `,
+            targetIndices: [1],
+            expectedIndices: [1],
+        },
+        {
+            testName: 'required transitively',
+            code: `
+                package test
+
+                @Impure([ImpurityReason.FileReadFromConstantPath("a.txt")])
+                fun fileRead() -> content: String
+
+                @Impure([ImpurityReason.FileWriteToConstantPath("a.txt")])
+                fun fileWrite(content: String)
+
+                pipeline myPipeline {
+                    val a = "a";
+                    val b = "b";
+                    fileWrite(a);
+                    val c = fileRead();
+                }
+            `,
+            targetIndices: [3],
+            expectedIndices: [0, 2, 3],
+        },
     ];
 
     it.each(testCases)('$testName', async ({ code, targetIndices, expectedIndices }) => {
@@ -148,6 +188,15 @@ describe('computeBackwardSliceToTargets', async () => {
 
         expect(actualIndices).toStrictEqual(expectedIndices);
     });
+
+    it('should not modify the given statements', async () => {
+        const pipeline = await getNodeOfType(services, 'pipeline myPipeline { val a = 1; val b = a; }', isSdsPipeline);
+        const statements = getStatements(pipeline.body);
+        const copy = [...statements];
+
+        slicer.computeBackwardSliceToTargets(statements, [statements[1]!]);
+        expect(statements).toStrictEqual(copy);
+    });
 });
 
 interface ComputeBackwardSliceTest {
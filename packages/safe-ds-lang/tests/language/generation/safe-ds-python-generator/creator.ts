@@ -13,6 +13,7 @@ import { TestDescription, TestDescriptionError } from '../../../helpers/testDesc
 import { URI } from 'langium';
 import { createSafeDsServices, locationToString } from '../../../../src/language/index.js';
 import { isEmpty } from '../../../../src/helpers/collections.js';
+import { GenerateOptions } from '../../../../src/language/generation/python/safe-ds-python-generator.js';
 
 const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
 const langiumDocuments = services.shared.workspace.LangiumDocuments;
@@ -20,6 +21,17 @@ const langiumDocuments = services.shared.workspace.LangiumDocuments;
 const rootResourceName = 'generation/python';
 const runnerIntegration = 'runner integration';
 
+/**
+ * Options that are enabled for all tests in a directory with the given name. Source maps do not depend on these options
+ * and are already covered by the other tests, so they are not created for these tests.
+ */
+const optionsByDirectoryName: Record<string, OptimizationOptions> = {
+    'lazy imports': { lazyImports: true },
+    optimization: { optimize: true },
+    parallelism: { parallelism: 2 },
+    'release placeholders': { releasePlaceholders: true },
+};
+
 export const createPythonGenerationTests = async (): Promise<PythonGenerationTest[]> => {
     const filesGroupedByParentDirectory = listTestSafeDsFilesGroupedByParentDirectory(rootResourceName);
     const testCases = filesGroupedByParentDirectory.map((entry) => createPythonGenerationTest(...entry));
@@ -81,6 +93,10 @@ const createPythonGenerationTest = async (parentDirectory: URI, inputUris: URI[]
     }
 
     const shortenedResourceName = uriToShortenedTestResourceName(parentDirectory, rootResourceName);
+    const options: OptimizationOptions = Object.assign(
+        {},
+        ...shortenedResourceName.split(path.sep).map((name) => optionsByDirectoryName[name]),
+    );
     return {
         testName: `[${shortenedResourceName}]`,
         inputUris,
@@ -88,6 +104,8 @@ const createPythonGenerationTest = async (parentDirectory: URI, inputUris: URI[]
         expectedOutputUris,
         targets,
         disableRunnerIntegration: !shortenedResourceName.startsWith(runnerIntegration),
+        createSourceMaps: isEmpty(Object.keys(options)),
+        options,
     };
 };
 
@@ -116,6 +134,8 @@ const invalidTest = (level: 'FILE' | 'SUITE', error: TestDescriptionError): Pyth
         expectedOutputUris: [],
         error,
         disableRunnerIntegration: false,
+        createSourceMaps: true,
+        options: {},
     };
 };
 
@@ -147,8 +167,23 @@ interface PythonGenerationTest extends TestDescription {
      * Whether the test should run with runner integration (memoization & placeholder saving) disabled.
      */
     disableRunnerIntegration: boolean;
+
+    /**
+     * Whether the test should create source maps.
+     */
+    createSourceMaps: boolean;
+
+    /**
+     * Further options for the generator.
+     */
+    options: OptimizationOptions;
 }
 
+/**
+ * Options of the generator that change the generated code of pipelines and segments.
+ */
+type OptimizationOptions = Pick<GenerateOptions, 'releasePlaceholders' | 'parallelism' | 'optimize' | 'lazyImports'>;
+
 /**
  * Found multiple test checks.
  */
@@ -1,4 +1,4 @@
-import { describe, expect, it } from 'vitest';
+import { afterEach, describe, expect, it, vi } from 'vitest';
 import { NodeFileSystem } from 'langium/node';
 import { createPythonGenerationTests } from './creator.js';
 import { loadDocuments } from '../../../helpers/testResources.js';
@@ -6,7 +6,8 @@ import { AstUtils, stream, URI } from 'langium';
 import { createSafeDsServices } from '../../../../src/language/index.js';
 import { isEmpty } from '../../../../src/helpers/collections.js';
 import { isSdsStatement } from '../../../../src/language/generated/ast.js';
-import { isRangeEqual } from 'langium/test';
+import { isRangeEqual, parseHelper } from 'langium/test';
+import { SourceMapGenerator } from 'source-map';
 
 const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
 const langiumDocuments = services.shared.workspace.LangiumDocuments;
@@ -49,9 +50,10 @@ describe('generation', async () => {
             .flatMap((document) =>
                 pythonGenerator.generate(document, {
                     destination: test.outputRoot,
-                    createSourceMaps: true,
+                    createSourceMaps: test.createSourceMaps,
                     targetStatements,
                     disableRunnerIntegration: test.disableRunnerIntegration,
+                    ...test.options,
                 }),
             )
             .map((textDocument) => [textDocument.uri, textDocument.getText()])
@@ -72,3 +74,32 @@ describe('generation', async () => {
         expect(actualOutputPaths).toStrictEqual(expectedOutputPaths);
     });
 });
+
+describe('generateLazily', () => {
+    afterEach(() => {
+        vi.restoreAllMocks();
+    });
+
+    it('should only create source maps once they are requested', async () => {
+        const createSourceMap = vi.spyOn(SourceMapGenerator.prototype, 'toString');
+        const document = await parseHelper(services)(`
+            package test
+
+            pipeline myPipeline {
+                val a = 1;
+            }
+        `);
+
+        const files = pythonGenerator.generateLazily(document, {
+            destination: URI.file('/output'),
+            createSourceMaps: true,
+            targetStatements: undefined,
+            disableRunnerIntegration: false,
+        });
+        expect(createSourceMap).not.toHaveBeenCalled();
+
+        const sourceMap = files.find((it) => it.uri.endsWith('.py.map'))!;
+        expect(sourceMap.getText()).toBe(sourceMap.getText());
+        expect(createSourceMap).toHaveBeenCalledOnce();
+    });
+});
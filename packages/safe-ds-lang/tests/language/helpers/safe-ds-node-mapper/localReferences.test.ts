@@ -0,0 +1,77 @@
+import { AstUtils, URI } from 'langium';
+import { NodeFileSystem } from 'langium/node';
+import { parseHelper } from 'langium/test';
+import fs from 'node:fs';
+import os from 'node:os';
+import path from 'node:path';
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+import { isSdsPlaceholder, SdsPlaceholder } from '../../../../src/language/generated/ast.js';
+import { createSafeDsServices } from '../../../../src/language/index.js';
+
+const services = (await createSafeDsServices(NodeFileSystem, { omitBuiltins: true })).SafeDs;
+const documentBuilder = services.shared.workspace.DocumentBuilder;
+const langiumDocuments = services.shared.workspace.LangiumDocuments;
+const nodeMapper = services.helpers.NodeMapper;
+
+const directory = fs.mkdtempSync(path.join(os.tmpdir(), 'safe-ds-node-mapper-'));
+const uri = URI.file(path.join(directory, 'main.sds'));
+
+const code = (referenceCount: number) => `
+    pipeline myPipeline {
+        val a1 = 1;
+        ${'a1;'.repeat(referenceCount)}
+    }
+`;
+
+describe('SafeDsNodeMapper', () => {
+    describe('local references', () => {
+        beforeEach(async () => {
+            fs.writeFileSync(uri.fsPath, code(1));
+            await parseHelper(services)(code(1), { documentUri: uri.toString() });
+        });
+
+        afterEach(async () => {
+            vi.restoreAllMocks();
+            await documentBuilder.update([], [uri]);
+            fs.rmSync(uri.fsPath, { force: true });
+        });
+
+        const getPlaceholder = (): SdsPlaceholder => {
+            const root = langiumDocuments.getDocument(uri)!.parseResult.value;
+            return AstUtils.streamAst(root).find(isSdsPlaceholder)!;
+        };
+
+        // The cache is private, but whether it is used is exactly what these tests check
+        const spyOnCache = () => vi.spyOn(nodeMapper['localReferencesCache'], 'get');
+
+        it('should cache the references of linked documents', () => {
+            const cacheGet = spyOnCache();
+
+            expect(nodeMapper.placeholderToReferences(getPlaceholder()).count()).toBe(1);
+            expect(cacheGet).toHaveBeenCalled();
+        });
+
+        it('should not cache the references of documents that are not linked yet', () => {
+            const cacheGet = spyOnCache();
+            const document = services.shared.workspace.LangiumDocumentFactory.fromString(
+                code(2),
+                URI.file(path.join(directory, 'unlinked.sds')),
+            );
+            const placeholder = AstUtils.streamAst(document.parseResult.value).find(isSdsPlaceholder);
+
+            nodeMapper.placeholderToReferences(placeholder).toArray();
+
+            expect(cacheGet).not.toHaveBeenCalled();
+        });
+
+        it('should return the references of the new version of an edited document', async () => {
+            expect(nodeMapper.placeholderToReferences(getPlaceholder()).count()).toBe(1);
+
+            // The document builder reads the new text from the file system
+            fs.writeFileSync(uri.fsPath, code(3));
+            await documentBuilder.update([uri], []);
+
+            expect(nodeMapper.placeholderToReferences(getPlaceholder()).count()).toBe(3);
+        });
+    });
+});
@@ -545,6 +545,21 @@ describe('partial evaluation model', async () => {
             });
         });
 
+        describe('size', () => {
+            it.each([
+                {
+                    tuple: new EvaluatedNamedTuple(new Map()),
+                    expectedValue: 0,
+                },
+                {
+                    tuple: new EvaluatedNamedTuple(new Map([[result1, NullConstant]])),
+                    expectedValue: 1,
+                },
+            ])('should return the number of results (%#)', ({ tuple, expectedValue }) => {
+                expect(tuple.size).toStrictEqual(expectedValue);
+            });
+        });
+
         describe('getResultValueByName', () => {
             it.each([
                 {
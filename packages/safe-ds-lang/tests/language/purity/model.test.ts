@@ -2,6 +2,7 @@ import { NodeFileSystem } from 'langium/node';
 import { describe, expect, it } from 'vitest';
 import { isSdsParameter } from '../../../src/language/generated/ast.js';
 import {
+    ALL_RESOURCES,
     EndlessRecursion,
     FileRead,
     FileWrite,
@@ -125,4 +126,34 @@ describe('purity model', async () => {
             expect(value.toString()).toStrictEqual(expectedString);
         });
     });
+
+    describe('affectedResources', () => {
+        const reasons: ImpurityReason[] = [
+            new FileRead(undefined),
+            new FileRead('a.txt'),
+            new FileRead('b.txt'),
+            new FileRead(parameter),
+            new FileWrite(undefined),
+            new FileWrite('a.txt'),
+            new FileWrite('b.txt'),
+            new FileWrite(parameter),
+            new PotentiallyImpureParameterCall(undefined),
+            new PotentiallyImpureParameterCall(parameter),
+            UnknownCallableCall,
+            EndlessRecursion,
+            OtherImpurityReason,
+        ];
+
+        const pairs = reasons.flatMap((past) => reasons.map((future) => ({ past, future })));
+
+        it.each(pairs)('should be consistent with canAffectFutureImpurityReason ($past, $future)', (pair) => {
+            const { past, future } = pair;
+            const affectedResources = past.affectedResources;
+            const canAffectByResource =
+                future.resource !== undefined &&
+                (affectedResources === ALL_RESOURCES || affectedResources.includes(future.resource));
+
+            expect(canAffectByResource).toBe(past.canAffectFutureImpurityReason(future));
+        });
+    });
 });
@@ -1,9 +1,16 @@
 import { describe, expect, it } from 'vitest';
 import { ToStringTest } from '../../helpers/testDescription.js';
 import {
+    createCancelMessage,
+    createPlaceholderBatchQueryMessage,
     createPlaceholderQueryMessage,
     createProgramMessage,
     createShutdownMessage,
+    decodeBinaryMessage,
+    encodeBinaryMessage,
+    PlaceholderValueAssembler,
+    PlaceholderValueChunkHeader,
+    PlaceholderValueEncoding,
     PythonServerMessage,
 } from '../../../src/language/runtime/messages.js';
 
@@ -40,6 +47,19 @@ describe('runner messages', async () => {
             value: () => createPlaceholderQueryMessage('abcdefg', 'value1'),
             expectedString: '{"type":"placeholder_query","id":"abcdefg","data":{"name":"value1","window":{}}}',
         },
+        {
+            value: () =>
+                createPlaceholderBatchQueryMessage('abcdefg', [
+                    { name: 'value1', window: {} },
+                    { name: 'value2', window: { begin: 0, size: 10 } },
+                ]),
+            expectedString:
+                '{"type":"placeholder_batch_query","id":"abcdefg","data":[{"name":"value1","window":{}},{"name":"value2","window":{"begin":0,"size":10}}]}',
+        },
+        {
+            value: () => createCancelMessage('abcdefg'),
+            expectedString: '{"type":"cancel","id":"abcdefg","data":""}',
+        },
         {
             value: () => createShutdownMessage(),
             expectedString: '{"type":"shutdown","id":"","data":""}',
@@ -52,3 +72,107 @@ describe('runner messages', async () => {
         });
     });
 });
+
+describe('binary runner messages', () => {
+    const createHeader = (
+        chunkIndex: number,
+        chunkCount: number,
+        encoding: PlaceholderValueEncoding = 'json',
+        id: string = 'abcdefg',
+    ): PlaceholderValueChunkHeader => ({
+        type: 'placeholder_value',
+        id,
+        data: { name: 'value1', type: 'Table', encoding, chunkIndex, chunkCount },
+    });
+
+    describe('decodeBinaryMessage', () => {
+        it('should return the header and payload that were encoded', () => {
+            const header = createHeader(0, 1);
+            const payload = Buffer.from([1, 2, 3]);
+
+            const result = decodeBinaryMessage(encodeBinaryMessage(header, payload));
+            expect(result.header).toStrictEqual(header);
+            expect(result.payload.equals(payload)).toBeTruthy();
+        });
+
+        it('should throw if the frame is too short to contain the header length', () => {
+            expect(() => decodeBinaryMessage(Buffer.from([0, 0]))).toThrowError();
+        });
+
+        it('should throw if the frame is shorter than its header', () => {
+            const frame = encodeBinaryMessage(createHeader(0, 1), Buffer.alloc(0));
+            expect(() => decodeBinaryMessage(frame.subarray(0, frame.length - 1))).toThrowError();
+        });
+
+        it('should throw if the header has an unsupported type', () => {
+            const header = { ...createHeader(0, 1), type: 'program' } as any;
+            expect(() => decodeBinaryMessage(encodeBinaryMessage(header, Buffer.alloc(0)))).toThrowError();
+        });
+    });
+
+    describe('PlaceholderValueAssembler', () => {
+        const value = { a: [1, 2, 3], b: ['x', 'y', 'z'] };
+        const json = Buffer.from(JSON.stringify(value), 'utf-8');
+        const chunks = [json.subarray(0, 5), json.subarray(5, 10), json.subarray(10)];
+
+        it('should decode a value that is sent in a single chunk', () => {
+            const assembler = new PlaceholderValueAssembler();
+            const message = assembler.add(encodeBinaryMessage(createHeader(0, 1), json));
+
+            expect(message).toStrictEqual({
+                type: 'placeholder_value',
+                id: 'abcdefg',
+                data: { name: 'value1', type: 'Table', value, window: undefined },
+            });
+        });
+
+        it('should return undefined until all chunks were received', () => {
+            const assembler = new PlaceholderValueAssembler();
+            expect(assembler.add(encodeBinaryMessage(createHeader(0, 3), chunks[0]!))).toBeUndefined();
+            expect(assembler.add(encodeBinaryMessage(createHeader(1, 3), chunks[1]!))).toBeUndefined();
+            expect(assembler.add(encodeBinaryMessage(createHeader(2, 3), chunks[2]!))?.data.value).toStrictEqual(value);
+        });
+
+        it('should join chunks that arrive out of order', () => {
+            const assembler = new PlaceholderValueAssembler();
+            assembler.add(encodeBinaryMessage(createHeader(2, 3), chunks[2]!));
+            assembler.add(encodeBinaryMessage(createHeader(1, 3), chunks[1]!));
+            expect(assembler.add(encodeBinaryMessage(createHeader(0, 3), chunks[0]!))?.data.value).toStrictEqual(value);
+        });
+
+        it('should keep values of different executions apart', () => {
+            const assembler = new PlaceholderValueAssembler();
+            assembler.add(encodeBinaryMessage(createHeader(0, 2, 'json', 'a'), chunks[0]!));
+            expect(assembler.add(encodeBinaryMessage(createHeader(1, 2, 'json', 'b'), chunks[1]!))).toBeUndefined();
+        });
+
+        it('should discard partially received values of an execution', () => {
+            const assembler = new PlaceholderValueAssembler();
+            assembler.add(encodeBinaryMessage(createHeader(0, 2), chunks[0]!));
+            assembler.discard('abcdefg');
+            expect(assembler.add(encodeBinaryMessage(createHeader(1, 2), chunks[1]!))).toBeUndefined();
+        });
+
+        it('should only discard partially received values of the given placeholders', () => {
+            const assembler = new PlaceholderValueAssembler();
+            assembler.add(encodeBinaryMessage(createHeader(0, 2), json.subarray(0, 5)));
+            assembler.discard('abcdefg', new Set(['value2']));
+            expect(assembler.add(encodeBinaryMessage(createHeader(1, 2), json.subarray(5)))?.data.value).toStrictEqual(
+                value,
+            );
+        });
+
+        it('should encode PNG images as base64', () => {
+            const assembler = new PlaceholderValueAssembler();
+            const png = Buffer.from([0x89, 0x50, 0x4e, 0x47]);
+            const message = assembler.add(encodeBinaryMessage(createHeader(0, 1, 'png'), png));
+
+            expect(message?.data.value).toStrictEqual({ format: 'png', bytes: png.toString('base64') });
+        });
+
+        it('should throw if the chunk index is out of range', () => {
+            const assembler = new PlaceholderValueAssembler();
+            expect(() => assembler.add(encodeBinaryMessage(createHeader(1, 1), json))).toThrowError();
+        });
+    });
+});
@@ -0,0 +1,93 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest';
+import { PooledProcess, ProcessPool } from '../../../src/language/runtime/processPool.js';
+
+class FakeProcess implements PooledProcess {
+    readonly runningExecutions = new Set<string>();
+    readonly stop = vi.fn(async () => {});
+
+    constructor(readonly index: number) {}
+}
+
+describe('ProcessPool', () => {
+    let pool: ProcessPool<FakeProcess>;
+
+    beforeEach(() => {
+        pool = new ProcessPool((index) => new FakeProcess(index));
+    });
+
+    describe('resize', () => {
+        it('should start with the primary process only', () => {
+            expect(pool.all.map((it) => it.index)).toStrictEqual([0]);
+        });
+
+        it('should add processes', () => {
+            pool.resize(3);
+            expect(pool.all.map((it) => it.index)).toStrictEqual([0, 1, 2]);
+        });
+
+        it('should remove and stop processes', () => {
+            pool.resize(3);
+            const removedProcess = pool.all[2]!;
+
+            pool.resize(2);
+
+            expect(pool.all.map((it) => it.index)).toStrictEqual([0, 1]);
+            expect(removedProcess.stop).toHaveBeenCalledOnce();
+        });
+
+        it('should always keep the primary process', () => {
+            const primary = pool.primary;
+
+            pool.resize(0);
+
+            expect(pool.all).toStrictEqual([primary]);
+            expect(primary.stop).not.toHaveBeenCalled();
+        });
+    });
+
+    describe('choose', () => {
+        it('should choose the primary process for interactive executions', () => {
+            pool.resize(3);
+            expect(pool.choose('a', 'interactive')).toBe(pool.primary);
+        });
+
+        it('should choose the primary process if there is no other process', () => {
+            expect(pool.choose('a', 'background')).toBe(pool.primary);
+        });
+
+        it('should choose the secondary process with the fewest running executions', () => {
+            pool.resize(3);
+            pool.all[1]!.runningExecutions.add('id');
+
+            expect(pool.choose('a', 'background')).toBe(pool.all[2]);
+        });
+
+        it('should choose the same process for the same pipeline', () => {
+            pool.resize(3);
+            const first = pool.choose('a', 'background');
+            first.runningExecutions.add('id');
+
+            expect(pool.choose('a', 'background')).toBe(first);
+        });
+
+        it('should choose another process if the previous one was removed', () => {
+            pool.resize(3);
+            pool.all[1]!.runningExecutions.add('id');
+            pool.choose('a', 'background');
+
+            pool.resize(2);
+
+            expect(pool.choose('a', 'background')).toBe(pool.all[1]);
+        });
+
+        it('should choose the least loaded process again after the assignments were cleared', () => {
+            pool.resize(3);
+            const first = pool.choose('a', 'background');
+            first.runningExecutions.add('id');
+
+            pool.clearAssignments();
+
+            expect(pool.choose('a', 'background')).not.toBe(first);
+        });
+    });
+});
@@ -0,0 +1,103 @@
+import { AstUtils, URI } from 'langium';
+import { NodeFileSystem } from 'langium/node';
+import { parseHelper } from 'langium/test';
+import fs from 'node:fs';
+import os from 'node:os';
+import path from 'node:path';
+import { afterEach, beforeEach, describe, expect, it } from 'vitest';
+import { isSdsAssignment, SdsAssignment } from '../../../src/language/generated/ast.js';
+import { getAssignees } from '../../../src/language/helpers/nodeProperties.js';
+import { createSafeDsServices } from '../../../src/language/index.js';
+
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const documentBuilder = services.shared.workspace.DocumentBuilder;
+const langiumDocuments = services.shared.workspace.LangiumDocuments;
+const placeholderValueCache = services.runtime.PlaceholderValueCache;
+
+const directory = fs.mkdtempSync(path.join(os.tmpdir(), 'safe-ds-placeholder-value-cache-'));
+const dataPath = path.join(directory, 'data.csv');
+const mainUri = URI.file(path.join(directory, 'main.sds'));
+const segmentsUri = URI.file(path.join(directory, 'segments.sds'));
+
+const mainDocument = `
+package test.placeholderValueCache
+
+@Impure([ImpurityReason.FileReadFromConstantPath("data.csv")])
+fun readData() -> result: Int
+
+@Impure([ImpurityReason.FileWriteToConstantPath("out.csv")])
+fun writeData() -> result: Int
+
+pipeline myPipeline {
+    val read = readData();
+    val computed = mySegment();
+    val written = writeData();
+}
+`;
+
+const segmentsDocument = (value: number) => `
+package test.placeholderValueCache
+
+segment mySegment() -> result: Int {
+    yield result = ${value};
+}
+`;
+
+describe('SafeDsPlaceholderValueCache', () => {
+    beforeEach(async () => {
+        fs.writeFileSync(dataPath, 'a,b\n1,2\n');
+        fs.writeFileSync(segmentsUri.fsPath, segmentsDocument(1));
+        await parseHelper(services)(segmentsDocument(1), { documentUri: segmentsUri.toString() });
+        await parseHelper(services)(mainDocument, { documentUri: mainUri.toString() });
+    });
+
+    afterEach(async () => {
+        await documentBuilder.update([], [mainUri, segmentsUri]);
+        fs.rmSync(dataPath, { force: true });
+        fs.rmSync(segmentsUri.fsPath, { force: true });
+    });
+
+    const getAssignment = (placeholderName: string): SdsAssignment => {
+        const root = langiumDocuments.getDocument(mainUri)!.parseResult.value;
+        return AstUtils.streamAst(root)
+            .filter(isSdsAssignment)
+            .find((it) => getAssignees(it)[0]?.name === placeholderName)!;
+    };
+
+    const computeFingerprint = (placeholderName: string): string | undefined =>
+        placeholderValueCache.computeFingerprint(getAssignment(placeholderName), placeholderName, {});
+
+    it('should return the same fingerprint if nothing changed', () => {
+        expect(computeFingerprint('read')).toStrictEqual(computeFingerprint('read'));
+    });
+
+    it('should return a different fingerprint if a read file was modified', () => {
+        const before = computeFingerprint('read');
+        const modificationTime = fs.statSync(dataPath).mtime;
+        fs.utimesSync(dataPath, modificationTime, new Date(modificationTime.getTime() + 1000));
+
+        expect(before).toBeDefined();
+        expect(computeFingerprint('read')).not.toStrictEqual(before);
+    });
+
+    it('should return undefined if a read file does not exist', () => {
+        fs.rmSync(dataPath);
+
+        expect(computeFingerprint('read')).toBeUndefined();
+    });
+
+    it('should return a different fingerprint if a referenced document was edited', async () => {
+        const before = computeFingerprint('computed');
+
+        // The document builder reads the new text from the file system and relinks the main document
+        fs.writeFileSync(segmentsUri.fsPath, segmentsDocument(2));
+        await documentBuilder.update([segmentsUri], []);
+
+        expect(before).toBeDefined();
+        expect(computeFingerprint('computed')).not.toStrictEqual(before);
+    });
+
+    it('should return undefined for statements with other impurity reasons', () => {
+        expect(computeFingerprint('written')).toBeUndefined();
+    });
+});
@@ -0,0 +1,352 @@
+import { NodeFileSystem } from 'langium/node';
+import { AddressInfo } from 'node:net';
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+import WebSocket, { WebSocketServer } from 'ws';
+import { createSafeDsServices } from '../../../src/language/index.js';
+import {
+    createPlaceholderQueryMessage,
+    createProgramMessage,
+    encodeBinaryMessage,
+    PlaceholderValueChunkHeader,
+    PythonServerMessage,
+} from '../../../src/language/runtime/messages.js';
+import { SafeDsPythonServer } from '../../../src/language/runtime/safe-ds-python-server.js';
+
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+
+/**
+ * A runner that records the messages it receives. The test decides how to answer them.
+ */
+class FakeRunner {
+    readonly receivedMessages: PythonServerMessage[] = [];
+    onMessage: (message: PythonServerMessage) => void = () => {};
+
+    private server: WebSocketServer | undefined = undefined;
+    private connection: WebSocket | undefined = undefined;
+
+    async start(): Promise<number> {
+        const server = new WebSocketServer({ host: '127.0.0.1', port: 0 });
+        this.server = server;
+        server.on('connection', (connection) => {
+            this.connection = connection;
+            connection.on('message', (data) => {
+                const message = JSON.parse(data.toString());
+                this.receivedMessages.push(message);
+                this.onMessage(message);
+            });
+        });
+
+        await new Promise((resolve) => server.once('listening', resolve));
+        return (server.address() as AddressInfo).port;
+    }
+
+    send(message: PythonServerMessage): void {
+        this.connection?.send(JSON.stringify(message));
+    }
+
+    sendChunk(id: string, name: string, chunkIndex: number, chunkCount: number, payload: string): void {
+        const header: PlaceholderValueChunkHeader = {
+            type: 'placeholder_value',
+            id,
+            data: { name, type: 'List', encoding: 'json', chunkIndex, chunkCount },
+        };
+        this.connection?.send(encodeBinaryMessage(header, Buffer.from(payload, 'utf-8')));
+    }
+
+    async stop(): Promise<void> {
+        this.connection?.terminate();
+        await new Promise((resolve) => (this.server ? this.server.close(resolve) : resolve(undefined)));
+    }
+}
+
+const createValueMessage = (id: string, name: string, value: string = name): PythonServerMessage => ({
+    type: 'placeholder_value',
+    id,
+    data: { name, type: 'Int', value },
+});
+
+const createProgram = (id: string): PythonServerMessage =>
+    createProgramMessage(id, { code: {}, main: { modulepath: 'a', module: 'b', pipeline: 'c' } });
+
+describe('SafeDsPythonServer', () => {
+    let runner: FakeRunner;
+    let pythonServer: SafeDsPythonServer;
+
+    const connect = async (version?: string) => {
+        const port = await runner.start();
+        await pythonServer.connectToPort(port, version);
+    };
+
+    const answerQueries = () => {
+        runner.onMessage = (message) => {
+            const queries =
+                message.type === 'placeholder_query'
+                    ? [message.data]
+                    : message.type === 'placeholder_batch_query'
+                      ? message.data
+                      : [];
+            for (const { name } of queries) {
+                runner.send(createValueMessage(message.id, name));
+            }
+        };
+    };
+
+    // Messages arrive in order, so all messages sent before are received once the runner has this one
+    const waitForSentMessages = async () => {
+        pythonServer.sendMessageToPythonServer(createPlaceholderQueryMessage('barrier', 'barrier'));
+        await vi.waitFor(() => expect(runner.receivedMessages.at(-1)?.id).toBe('barrier'));
+        runner.receivedMessages.pop();
+    };
+
+    beforeEach(() => {
+        runner = new FakeRunner();
+        pythonServer = new SafeDsPythonServer(services);
+    });
+
+    afterEach(async () => {
+        await runner.stop();
+    });
+
+    describe('queryPlaceholders', () => {
+        it('should send one query per placeholder if the runner version is unknown', async () => {
+            await connect();
+            answerQueries();
+
+            const values = await pythonServer.queryPlaceholders('id', [
+                { name: 'a', window: {} },
+                { name: 'b', window: { begin: 1, size: 2 } },
+            ]);
+
+            expect(runner.receivedMessages).toStrictEqual([
+                { type: 'placeholder_query', id: 'id', data: { name: 'a', window: {} } },
+                { type: 'placeholder_query', id: 'id', data: { name: 'b', window: { begin: 1, size: 2 } } },
+            ]);
+            expect([...values.keys()]).toStrictEqual(['a', 'b']);
+        });
+
+        it('should send one query per placeholder if the runner does not support batch queries', async () => {
+            await connect('0.19.0');
+            answerQueries();
+
+            await pythonServer.queryPlaceholders('id', [
+                { name: 'a', window: {} },
+                { name: 'b', window: {} },
+            ]);
+
+            expect(runner.receivedMessages.map((it) => it.type)).toStrictEqual([
+                'placeholder_query',
+                'placeholder_query',
+            ]);
+        });
+
+        it('should send a single batch query if the runner supports it', async () => {
+            await connect('0.20.0');
+            answerQueries();
+
+            const values = await pythonServer.queryPlaceholders('id', [
+                { name: 'a', window: {} },
+                { name: 'b', window: {} },
+            ]);
+
+            expect(runner.receivedMessages).toStrictEqual([
+                {
+                    type: 'placeholder_batch_query',
+                    id: 'id',
+                    data: [
+                        { name: 'a', window: {} },
+                        { name: 'b', window: {} },
+                    ],
+                },
+            ]);
+            expect([...values.keys()]).toStrictEqual(['a', 'b']);
+        });
+
+        it('should call the callback for each value once it arrives', async () => {
+            await connect();
+            answerQueries();
+            const onValue = vi.fn();
+
+            await pythonServer.queryPlaceholders('id', [{ name: 'a', window: {} }], onValue);
+
+            expect(onValue).toHaveBeenCalledExactlyOnceWith({ name: 'a', type: 'Int', value: 'a' });
+        });
+
+        it('should ignore values of other executions', async () => {
+            await connect();
+            runner.onMessage = (message) => {
+                runner.send(createValueMessage('other', 'a', '1'));
+                runner.send(createValueMessage(message.id, 'a', '2'));
+            };
+
+            const values = await pythonServer.queryPlaceholders('id', [{ name: 'a', window: {} }]);
+
+            expect(values.get('a')?.value).toBe('2');
+        });
+
+        it('should return the values that arrived before the timeout', async () => {
+            await connect();
+            runner.onMessage = (message) => {
+                if (message.type === 'placeholder_query' && message.data.name === 'a') {
+                    runner.send(createValueMessage(message.id, 'a'));
+                }
+            };
+
+            const values = await pythonServer.queryPlaceholders(
+                'id',
+                [
+                    { name: 'a', window: {} },
+                    { name: 'b', window: {} },
+                ],
+                undefined,
+                200,
+            );
+
+            expect([...values.keys()]).toStrictEqual(['a']);
+        });
+
+        it('should assemble values whose chunks arrive after the execution is done', async () => {
+            await connect();
+            runner.onMessage = (message) => {
+                runner.sendChunk(message.id, 'a', 0, 2, '[1, ');
+                runner.send({ type: 'runtime_progress', id: message.id, data: 'done' });
+                runner.sendChunk(message.id, 'a', 1, 2, '2]');
+            };
+
+            const values = await pythonServer.queryPlaceholders('id', [{ name: 'a', window: {} }]);
+
+            expect(values.get('a')?.value).toStrictEqual([1, 2]);
+        });
+
+        it('should discard chunks of values that did not arrive before the timeout', async () => {
+            await connect();
+            runner.onMessage = (message) => runner.sendChunk(message.id, 'a', 0, 2, '[1, ');
+            await pythonServer.queryPlaceholders('id', [{ name: 'a', window: {} }], undefined, 200);
+
+            runner.onMessage = (message) => runner.sendChunk(message.id, 'a', 1, 2, '2]');
+            const values = await pythonServer.queryPlaceholders('id', [{ name: 'a', window: {} }], undefined, 200);
+
+            expect(values.size).toBe(0);
+        });
+
+        it('should not send anything if no placeholders are requested', async () => {
+            await connect();
+
+            const values = await pythonServer.queryPlaceholders('id', []);
+
+            expect(values.size).toBe(0);
+            expect(runner.receivedMessages).toStrictEqual([]);
+        });
+    });
+
+    describe('cancelExecution', () => {
+        it('should call the listeners of the execution once', () => {
+            const listener = vi.fn();
+            const otherListener = vi.fn();
+            pythonServer.onExecutionCancelled('id', listener);
+            pythonServer.onExecutionCancelled('other', otherListener);
+
+            pythonServer.cancelExecution('id');
+            pythonServer.cancelExecution('id');
+
+            expect(listener).toHaveBeenCalledOnce();
+            expect(otherListener).not.toHaveBeenCalled();
+        });
+
+        it('should not call disposed listeners', () => {
+            const disposedListener = vi.fn();
+            const listener = vi.fn();
+            pythonServer.onExecutionCancelled('id', disposedListener).dispose();
+            pythonServer.onExecutionCancelled('id', listener);
+
+            pythonServer.cancelExecution('id');
+
+            expect(disposedListener).not.toHaveBeenCalled();
+            expect(listener).toHaveBeenCalledOnce();
+        });
+
+        it('should drop programs that were not sent yet', async () => {
+            const port = await runner.start();
+            const connected = pythonServer.connectToPort(port, '0.20.0');
+            pythonServer.sendMessageToPythonServer(createProgram('cancelled'));
+            pythonServer.sendMessageToPythonServer(createProgram('kept'));
+
+            pythonServer.cancelExecution('cancelled');
+            await connected;
+            await waitForSentMessages();
+
+            expect(runner.receivedMessages.map((it) => [it.type, it.id])).toStrictEqual([['program', 'kept']]);
+        });
+
+        it('should ask the runner to stop a running program if it supports cancellation', async () => {
+            await connect('0.20.0');
+            pythonServer.sendMessageToPythonServer(createProgram('id'));
+
+            pythonServer.cancelExecution('id');
+            await waitForSentMessages();
+
+            expect(runner.receivedMessages.map((it) => it.type)).toStrictEqual(['program', 'cancel']);
+        });
+
+        it('should not ask the runner to stop a running program if it does not support cancellation', async () => {
+            await connect('0.19.0');
+            pythonServer.sendMessageToPythonServer(createProgram('id'));
+
+            pythonServer.cancelExecution('id');
+            await waitForSentMessages();
+
+            expect(runner.receivedMessages.map((it) => it.type)).toStrictEqual(['program']);
+        });
+
+        it('should not ask the runner to stop a finished program', async () => {
+            await connect('0.20.0');
+            const finished = new Promise((resolve) => pythonServer.addMessageCallback('runtime_progress', resolve));
+            runner.onMessage = (message) => runner.send({ type: 'runtime_progress', id: message.id, data: 'done' });
+            pythonServer.sendMessageToPythonServer(createProgram('id'));
+            await finished;
+            runner.onMessage = () => {};
+
+            pythonServer.cancelExecution('id');
+            await waitForSentMessages();
+
+            expect(runner.receivedMessages.map((it) => it.type)).toStrictEqual(['program']);
+        });
+
+        it('should resolve pending placeholder queries right away', async () => {
+            await connect();
+            const values = pythonServer.queryPlaceholders('id', [{ name: 'a', window: {} }], undefined, 60000);
+
+            pythonServer.cancelExecution('id');
+
+            await expect(values).resolves.toStrictEqual(new Map());
+        });
+    });
+
+    describe('closing the connection', () => {
+        it('should end running executions with an error', async () => {
+            await connect('0.20.0');
+            const errors: PythonServerMessage[] = [];
+            pythonServer.addMessageCallback('runtime_error', (message) => errors.push(message));
+            pythonServer.sendMessageToPythonServer(createProgram('id'));
+            await waitForSentMessages();
+
+            await runner.stop();
+
+            await vi.waitFor(() => expect(errors.map((it) => it.id)).toStrictEqual(['id']));
+        });
+
+        it('should not end finished executions', async () => {
+            await connect('0.20.0');
+            const finished = new Promise((resolve) => pythonServer.addMessageCallback('runtime_progress', resolve));
+            const errorCallback = vi.fn();
+            pythonServer.addMessageCallback('runtime_error', errorCallback);
+            runner.onMessage = (message) => runner.send({ type: 'runtime_progress', id: message.id, data: 'done' });
+            pythonServer.sendMessageToPythonServer(createProgram('id'));
+            await finished;
+
+            await runner.stop();
+            await new Promise((resolve) => setTimeout(resolve, 100));
+
+            expect(errorCallback).not.toHaveBeenCalled();
+        });
+    });
+});
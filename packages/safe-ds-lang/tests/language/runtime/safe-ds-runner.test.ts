@@ -1,10 +1,18 @@
-import { describe, expect, it } from 'vitest';
+import { afterEach, describe, expect, it, vi } from 'vitest';
 import { NodeFileSystem } from 'langium/node';
+import { parseHelper } from 'langium/test';
 import { URI } from 'langium';
+import fs from 'node:fs';
+import os from 'node:os';
+import path from 'node:path';
+import { CancellationTokenSource } from 'vscode-languageserver';
 import { createSafeDsServices } from '../../../src/language/index.js';
 
 const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const documentBuilder = services.shared.workspace.DocumentBuilder;
+const langiumDocuments = services.shared.workspace.LangiumDocuments;
 const runner = services.runtime.Runner;
+const pythonServer = services.runtime.PythonServer;
 
 describe('SafeDsRunner', async () => {
     describe('getMainModuleName', async () => {
@@ -38,5 +46,117 @@ describe('SafeDsRunner', async () => {
                 '{"a":{"gen_b":"# Pipelines --------------------------------------------------------------------\\n\\ndef mainpipeline():\\n    pass\\n","gen_b_mainpipeline":"from .gen_b import mainpipeline\\n\\nif __name__ == \'__main__\':\\n    mainpipeline()\\n"}}',
             );
         });
+
+        describe('cache', () => {
+            const directory = fs.mkdtempSync(path.join(os.tmpdir(), 'safe-ds-runner-'));
+            const uri = URI.file(path.join(directory, 'main.sdsdev'));
+            const code = (pipelineName: string) => `package a\n\npipeline ${pipelineName} {}`;
+
+            const loadDocument = async (pipelineName: string) => {
+                fs.writeFileSync(uri.fsPath, code(pipelineName));
+                return parseHelper(services)(code(pipelineName), { documentUri: uri.toString() });
+            };
+
+            afterEach(async () => {
+                await documentBuilder.update([], [uri]);
+                fs.rmSync(uri.fsPath, { force: true });
+            });
+
+            it('should return the cached program if nothing changed', async () => {
+                const document = await loadDocument('mainpipeline');
+
+                const first = runner.generateCodeForRunner(document, undefined);
+                const second = runner.generateCodeForRunner(document, undefined);
+
+                expect(second[0]).toBe(first[0]);
+            });
+
+            it('should generate the program again after the document was edited', async () => {
+                const document = await loadDocument('mainpipeline');
+                const [oldProgramCodeMap] = runner.generateCodeForRunner(document, undefined);
+
+                // The document builder reads the new text from the file system
+                fs.writeFileSync(uri.fsPath, code('otherpipeline'));
+                await documentBuilder.update([uri], []);
+                const [newProgramCodeMap] = runner.generateCodeForRunner(langiumDocuments.getDocument(uri)!, undefined);
+
+                expect(newProgramCodeMap).not.toBe(oldProgramCodeMap);
+                expect(Object.keys(newProgramCodeMap['a']!)).toStrictEqual(['gen_main', 'gen_main_otherpipeline']);
+            });
+        });
+    });
+
+    describe('runWithCallbacks', async () => {
+        // Starts a task and returns its execution ID along with a promise that resolves once the task is finished
+        const startTask = async (supersedeKey: string, cancelToken?: CancellationTokenSource) => {
+            let pipelineExecutionId = '';
+            let isFinished = false;
+            const finished = runner
+                .runWithCallbacks(
+                    'task',
+                    supersedeKey,
+                    async (id) => {
+                        pipelineExecutionId = id;
+                    },
+                    undefined,
+                    cancelToken?.token,
+                )
+                .then(() => {
+                    isFinished = true;
+                });
+            await vi.waitFor(() => expect(pipelineExecutionId).not.toBe(''));
+            return { pipelineExecutionId, finished, isFinished: () => isFinished };
+        };
+
+        afterEach(() => {
+            vi.restoreAllMocks();
+        });
+
+        it('should cancel a running task with the same supersede key', async () => {
+            const cancelExecution = vi.spyOn(pythonServer, 'cancelExecution');
+            const first = await startTask('key');
+            const second = await startTask('key');
+
+            await first.finished;
+
+            expect(cancelExecution).toHaveBeenCalledExactlyOnceWith(first.pipelineExecutionId);
+            expect(second.isFinished()).toBeFalsy();
+            pythonServer.cancelExecution(second.pipelineExecutionId);
+            await second.finished;
+        });
+
+        it('should not cancel running tasks with other supersede keys', async () => {
+            const first = await startTask('key1');
+            const second = await startTask('key2');
+
+            pythonServer.cancelExecution(second.pipelineExecutionId);
+            await second.finished;
+
+            expect(first.isFinished()).toBeFalsy();
+            pythonServer.cancelExecution(first.pipelineExecutionId);
+            await first.finished;
+        });
+
+        it('should not cancel a finished task with the same supersede key', async () => {
+            const first = await startTask('key');
+            pythonServer.cancelExecution(first.pipelineExecutionId);
+            await first.finished;
+            const cancelExecution = vi.spyOn(pythonServer, 'cancelExecution');
+
+            const second = await startTask('key');
+
+            expect(cancelExecution).not.toHaveBeenCalled();
+            pythonServer.cancelExecution(second.pipelineExecutionId);
+            await second.finished;
+        });
+
+        it('should finish once the token is cancelled', async () => {
+            const cancelToken = new CancellationTokenSource();
+            const task = await startTask('key', cancelToken);
+
+            cancelToken.cancel();
+
+            await expect(task.finished).resolves.toBeUndefined();
+        });
     });
 });
@@ -1,13 +1,17 @@
+import { AstUtils, URI } from 'langium';
 import { NodeFileSystem } from 'langium/node';
+import { parseHelper } from 'langium/test';
 import { describe, expect, it } from 'vitest';
 import {
     isSdsAttribute,
     isSdsClass,
     isSdsFunction,
+    isSdsNamedType,
     SdsClass,
     type SdsClassMember,
 } from '../../../src/language/generated/ast.js';
 import { createSafeDsServices, getClassMembers } from '../../../src/language/index.js';
+import { createBuiltinIndexSnapshot } from '../../../src/language/workspace/safe-ds-builtin-index.js';
 import { getNodeOfType } from '../../helpers/nodeFinder.js';
 
 const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
@@ -530,6 +534,52 @@ describe('SafeDsClassHierarchy', async () => {
             const firstClass = await getNodeOfType(services, code, isSdsClass);
             expect(directSubclassNames(firstClass)).toStrictEqual(expected);
         });
+
+        it('should consider added and deleted documents', async () => {
+            const parentUri = URI.parse('file:///classHierarchyParent.sds');
+            const childUri = URI.parse('file:///classHierarchyChild.sds');
+
+            const parentDocument = await parseHelper(services)(`package test.classHierarchy\n\nclass B`, {
+                documentUri: parentUri.toString(),
+            });
+            const parentClass = AstUtils.streamAst(parentDocument.parseResult.value).find(isSdsClass);
+            expect(directSubclassNames(parentClass)).toStrictEqual([]);
+
+            await parseHelper(services)(`package test.classHierarchy\n\nclass A sub B`, {
+                documentUri: childUri.toString(),
+            });
+            expect(directSubclassNames(parentClass)).toStrictEqual(['A']);
+
+            await services.shared.workspace.DocumentBuilder.update([], [childUri]);
+            expect(directSubclassNames(parentClass)).toStrictEqual([]);
+
+            await services.shared.workspace.DocumentBuilder.update([], [parentUri]);
+        });
+
+        it('should consider builtin documents that are not loaded yet', async () => {
+            const snapshot = await createBuiltinIndexSnapshot(services);
+            const lazyServices = (await createSafeDsServices(NodeFileSystem, { omitBuiltins: true })).SafeDs;
+            lazyServices.shared.workspace.BuiltinIndex.registerSnapshot(snapshot);
+
+            const namedType = await getNodeOfType(
+                lazyServices,
+                `
+                    package test
+
+                    from safeds.ml.classical.classification import Classifier
+
+                    segment mySegment(p: Classifier) {}
+                `,
+                isSdsNamedType,
+            );
+            const classifier = namedType.declaration?.ref as SdsClass | undefined;
+            const subclassNames = lazyServices.typing.ClassHierarchy.streamDirectSubclasses(classifier)
+                .map((clazz) => clazz.name)
+                .toArray();
+
+            expect(subclassNames).toContain('DecisionTreeClassifier');
+            expect(subclassNames).toContain('RandomForestClassifier');
+        });
     });
 });
 
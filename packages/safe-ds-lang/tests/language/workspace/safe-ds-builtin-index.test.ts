@@ -0,0 +1,62 @@
+import { NodeFileSystem } from 'langium/node';
+import { describe, expect, it } from 'vitest';
+import { listBuiltinFiles } from '../../../src/language/builtins/fileFinder.js';
+import { isSdsClass, isSdsNamedType } from '../../../src/language/generated/ast.js';
+import { createSafeDsServices } from '../../../src/language/index.js';
+import {
+    BuiltinIndexSnapshot,
+    computeBuiltinFingerprint,
+    createBuiltinIndexSnapshot,
+} from '../../../src/language/workspace/safe-ds-builtin-index.js';
+import { getNodeOfType } from '../../helpers/nodeFinder.js';
+
+const eagerServices = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const snapshot: BuiltinIndexSnapshot = JSON.parse(JSON.stringify(await createBuiltinIndexSnapshot(eagerServices)));
+
+const code = `
+package test
+
+from safeds.data.tabular.containers import Table
+
+segment mySegment(p: Table) {}
+`;
+
+describe('SafeDsBuiltinIndex', () => {
+    describe('createBuiltinIndexSnapshot', () => {
+        it('should contain all builtin files', () => {
+            expect(snapshot.documents).toHaveLength(listBuiltinFiles().length);
+        });
+
+        it('should store the fingerprint of the builtin files', () => {
+            expect(snapshot.fingerprint).toStrictEqual(computeBuiltinFingerprint());
+        });
+
+        it('should store the package names', () => {
+            const entry = snapshot.documents.find(
+                (it) => it.resourceName === 'safeds/data/tabular/containers/Table.sdsstub',
+            );
+            expect(entry?.packageName).toBe('safeds.data.tabular.containers');
+        });
+    });
+
+    describe('registerSnapshot', () => {
+        it('should resolve references into builtin files', async () => {
+            const lazyServices = (await createSafeDsServices(NodeFileSystem, { omitBuiltins: true })).SafeDs;
+            lazyServices.shared.workspace.BuiltinIndex.registerSnapshot(snapshot);
+
+            const namedType = await getNodeOfType(lazyServices, code, isSdsNamedType);
+            expect(isSdsClass(namedType.declaration?.ref)).toBeTruthy();
+        });
+
+        it('should only load builtin files on demand', async () => {
+            const lazyServices = (await createSafeDsServices(NodeFileSystem, { omitBuiltins: true })).SafeDs;
+            lazyServices.shared.workspace.BuiltinIndex.registerSnapshot(snapshot);
+
+            await getNodeOfType(lazyServices, code, isSdsNamedType);
+            const loadedBuiltinFiles = lazyServices.shared.workspace.LangiumDocuments.all.filter(
+                (it) => it.uri.path.endsWith('.sdsstub'),
+            );
+            expect(loadedBuiltinFiles.count()).toBeLessThan(listBuiltinFiles().length);
+        });
+    });
+});
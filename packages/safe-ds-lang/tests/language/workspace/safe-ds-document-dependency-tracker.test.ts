@@ -0,0 +1,107 @@
+import { URI } from 'langium';
+import { NodeFileSystem } from 'langium/node';
+import { parseHelper } from 'langium/test';
+import { afterEach, beforeEach, describe, expect, it } from 'vitest';
+import { listBuiltinFiles } from '../../../src/language/builtins/fileFinder.js';
+import { createSafeDsServices } from '../../../src/language/index.js';
+import { DocumentDependentCache } from '../../../src/language/workspace/safe-ds-document-dependency-tracker.js';
+
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const documentBuilder = services.shared.workspace.DocumentBuilder;
+const tracker = services.workspace.DocumentDependencyTracker;
+
+const uri1 = URI.parse('file:///document1.sds');
+const uri2 = URI.parse('file:///document2.sds');
+const uri3 = URI.parse('file:///document3.sds');
+const uri4 = URI.parse('file:///document4.sds');
+
+const document1 = `
+package test.document1
+
+class MyClass
+`;
+
+const document2 = `
+package test.document2
+
+from test.document1 import MyClass
+
+fun myFunction(p: MyClass)
+`;
+
+const document3 = `
+package test.document3
+
+from test.document2 import myFunction
+
+pipeline myPipeline {
+    myFunction(1);
+}
+`;
+
+const document4 = `
+package test.document4
+
+class MyOtherClass
+`;
+
+describe('SafeDsDocumentDependencyTracker', () => {
+    beforeEach(async () => {
+        await parseHelper(services)(document1, { documentUri: uri1.toString() });
+        await parseHelper(services)(document2, { documentUri: uri2.toString() });
+        await parseHelper(services)(document3, { documentUri: uri3.toString() });
+        await parseHelper(services)(document4, { documentUri: uri4.toString() });
+    });
+
+    afterEach(async () => {
+        await documentBuilder.update([], [uri1, uri2, uri3, uri4]);
+    });
+
+    describe('computeAffectedUris', () => {
+        it('should include the changed document and all documents that transitively reference it', () => {
+            const result = tracker.computeAffectedUris([uri1], []);
+            expect(result).toStrictEqual(new Set([uri1.toString(), uri2.toString(), uri3.toString()]));
+        });
+
+        it('should include deleted documents', () => {
+            const result = tracker.computeAffectedUris([], [uri4]);
+            expect(result).toStrictEqual(new Set([uri4.toString()]));
+        });
+
+        it('should not include documents that are only referenced', () => {
+            const result = tracker.computeAffectedUris([uri3], []);
+            expect(result).toStrictEqual(new Set([uri3.toString()]));
+        });
+    });
+
+    describe('DocumentDependentCache', () => {
+        it('should only evict entries of affected documents', async () => {
+            const builtinUri = listBuiltinFiles()[0]!;
+            const cache = new DocumentDependentCache<string, number>(tracker);
+            cache.set(builtinUri, 'key', 0);
+            cache.set(uri2, 'key', 2);
+            cache.set(uri4, 'key', 4);
+
+            await documentBuilder.update([], [uri1]);
+
+            expect(cache.has(builtinUri, 'key')).toBeTruthy();
+            expect(cache.has(uri2, 'key')).toBeFalsy();
+            expect(cache.has(uri4, 'key')).toBeTruthy();
+
+            cache.dispose();
+        });
+
+        it('should evict entries of explicitly invalidated documents', () => {
+            const cache = new DocumentDependentCache<string, number>(tracker);
+            cache.set(uri2, 'key', 2);
+            cache.set(uri4, 'key', 4);
+
+            tracker.invalidate([uri4]);
+
+            expect(cache.has(uri2, 'key')).toBeTruthy();
+            expect(cache.has(uri4, 'key')).toBeFalsy();
+
+            cache.dispose();
+        });
+    });
+});
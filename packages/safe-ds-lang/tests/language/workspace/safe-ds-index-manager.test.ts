@@ -0,0 +1,82 @@
+import { AstUtils, URI } from 'langium';
+import { NodeFileSystem } from 'langium/node';
+import { parseHelper } from 'langium/test';
+import { afterEach, beforeEach, describe, expect, it } from 'vitest';
+import { isSdsClass, SdsClass } from '../../../src/language/generated/ast.js';
+import { createSafeDsServices } from '../../../src/language/index.js';
+
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const astNodeLocator = services.workspace.AstNodeLocator;
+const documentBuilder = services.shared.workspace.DocumentBuilder;
+const indexManager = services.shared.workspace.IndexManager;
+const langiumDocuments = services.shared.workspace.LangiumDocuments;
+
+const uri1 = URI.parse('file:///indexManager1.sds');
+const uri2 = URI.parse('file:///indexManager2.sds');
+
+const document1 = `
+package test.indexManager
+
+class MyClass
+class MyOtherClass
+`;
+
+const document2 = `
+package test.indexManager
+
+segment mySegment(p: MyClass, q: MyClass) {}
+`;
+
+describe('SafeDsIndexManager', () => {
+    beforeEach(async () => {
+        await parseHelper(services)(document1, { documentUri: uri1.toString() });
+        await parseHelper(services)(document2, { documentUri: uri2.toString() });
+    });
+
+    afterEach(async () => {
+        await documentBuilder.update([], [uri1, uri2]);
+    });
+
+    const getClass = (name: string): SdsClass => {
+        const root = langiumDocuments.getDocument(uri1)!.parseResult.value;
+        return AstUtils.streamAst(root)
+            .filter(isSdsClass)
+            .find((it) => it.name === name)!;
+    };
+
+    const referenceCount = (node: SdsClass): number =>
+        indexManager.findAllReferences(node, astNodeLocator.getAstNodePath(node)).count();
+
+    const isReferenced = (node: SdsClass): boolean =>
+        indexManager.isReferenced(node, astNodeLocator.getAstNodePath(node));
+
+    describe('findAllReferences', () => {
+        it('should return all references to a declaration', () => {
+            expect(referenceCount(getClass('MyClass'))).toBe(2);
+        });
+
+        it('should return no references for an unreferenced declaration', () => {
+            expect(referenceCount(getClass('MyOtherClass'))).toBe(0);
+        });
+
+        it('should forget the references of removed documents', async () => {
+            await documentBuilder.update([], [uri2]);
+            expect(referenceCount(getClass('MyClass'))).toBe(0);
+        });
+    });
+
+    describe('isReferenced', () => {
+        it('should return true for a referenced declaration', () => {
+            expect(isReferenced(getClass('MyClass'))).toBeTruthy();
+        });
+
+        it('should return false for an unreferenced declaration', () => {
+            expect(isReferenced(getClass('MyOtherClass'))).toBeFalsy();
+        });
+
+        it('should return false once the references were removed', async () => {
+            await documentBuilder.update([], [uri2]);
+            expect(isReferenced(getClass('MyClass'))).toBeFalsy();
+        });
+    });
+});
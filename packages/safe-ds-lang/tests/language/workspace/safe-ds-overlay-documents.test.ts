@@ -0,0 +1,81 @@
+import { AstUtils, URI } from 'langium';
+import { NodeFileSystem } from 'langium/node';
+import { parseHelper } from 'langium/test';
+import { afterEach, beforeEach, describe, expect, it } from 'vitest';
+import { isSdsReference } from '../../../src/language/generated/ast.js';
+import { createSafeDsServices } from '../../../src/language/index.js';
+
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const documentBuilder = services.shared.workspace.DocumentBuilder;
+const langiumDocuments = services.shared.workspace.LangiumDocuments;
+const overlayDocuments = services.workspace.OverlayDocuments;
+
+const uri = URI.parse('file:///pipeline.sds');
+
+const code = `
+package test
+
+segment mySegment() -> r: Int {
+    yield r = 1;
+}
+
+pipeline myPipeline {
+    val a = mySegment();
+}
+`;
+
+describe('SafeDsOverlayDocuments', () => {
+    beforeEach(async () => {
+        await parseHelper(services)(code, { documentUri: uri.toString() });
+    });
+
+    afterEach(async () => {
+        await documentBuilder.update([], [uri]);
+    });
+
+    it('should apply the edits to the text of the base document', async () => {
+        const baseDocument = langiumDocuments.getDocument(uri)!;
+        const offset = code.lastIndexOf('}');
+        const overlay = await overlayDocuments.create(baseDocument, [
+            { start: offset, end: offset, text: 'val b = a;\n' },
+            { start: code.indexOf('val a'), end: code.indexOf('val a') + 5, text: 'val c' },
+        ]);
+
+        const expected = code.substring(0, offset) + 'val b = a;\n' + code.substring(offset);
+        expect(overlay.textDocument.getText()).toBe(expected.replace('val a', 'val c'));
+        overlayDocuments.delete(overlay);
+    });
+
+    it('should have a different URI with the same file system path', async () => {
+        const baseDocument = langiumDocuments.getDocument(uri)!;
+        const overlay = await overlayDocuments.create(baseDocument, []);
+
+        expect(overlay.uri.toString()).not.toBe(uri.toString());
+        expect(overlay.uri.fsPath).toBe(uri.fsPath);
+        overlayDocuments.delete(overlay);
+    });
+
+    it('should not replace the base document in the workspace', async () => {
+        const baseDocument = langiumDocuments.getDocument(uri)!;
+        const overlay = await overlayDocuments.create(baseDocument, []);
+
+        expect(langiumDocuments.getDocument(uri)).toBe(baseDocument);
+        expect(langiumDocuments.hasDocument(overlay.uri)).toBeFalsy();
+        overlayDocuments.delete(overlay);
+    });
+
+    it('should link references to declarations in the overlay', async () => {
+        const baseDocument = langiumDocuments.getDocument(uri)!;
+        const offset = code.lastIndexOf('}');
+        const overlay = await overlayDocuments.create(baseDocument, [
+            { start: offset, end: offset, text: 'val b = mySegment();\n' },
+        ]);
+
+        const references = AstUtils.streamAst(overlay.parseResult.value).filter(isSdsReference).toArray();
+        expect(references).toHaveLength(2);
+        for (const reference of references) {
+            expect(AstUtils.getDocument(reference.target.ref!)).toBe(overlay);
+        }
+        overlayDocuments.delete(overlay);
+    });
+});
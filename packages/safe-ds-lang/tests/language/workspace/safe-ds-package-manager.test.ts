@@ -1,11 +1,23 @@
-import { EmptyFileSystem } from 'langium';
+import { EmptyFileSystem, URI } from 'langium';
+import { NodeFileSystem } from 'langium/node';
 import { clearDocuments, parseHelper } from 'langium/test';
-import { afterAll, beforeAll, describe, expect, it } from 'vitest';
+import fs from 'node:fs';
+import os from 'node:os';
+import path from 'node:path';
+import { afterAll, afterEach, beforeAll, beforeEach, describe, expect, it } from 'vitest';
 import { createSafeDsServices } from '../../../src/language/index.js';
 
 const services = (await createSafeDsServices(EmptyFileSystem, { omitBuiltins: true })).SafeDs;
 const packageManager = services.workspace.PackageManager;
 
+// Changed documents are read from the file system again, so these tests need real files
+const nodeServices = (await createSafeDsServices(NodeFileSystem, { omitBuiltins: true })).SafeDs;
+const nodeDocumentBuilder = nodeServices.shared.workspace.DocumentBuilder;
+const nodePackageManager = nodeServices.workspace.PackageManager;
+
+const directory = fs.mkdtempSync(path.join(os.tmpdir(), 'safe-ds-package-manager-'));
+const changedUri = URI.file(path.join(directory, 'changed.sds'));
+
 const document1 = `
 package myPackage1
 
@@ -114,4 +126,78 @@ describe('SafeDsPackageManager', () => {
             expect(result.map((desc) => desc.name)).toStrictEqual(['Class1', 'Class2', 'Enum1', 'Class3', 'Enum2']);
         });
     });
+
+    describe('getDeclarationsInPackageByName', () => {
+        it('should return the declarations with the given name in the given package', () => {
+            const result = packageManager.getDeclarationsInPackageByName('myPackage1', 'Class2');
+
+            expect(result.map((desc) => desc.name)).toStrictEqual(['Class2']);
+        });
+
+        it('should not return declarations of subpackages', () => {
+            const result = packageManager.getDeclarationsInPackageByName('myPackage1', 'Class3');
+
+            expect(result).toStrictEqual([]);
+        });
+
+        it('should filter by node type if specified', () => {
+            const result = packageManager.getDeclarationsInPackageByName('myPackage1', 'Class1', {
+                nodeType: 'SdsEnum',
+            });
+
+            expect(result).toStrictEqual([]);
+        });
+    });
+
+    describe('getDeclarationsInPackageOrSubpackageByName', () => {
+        it('should return the declarations with the given name in the given package or any subpackage', () => {
+            const result = packageManager.getDeclarationsInPackageOrSubpackageByName('myPackage1', 'Enum2');
+
+            expect(result.map((desc) => desc.name)).toStrictEqual(['Enum2']);
+        });
+
+        it('should hide internal declarations if requested', () => {
+            const result = packageManager.getDeclarationsInPackageOrSubpackageByName('myPackage1', 'segment1', {
+                hideInternal: true,
+            });
+
+            expect(result).toStrictEqual([]);
+        });
+    });
+
+    describe('document changes', () => {
+        const changedDocument = (packageName: string, className: string) => `
+package ${packageName}
+
+class ${className}
+`;
+
+        beforeEach(async () => {
+            const text = changedDocument('myPackage3', 'Class5');
+            fs.writeFileSync(changedUri.fsPath, text);
+            await parseHelper(nodeServices)(text, { documentUri: changedUri.toString() });
+        });
+
+        afterEach(async () => {
+            await nodeDocumentBuilder.update([], [changedUri]);
+            fs.rmSync(changedUri.fsPath, { force: true });
+        });
+
+        it('should update the index if a document was edited', async () => {
+            fs.writeFileSync(changedUri.fsPath, changedDocument('myPackage4', 'Class6'));
+            await nodeDocumentBuilder.update([changedUri], []);
+            const result = nodePackageManager.getDeclarationsInPackageByName('myPackage4', 'Class6');
+
+            expect(nodePackageManager.getPackageNames()).toStrictEqual(['myPackage4']);
+            expect(nodePackageManager.getDeclarationsInPackageByName('myPackage3', 'Class5')).toStrictEqual([]);
+            expect(result.map((desc) => desc.name)).toStrictEqual(['Class6']);
+        });
+
+        it('should update the index if a document was deleted', async () => {
+            await nodeDocumentBuilder.update([], [changedUri]);
+
+            expect(nodePackageManager.getPackageNames()).toStrictEqual([]);
+            expect(nodePackageManager.getDeclarationsInPackageByName('myPackage3', 'Class5')).toStrictEqual([]);
+        });
+    });
 });
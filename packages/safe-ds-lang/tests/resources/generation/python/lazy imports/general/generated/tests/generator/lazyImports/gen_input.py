@@ -0,0 +1,29 @@
+# Imports ----------------------------------------------------------------------
+
+from tests.generator.lazyImports import g
+from typing import TypeVar
+
+# Type variables ---------------------------------------------------------------
+
+__gen_T = TypeVar("__gen_T")
+
+# Utils ------------------------------------------------------------------------
+
+def __gen_eager_elvis(left_operand: __gen_T, right_operand: __gen_T) -> __gen_T:
+    return left_operand if left_operand is not None else right_operand
+
+# Segments ---------------------------------------------------------------------
+
+def mySegment(param=g()):
+    from tests.generator.lazyImports import f
+    __gen_yield_result = __gen_eager_elvis(f(param), 1)
+    return __gen_yield_result
+
+# Pipelines --------------------------------------------------------------------
+
+def testPipeline():
+    from tests.generator.lazyImports import f
+    f(mySegment())
+
+def pipelineWithoutImports():
+    mySegment()
@@ -0,0 +1,4 @@
+from .gen_input import pipelineWithoutImports
+
+if __name__ == '__main__':
+    pipelineWithoutImports()
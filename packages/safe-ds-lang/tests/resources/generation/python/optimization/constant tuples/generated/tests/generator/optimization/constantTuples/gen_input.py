@@ -0,0 +1,25 @@
+# Imports ----------------------------------------------------------------------
+
+from tests.generator.optimization.constantTuples import f, p
+
+# Segments ---------------------------------------------------------------------
+
+def constants():
+    __gen_yield_a = 1
+    __gen_yield_b = 'x'
+    return __gen_yield_a, __gen_yield_b
+
+def mixed():
+    __gen_yield_a = 1
+    __gen_yield_b = p()
+    return __gen_yield_a, __gen_yield_b
+
+# Pipelines --------------------------------------------------------------------
+
+def testPipeline():
+    __gen_placeholder_x, __gen_placeholder_y = (1, 'x')
+    __gen_placeholder_z, __gen_placeholder_w = mixed()
+    f(1)
+    f('x')
+    f(1)
+    f(__gen_placeholder_w)
@@ -0,0 +1,4 @@
+from .gen_input import testPipeline
+
+if __name__ == '__main__':
+    testPipeline()
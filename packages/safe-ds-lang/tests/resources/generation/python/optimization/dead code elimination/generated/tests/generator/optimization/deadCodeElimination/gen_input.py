@@ -0,0 +1,12 @@
+# Imports ----------------------------------------------------------------------
+
+from tests.generator.optimization.deadCodeElimination import f, p
+
+# Pipelines --------------------------------------------------------------------
+
+def testPipeline():
+    __gen_placeholder_a = p(2)
+    __gen_placeholder_b = p(__gen_placeholder_a)
+    __gen_placeholder_b
+    __gen_placeholder_c = p(3)
+    f(__gen_placeholder_c)
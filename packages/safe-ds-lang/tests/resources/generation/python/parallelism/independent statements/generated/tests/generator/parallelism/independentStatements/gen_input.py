@@ -0,0 +1,36 @@
+# Imports ----------------------------------------------------------------------
+
+from concurrent.futures import ThreadPoolExecutor
+from tests.generator.parallelism.independentStatements import f, p, q
+from typing import Any, Callable
+
+# Utils ------------------------------------------------------------------------
+
+def __gen_run_in_parallel(max_workers: int, *tasks: Callable[[], Any]) -> list[Any]:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(task) for task in tasks]
+        return [future.result() for future in futures]
+
+# Pipelines --------------------------------------------------------------------
+
+def testPipeline():
+    def __gen_task_0():
+        __gen_placeholder_a = p(1)
+        return __gen_placeholder_a
+    def __gen_task_1():
+        __gen_placeholder_b = p(2)
+        return __gen_placeholder_b
+    def __gen_task_3():
+        __gen_placeholder_d, __gen_placeholder_e = q()
+        return __gen_placeholder_d, __gen_placeholder_e
+    __gen_placeholder_a, __gen_placeholder_b, (__gen_placeholder_d, __gen_placeholder_e) = __gen_run_in_parallel(2, __gen_task_0, __gen_task_1, __gen_task_3)
+    __gen_placeholder_c = p(__gen_placeholder_a)
+    f(__gen_placeholder_c)
+    def __gen_task_5():
+        __gen_placeholder_g = p(__gen_placeholder_b)
+        return __gen_placeholder_g
+    def __gen_task_6():
+        __gen_placeholder_h = p(__gen_placeholder_d)
+        return __gen_placeholder_h
+    __gen_placeholder_g, __gen_placeholder_h = __gen_run_in_parallel(2, __gen_task_5, __gen_task_6)
+    f(__gen_placeholder_g)
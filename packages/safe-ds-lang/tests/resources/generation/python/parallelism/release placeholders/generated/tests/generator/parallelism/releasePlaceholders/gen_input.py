@@ -0,0 +1,29 @@
+# Imports ----------------------------------------------------------------------
+
+from concurrent.futures import ThreadPoolExecutor
+from tests.generator.parallelism.releasePlaceholders import f, p
+from typing import Any, Callable
+
+# Utils ------------------------------------------------------------------------
+
+def __gen_run_in_parallel(max_workers: int, *tasks: Callable[[], Any]) -> list[Any]:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(task) for task in tasks]
+        return [future.result() for future in futures]
+
+# Pipelines --------------------------------------------------------------------
+
+def testPipeline():
+    __gen_placeholder_a = p(1)
+    def __gen_task_1():
+        __gen_placeholder_b = p(__gen_placeholder_a)
+        return __gen_placeholder_b
+    def __gen_task_2():
+        __gen_placeholder_c = p(__gen_placeholder_a)
+        return __gen_placeholder_c
+    __gen_placeholder_b, __gen_placeholder_c = __gen_run_in_parallel(2, __gen_task_1, __gen_task_2)
+    del __gen_placeholder_a
+    f(__gen_placeholder_b)
+    del __gen_placeholder_b
+    f(__gen_placeholder_c)
+    del __gen_placeholder_c
@@ -0,0 +1,21 @@
+# Imports ----------------------------------------------------------------------
+
+import safeds_runner
+from tests.generator.releasePlaceholders.fullExecution import f, g, h
+
+# Pipelines --------------------------------------------------------------------
+
+def testPipeline():
+    __gen_placeholder_used = h()
+    safeds_runner.save_placeholder('used', __gen_placeholder_used)
+    __gen_placeholder_unused = h()
+    safeds_runner.save_placeholder('unused', __gen_placeholder_unused)
+    del __gen_placeholder_unused
+    __gen_placeholder_captured = h()
+    safeds_runner.save_placeholder('captured', __gen_placeholder_captured)
+    f(__gen_placeholder_used)
+    def __gen_lambda_0():
+        return __gen_placeholder_captured
+    g(__gen_lambda_0)
+    f(__gen_placeholder_used)
+    del __gen_placeholder_used
@@ -0,0 +1,14 @@
+# Imports ----------------------------------------------------------------------
+
+import safeds_runner
+from tests.generator.releasePlaceholders.partialExecution import f, h
+
+# Pipelines --------------------------------------------------------------------
+
+def testPipeline():
+    __gen_placeholder_a = h()
+    __gen_placeholder_b = f(__gen_placeholder_a)
+    del __gen_placeholder_a
+    __gen_placeholder_c = f(__gen_placeholder_b)
+    safeds_runner.save_placeholder('c', __gen_placeholder_c)
+    del __gen_placeholder_b, __gen_placeholder_c
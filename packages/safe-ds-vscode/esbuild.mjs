@@ -33,6 +33,13 @@ const plugins = [
         },
         watch,
     }),
+    copy({
+        assets: {
+            from: ['../safe-ds-lang/lib/resources/builtins.index.json'],
+            to: ['./resources'],
+        },
+        watch,
+    }),
     copy({
         assets: {
             from: ['../safe-ds-eda/dist/main.js'],
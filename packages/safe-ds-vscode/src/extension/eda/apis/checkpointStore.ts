@@ -0,0 +1,151 @@
+import { HistoryEntry } from '@safe-ds/eda/types/state.js';
+import crypto from 'crypto';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import type { LogOutputChannel } from 'vscode';
+
+/**
+ * The default number of bytes that the checkpoints of one EDA panel may occupy on disk.
+ */
+const DEFAULT_MAX_BYTES = 1024 * 1024 * 1024;
+
+/**
+ * Properties of history entries that do not influence the resulting table.
+ */
+const IGNORED_PROPERTIES = new Set(['id', 'overrideId', 'alias', 'loading', 'tabOrder', 'profilingState']);
+
+/**
+ * A table that was written to disk after some manipulating history entries were applied.
+ */
+export interface Checkpoint {
+    readonly key: string;
+    readonly filePath: string;
+}
+
+/**
+ * Keeps the intermediate tables of the EDA history, so replaying the history can start from the nearest checkpoint
+ * instead of the original table. The runner does not keep values across pipeline executions, so checkpoints are
+ * written to Parquet files. If they exceed the size budget, the least recently used ones are deleted.
+ */
+export class CheckpointStore {
+    private readonly directory = path.join(os.tmpdir(), 'safe-ds-eda-checkpoints', crypto.randomUUID());
+
+    // Maps keep their insertion order, so the first key is always the least recently used one
+    private readonly checkpoints = new Map<string, Checkpoint & { size: number }>();
+    private totalBytes = 0;
+    private fileCounter = 0;
+
+    constructor(
+        private readonly logger: Pick<LogOutputChannel, 'warn'>,
+        private readonly maxBytes: number = DEFAULT_MAX_BYTES,
+    ) {}
+
+    /**
+     * Returns the checkpoint for the longest prefix of the manipulating entries, along with the length of the prefix.
+     * The checkpoint is marked as recently used.
+     */
+    findLongestPrefix(entries: HistoryEntry[]): { checkpoint: Checkpoint; length: number } | undefined {
+        for (let length = entries.length; length > 0; length--) {
+            const key = this.getKey(entries.slice(0, length));
+            const checkpoint = this.checkpoints.get(key);
+            if (!checkpoint) {
+                continue;
+            }
+
+            this.checkpoints.delete(key);
+            if (!fs.existsSync(checkpoint.filePath)) {
+                this.totalBytes -= checkpoint.size;
+                continue;
+            }
+
+            this.checkpoints.set(key, checkpoint);
+            return { checkpoint, length };
+        }
+
+        return undefined;
+    }
+
+    /**
+     * Creates a checkpoint for the manipulating entries, unless there is one already. It is only stored once `add` is
+     * called after the runner wrote the file.
+     */
+    create(entries: HistoryEntry[]): Checkpoint | undefined {
+        if (entries.length === 0) {
+            return undefined;
+        }
+
+        const key = this.getKey(entries);
+        if (this.checkpoints.has(key)) {
+            return undefined;
+        }
+
+        return { key, filePath: path.join(this.directory, `${this.fileCounter++}.parquet`) };
+    }
+
+    /**
+     * Stores a checkpoint that was written by the runner and deletes the least recently used checkpoints if the size
+     * budget is exceeded.
+     */
+    add(checkpoint: Checkpoint): void {
+        let size: number;
+        try {
+            size = fs.statSync(checkpoint.filePath).size;
+        } catch {
+            this.logger.warn(`Checkpoint ${checkpoint.filePath} was not written`);
+            return;
+        }
+
+        this.delete(checkpoint.key);
+        this.checkpoints.set(checkpoint.key, { ...checkpoint, size });
+        this.totalBytes += size;
+
+        for (const key of this.checkpoints.keys()) {
+            if (this.totalBytes <= this.maxBytes || key === checkpoint.key) break;
+            this.delete(key);
+        }
+    }
+
+    /**
+     * Deletes all checkpoints.
+     */
+    dispose(): void {
+        this.checkpoints.clear();
+        this.totalBytes = 0;
+        fs.rm(this.directory, { recursive: true, force: true }, (error) => {
+            if (error) {
+                this.logger.warn(`Could not delete checkpoints in ${this.directory}: ${error.message}`);
+            }
+        });
+    }
+
+    private delete(key: string): void {
+        const checkpoint = this.checkpoints.get(key);
+        if (!checkpoint) {
+            return;
+        }
+
+        this.checkpoints.delete(key);
+        this.totalBytes -= checkpoint.size;
+        fs.rm(checkpoint.filePath, { force: true }, (error) => {
+            if (error) {
+                this.logger.warn(`Could not delete checkpoint ${checkpoint.filePath}: ${error.message}`);
+            }
+        });
+    }
+
+    /**
+     * Serializes the entries. Properties are sorted, so the key does not depend on the order they were set in.
+     */
+    private getKey(entries: HistoryEntry[]): string {
+        return JSON.stringify(entries, (property, value) => {
+            if (IGNORED_PROPERTIES.has(property)) {
+                return undefined;
+            } else if (value && typeof value === 'object' && !Array.isArray(value)) {
+                return Object.fromEntries(Object.entries(value).sort(([a], [b]) => a.localeCompare(b)));
+            } else {
+                return value;
+            }
+        });
+    }
+}
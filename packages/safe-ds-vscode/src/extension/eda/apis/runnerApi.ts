@@ -3,13 +3,17 @@ import {
     CategoricalFilter,
     Column,
     ExternalHistoryEntry,
+    FullExternalManipulatingHistoryEntry,
     HistoryEntry,
     NumericalFilter,
     PossibleSorts,
     Profiling,
     ProfilingDetailStatistical,
     Table,
+    TableRows,
+    TableRowSource,
 } from '@safe-ds/eda/types/state.js';
+import { maxSpecificValueFilterCount, tablePageSize } from '@safe-ds/eda/consts.config.js';
 import { CODEGEN_PREFIX, messages, SafeDsServices } from '@safe-ds/lang';
 import { AstUtils, LangiumDocument } from 'langium';
 import * as vscode from 'vscode';
@@ -28,6 +32,18 @@ import {
     SdsModule,
 } from '../../../../../safe-ds-lang/src/language/generated/ast.js';
 import { getModuleMembers, getPlaceholderByName } from '../../../../../safe-ds-lang/src/language/index.js';
+import type { OverlayEdit } from '../../../../../safe-ds-lang/src/language/workspace/safe-ds-overlay-documents.js';
+import { Checkpoint, CheckpointStore } from './checkpointStore.js';
+
+/**
+ * The alias under which the `Table` class is imported to load checkpoints.
+ */
+const CHECKPOINT_TABLE_CLASS = CODEGEN_PREFIX + 'Table';
+
+/**
+ * How long to wait for a pipeline execution before it is cancelled.
+ */
+const EXECUTION_TIMEOUT_MS = 3000000;
 
 export class RunnerApi {
     services: SafeDsServices;
@@ -37,6 +53,9 @@ export class RunnerApi {
     tablePlaceholder: string;
     baseDocument: LangiumDocument | undefined;
     placeholderCounter = 0;
+    checkpointStore = new CheckpointStore(safeDsLogger);
+    outputStatementEdits: OverlayEdit[] | undefined;
+    runningExecutionIds = new Set<string>();
 
     constructor(
         services: SafeDsServices,
@@ -58,43 +77,73 @@ export class RunnerApi {
         });
     }
 
+    /**
+     * Cancel all running executions and delete all checkpoints. The instance must not be used afterward.
+     */
+    public dispose(): void {
+        for (const pipelineExecutionId of [...this.runningExecutionIds]) {
+            this.services.runtime.PythonServer.cancelExecution(pipelineExecutionId);
+        }
+        this.checkpointStore.dispose();
+    }
+
     //#region Pipeline execution
-    private async addToAndExecutePipeline(
+    /**
+     * Execute the added lines like `addToAndExecutePipeline`. If the replay of the manipulating entries creates a
+     * checkpoint, the code that saves it is added last and the checkpoint is stored once the execution is done.
+     */
+    private async addToAndExecutePipelineWithCheckpoint(
         pipelineExecutionId: string,
         addedLines: string,
-        placeholderNames?: string[],
+        placeholderNames: string[] | undefined,
+        replay: ManipulatingEntriesReplay,
     ): Promise<void> {
-        return new Promise(async (resolve, reject) => {
-            if (!this.baseDocument) {
-                reject('Document not found');
-                return;
-            }
-
-            const documentText = this.baseDocument.textDocument.getText();
-
-            const endOfPipeline = this.pipelineNodeEndOffset;
+        if (!replay.checkpoint) {
+            return this.addToAndExecutePipeline(pipelineExecutionId, addedLines, placeholderNames);
+        }
 
-            let newDocumentText;
+        await this.addToAndExecutePipeline(
+            pipelineExecutionId,
+            addedLines + this.sdsStringForSaveCheckpoint(replay.checkpoint.filePath, replay.placeholderName),
+            placeholderNames,
+            1,
+        );
+        this.checkpointStore.add(replay.checkpoint);
+    }
 
-            this.services.shared.workspace.LangiumDocuments.deleteDocument(this.pipelinePath);
+    /**
+     * Add the lines at the end of the pipeline and execute the statements that are needed to compute the placeholders.
+     * The last `sideEffectStatementCount` added statements are executed as well, even though no placeholder depends on
+     * them.
+     */
+    private async addToAndExecutePipeline(
+        pipelineExecutionId: string,
+        addedLines: string,
+        placeholderNames?: string[],
+        sideEffectStatementCount = 0,
+    ): Promise<void> {
+        if (!this.baseDocument) {
+            throw new Error('Document not found');
+        }
 
-            const beforePipelineEnd = documentText.substring(0, endOfPipeline - 1);
-            const afterPipelineEnd = documentText.substring(endOfPipeline - 1);
-            newDocumentText = beforePipelineEnd + addedLines + afterPipelineEnd;
+        const endOfPipeline = this.pipelineNodeEndOffset;
 
-            let newDoc = this.services.shared.workspace.LangiumDocumentFactory.fromString(
-                newDocumentText,
-                this.pipelinePath,
-            );
+        // The lines are added to an overlay, so the base document stays in the workspace and is only parsed once
+        this.outputStatementEdits ??= this.getOutputStatementEdits(this.baseDocument);
+        const edits = [
+            ...this.outputStatementEdits,
+            { start: endOfPipeline - 1, end: endOfPipeline - 1, text: addedLines },
+        ];
+        if (addedLines.includes(CHECKPOINT_TABLE_CLASS)) {
+            edits.push(this.getCheckpointTableImportEdit(this.baseDocument));
+        }
 
-            newDocumentText = this.replaceOutputStatements(newDoc);
-            safeDsLogger.debug(newDocumentText);
-            newDoc = this.services.shared.workspace.LangiumDocumentFactory.fromString(
-                newDocumentText,
-                this.pipelinePath,
-            );
-            await this.services.shared.workspace.DocumentBuilder.build([newDoc]);
+        const overlayDocuments = this.services.workspace.OverlayDocuments;
+        const newDoc = await overlayDocuments.create(this.baseDocument, edits);
+        safeDsLogger.debug(newDoc.textDocument.getText());
 
+        let finish = () => {};
+        try {
             let targetStatements: number[] = [];
             for (const moduleMember of getModuleMembers(newDoc.parseResult.value as SdsModule)) {
                 if (isSdsPipeline(moduleMember) && moduleMember.name === this.pipelineName) {
@@ -105,57 +154,96 @@ export class RunnerApi {
                             targetStatements.push(statement.$containerIndex!);
                         }
                     }
+
+                    const statementCount = moduleMember.body.statements.length;
+                    for (let i = statementCount - sideEffectStatementCount; i < statementCount; i++) {
+                        targetStatements.push(i);
+                    }
                 }
             }
 
-            safeDsLogger.debug(`Executing pipeline ${this.pipelineName} with added lines`);
-            await this.services.runtime.Runner.executePipeline(
-                pipelineExecutionId,
-                newDoc,
-                this.pipelineName,
-                targetStatements,
-            );
-
-            this.services.shared.workspace.LangiumDocuments.deleteDocument(this.pipelinePath);
-            this.services.shared.workspace.LangiumDocuments.addDocument(this.baseDocument);
-
-            const runtimeCallback = (message: messages.RuntimeProgressMessage) => {
-                if (message.id !== pipelineExecutionId) {
-                    return;
-                }
-                if (message.data === 'done') {
-                    safeDsLogger.debug(`Pipeline execution ${this.pipelineName} done`);
-                    this.services.runtime.PythonServer.removeMessageCallback('runtime_progress', runtimeCallback);
-                    this.services.runtime.PythonServer.removeMessageCallback('runtime_error', errorCallback);
-                    resolve();
-                }
-            };
-            const errorCallback = (message: messages.RuntimeErrorMessage) => {
-                if (message.id !== pipelineExecutionId) {
-                    return;
-                }
-                safeDsLogger.error(`Pipeline execution ${this.pipelineName} ran into error: ${message.data}`);
-                this.services.runtime.PythonServer.removeMessageCallback('runtime_progress', runtimeCallback);
-                this.services.runtime.PythonServer.removeMessageCallback('runtime_error', errorCallback);
-                reject(message.data);
-            };
-            this.services.runtime.PythonServer.addMessageCallback('runtime_progress', runtimeCallback);
-            this.services.runtime.PythonServer.addMessageCallback('runtime_error', errorCallback);
+            // Register the callbacks first, so fast executions are not missed
+            const pythonServer = this.services.runtime.PythonServer;
+            const executionDone = new Promise<void>((resolve, reject) => {
+                finish = () => {
+                    pythonServer.removeMessageCallback('runtime_progress', runtimeCallback);
+                    pythonServer.removeMessageCallback('runtime_error', errorCallback);
+                    cancellationDisposable.dispose();
+                    clearTimeout(timeout);
+                    this.runningExecutionIds.delete(pipelineExecutionId);
+                };
+                const runtimeCallback = (message: messages.RuntimeProgressMessage) => {
+                    if (message.id !== pipelineExecutionId) {
+                        return;
+                    }
+                    if (message.data === 'done') {
+                        safeDsLogger.debug(`Pipeline execution ${this.pipelineName} done`);
+                        finish();
+                        resolve();
+                    }
+                };
+                const errorCallback = (message: messages.RuntimeErrorMessage) => {
+                    if (message.id !== pipelineExecutionId) {
+                        return;
+                    }
+                    safeDsLogger.error(`Pipeline execution ${this.pipelineName} ran into error: ${message.data}`);
+                    finish();
+                    reject(message.data);
+                };
+                pythonServer.addMessageCallback('runtime_progress', runtimeCallback);
+                pythonServer.addMessageCallback('runtime_error', errorCallback);
+                const cancellationDisposable = pythonServer.onExecutionCancelled(pipelineExecutionId, () => {
+                    finish();
+                    reject('Pipeline execution was cancelled');
+                });
+                const timeout = setTimeout(() => {
+                    finish();
+                    reject('Pipeline execution timed out');
+                    pythonServer.cancelExecution(pipelineExecutionId);
+                }, EXECUTION_TIMEOUT_MS);
+                this.runningExecutionIds.add(pipelineExecutionId);
+            });
 
-            setTimeout(() => {
-                reject('Pipeline execution timed out');
-            }, 3000000);
-        });
+            safeDsLogger.debug(`Executing pipeline ${this.pipelineName} with added lines`);
+            await Promise.all([
+                executionDone,
+                this.services.runtime.Runner.executePipeline(
+                    pipelineExecutionId,
+                    newDoc,
+                    this.pipelineName,
+                    targetStatements,
+                ),
+            ]);
+        } catch (e) {
+            // The execution might not have started, so no message would ever remove the callbacks
+            finish();
+            throw e;
+        } finally {
+            overlayDocuments.delete(newDoc);
+        }
     }
     //#endregion
 
-    private replaceOutputStatements(doc: LangiumDocument): string {
-        const outputStatements = AstUtils.streamAst(doc.parseResult.value)
-            .filter(isSdsOutputStatement)
-            .toArray()
-            .reverse();
+    /**
+     * Import the `Table` class under an alias before the first module member, so checkpoints can be loaded even if
+     * the pipeline file does not import it.
+     */
+    private getCheckpointTableImportEdit(doc: LangiumDocument): OverlayEdit {
+        const firstMember = getModuleMembers(doc.parseResult.value as SdsModule)[0];
+        const offset = firstMember?.$cstNode?.offset ?? doc.textDocument.getText().length;
+        return {
+            start: offset,
+            end: offset,
+            text: `from safeds.data.tabular.containers import Table as ${CHECKPOINT_TABLE_CLASS}\n`,
+        };
+    }
 
-        let documentText = doc.textDocument.getText();
+    /**
+     * Replace output statements with assignments to placeholders, so their values can be used by added lines.
+     */
+    private getOutputStatementEdits(doc: LangiumDocument): OverlayEdit[] {
+        const outputStatements = AstUtils.streamAst(doc.parseResult.value).filter(isSdsOutputStatement).toArray();
+        const edits: OverlayEdit[] = [];
 
         for (const outputStatement of outputStatements) {
             const cstNode = outputStatement.$cstNode;
@@ -172,21 +260,26 @@ export class RunnerApi {
                 .map((valueName) => `val ${CODEGEN_PREFIX}${index}_${valueName}`)
                 .join(', ');
 
-            const replacement = `${assignees} = ${expressionCstNode.text};`;
-            documentText =
-                documentText.substring(0, cstNode.offset) + replacement + documentText.substring(cstNode.end);
+            edits.push({ start: cstNode.offset, end: cstNode.end, text: `${assignees} = ${expressionCstNode.text};` });
         }
 
-        return documentText;
+        return edits;
     }
 
     //#region Helpers
-    private runnerResultToTable(tableName: string, runnerResult: any, columnIsNumeric: Map<string, boolean>): Table {
+    private runnerResultToTable(
+        tableName: string,
+        runnerResult: any,
+        columnIsNumeric: Map<string, boolean>,
+        rowSource: TableRowSource,
+        rowCount: number | undefined,
+    ): Table {
         const table: Table = {
             totalRows: 0,
             name: tableName,
             columns: [] as Table['columns'],
             appliedFilters: [] as Table['appliedFilters'],
+            rowSource,
         };
 
         let currentMax = 0;
@@ -212,14 +305,52 @@ export class RunnerApi {
             };
             table.columns.push(column);
         }
-        table.totalRows = currentMax;
-        table.visibleRows = currentMax;
+        // The runner result usually only contains the first page of rows
+        table.totalRows = rowCount ?? currentMax;
+        table.visibleRows = rowCount ?? currentMax;
 
         return table;
     }
     //#endregion
 
     //#region SDS code generation
+    /**
+     * Generate the Safe-DS code that applies the manipulating entries among the given ones to the table. Replaying
+     * starts from the checkpoint of the longest prefix of these entries. If further entries have to be replayed, a
+     * checkpoint is created for their result.
+     */
+    private sdsStringForManipulatingEntries(entries: HistoryEntry[]): ManipulatingEntriesReplay {
+        const manipulatingEntries = entries.filter(
+            (entry): entry is FullExternalManipulatingHistoryEntry => entry.type === 'external-manipulating',
+        );
+
+        let sdsString = '';
+        let placeholderName = this.tablePlaceholder;
+
+        const nearest = this.checkpointStore.findLongestPrefix(manipulatingEntries);
+        if (nearest) {
+            placeholderName = this.genPlaceholderName('checkpoint');
+            sdsString += this.sdsStringForLoadCheckpoint(nearest.checkpoint.filePath, placeholderName);
+            safeDsLogger.debug(`Starting from checkpoint after ${nearest.length} entries`);
+        }
+
+        const replayedEntries = manipulatingEntries.slice(nearest?.length ?? 0);
+        for (const entry of replayedEntries) {
+            const sdsStringObj = this.sdsStringForHistoryEntry(entry, placeholderName);
+            sdsString += sdsStringObj.sdsString;
+            placeholderName = sdsStringObj.placeholderName;
+            safeDsLogger.debug(`Running old entry ${entry.id} with action ${entry.action}`);
+        }
+
+        // Nothing is saved if the table is unchanged, e.g. if only void entries were replayed on the original table
+        let checkpoint: Checkpoint | undefined;
+        if (replayedEntries.length > 0 && placeholderName !== this.tablePlaceholder) {
+            checkpoint = this.checkpointStore.create(manipulatingEntries);
+        }
+
+        return { sdsString, placeholderName, checkpoint };
+    }
+
     private sdsStringForHistoryEntry(
         historyEntry: ExternalHistoryEntry,
         overrideTablePlaceholder?: string,
@@ -379,6 +510,63 @@ export class RunnerApi {
         );
     }
 
+    private sdsStringForDistinctValueCountByColumnName(
+        columnName: string,
+        tablePlaceholder: string,
+        newPlaceholderName: string,
+    ) {
+        // Missing values count as one more distinct value
+        return (
+            'val ' +
+            newPlaceholderName +
+            ' = ' +
+            tablePlaceholder +
+            '.getColumn("' +
+            columnName +
+            '").distinctValueCount(ignoreMissingValues = false); \n'
+        );
+    }
+
+    private sdsStringForDistinctValuesByColumnName(
+        columnName: string,
+        tablePlaceholder: string,
+        newPlaceholderName: string,
+    ) {
+        // Missing values are included, so the list has as many elements as the distinct value count
+        return (
+            'val ' +
+            newPlaceholderName +
+            ' = ' +
+            tablePlaceholder +
+            '.getColumn("' +
+            columnName +
+            '").getDistinctValues(ignoreMissingValues = false); \n'
+        );
+    }
+
+    private sdsStringForCountDistinctValueByColumnName(
+        columnName: string,
+        distinctValuesPlaceholder: string,
+        index: number,
+        tablePlaceholder: string,
+        newPlaceholderName: string,
+    ) {
+        // The value is read from the list in the runner, so values from user data are never pasted into the code
+        return (
+            'val ' +
+            newPlaceholderName +
+            ' = ' +
+            tablePlaceholder +
+            '.getColumn("' +
+            columnName +
+            '").countIf((cell) -> cell.eq(' +
+            distinctValuesPlaceholder +
+            '[' +
+            index +
+            '])); \n'
+        );
+    }
+
     private sdsStringForIDnessByColumnName(columnName: string, tablePlaceholder: string, newPlaceholderName: string) {
         return 'val ' + newPlaceholderName + ' = ' + tablePlaceholder + '.getColumn("' + columnName + '").idness(); \n';
     }
@@ -491,6 +679,35 @@ export class RunnerApi {
         return 'val ' + newPlaceholderName + ' = ' + tablePlaceholder + `.removeColumns([${quotedColumns}]); \n`;
     }
 
+    private sdsStringForMinByColumnName(columnName: string, tablePlaceholder: string, newPlaceholderName: string) {
+        return 'val ' + newPlaceholderName + ' = ' + tablePlaceholder + '.getColumn("' + columnName + '").min(); \n';
+    }
+
+    private sdsStringForMaxByColumnName(columnName: string, tablePlaceholder: string, newPlaceholderName: string) {
+        return 'val ' + newPlaceholderName + ' = ' + tablePlaceholder + '.getColumn("' + columnName + '").max(); \n';
+    }
+
+    private sdsStringForLoadCheckpoint(filePath: string, newPlaceholderName: string) {
+        return (
+            'val ' +
+            newPlaceholderName +
+            ' = ' +
+            CHECKPOINT_TABLE_CLASS +
+            '.fromParquetFile("' +
+            this.sdsPathFor(filePath) +
+            '"); \n'
+        );
+    }
+
+    private sdsStringForSaveCheckpoint(filePath: string, tablePlaceholder: string) {
+        return tablePlaceholder + '.toParquetFile("' + this.sdsPathFor(filePath) + '"); \n';
+    }
+
+    private sdsPathFor(filePath: string): string {
+        // Backslashes would start escape sequences in Safe-DS strings, but Python accepts forward slashes on Windows
+        return filePath.replaceAll('\\', '/');
+    }
+
     private sdsStringForTableSchema(tablePlaceholder: string, newPlaceholderName: string) {
         return 'val ' + newPlaceholderName + ' = ' + tablePlaceholder + '.schema; \n';
     }
@@ -504,33 +721,44 @@ export class RunnerApi {
     }
 
     private async getPlaceholderValue(placeholder: string, pipelineExecutionId: string): Promise<any | undefined> {
-        return new Promise((resolve) => {
-            if (placeholder === '') {
-                resolve(undefined);
-            }
-
-            const placeholderValueCallback = (message: messages.PlaceholderValueMessage) => {
-                if (message.id !== pipelineExecutionId || message.data.name !== placeholder) {
-                    return;
-                }
-                this.services.runtime.PythonServer.removeMessageCallback('placeholder_value', placeholderValueCallback);
-                safeDsLogger.debug(
-                    'Got placeholder value: ' + JSON.stringify(message.data.value).slice(0, 100) + '...',
-                );
-                resolve(message.data.value);
-            };
+        return (await this.getPlaceholderData(placeholder, pipelineExecutionId))?.value;
+    }
 
-            this.services.runtime.PythonServer.addMessageCallback('placeholder_value', placeholderValueCallback);
+    /**
+     * Get the value of a placeholder along with its description. If a window is given, only the rows in the window are
+     * requested. The window of the response then also contains the total number of rows.
+     */
+    private async getPlaceholderData(
+        placeholder: string,
+        pipelineExecutionId: string,
+        window: messages.PlaceholderQueryWindow = {},
+    ): Promise<messages.PlaceholderValue | undefined> {
+        if (placeholder === '') {
+            return undefined;
+        }
 
-            safeDsLogger.debug('Requesting placeholder: ' + placeholder);
-            this.services.runtime.PythonServer.sendMessageToPythonServer(
-                messages.createPlaceholderQueryMessage(pipelineExecutionId, placeholder),
-            );
+        safeDsLogger.debug('Requesting placeholder: ' + placeholder);
+        const values = await this.services.runtime.PythonServer.queryPlaceholders(
+            pipelineExecutionId,
+            [{ name: placeholder, window }],
+            (value) => {
+                safeDsLogger.debug('Got placeholder value: ' + JSON.stringify(value.value).slice(0, 100) + '...');
+            },
+        );
+        return values.get(placeholder);
+    }
 
-            setTimeout(() => {
-                resolve(undefined);
-            }, 30000);
-        });
+    /**
+     * Get the values of several placeholders with a single batch query. Values are keyed by placeholder name, missing
+     * values are `undefined`.
+     */
+    private async getPlaceholderValues(placeholders: string[], pipelineExecutionId: string): Promise<Map<string, any>> {
+        safeDsLogger.debug(`Requesting ${placeholders.length} placeholders`);
+        const values = await this.services.runtime.PythonServer.queryPlaceholders(
+            pipelineExecutionId,
+            placeholders.map((name) => ({ name, window: {} })),
+        );
+        return new Map(placeholders.map((name) => [name, values.get(name)?.value]));
     }
 
     //#region Public API
@@ -543,7 +771,12 @@ export class RunnerApi {
     ): Promise<Table | undefined> {
         safeDsLogger.debug('Getting table by placeholder: ' + tableName);
 
-        const pythonTableColumns = await this.getPlaceholderValue(tableName, pipelineExecutionId);
+        // Only the first page of rows is fetched. Further rows are requested by the webview once they become visible.
+        const firstPage = await this.getPlaceholderData(tableName, pipelineExecutionId, {
+            begin: 0,
+            size: tablePageSize,
+        });
+        const pythonTableColumns = firstPage?.value as any;
         if (pythonTableColumns) {
             // Get Column Types
             safeDsLogger.debug('Getting column types for table: ' + tableName);
@@ -558,106 +791,189 @@ export class RunnerApi {
             }
 
             await this.addToAndExecutePipeline(pipelineExecutionId, sdsLines, placeholderNames);
+            const columnTypes = await this.getPlaceholderValues(placeholderNames, pipelineExecutionId);
             const columnIsNumeric = new Map<string, boolean>();
             for (const [columnName, placeholderName] of columnNameToPlaceholderIsNumericNameMap) {
-                const columnType = await this.getPlaceholderValue(placeholderName, pipelineExecutionId);
-                columnIsNumeric.set(columnName, columnType as boolean);
+                columnIsNumeric.set(columnName, columnTypes.get(placeholderName) as boolean);
             }
 
-            return this.runnerResultToTable(tableName, pythonTableColumns, columnIsNumeric);
+            const table = this.runnerResultToTable(
+                tableName,
+                pythonTableColumns,
+                columnIsNumeric,
+                { pipelineExecutionId, placeholderName: tableName },
+                firstPage!.window?.max,
+            );
+            await this.addFilterStatistics(table, pipelineExecutionId, sdsLinesOverride);
+            return table;
         } else {
             return undefined;
         }
     }
-    //#endregion
 
-    //#region Profiling
-    public async getProfiling(
+    /**
+     * Compute the minimum and maximum of all numerical columns and the distinct values of all columns. The loaded rows
+     * are only a part of the table, so the possible filters of a column cannot be derived from them. Distinct values
+     * are only sent for columns that can be filtered by a specific value.
+     */
+    private async addFilterStatistics(
         table: Table,
-        sdsLinesOverride = '',
-    ): Promise<{ columnName: string; profiling: Profiling }[]> {
-        safeDsLogger.debug('Getting profiling for table: ' + table.name);
-
-        const columns = table.columns;
-
-        let sdsStrings = sdsLinesOverride;
+        pipelineExecutionId: string,
+        sdsLinesOverride: string,
+        tablePlaceholder = table.name,
+    ): Promise<void> {
+        if (table.columns.length === 0) {
+            return;
+        }
 
+        let sdsLines = sdsLinesOverride;
         let placeholderNames: string[] = [];
+        const columnToPlaceholderNames = new Map<Column, { distinctValueCount: string; min?: string; max?: string }>();
+        for (const column of table.columns) {
+            const distinctValueCount = this.genPlaceholderName(column.name + '_distinct');
+            placeholderNames.push(distinctValueCount);
+            sdsLines += this.sdsStringForDistinctValueCountByColumnName(
+                column.name,
+                tablePlaceholder,
+                distinctValueCount,
+            );
 
-        const columnNameToPlaceholderMVNameMap = new Map<string, string>(); // Mapping random placeholder name for missing value ratio back to column name
-        const missingValueRatioMap = new Map<string, number>(); // Saved by random placeholder name
-
-        const columnNameToPlaceholderHistogramNameMap = new Map<string, string>(); // Mapping random placeholder name for histogram back to column name
-        const histogramMap = new Map<string, Base64Image | undefined>(); // Saved by random placeholder name
-
-        const uniqueValuesMap = new Map<string, Set<any>>();
-
-        // Generate SDS code to get missing value ratio for each column
-        for (const column of columns) {
-            const newMvPlaceholderName = this.genPlaceholderName(column.name + '_mv');
-            placeholderNames.push(newMvPlaceholderName);
-            columnNameToPlaceholderMVNameMap.set(column.name, newMvPlaceholderName);
-            sdsStrings += this.sdsStringForMissingValueRatioByColumnName(column.name, table.name, newMvPlaceholderName);
-
-            // Find unique values
-            // TODO reevaluate when image stuck problem fixed
-            let uniqueValues = new Set<any>();
-            for (let j = 0; j < column.values.length; j++) {
-                uniqueValues.add(column.values[j]);
+            if (column.type === 'numerical') {
+                const min = this.genPlaceholderName(column.name + '_min');
+                const max = this.genPlaceholderName(column.name + '_max');
+                placeholderNames.push(min, max);
+                sdsLines += this.sdsStringForMinByColumnName(column.name, tablePlaceholder, min);
+                sdsLines += this.sdsStringForMaxByColumnName(column.name, tablePlaceholder, max);
+                columnToPlaceholderNames.set(column, { distinctValueCount, min, max });
+            } else {
+                columnToPlaceholderNames.set(column, { distinctValueCount });
             }
-            uniqueValuesMap.set(column.name, uniqueValues);
+        }
 
-            // Different histogram conditions for numerical and categorical columns
-            if (column.type !== 'numerical') {
-                if (uniqueValues.size <= 3 || uniqueValues.size > 10) {
-                    // Must match conidtions below that choose to display histogram for categorical columns
-                    continue; // This historam only generated if between 4-10 categorigal uniques or numerical type
-                }
-            } else {
-                if (uniqueValues.size > column.values.length * 0.9) {
-                    // Must match conidtions below that choose to display histogram for numerical columns
-                    // If 90% of values are unique, it's not a good idea to display histogram
-                    continue;
-                }
+        await this.addToAndExecutePipeline(pipelineExecutionId, sdsLines, placeholderNames);
+        const values = await this.getPlaceholderValues(placeholderNames, pipelineExecutionId);
+        for (const [column, { distinctValueCount, min, max }] of columnToPlaceholderNames) {
+            column.distinctValueCount = values.get(distinctValueCount) as number | undefined;
+            if (column.type === 'numerical') {
+                column.min = values.get(min!);
+                column.max = values.get(max!);
             }
+        }
 
-            // Histogram for numerical columns or categorical columns with 4-10 unique values
-            const newHistogramPlaceholderName = this.genPlaceholderName(column.name + '_hist');
-            placeholderNames.push(newHistogramPlaceholderName);
-            columnNameToPlaceholderHistogramNameMap.set(column.name, newHistogramPlaceholderName);
-            sdsStrings += this.sdsStringForHistogramByColumnName(column.name, table.name, newHistogramPlaceholderName);
+        // Get the distinct values of columns that have only a few of them
+        const fewValueColumns = table.columns.filter(
+            (column) =>
+                column.distinctValueCount !== undefined && column.distinctValueCount <= maxSpecificValueFilterCount,
+        );
+        if (fewValueColumns.length === 0) {
+            return;
         }
 
-        // Execute with generated SDS code
-        const pipelineExecutionId = crypto.randomUUID();
-        try {
-            await this.addToAndExecutePipeline(pipelineExecutionId, sdsStrings, placeholderNames);
-        } catch (e) {
-            throw e;
+        sdsLines = sdsLinesOverride;
+        placeholderNames = [];
+        const columnToDistinctValuesPlaceholderName = new Map<Column, string>();
+        for (const column of fewValueColumns) {
+            const distinctValues = this.genPlaceholderName(column.name + '_distinctValues');
+            columnToDistinctValuesPlaceholderName.set(column, distinctValues);
+            placeholderNames.push(distinctValues);
+            sdsLines += this.sdsStringForDistinctValuesByColumnName(column.name, tablePlaceholder, distinctValues);
         }
 
-        // Get missing value ratio for each column
-        for (const [, placeholderName] of columnNameToPlaceholderMVNameMap) {
-            const missingValueRatio = await this.getPlaceholderValue(placeholderName, pipelineExecutionId);
-            if (missingValueRatio) {
-                missingValueRatioMap.set(placeholderName, missingValueRatio as number);
-            }
+        await this.addToAndExecutePipeline(pipelineExecutionId, sdsLines, placeholderNames);
+        const distinctValues = await this.getPlaceholderValues(placeholderNames, pipelineExecutionId);
+        for (const [column, placeholderName] of columnToDistinctValuesPlaceholderName) {
+            column.distinctValues = distinctValues.get(placeholderName) as any[] | undefined;
         }
+    }
 
-        // Get histogram for each column
-        for (const [, placeholderName] of columnNameToPlaceholderHistogramNameMap) {
-            const histogram = await this.getPlaceholderValue(placeholderName, pipelineExecutionId);
-            if (histogram) {
-                histogramMap.set(placeholderName, histogram as Base64Image);
-            }
+    /**
+     * Get a window of rows of a table that was sent to the webview before.
+     */
+    public async getTableRows(rowSource: TableRowSource, begin: number, size: number): Promise<TableRows | undefined> {
+        const page = await this.getPlaceholderData(rowSource.placeholderName, rowSource.pipelineExecutionId, {
+            begin,
+            size,
+        });
+        if (!page?.value) {
+            return undefined;
         }
 
+        return { rowSource, begin, columns: page.value as any };
+    }
+
+    /**
+     * Get the first page of rows of a table that was computed for a history entry. Column types are guessed from these
+     * rows, since otherwise another execution would be needed. The statistics needed for filters are computed on the
+     * whole table by executing the given lines again.
+     */
+    private async getHistoryTable(
+        placeholderName: string,
+        pipelineExecutionId: string,
+        sdsLinesOverride: string,
+    ): Promise<Table> {
+        const firstPage = await this.getPlaceholderData(placeholderName, pipelineExecutionId, {
+            begin: 0,
+            size: tablePageSize,
+        });
+        const newTable = firstPage?.value as any;
+        if (!newTable) throw new Error('Table not found');
+
+        const table = this.runnerResultToTable(
+            this.tablePlaceholder,
+            newTable,
+            new Map<string, boolean>(
+                Object.keys(newTable).map((col) => [col, typeof newTable[col].find((c: any) => c) === 'number']),
+            ),
+            { pipelineExecutionId, placeholderName },
+            firstPage!.window?.max,
+        );
+        await this.addFilterStatistics(table, pipelineExecutionId, sdsLinesOverride, placeholderName);
+        return table;
+    }
+    //#endregion
+
+    //#region Profiling
+    public async getProfiling(
+        table: Table,
+        sdsLinesOverride = '',
+    ): Promise<{ columnName: string; profiling: Profiling }[]> {
+        safeDsLogger.debug('Getting profiling for table: ' + table.name);
+
+        const columns = table.columns;
+        const rowCount = table.totalRows;
+
+        // Statistics are computed by the runner, so the rows of the table do not have to be loaded here
+        const statistics = await this.getColumnStatistics(table, sdsLinesOverride);
+        const distinctValueCountOf = (column: Column) => statistics.get(column.name)?.distinctValueCount ?? 0;
+
+        // Must match the conditions below that choose how to display each column
+        const histogramColumns = columns.filter((column) => {
+            if (column.type !== 'numerical') {
+                // This histogram only generated if between 4-10 categorical uniques
+                return distinctValueCountOf(column) > 3 && distinctValueCountOf(column) <= 10;
+            } else {
+                // If 90% of values are unique, it's not a good idea to display histogram
+                return distinctValueCountOf(column) <= rowCount * 0.9;
+            }
+        });
+        const valueCountColumns = columns.filter(
+            (column) => column.type !== 'numerical' && distinctValueCountOf(column) <= 3,
+        );
+
+        const { histograms, valueCounts } = await this.getHistogramsAndValueCounts(
+            table,
+            histogramColumns,
+            valueCountColumns,
+            distinctValueCountOf,
+            sdsLinesOverride,
+        );
+
         // Create profiling data
         const profiling: { columnName: string; profiling: Profiling }[] = [];
         for (const column of columns) {
             // Base info for the top of the profiling
-            const missingValuesRatio =
-                missingValueRatioMap.get(columnNameToPlaceholderMVNameMap.get(column.name)!)! * 100;
+            const missingValueRatio = statistics.get(column.name)?.missingValueRatio ?? 0;
+            const missingValuesRatio = missingValueRatio * 100;
 
             const validRatio: ProfilingDetailStatistical = {
                 type: 'numerical',
@@ -673,24 +989,17 @@ export class RunnerApi {
                 interpretation: missingValuesRatio > 0 ? 'error' : 'default',
             };
 
-            const uniqueValues = uniqueValuesMap.get(column.name)!.size;
+            const uniqueValues = distinctValueCountOf(column);
             // If not numerical, add proper profilings according to idness results
             if (column.type !== 'numerical') {
                 if (uniqueValues <= 3) {
                     // Can display each separate percentages of unique values
-                    // Find all unique values and count them
-                    const uniqueValueCounts = new Map<string, number>();
-                    for (let i = 0; i < column.values.length; i++) {
-                        if (column.values[i] !== undefined && column.values[i] !== null)
-                            uniqueValueCounts.set(column.values[i], (uniqueValueCounts.get(column.values[i]) || 0) + 1);
-                    }
-
                     let uniqueProfilings: ProfilingDetailStatistical[] = [];
-                    for (const [key, value] of uniqueValueCounts) {
+                    for (const [key, value] of valueCounts.get(column.name) ?? []) {
                         uniqueProfilings.push({
                             type: 'numerical',
                             name: key,
-                            value: ((value / column.values.length) * 100).toFixed(2) + '%',
+                            value: ((value / rowCount) * 100).toFixed(2) + '%',
                             interpretation: 'category',
                         });
                     }
@@ -708,7 +1017,7 @@ export class RunnerApi {
                     });
                 } else if (uniqueValues <= 10) {
                     // Display histogram for 4-10 unique values, has to match the condition above where histogram is generated
-                    const histogram = histogramMap.get(columnNameToPlaceholderHistogramNameMap.get(column.name)!)!;
+                    const histogram = histograms.get(column.name)!;
 
                     profiling.push({
                         columnName: column.name,
@@ -737,14 +1046,7 @@ export class RunnerApi {
                                 },
                                 {
                                     type: 'text',
-                                    value:
-                                        Math.round(
-                                            column.values.length *
-                                                (1 -
-                                                    (missingValueRatioMap.get(
-                                                        columnNameToPlaceholderMVNameMap.get(column.name)!,
-                                                    ) || 0)),
-                                        ) + ' Total Valids',
+                                    value: Math.round(rowCount * (1 - missingValueRatio)) + ' Total Valids',
                                     interpretation: 'default',
                                 },
                             ],
@@ -752,7 +1054,7 @@ export class RunnerApi {
                     });
                 }
             } else {
-                if (uniqueValues > column.values.length * 0.9) {
+                if (uniqueValues > rowCount * 0.9) {
                     profiling.push({
                         columnName: column.name,
                         profiling: {
@@ -767,21 +1069,14 @@ export class RunnerApi {
                                 },
                                 {
                                     type: 'text',
-                                    value:
-                                        Math.round(
-                                            column.values.length *
-                                                (1 -
-                                                    (missingValueRatioMap.get(
-                                                        columnNameToPlaceholderMVNameMap.get(column.name)!,
-                                                    ) || 0)),
-                                        ) + ' Total Valids',
+                                    value: Math.round(rowCount * (1 - missingValueRatio)) + ' Total Valids',
                                     interpretation: 'default',
                                 },
                             ],
                         },
                     });
                 } else {
-                    const histogram = histogramMap.get(columnNameToPlaceholderHistogramNameMap.get(column.name)!)!;
+                    const histogram = histograms.get(column.name)!;
 
                     profiling.push({
                         columnName: column.name,
@@ -801,27 +1096,133 @@ export class RunnerApi {
         return profiling;
     }
 
-    public async getFreshProfiling(
-        historyEntries: HistoryEntry[],
-    ): Promise<{ columnName: string; profiling: Profiling }[]> {
-        let sdsLines = '';
-        const filteredEntries = this.filterPastEntries(historyEntries);
-        let placeholderOverride = this.tablePlaceholder;
+    /**
+     * Compute the missing value ratio and the number of distinct values of all columns. The runner computes them
+     * column-wise on the whole table in a single execution.
+     */
+    private async getColumnStatistics(
+        table: Table,
+        sdsLinesOverride: string,
+    ): Promise<Map<string, { missingValueRatio: number; distinctValueCount: number }>> {
+        let sdsLines = sdsLinesOverride;
+        let placeholderNames: string[] = [];
+        const columnToPlaceholderNames = new Map<string, { missingValueRatio: string; distinctValueCount: string }>();
+        for (const column of table.columns) {
+            const missingValueRatio = this.genPlaceholderName(column.name + '_mv');
+            const distinctValueCount = this.genPlaceholderName(column.name + '_distinct');
+            columnToPlaceholderNames.set(column.name, { missingValueRatio, distinctValueCount });
+            placeholderNames.push(missingValueRatio, distinctValueCount);
+            sdsLines += this.sdsStringForMissingValueRatioByColumnName(column.name, table.name, missingValueRatio);
+            sdsLines += this.sdsStringForDistinctValueCountByColumnName(column.name, table.name, distinctValueCount);
+        }
 
-        for (const entry of filteredEntries) {
-            if (entry.type === 'external-manipulating') {
-                const sdsStringObj = this.sdsStringForHistoryEntry(entry, placeholderOverride);
-                sdsLines += sdsStringObj.sdsString;
-                placeholderOverride = sdsStringObj.placeholderName;
+        const pipelineExecutionId = crypto.randomUUID();
+        await this.addToAndExecutePipeline(pipelineExecutionId, sdsLines, placeholderNames);
+        const values = await this.getPlaceholderValues(placeholderNames, pipelineExecutionId);
+
+        const statistics = new Map<string, { missingValueRatio: number; distinctValueCount: number }>();
+        for (const [columnName, { missingValueRatio, distinctValueCount }] of columnToPlaceholderNames) {
+            statistics.set(columnName, {
+                missingValueRatio: (values.get(missingValueRatio) as number | undefined) ?? 0,
+                distinctValueCount: (values.get(distinctValueCount) as number | undefined) ?? 0,
+            });
+        }
+        return statistics;
+    }
+
+    /**
+     * Compute the histograms of some columns and count how often each distinct value occurs in other columns. The
+     * number of distinct values is already known, so the values are counted by their index in the list of distinct
+     * values, and everything is computed in a single execution.
+     */
+    private async getHistogramsAndValueCounts(
+        table: Table,
+        histogramColumns: Column[],
+        valueCountColumns: Column[],
+        distinctValueCountOf: (column: Column) => number,
+        sdsLinesOverride: string,
+    ): Promise<{ histograms: Map<string, Base64Image>; valueCounts: Map<string, Map<any, number>> }> {
+        const histograms = new Map<string, Base64Image>();
+        const valueCounts = new Map<string, Map<any, number>>();
+        if (histogramColumns.length === 0 && valueCountColumns.length === 0) {
+            return { histograms, valueCounts };
+        }
+
+        let sdsLines = sdsLinesOverride;
+        const placeholderNames: string[] = [];
+
+        // Get histograms
+        const columnNameToPlaceholderHistogramNameMap = new Map<string, string>();
+        for (const column of histogramColumns) {
+            const newPlaceholderName = this.genPlaceholderName(column.name + '_hist');
+            columnNameToPlaceholderHistogramNameMap.set(column.name, newPlaceholderName);
+            placeholderNames.push(newPlaceholderName);
+            sdsLines += this.sdsStringForHistogramByColumnName(column.name, table.name, newPlaceholderName);
+        }
+
+        // Get distinct values and count them
+        const columnNameToValueCountPlaceholderNames = new Map<string, { distinctValues: string; counts: string[] }>();
+        for (const column of valueCountColumns) {
+            const distinctValues = this.genPlaceholderName(column.name + '_distinctValues');
+            placeholderNames.push(distinctValues);
+            sdsLines += this.sdsStringForDistinctValuesByColumnName(column.name, table.name, distinctValues);
+
+            const counts: string[] = [];
+            for (let index = 0; index < distinctValueCountOf(column); index++) {
+                const newPlaceholderName = this.genPlaceholderName(column.name + '_count');
+                counts.push(newPlaceholderName);
+                placeholderNames.push(newPlaceholderName);
+                sdsLines += this.sdsStringForCountDistinctValueByColumnName(
+                    column.name,
+                    distinctValues,
+                    index,
+                    table.name,
+                    newPlaceholderName,
+                );
             }
+            columnNameToValueCountPlaceholderNames.set(column.name, { distinctValues, counts });
         }
 
+        const pipelineExecutionId = crypto.randomUUID();
+        await this.addToAndExecutePipeline(pipelineExecutionId, sdsLines, placeholderNames);
+        const values = await this.getPlaceholderValues(placeholderNames, pipelineExecutionId);
+
+        for (const [columnName, placeholderName] of columnNameToPlaceholderHistogramNameMap) {
+            const histogram = values.get(placeholderName);
+            if (histogram) {
+                histograms.set(columnName, histogram as Base64Image);
+            }
+        }
+
+        for (const [columnName, { distinctValues, counts }] of columnNameToValueCountPlaceholderNames) {
+            const valueCount = new Map<any, number>();
+            const distinctValueList = (values.get(distinctValues) as any[] | undefined) ?? [];
+            distinctValueList.forEach((value, index) => {
+                // Missing values are not shown as a category
+                if (value !== null && value !== undefined) {
+                    valueCount.set(value, values.get(counts[index]!) ?? 0);
+                }
+            });
+            valueCounts.set(columnName, valueCount);
+        }
+
+        return { histograms, valueCounts };
+    }
+
+    public async getFreshProfiling(
+        historyEntries: HistoryEntry[],
+    ): Promise<{ columnName: string; profiling: Profiling }[]> {
+        const replay = this.sdsStringForManipulatingEntries(this.filterPastEntries(historyEntries));
+        const sdsLines = replay.sdsString;
+        const placeholderOverride = replay.placeholderName;
+
         const pipelineExecutionId = crypto.randomUUID();
         try {
-            await this.addToAndExecutePipeline(
+            await this.addToAndExecutePipelineWithCheckpoint(
                 pipelineExecutionId,
                 sdsLines,
                 placeholderOverride ? [placeholderOverride] : undefined,
+                replay,
             );
         } catch (e) {
             throw e;
@@ -839,22 +1240,18 @@ export class RunnerApi {
         newEntry: HistoryEntry,
         hiddenColumns?: string[],
     ): Promise<RunnerExecutionResultMessage['value']> {
-        let sdsLines = '';
         let placeholderNameNeeded: string | undefined;
-        let currentPlaceholderOverride = this.tablePlaceholder;
         // let schemaPlaceHolder = this.genPlaceholderName('schema');
 
         const filteredPastEntries: HistoryEntry[] = this.filterPastEntries(pastEntries, newEntry);
 
-        for (const entry of filteredPastEntries) {
-            if (entry.type === 'external-manipulating') {
-                // Only manipulating actions have to be repeated before last entry that is of interest, others do not influence that end result
-                const sdsStringObj = this.sdsStringForHistoryEntry(entry, currentPlaceholderOverride);
-                sdsLines += sdsStringObj.sdsString;
-                currentPlaceholderOverride = sdsStringObj.placeholderName;
-                safeDsLogger.debug(`Running old entry ${entry.id} with action ${entry.action}`);
-            }
-        }
+        // Only manipulating actions have to be repeated before last entry that is of interest, others do not influence that end result
+        // A new manipulating entry is replayed along with them, so the checkpoint covers its result
+        const replay = this.sdsStringForManipulatingEntries(
+            newEntry.type === 'external-manipulating' ? [...filteredPastEntries, newEntry] : filteredPastEntries,
+        );
+        let sdsLines = replay.sdsString;
+        const currentPlaceholderOverride = replay.placeholderName;
 
         if (newEntry.type === 'external-visualizing') {
             if (newEntry.action === 'infoPanel') throw new Error('Not implemented');
@@ -878,21 +1275,18 @@ export class RunnerApi {
 
             safeDsLogger.debug(`Running new entry ${newEntry.id} with action ${newEntry.action}`);
         } else if (newEntry.type === 'external-manipulating') {
-            const sdsStringObj = this.sdsStringForHistoryEntry(newEntry, currentPlaceholderOverride);
-            sdsLines += sdsStringObj.sdsString;
-            placeholderNameNeeded = sdsStringObj.placeholderName;
-
-            safeDsLogger.debug(`Running new entry ${newEntry.id} with action ${newEntry.action}`);
+            placeholderNameNeeded = currentPlaceholderOverride;
         } else if (newEntry.type === 'internal') {
             throw new Error('Cannot execute internal history entry in Runner');
         }
 
         const pipelineExecutionId = crypto.randomUUID();
         try {
-            await this.addToAndExecutePipeline(
+            await this.addToAndExecutePipelineWithCheckpoint(
                 pipelineExecutionId,
                 sdsLines,
                 placeholderNameNeeded ? [placeholderNameNeeded] : undefined,
+                replay,
             );
         } catch (e) {
             throw e;
@@ -956,24 +1350,11 @@ export class RunnerApi {
                 };
             }
         } else if (placeholderNameNeeded) {
-            const newTable = await this.getPlaceholderValue(placeholderNameNeeded, pipelineExecutionId);
             // const schema = await this.getPlaceholderValue(schemaPlaceHolder, pipelineExecutionId); // Not displayable yet, waiting
-
-            if (!newTable) throw new Error('Table not found');
-
             return {
                 type: 'table',
                 historyId: newEntry.id,
-                content: this.runnerResultToTable(
-                    this.tablePlaceholder,
-                    newTable,
-                    new Map<string, boolean>(
-                        Object.keys(newTable).map((col) => [
-                            col,
-                            typeof newTable[col].find((c: any) => c) === 'number',
-                        ]),
-                    ), // temp until schema works as otherwise we would need another execution to get column names
-                ),
+                content: await this.getHistoryTable(placeholderNameNeeded, pipelineExecutionId, sdsLines),
             };
         } else {
             throw new Error('placeholderNameNeeded not found');
@@ -982,13 +1363,12 @@ export class RunnerApi {
 
     public async executeMultipleHistoryAndReturnNewResults(
         entries: ExecuteRunnerAllEntry[],
-        placeholderOverride = this.tablePlaceholder,
-        sdsLinesOverride = '',
+        pastReplay: ManipulatingEntriesReplay = { sdsString: '', placeholderName: this.tablePlaceholder },
     ): Promise<MultipleRunnerExecutionResultMessage['value']['results']> {
-        let sdsLines = sdsLinesOverride;
+        let sdsLines = pastReplay.sdsString;
         let placeholderNames: string[] = [];
         let entryIdToPlaceholderNames = new Map<number, string>();
-        let currentPlaceholderOverride = placeholderOverride;
+        let currentPlaceholderOverride = pastReplay.placeholderName;
         // let schemaPlaceHolder = this.genPlaceholderName('schema');
 
         const filteredEntries: ExecuteRunnerAllEntry[] = this.filterPastEntriesForAllExecution(entries);
@@ -1030,18 +1410,27 @@ export class RunnerApi {
 
         const pipelineExecutionId = crypto.randomUUID();
         try {
-            await this.addToAndExecutePipeline(pipelineExecutionId, sdsLines, placeholderNames);
+            await this.addToAndExecutePipelineWithCheckpoint(
+                pipelineExecutionId,
+                sdsLines,
+                placeholderNames,
+                pastReplay,
+            );
         } catch (e) {
             throw e;
         }
 
+        // Fetch all images at once, tables are fetched page by page below
+        const images = await this.getPlaceholderValues(
+            filteredEntries
+                .filter((entry) => entry.entry.type === 'external-visualizing' && entry.entry.action !== 'infoPanel')
+                .map((entry) => entryIdToPlaceholderNames.get(entry.entry.id)!),
+            pipelineExecutionId,
+        );
+
         for (const entry of filteredEntries) {
             if (entry.entry.type === 'external-visualizing' && entry.entry.action !== 'infoPanel') {
-                const result = await this.getPlaceholderValue(
-                    entryIdToPlaceholderNames.get(entry.entry.id)!,
-                    pipelineExecutionId,
-                );
-                const image = result as Base64Image;
+                const image = images.get(entryIdToPlaceholderNames.get(entry.entry.id)!) as Base64Image;
 
                 if (entry.entry.columnNumber === 'none') {
                     results.push({
@@ -1097,22 +1486,13 @@ export class RunnerApi {
                     });
                 }
             } else if (entry.entry.type === 'external-manipulating') {
-                const newTable = await this.getPlaceholderValue(
-                    entryIdToPlaceholderNames.get(entry.entry.id)!,
-                    pipelineExecutionId,
-                );
-
-                if (!newTable) throw new Error('Table not found');
-
                 results.push({
                     type: 'table',
                     historyId: entry.entry.id,
-                    content: this.runnerResultToTable(
-                        this.tablePlaceholder,
-                        newTable,
-                        new Map<string, boolean>(
-                            Object.keys(newTable).map((col) => [col, typeof newTable[col][0] === 'number']),
-                        ), // temp until schema works as otherwise we would need another execution to get column names
+                    content: await this.getHistoryTable(
+                        entryIdToPlaceholderNames.get(entry.entry.id)!,
+                        pipelineExecutionId,
+                        sdsLines,
                     ),
                 });
             }
@@ -1125,27 +1505,15 @@ export class RunnerApi {
         pastEntries: HistoryEntry[],
         futureEntries: ExecuteRunnerAllEntry[],
     ): Promise<MultipleRunnerExecutionResultMessage['value']['results']> {
-        let sdsLines = '';
-        let currentPlaceholderOverride = this.tablePlaceholder;
         // let schemaPlaceHolder = this.genPlaceholderName('schema');
 
         const { pastEntries: filteredPastEntries, futureEntries: filteredFutureEntries } =
             this.filterPastEntriesForMultipleExecution(pastEntries, futureEntries);
 
-        for (const entry of filteredPastEntries) {
-            if (entry.type === 'external-manipulating') {
-                // Only manipulating actions have to be repeated before last entry that is of interest, others do not influence that end result
-                const sdsStringObj = this.sdsStringForHistoryEntry(entry, currentPlaceholderOverride);
-                sdsLines += sdsStringObj.sdsString;
-                currentPlaceholderOverride = sdsStringObj.placeholderName;
-                safeDsLogger.debug(`Running old entry ${entry.id} with action ${entry.action}`);
-            }
-        }
-
+        // Only manipulating actions have to be repeated before last entry that is of interest, others do not influence that end result
         return this.executeMultipleHistoryAndReturnNewResults(
             filteredFutureEntries,
-            currentPlaceholderOverride,
-            sdsLines,
+            this.sdsStringForManipulatingEntries(filteredPastEntries),
         );
     }
 
@@ -1261,3 +1629,20 @@ export class RunnerApi {
     //#endregion
     //#endregion // Public API
 }
+
+/**
+ * The Safe-DS code that applies manipulating history entries to the table.
+ */
+interface ManipulatingEntriesReplay {
+    sdsString: string;
+
+    /**
+     * The placeholder that holds the resulting table.
+     */
+    placeholderName: string;
+
+    /**
+     * The checkpoint that should be saved for the resulting table.
+     */
+    checkpoint?: Checkpoint;
+}
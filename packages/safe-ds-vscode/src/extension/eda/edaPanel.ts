@@ -1,7 +1,7 @@
 import * as vscode from 'vscode';
 import { ToExtensionMessage } from '@safe-ds/eda/types/messaging.js';
 import * as webviewApi from './apis/webviewApi.ts';
-import { Table } from '@safe-ds/eda/types/state.ts';
+import { Table, TableRows } from '@safe-ds/eda/types/state.ts';
 import { SafeDsServices } from '@safe-ds/lang';
 import { RunnerApi } from './apis/runnerApi.ts';
 import { safeDsLogger } from '../helpers/logging.js';
@@ -168,6 +168,25 @@ export class EDAPanel {
                     });
                     break;
                 }
+                case 'getTableRows': {
+                    if (!data.value) {
+                        return;
+                    }
+
+                    // The webview is always answered, so it can request rows again that could not be loaded
+                    const { rowSource, begin, size } = data.value;
+                    let rows: TableRows | undefined = undefined;
+                    try {
+                        rows = await this.runnerApi.getTableRows(rowSource, begin, size);
+                    } catch (error) {
+                        safeDsLogger.error(`Could not load table rows: ${error}`);
+                    }
+                    webviewApi.postMessage(this.panel.webview, {
+                        command: 'setTableRows',
+                        value: rows ?? { rowSource, begin, columns: undefined },
+                    });
+                    break;
+                }
                 case 'executeRunnerAll': {
                     if (!data.value) {
                         return;
@@ -282,6 +301,7 @@ export class EDAPanel {
             panel.panel.reveal(panel.column);
             panel.tableIdentifier = tableIdentifier;
             panel.startPipelineExecutionId = startPipelineExecutionId;
+            panel.runnerApi.dispose();
             panel.runnerApi = new RunnerApi(services, pipelinePath, pipelineName, pipelineNodeEndOffset, tableName);
             panel.tableName = tableName;
             EDAPanel.panelsMap.set(tableIdentifier, panel);
@@ -351,6 +371,7 @@ export class EDAPanel {
     public dispose() {
         safeDsLogger.info('dispose ' + this.tableIdentifier);
         EDAPanel.panelsMap.delete(this.tableIdentifier);
+        this.runnerApi.dispose();
 
         // Clean up our panel
         this.panel.dispose();
@@ -93,8 +93,8 @@ const registerNotificationListeners = function (context: vscode.ExtensionContext
         client.onNotification(rpc.InstallRunnerNotification.type, async () => {
             await installRunner(client)();
         }),
-        client.onNotification(rpc.RunnerStartedNotification.type, async ({ port }: rpc.RunnerStartedParams) => {
-            await services.runtime.PythonServer.connectToPort(port);
+        client.onNotification(rpc.RunnerStartedNotification.type, async ({ port, version }: rpc.RunnerStartedParams) => {
+            await services.runtime.PythonServer.connectToPort(port, version);
         }),
         client.onNotification(rpc.UpdateRunnerNotification.type, async () => {
             await updateRunner(context, client)();
@@ -0,0 +1,156 @@
+import { HistoryEntry } from '@safe-ds/eda/types/state.js';
+import fs from 'fs';
+import path from 'path';
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+import { Checkpoint, CheckpointStore } from '../../../../src/extension/eda/apis/checkpointStore.js';
+
+const sortEntry = (id: number, columnName: string): HistoryEntry => ({
+    id,
+    overrideId: `${columnName}.sortByColumn`,
+    type: 'external-manipulating',
+    action: 'sortByColumn',
+    alias: `Sort by ${columnName}`,
+    columnName,
+    sort: 'asc',
+    tabOrder: [],
+    profilingState: null,
+});
+
+describe('CheckpointStore', () => {
+    let logger: { warn: ReturnType<typeof vi.fn> };
+    let store: CheckpointStore;
+
+    // Writes the file like the runner would and stores the checkpoint
+    const addCheckpoint = (entries: HistoryEntry[], bytes: number = 1): Checkpoint => {
+        const checkpoint = store.create(entries)!;
+        fs.mkdirSync(path.dirname(checkpoint.filePath), { recursive: true });
+        fs.writeFileSync(checkpoint.filePath, 'x'.repeat(bytes));
+        store.add(checkpoint);
+        return checkpoint;
+    };
+
+    beforeEach(() => {
+        logger = { warn: vi.fn() };
+        store = new CheckpointStore(logger, 10);
+    });
+
+    afterEach(() => {
+        store.dispose();
+    });
+
+    describe('findLongestPrefix', () => {
+        it('should return the checkpoint of the longest stored prefix', () => {
+            const entries = [sortEntry(1, 'a'), sortEntry(2, 'b'), sortEntry(3, 'c')];
+            addCheckpoint(entries.slice(0, 1));
+            const checkpoint = addCheckpoint(entries.slice(0, 2));
+
+            expect(store.findLongestPrefix(entries)).toStrictEqual({ checkpoint, length: 2 });
+        });
+
+        it('should return a shorter prefix if a later entry differs', () => {
+            const checkpoint = addCheckpoint([sortEntry(1, 'a')]);
+            addCheckpoint([sortEntry(1, 'a'), sortEntry(2, 'b')]);
+
+            expect(store.findLongestPrefix([sortEntry(1, 'a'), sortEntry(2, 'c')])).toStrictEqual({
+                checkpoint,
+                length: 1,
+            });
+        });
+
+        it('should return undefined if no prefix is stored', () => {
+            addCheckpoint([sortEntry(1, 'a')]);
+
+            expect(store.findLongestPrefix([sortEntry(1, 'b')])).toBeUndefined();
+        });
+
+        it('should ignore properties that do not influence the table', () => {
+            const checkpoint = addCheckpoint([sortEntry(1, 'a')]);
+            const entry = { ...sortEntry(2, 'a'), alias: 'Other alias', loading: true };
+
+            expect(store.findLongestPrefix([entry])).toStrictEqual({ checkpoint, length: 1 });
+        });
+
+        it('should not depend on the order of properties', () => {
+            const checkpoint = addCheckpoint([sortEntry(1, 'a')]);
+            const entry = Object.fromEntries(Object.entries(sortEntry(1, 'a')).reverse()) as HistoryEntry;
+
+            expect(store.findLongestPrefix([entry])).toStrictEqual({ checkpoint, length: 1 });
+        });
+
+        it('should skip checkpoints whose file was deleted', () => {
+            const checkpoint = addCheckpoint([sortEntry(1, 'a')]);
+            fs.rmSync(addCheckpoint([sortEntry(1, 'a'), sortEntry(2, 'b')]).filePath);
+
+            expect(store.findLongestPrefix([sortEntry(1, 'a'), sortEntry(2, 'b')])).toStrictEqual({
+                checkpoint,
+                length: 1,
+            });
+        });
+    });
+
+    describe('create', () => {
+        it('should return undefined if there are no entries', () => {
+            expect(store.create([])).toBeUndefined();
+        });
+
+        it('should return undefined if a checkpoint exists already', () => {
+            addCheckpoint([sortEntry(1, 'a')]);
+
+            expect(store.create([sortEntry(1, 'a')])).toBeUndefined();
+        });
+
+        it('should return checkpoints with different files', () => {
+            const first = store.create([sortEntry(1, 'a')])!;
+            const second = store.create([sortEntry(1, 'b')])!;
+
+            expect(first.filePath).not.toBe(second.filePath);
+        });
+    });
+
+    describe('add', () => {
+        it('should not store checkpoints that were not written', () => {
+            store.add(store.create([sortEntry(1, 'a')])!);
+
+            expect(store.findLongestPrefix([sortEntry(1, 'a')])).toBeUndefined();
+            expect(logger.warn).toHaveBeenCalledOnce();
+        });
+
+        it('should delete the least recently used checkpoints if the size budget is exceeded', async () => {
+            const first = addCheckpoint([sortEntry(1, 'a')], 4);
+            addCheckpoint([sortEntry(1, 'b')], 4);
+            addCheckpoint([sortEntry(1, 'c')], 4);
+
+            expect(store.findLongestPrefix([sortEntry(1, 'a')])).toBeUndefined();
+            expect(store.findLongestPrefix([sortEntry(1, 'b')])).toBeDefined();
+            expect(store.findLongestPrefix([sortEntry(1, 'c')])).toBeDefined();
+            await vi.waitFor(() => expect(fs.existsSync(first.filePath)).toBeFalsy());
+        });
+
+        it('should keep checkpoints that were used recently', () => {
+            addCheckpoint([sortEntry(1, 'a')], 4);
+            addCheckpoint([sortEntry(1, 'b')], 4);
+            store.findLongestPrefix([sortEntry(1, 'a')]);
+            addCheckpoint([sortEntry(1, 'c')], 4);
+
+            expect(store.findLongestPrefix([sortEntry(1, 'a')])).toBeDefined();
+            expect(store.findLongestPrefix([sortEntry(1, 'b')])).toBeUndefined();
+        });
+
+        it('should keep a checkpoint that exceeds the size budget on its own', () => {
+            addCheckpoint([sortEntry(1, 'a')], 11);
+
+            expect(store.findLongestPrefix([sortEntry(1, 'a')])).toBeDefined();
+        });
+    });
+
+    describe('dispose', () => {
+        it('should delete all checkpoints', async () => {
+            const checkpoint = addCheckpoint([sortEntry(1, 'a')]);
+
+            store.dispose();
+
+            expect(store.findLongestPrefix([sortEntry(1, 'a')])).toBeUndefined();
+            await vi.waitFor(() => expect(fs.existsSync(path.dirname(checkpoint.filePath))).toBeFalsy());
+        });
+    });
+});